@@ -16,6 +16,8 @@
 #include <bcl/beerocks_version.h>
 #include <bcl/network/network_utils.h>
 #include <easylogging++.h>
+#include <sstream>
+#include <tlvf/tlvfstats.h>
 
 // Do not use this macro anywhere else in ire process
 // It should only be there in one place in each executable module
@@ -55,6 +57,14 @@ static void handle_signal()
         break;
     }
 
+    // Dump the tlvf class counters (generated with tlvf.py --stats)
+    case SIGUSR2: {
+        std::stringstream ss;
+        tlvf_stats_dump(ss);
+        LOG(INFO) << ss.str();
+        break;
+    }
+
     default:
         LOG(WARNING) << "Unhandled Signal: '" << strsignal(s_signal) << "' Ignoring...";
         break;
@@ -85,6 +95,12 @@ static void init_signals()
     sigemptyset(&sigusr1_action.sa_mask);
     sigusr1_action.sa_flags = 0;
     sigaction(SIGUSR1, &sigusr1_action, NULL);
+
+    struct sigaction sigusr2_action;
+    sigusr2_action.sa_handler = signal_handler;
+    sigemptyset(&sigusr2_action.sa_mask);
+    sigusr2_action.sa_flags = 0;
+    sigaction(SIGUSR2, &sigusr2_action, NULL);
 }
 
 static bool parse_arguments(int argc, char *argv[])
@@ -1,4 +1,4 @@
-#!/usr/bin/env python
+#!/usr/bin/env python3
 
 # SPDX-License-Identifier: BSD-2-Clause-Patent
 #
@@ -14,18 +14,26 @@
 #
 #
 
+from __future__ import print_function
 import sys
 import os
 import copy
-import tempfile
-import filecmp
-import shutil
+import hashlib
+import re
 
 class MessageEndianConverter():
+    # Bump when the generated code changes, to invalidate the stamp file
+    SCRIPT_VERSION = 2
+
+    # Single pass C/C++ tokenizer used by cleanText(): comments (dropped),
+    # an unterminated block comment (error), line ends and code
+    TOKEN_RE = re.compile(r'(?P<comment>/\*.*?\*/|//[^\n]*)|(?P<open>/\*)|(?P<newline>\n)'
+                          r'|(?P<code>[^/\n]+|/)', re.S)
+
     def __init__(self):
         
         cwd = os.getcwd()
-        print cwd
+        print(cwd)
         if cwd.endswith("build"):
             self.PATH_PREFIX = "../"
         else:
@@ -36,23 +44,37 @@ class MessageEndianConverter():
         self.OUT_HEADER_FILE = self.PATH_PREFIX + "include/beerocks/bcl/beerocks_message_endian_converter.h"
         self.OUT_CPP_FILE = self.PATH_PREFIX + "source/beerocks_message_endian_converter.cpp"
         self.INTEL_HEADER = self.PATH_PREFIX + "intel_header.txt"
+        self.STAMP_FILE = self.PATH_PREFIX + "source/beerocks_message_endian_converter.stamp"
         self.debug=0
+        self.table = False
         self.control_header_lines = ""
         self.control_structs_lines = ""
         self.action_op = []
+        self.action_op_values = {}
+        self.action_op_end = 0
         self.structs_dic = {}
+        self.input_texts = {}
             
     def readArgs(self, args):
         if "-d" in args:
             self.debug=1
-            print "Debug level 1 enabled"
+            print("Debug level 1 enabled")
         elif "-dd" in args:
             self.debug=2
-            print "Debug level 2 enabled"
+            print("Debug level 2 enabled")
+        if "--table" in args:
+            self.table = True
+            print("Table driven swap enabled")
         return True
 
     def run(self, args):
         if not self.readArgs(args): return
+        if not self.readInputFiles():
+            return
+        digest = self.getInputsDigest()
+        if self.isUpToDate(digest):
+            print("Nothing changed since the last build")
+            return
         if not self.readControlHeaderFile(): return
         if not self.readControlStructsFile(): return
         if not self.loadActionOp(): return
@@ -60,20 +82,62 @@ class MessageEndianConverter():
         if not self.loadStructs(self.control_structs_lines): return
         if not self.writeHeaderFile(): return
         if not self.writeCPPFile(): return
+        self.writeStamp(digest)
+
+    def readInputFiles(self):
+        # every input is read once, for both the stamp digest and the parsing
+        for fname in [self.CONTROL_HEADER_FILE, self.CONTROL_STRUCTS_FILE, self.NET_STRUCTS_FILE,
+                      self.INTEL_HEADER]:
+            try:
+                with open(fname, "rt") as fd:
+                    self.input_texts[fname] = fd.read()
+            except IOError:
+                print("readInputFiles Error, can't open file: " + fname)
+                return False
+        return True
+
+    def getInputsDigest(self):
+        digest = hashlib.sha256()
+        digest.update(("version=%d table=%d\n" % (self.SCRIPT_VERSION, self.table)).encode("utf-8"))
+        for fname in sorted(self.input_texts.keys()):
+            digest.update(("%s %d\n" % (fname, len(self.input_texts[fname]))).encode("utf-8"))
+            digest.update(self.input_texts[fname].encode("utf-8"))
+        return digest.hexdigest()
+
+    def isUpToDate(self, digest):
+        if not os.path.isfile(self.OUT_HEADER_FILE) or not os.path.isfile(self.OUT_CPP_FILE):
+            return False
+        try:
+            with open(self.STAMP_FILE, "rt") as fd:
+                return fd.read().strip() == digest
+        except IOError:
+            return False
+
+    def writeStamp(self, digest):
+        with open(self.STAMP_FILE, "wt") as fd:
+            fd.write(digest + '\n')
 
     def writeLine(self,fd,line):
-        fd.write(line)
-        fd.write('\n')
+        fd.append(line + '\n')
+
+    def updateFile(self, fname, fd):
+        text = "".join(fd)
+        # Check if anything changed since the last build
+        try:
+            with open(fname, "rt") as f:
+                if f.read() == text:
+                    return
+        except IOError:
+            pass
+        print("Updating %s..." % fname)
+        with open(fname, "wt") as f:
+            f.write(text)
 
     def writeHeaderFile(self):
-        fd = tempfile.NamedTemporaryFile(mode='w+t', delete=False)
+        fd = []
 
-        fd2 = open(self.INTEL_HEADER, "rt")
-        t = fd2.read()
-        fd.write(t)
+        fd.append(self.input_texts[self.INTEL_HEADER])
         self.writeLine(fd,'\n')
-        fd2.close()
-        t=""
 
         self.writeLine(fd,'#ifndef _BEEROCKS_MESSAGE_ENDIAN_CONVERTER_H_')
         self.writeLine(fd,'#define _BEEROCKS_MESSAGE_ENDIAN_CONVERTER_H_')
@@ -98,25 +162,33 @@ class MessageEndianConverter():
 
         self.writeLine(fd,'#endif // _BEEROCKS_MESSAGE_ENDIAN_CONVERTER_H_')
 
-        temp_file_name = fd.name
-        fd.close()
-
-        # Check if anything changed since the last build
-        if not os.path.isfile(self.OUT_HEADER_FILE) or not filecmp.cmp(temp_file_name, self.OUT_HEADER_FILE, shallow=False):
-            print "Updating %s..." % self.OUT_HEADER_FILE
-            shutil.copyfile(temp_file_name, self.OUT_HEADER_FILE)
-
-        os.remove(temp_file_name)
+        self.updateFile(self.OUT_HEADER_FILE, fd)
         return True
 
     def writeCPPFile(self):
-        fd = tempfile.NamedTemporaryFile(mode='w+t', delete=False)
+        fd = []
 
         self.writeLine(fd,'#include <bcl/beerocks_message_endian_converter.h>')
+        if self.table:
+            self.writeLine(fd, '#include <cstddef>')
         self.writeLine(fd,'')
         self.writeLine(fd,'using namespace beerocks;')
         self.writeLine(fd,'using namespace message;')
         self.writeLine(fd,'')
+
+        if self.table:
+            ok = self.writeSwapTable(fd)
+        else:
+            ok = self.writeSwapCode(fd)
+        if not ok:
+            return False
+
+        self.updateFile(self.OUT_CPP_FILE, fd)
+        return True
+
+    def writeSwapCode(self, fd):
+        if not self.writeSwapFunctions(fd):
+            return False
         self.writeLine(fd,'void endian_converter::swap_message(uint8_t* buffer, bool only_header)')
         self.writeLine(fd,'{')
         self.writeLine(fd,'    auto header = (message::sActionHeader*)buffer;')
@@ -138,35 +210,177 @@ class MessageEndianConverter():
 
         self.writeLine(fd,'    if (only_header) return;')
         self.writeLine(fd,'')
-        self.writeLine(fd,'    switch(header->action_op)')
-        self.writeLine(fd,'    {')
+        self.writeLine(fd, '    if (header->action_op >= ACTION_CONTROL_ENUM_END) return;')
+        self.writeLine(fd, '    auto swap = control_swap[header->action_op];')
+        self.writeLine(fd, '    if (swap) swap(buffer);')
+        self.writeLine(fd, '}')
+        return True
+
+    def writeSwapFunctions(self, fd):
+        self.writeLine(fd, 'namespace {')
+        self.writeLine(fd, '')
+        self.writeLine(fd, 'typedef void (*swap_func)(uint8_t* buffer);')
+        self.writeLine(fd, '')
+        entries = {}
         for op in self.action_op:
             struct_name = "s"+op
             [lines, has_code, error] = self.convertStruct(struct_name)
             if error:
                 self.writeLine(fd,'#error "Code generation failed!!"')
                 return False
-            self.writeLine(fd,'        case ' + op + ':')
-            self.writeLine(fd,'        {')
-            self.writeLine(fd,'            %sauto msg = (message::s%s*)buffer;' % ("" if has_code else "//" ,op) ) 
+            if not has_code:
+                continue
+            self.writeLine(fd, 'void swap_%s(uint8_t* buffer)' % op)
+            self.writeLine(fd, '{')
+            self.writeLine(fd, '    auto msg = (message::s%s*)buffer;' % op)
             for line in lines:
-                self.writeLine(fd,'            %s' % line)
-            self.writeLine(fd,'            break;')
-            self.writeLine(fd,'        }')
-        self.writeLine(fd,'    }')
-        self.writeLine(fd,'}')
-
-        tmep_file_name = fd.name
-        fd.close()
-
-        # Check if anything changed since the last build
-        if not os.path.isfile(self.OUT_CPP_FILE) or not filecmp.cmp(tmep_file_name, self.OUT_CPP_FILE, shallow=False):
-            print "Updating %s..." % self.OUT_CPP_FILE
-            shutil.copyfile(tmep_file_name, self.OUT_CPP_FILE)
+                self.writeLine(fd, '    %s' % line)
+            self.writeLine(fd, '}')
+            self.writeLine(fd, '')
+            entries[op] = 'swap_%s' % op
+
+        self.writeDispatchTable(fd, 'swap_func', 'control_swap', entries, 'nullptr')
+        self.writeLine(fd, '} // namespace')
+        self.writeLine(fd, '')
+        return True
 
-        os.remove(tmep_file_name)
+    # Dense table indexed by the action_op value, with an entry (or the
+    # empty entry) for every value below ACTION_CONTROL_ENUM_END, so that
+    # swap_message() dispatches in constant time. The static_asserts make
+    # sure the values evaluated by loadActionOp() match the compiler ones.
+    def writeDispatchTable(self, fd, entry_type, table_name, entries, empty_entry):
+        ops_by_value = {}
+        for op in self.action_op:
+            ops_by_value.setdefault(self.action_op_values[op], op)
+        self.writeLine(fd, 'const %s %s[ACTION_CONTROL_ENUM_END] = {' % (entry_type, table_name))
+        for value in range(self.action_op_end):
+            op = ops_by_value.get(value)
+            if op and op in entries:
+                self.writeLine(fd, '    %s, // %d' % (entries[op], value))
+            else:
+                self.writeLine(fd, '    %s, // %d%s' % (empty_entry, value, " " + op if op else ""))
+        self.writeLine(fd, '};')
+        self.writeLine(fd, '')
+        for op in self.action_op:
+            self.writeLine(fd, 'static_assert(%s == %d, "%s value mismatch");' %
+                           (op, self.action_op_values[op], op))
+        self.writeLine(fd, 'static_assert(ACTION_CONTROL_ENUM_END == %d, '
+                           '"ACTION_CONTROL_ENUM_END value mismatch");' % self.action_op_end)
+        self.writeLine(fd, '')
+
+    # Table driven swap (--table)
+    # Instead of straight-line swap code per member, every struct gets a
+    # static table of {offset, width, count, stride} descriptors, one per
+    # swappable member (a whole array is a single descriptor), which is
+    # interpreted by a single swap loop.
+    def writeSwapTable(self, fd):
+        self.writeLine(fd, 'namespace {')
+        self.writeLine(fd, '')
+        self.writeLine(fd, 'typedef struct {')
+        self.writeLine(fd, '    uint16_t offset; // member offset from the start of the struct')
+        self.writeLine(fd, '    uint8_t width;   // swap width in bits (16, 32 or 64)')
+        self.writeLine(fd, '    uint16_t count;  '
+                           '// number of elements, more than 1 for array members')
+        self.writeLine(fd, '    uint16_t stride; // distance in bytes between two elements')
+        self.writeLine(fd, '} sSwapField;')
+        self.writeLine(fd, '')
+        self.writeLine(fd, 'typedef struct {')
+        self.writeLine(fd, '    const sSwapField *fields;')
+        self.writeLine(fd, '    size_t size;')
+        self.writeLine(fd, '} sSwapTable;')
+        self.writeLine(fd, '')
+        self.writeLine(fd, 'template <size_t N> '
+                           'constexpr sSwapTable swap_table(const sSwapField (&fields)[N])')
+        self.writeLine(fd, '{')
+        self.writeLine(fd, '    return {fields, N};')
+        self.writeLine(fd, '}')
+        self.writeLine(fd, '')
+        self.writeLine(fd, 'void swap_fields(uint8_t *buffer, const sSwapTable &table)')
+        self.writeLine(fd, '{')
+        self.writeLine(fd, '    for (size_t i = 0; i < table.size; i++) {')
+        self.writeLine(fd, '        auto &field = table.fields[i];')
+        self.writeLine(fd, '        auto ptr    = buffer + field.offset;')
+        self.writeLine(fd, '        for (size_t j = 0; j < field.count; '
+                           'j++, ptr += field.stride) {')
+        self.writeLine(fd, '            tlvf_swap(field.width, ptr);')
+        self.writeLine(fd, '        }')
+        self.writeLine(fd, '    }')
+        self.writeLine(fd, '}')
+        self.writeLine(fd, '')
+
+        has_fields = {}
+        for struct_name in ["sActionHeader"] + ["s" + op for op in self.action_op]:
+            [fields, error] = self.getSwapFields(struct_name)
+            if error:
+                self.writeLine(fd, '#error "Code generation failed!!"')
+                return False
+            has_fields[struct_name] = len(fields) > 0
+            if not fields:
+                continue
+            self.writeLine(fd, 'const sSwapField %s_fields[] = {' % struct_name)
+            for (offset, width, count, stride, var) in fields:
+                self.writeLine(fd, '    {%s, %d, %s, %s}, // %s %s' %
+                               (offset, width, count, stride, var[0], var[1]))
+            self.writeLine(fd, '};')
+            self.writeLine(fd, '')
+
+        entries = {}
+        for op in self.action_op:
+            if has_fields["s" + op]:
+                entries[op] = 'swap_table(s%s_fields)' % op
+        self.writeDispatchTable(fd, 'sSwapTable', 'control_tables', entries, '{nullptr, 0}')
+        self.writeLine(fd, '} // namespace')
+        self.writeLine(fd, '')
+        self.writeLine(fd, 'void endian_converter::swap_message(uint8_t* buffer, bool only_header)')
+        self.writeLine(fd, '{')
+        self.writeLine(fd, '    auto header = (message::sActionHeader*)buffer;')
+        self.writeLine(fd, '    if(header->action != ACTION_CONTROL) return; '
+                           '// local message, no need to convert')
+        self.writeLine(fd, '')
+        if has_fields["sActionHeader"]:
+            self.writeLine(fd, '    swap_fields(buffer, swap_table(sActionHeader_fields));')
+        self.writeLine(fd, '    buffer += sizeof(message::sActionHeader);')
+        self.writeLine(fd, '')
+        self.writeLine(fd, '    if (only_header) return;')
+        self.writeLine(fd, '')
+        self.writeLine(fd, '    if (header->action_op >= ACTION_CONTROL_ENUM_END) return;')
+        self.writeLine(fd, '    swap_fields(buffer, control_tables[header->action_op]);')
+        self.writeLine(fd, '}')
         return True
 
+    def getSwapFields(self, struct_name):
+        fields = []
+        try:
+            var_list = copy.deepcopy(self.structs_dic[struct_name])
+        except KeyError:
+            print("getSwapFields Error, can't find struct=" + struct_name)
+            return [fields, True]
+
+        var_list = self.convertVarListToBasicVarTypes(struct_name, var_list)
+        if var_list is None:
+            return [fields, True]
+        for var in var_list:
+            width = self.getSwapWidth(var[0])
+            if width is None:
+                return [fields, True]
+            if width == 0:
+                continue
+            name = var[1]
+            i1 = name.find("[")
+            if i1 == -1:
+                fields.append(("offsetof(%s, %s)" % (struct_name, name), width, "1", "0", var))
+                continue
+            i2 = name.find("]")
+            if name.find("[", i2) != -1:
+                print("getSwapFields Error, nested arrays are not supported, var=" + str(var) +
+                      " in struct=" + struct_name)
+                return [fields, True]
+            elem = name[:i1] + "[0]"
+            offset = "offsetof(%s, %s%s)" % (struct_name, elem, name[i2+1:])
+            fields.append((offset, width, name[i1 + 1:i2], "sizeof(%s::%s)" % (struct_name, elem),
+                           var))
+        return [fields, False]
+
     def convertStruct(self,struct_name):
         has_code=False
         error=False
@@ -174,7 +388,7 @@ class MessageEndianConverter():
         try:
             var_list = self.structs_dic[ struct_name ]
         except:
-            print "writeConverterCode Error, can't find struct=" + struct_name
+            print("writeConverterCode Error, can't find struct=" + struct_name)
             error = True
 
         if not error:
@@ -209,38 +423,42 @@ class MessageEndianConverter():
             elif var[0].startswith("s"):
                 try:
                     var_v_list = copy.deepcopy( self.structs_dic[ var[0] ] )
-                    for j in xrange(len(var_v_list)):
+                    for j in range(len(var_v_list)):
                         var_v_list[j][1] = var[1] + "." + var_v_list[j][1]
                     del var_list[ii]
-                    for j in xrange(len(var_v_list)):
+                    for j in range(len(var_v_list)):
                         var_list.insert(ii, var_v_list[j])
                         ii+=1
                 except:
-                    print "convertVarListToBasicVarTypes Error, can't find var=" + str(var) + " in struct=" + struct_name
+                    print("convertVarListToBasicVarTypes Error, can't find var=" + str(var) +
+                          " in struct=" + struct_name)
                     return None
             else:
-                print "convertVarListToBasicVarTypes Error, unknown supported var=" + str(var) + " in struct=" + struct_name
+                print("convertVarListToBasicVarTypes Error, unknown supported var=" + str(var) +
+                      " in struct=" + struct_name)
                 return None
         return var_list
 
-    def getSwapLine(self, var):
-        line = None
-        if var[0].startswith("char"):
-            line = "// msg->%s;    //%s" % (var[1],var[0])
+    def getSwapWidth(self, var_type):
+        width = None
+        if var_type.startswith("char"):
+            width = 0
         else:
-            i1 = var[0].find("int")
+            i1 = var_type.find("int")
             if i1 != -1:
-                if var[0][i1+3:] == "64_t":
-                    line = "swap_64(msg->%s); //%s" % (var[1], var[0])
-                elif var[0][i1+3:] == "32_t":
-                    line = "swap_32(msg->%s); //%s" % (var[1], var[0])
-                elif var[0][i1+3:] == "16_t":
-                    line = "swap_16(msg->%s); //%s" % (var[1], var[0])
-                elif var[0][i1+3:] == "8_t":
-                    line = "// msg->%s;    //%s" % (var[1],var[0])
-
-        if line == None: print "getSwapLine Error: type " + var[0] + " is not supported!"
-        return line
+                width = {"64_t": 64, "32_t": 32, "16_t": 16, "8_t": 0}.get(var_type[i1+3:])
+
+        if width is None:
+            print("getSwapWidth Error: type " + var_type + " is not supported!")
+        return width
+
+    def getSwapLine(self, var):
+        width = self.getSwapWidth(var[0])
+        if width is None:
+            return None
+        if width == 0:
+            return "// msg->%s;    //%s" % (var[1], var[0])
+        return "swap_%d(msg->%s); //%s" % (width, var[1], var[0])
 
     def expandArray(self, line):
         lines_out = []
@@ -257,56 +475,31 @@ class MessageEndianConverter():
         return lines_out
 
     def cleanText(self, text, fname):
-        # clean multi line comment
-        new_text = ""
-        i0=0
-        while True:
-            i1 = text.find("/*", i0)
-            if i1 == -1: break
-            i2 = text.find("*/", i1)
-            if i2 == -1:
-                print "cleanText Error, can't find matching */ after position " +  str(i1) + " fname=" + fname
-                return None
-            else: # clear the comment
-                new_text += text[i0:i1]
-                i0=i2+2
-
-        if i0 < len(text):
-            new_text += text[i0:]
-
-        # clear empty and comments lines
+        # drop comments and split to stripped, non empty lines in a single
+        # pass (a block comment joins the lines around it)
         line_list = []
-        i0=0
-        while True:
-            i1 = new_text.find("\n", i0)
-            if i1 == -1: break
-            line = new_text[i0:i1].strip()
-            i0 = i1+1
-            if line == "": continue
-            ic = line.find("//")
-            if ic == 0: continue
-            elif ic != -1: line = line[0:ic]
+        line = ""
+        for token in self.TOKEN_RE.finditer(text):
+            kind = token.lastgroup
+            if kind == "code":
+                line += token.group()
+            elif kind == "newline":
+                line = line.strip()
+                if line != "":
+                    line_list.append(line)
+                line = ""
+            elif kind == "open":
+                print("cleanText Error, can't find matching */ after position " +
+                      str(token.start()) + " fname=" + fname)
+                return None
+        line = line.strip()
+        if line != "":
             line_list.append(line)
-
-        # if self.debug == 2:
-        #     print "write debug file " + name
-        #     with open("Output_" +  name + ".txt", "w") as text_file:
-        #         for line in line_list:
-        #             text_file.write(line + "\n")
-
         return line_list
 
     def readControlHeaderFile(self):
         fname = self.CONTROL_HEADER_FILE
-        fd = open(fname, "rt")
-        if fd == None:
-            print "readControlHeaderFile Error, can't open file: " + fname
-            return False
-
-        text1 = fd.read()
-        fd.close()
-
-        text1 = self.cleanText(text1, fname)
+        text1 = self.cleanText(self.input_texts[fname], fname)
         if text1 == None: return False
 
         self.control_header_lines = text1
@@ -314,27 +507,11 @@ class MessageEndianConverter():
 
     def readControlStructsFile(self):
         fname = self.CONTROL_STRUCTS_FILE
-        fd = open(fname, "rt")
-        if fd == None:
-            print "readControlStructsFile Error, can't open file: " + fname
-            return False
-
-        text1 = fd.read()
-        fd.close()
-
-        text1 = self.cleanText(text1, fname)
+        text1 = self.cleanText(self.input_texts[fname], fname)
         if text1 == None: return False
 
         fname = self.NET_STRUCTS_FILE
-        fd = open(fname, "rt")
-        if fd == None:
-            print "readControlStructsFile Error, can't open file: " + fname
-            return False
-
-        text2 = fd.read()
-        fd.close()
-
-        text2 = self.cleanText(text2, fname)
+        text2 = self.cleanText(self.input_texts[fname], fname)
         if text2 == None: return False
 
         self.control_structs_lines = text1 + text2
@@ -346,6 +523,7 @@ class MessageEndianConverter():
         s2 = "ACTION_CONTROL_"
         s3 = "ACTION_CONTROL_ENUM_END"
         state = "Init"
+        value = -1
 
         for line in self.control_header_lines:
             
@@ -353,31 +531,48 @@ class MessageEndianConverter():
                 if line.startswith(s1):
                     state = "Fill"
             elif state == "Fill":
-                if line.startswith(s3):
-                    state = "ListEnd"
-                    break
-                elif line.startswith(s2):
-                    ss = line.split("=")
-                    op = ss[0].strip()
+                if line.startswith(s2):
+                    ss = line.rstrip(",").split("=")
+                    op = ss[0].strip().rstrip(",").strip()
+                    value = self.getActionOpValue(ss, value)
+                    if value is None:
+                        print("loadActionOp Error, can't evaluate the value of " + op)
+                        return False
+                    if op == s3:
+                        self.action_op_end = value
+                        state = "ListEnd"
+                        break
                     self.action_op.append(op)
+                    self.action_op_values[op] = value
                 elif line != "":
-                    print "loadActionOp Error, line " + " -> " + line 
+                    print("loadActionOp Error, line " + " -> " + line)
                     return False
             else:
-                print "loadActionOp Error, state ", state
+                print("loadActionOp Error, state ", state)
                 return False
 
         if state != "ListEnd":
-            print "loadActionOp Error in ", state
+            print("loadActionOp Error in ", state)
             return False
 
         if self.debug == 1:
-            print "self.action_op"
+            print("self.action_op")
             for op in self.action_op:
-                print op
+                print(op, self.action_op_values[op])
 
         return True
 
+    def getActionOpValue(self, ss, prev_value):
+        # implicit value - previous value + 1
+        if len(ss) < 2:
+            return prev_value + 1
+        value = ss[1].strip().rstrip(",").strip()
+        try:
+            return int(value, 0)
+        except ValueError:
+            # explicit value which is a previous enum value
+            return self.action_op_values.get(value)
+
 
     def loadStructs(self, list_lines):
         line_num=0
@@ -405,7 +600,8 @@ class MessageEndianConverter():
                     state = "Start"
 
             elif state == "Start":
-                if self.debug == 1: print "** { start, line " + str(line_idx)
+                if self.debug == 1:
+                    print("** { start, line " + str(line_idx))
                 struct_name = ""
                 struct_list = []
                 state = "FindEnd"
@@ -430,7 +626,8 @@ class MessageEndianConverter():
                         if not struct_name.startswith("s"):
                             error = "loadStructs, Error struct name not starting with 's' at line " + str(line_idx) + " -->" + line
                         else:
-                            if self.debug == 1: print "** } " +  struct_name + " end, line", str(line_idx)
+                            if self.debug == 1:
+                                print("** } " + struct_name + " end, line", str(line_idx))
 
                             self.structs_dic[ struct_name ] = struct_list
 
@@ -446,14 +643,15 @@ class MessageEndianConverter():
                         struct_list.append( [var[0], var[1] ] )
 
         if error == "":
-            if self.debug == 2: print self.structs_dic
+            if self.debug == 2:
+                print(self.structs_dic)
             return True
         else:
-            print error
+            print(error)
             return False
 
 if __name__ == '__main__':
     mec = MessageEndianConverter()
-    print "Running message endian_converter..."
+    print("Running message endian_converter...")
     mec.run(sys.argv[1:])
-    print "Message endian_converter done."
+    print("Message endian_converter done.")
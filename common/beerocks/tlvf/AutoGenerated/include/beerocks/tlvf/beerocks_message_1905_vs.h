@@ -16,10 +16,8 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
-#include <string.h>
 #include <memory>
 #include <tlvf/BaseClass.h>
-#include <tlvf/ClassList.h>
 #include "bcl/beerocks_message_structs.h"
 #include "beerocks/tlvf/beerocks_message_action.h"
 
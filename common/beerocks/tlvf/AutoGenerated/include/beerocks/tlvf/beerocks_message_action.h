@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 
 namespace beerocks_message {
 
@@ -31,10 +32,31 @@ enum eAction: uint8_t {
     ACTION_CLI = 0x32,
     ACTION_BML = 0x3c,
 };
+inline const char *eAction_str(eAction value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "ACTION_NONE"},
+        {0x1, "ACTION_1905_VS"},
+        {0xa, "ACTION_CONTROL"},
+        {0xb, "ACTION_BACKHAUL"},
+        {0xc, "ACTION_PLATFORM"},
+        {0x14, "ACTION_APMANAGER"},
+        {0x1e, "ACTION_MONITOR"},
+        {0x28, "ACTION_DHCP"},
+        {0x32, "ACTION_CLI"},
+        {0x3c, "ACTION_BML"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), false);
+}
 
 enum eActionOp_1905_VS: uint8_t {
     ACTION_TLV_VENDOR_SPECIFIC = 0xb,
 };
+inline const char *eActionOp_1905_VS_str(eActionOp_1905_VS value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0xb, "ACTION_TLV_VENDOR_SPECIFIC"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 enum eActionOp_CONTROL: uint8_t {
     ACTION_CONTROL_NONE = 0x0,
@@ -117,6 +139,160 @@ enum eActionOp_CONTROL: uint8_t {
     ACTION_CONTROL_CHANNEL_SCAN_FINISHED_NOTIFICATION = 0x93,
     ACTION_CONTROL_ENUM_END = 0x94,
 };
+inline const char *eActionOp_CONTROL_str(eActionOp_CONTROL value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "ACTION_CONTROL_NONE"},
+        {0x1, "ACTION_CONTROL_SLAVE_HANDSHAKE_REQUEST"},
+        {0x2, "ACTION_CONTROL_SLAVE_HANDSHAKE_RESPONSE"},
+        {0x3, "ACTION_CONTROL_SLAVE_JOINED_NOTIFICATION"},
+        {0x4, "ACTION_CONTROL_SLAVE_JOINED_RESPONSE"},
+        {0x5, "ACTION_CONTROL_SON_CONFIG_UPDATE"},
+        {0x6, "ACTION_CONTROL_CONTROLLER_PING_REQUEST"},
+        {0x7, "ACTION_CONTROL_CONTROLLER_PING_RESPONSE"},
+        {0x8, "ACTION_CONTROL_AGENT_PING_REQUEST"},
+        {0x9, "ACTION_CONTROL_AGENT_PING_RESPONSE"},
+        {0xa, "ACTION_CONTROL_SLAVE_JOINED_4ADDR_MODE_NOTIFICATION"},
+        {0xb, "ACTION_CONTROL_CHANGE_MODULE_LOGGING_LEVEL"},
+        {0xc, "ACTION_CONTROL_ARP_QUERY_REQUEST"},
+        {0xd, "ACTION_CONTROL_ARP_QUERY_RESPONSE"},
+        {0xe, "ACTION_CONTROL_PLATFORM_OPERATIONAL_NOTIFICATION"},
+        {0xf, nullptr},
+        {0x10, nullptr},
+        {0x11, nullptr},
+        {0x12, nullptr},
+        {0x13, nullptr},
+        {0x14, nullptr},
+        {0x15, nullptr},
+        {0x16, nullptr},
+        {0x17, nullptr},
+        {0x18, nullptr},
+        {0x19, nullptr},
+        {0x1a, nullptr},
+        {0x1b, nullptr},
+        {0x1c, nullptr},
+        {0x1d, nullptr},
+        {0x1e, "ACTION_CONTROL_BACKHAUL_ROAM_REQUEST"},
+        {0x1f, "ACTION_CONTROL_BACKHAUL_DL_RSSI_REPORT_NOTIFICATION"},
+        {0x20, "ACTION_CONTROL_BACKHAUL_RESET"},
+        {0x21, nullptr},
+        {0x22, nullptr},
+        {0x23, nullptr},
+        {0x24, nullptr},
+        {0x25, nullptr},
+        {0x26, nullptr},
+        {0x27, nullptr},
+        {0x28, nullptr},
+        {0x29, nullptr},
+        {0x2a, nullptr},
+        {0x2b, nullptr},
+        {0x2c, nullptr},
+        {0x2d, nullptr},
+        {0x2e, nullptr},
+        {0x2f, nullptr},
+        {0x30, nullptr},
+        {0x31, nullptr},
+        {0x32, nullptr},
+        {0x33, nullptr},
+        {0x34, nullptr},
+        {0x35, "ACTION_CONTROL_HOSTAP_CHANNEL_SWITCH_REQUEST"},
+        {0x36, "ACTION_CONTROL_HOSTAP_CSA_ERROR_NOTIFICATION"},
+        {0x37, "ACTION_CONTROL_HOSTAP_CSA_NOTIFICATION"},
+        {0x38, "ACTION_CONTROL_HOSTAP_ACS_ERROR_NOTIFICATION"},
+        {0x39, "ACTION_CONTROL_HOSTAP_ACS_NOTIFICATION"},
+        {0x3a, "ACTION_CONTROL_HOSTAP_DFS_CAC_COMPLETED_NOTIFICATION"},
+        {0x3b, "ACTION_CONTROL_HOSTAP_DFS_CHANNEL_AVAILABLE_NOTIFICATION"},
+        {0x3c, "ACTION_CONTROL_HOSTAP_STATS_MEASUREMENT_REQUEST"},
+        {0x3d, "ACTION_CONTROL_HOSTAP_STATS_MEASUREMENT_RESPONSE"},
+        {0x3e, "ACTION_CONTROL_HOSTAP_LOAD_MEASUREMENT_NOTIFICATION"},
+        {0x3f, "ACTION_CONTROL_HOSTAP_SET_NEIGHBOR_11K_REQUEST"},
+        {0x40, "ACTION_CONTROL_HOSTAP_REMOVE_NEIGHBOR_11K_REQUEST"},
+        {0x41, "ACTION_CONTROL_HOSTAP_SET_RESTRICTED_FAILSAFE_CHANNEL_REQUEST"},
+        {0x42, "ACTION_CONTROL_HOSTAP_SET_RESTRICTED_FAILSAFE_CHANNEL_RESPONSE"},
+        {0x43, "ACTION_CONTROL_HOSTAP_CHANNEL_SWITCH_ACS_START"},
+        {0x44, "ACTION_CONTROL_HOSTAP_UPDATE_STOP_ON_FAILURE_ATTEMPTS_REQUEST"},
+        {0x45, "ACTION_CONTROL_HOSTAP_DISABLED_BY_MASTER"},
+        {0x46, "ACTION_CONTROL_HOSTAP_ACTIVITY_NOTIFICATION"},
+        {0x47, "ACTION_CONTROL_HOSTAP_VAPS_LIST_UPDATE_NOTIFICATION"},
+        {0x48, "ACTION_CONTROL_HOSTAP_AP_DISABLED_NOTIFICATION"},
+        {0x49, "ACTION_CONTROL_HOSTAP_AP_ENABLED_NOTIFICATION"},
+        {0x4a, nullptr},
+        {0x4b, nullptr},
+        {0x4c, nullptr},
+        {0x4d, nullptr},
+        {0x4e, nullptr},
+        {0x4f, nullptr},
+        {0x50, nullptr},
+        {0x51, nullptr},
+        {0x52, nullptr},
+        {0x53, nullptr},
+        {0x54, nullptr},
+        {0x55, nullptr},
+        {0x56, nullptr},
+        {0x57, nullptr},
+        {0x58, nullptr},
+        {0x59, nullptr},
+        {0x5a, nullptr},
+        {0x5b, nullptr},
+        {0x5c, nullptr},
+        {0x5d, nullptr},
+        {0x5e, nullptr},
+        {0x5f, nullptr},
+        {0x60, nullptr},
+        {0x61, nullptr},
+        {0x62, nullptr},
+        {0x63, nullptr},
+        {0x64, "ACTION_CONTROL_CLIENT_START_MONITORING_REQUEST"},
+        {0x65, "ACTION_CONTROL_CLIENT_START_MONITORING_RESPONSE"},
+        {0x66, "ACTION_CONTROL_CLIENT_STOP_MONITORING_REQUEST"},
+        {0x67, "ACTION_CONTROL_CLIENT_RX_RSSI_MEASUREMENT_REQUEST"},
+        {0x68, "ACTION_CONTROL_CLIENT_RX_RSSI_MEASUREMENT_RESPONSE"},
+        {0x69, "ACTION_CONTROL_CLIENT_RX_RSSI_MEASUREMENT_START_NOTIFICATION"},
+        {0x6a, "ACTION_CONTROL_CLIENT_RX_RSSI_MEASUREMENT_NOTIFICATION"},
+        {0x6b, "ACTION_CONTROL_CLIENT_NO_RESPONSE_NOTIFICATION"},
+        {0x6c, "ACTION_CONTROL_CLIENT_NEW_IP_ADDRESS_NOTIFICATION"},
+        {0x6d, nullptr},
+        {0x6e, nullptr},
+        {0x6f, "ACTION_CONTROL_CLIENT_DISCONNECT_REQUEST"},
+        {0x70, "ACTION_CONTROL_CLIENT_DISCONNECT_RESPONSE"},
+        {0x71, nullptr},
+        {0x72, nullptr},
+        {0x73, "ACTION_CONTROL_CLIENT_DHCP_COMPLETE_NOTIFICATION"},
+        {0x74, "ACTION_CONTROL_CLIENT_ARP_MONITOR_NOTIFICATION"},
+        {0x75, "ACTION_CONTROL_CLIENT_BEACON_11K_REQUEST"},
+        {0x76, "ACTION_CONTROL_CLIENT_BEACON_11K_RESPONSE"},
+        {0x77, "ACTION_CONTROL_CLIENT_CHANNEL_LOAD_11K_REQUEST"},
+        {0x78, "ACTION_CONTROL_CLIENT_CHANNEL_LOAD_11K_RESPONSE"},
+        {0x79, "ACTION_CONTROL_CLIENT_STATISTICS_11K_REQUEST"},
+        {0x7a, "ACTION_CONTROL_CLIENT_STATISTICS_11K_RESPONSE"},
+        {0x7b, "ACTION_CONTROL_CLIENT_LINK_MEASUREMENT_11K_REQUEST"},
+        {0x7c, "ACTION_CONTROL_CLIENT_LINK_MEASUREMENTS_11K_RESPONSE"},
+        {0x7d, "ACTION_CONTROL_CLIENT_RX_RSSI_MEASUREMENT_CMD_RESPONSE"},
+        {0x7e, "ACTION_CONTROL_CLIENT_NO_ACTIVITY_NOTIFICATION"},
+        {0x7f, "ACTION_CONTROL_STEERING_CLIENT_SET_GROUP_REQUEST"},
+        {0x80, "ACTION_CONTROL_STEERING_CLIENT_SET_GROUP_RESPONSE"},
+        {0x81, "ACTION_CONTROL_STEERING_CLIENT_SET_REQUEST"},
+        {0x82, "ACTION_CONTROL_STEERING_CLIENT_SET_RESPONSE"},
+        {0x83, "ACTION_CONTROL_STEERING_EVENT_CLIENT_ACTIVITY_NOTIFICATION"},
+        {0x84, "ACTION_CONTROL_STEERING_EVENT_SNR_XING_NOTIFICATION"},
+        {0x85, "ACTION_CONTROL_STEERING_EVENT_PROBE_REQ_NOTIFICATION"},
+        {0x86, "ACTION_CONTROL_STEERING_EVENT_AUTH_FAIL_NOTIFICATION"},
+        {0x87, nullptr},
+        {0x88, nullptr},
+        {0x89, nullptr},
+        {0x8a, nullptr},
+        {0x8b, nullptr},
+        {0x8c, "ACTION_CONTROL_CHANNEL_SCAN_TRIGGER_SCAN_REQUEST"},
+        {0x8d, "ACTION_CONTROL_CHANNEL_SCAN_TRIGGER_SCAN_RESPONSE"},
+        {0x8e, "ACTION_CONTROL_CHANNEL_SCAN_DUMP_RESULTS_REQUEST"},
+        {0x8f, "ACTION_CONTROL_CHANNEL_SCAN_DUMP_RESULTS_RESPONSE"},
+        {0x90, "ACTION_CONTROL_CHANNEL_SCAN_TRIGGERED_NOTIFICATION"},
+        {0x91, "ACTION_CONTROL_CHANNEL_SCAN_RESULTS_NOTIFICATION"},
+        {0x92, "ACTION_CONTROL_CHANNEL_SCAN_ABORT_NOTIFICATION"},
+        {0x93, "ACTION_CONTROL_CHANNEL_SCAN_FINISHED_NOTIFICATION"},
+        {0x94, "ACTION_CONTROL_ENUM_END"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 enum eActionOp_BACKHAUL: uint8_t {
     ACTION_BACKHAUL_REGISTER_REQUEST = 0x0,
@@ -141,6 +317,32 @@ enum eActionOp_BACKHAUL: uint8_t {
     ACTION_BACKHAUL_CLIENT_RX_RSSI_MEASUREMENT_CMD_RESPONSE = 0x2a,
     ACTION_BACKHAUL_ENUM_END = 0x2b,
 };
+inline const char *eActionOp_BACKHAUL_str(eActionOp_BACKHAUL value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "ACTION_BACKHAUL_REGISTER_REQUEST"},
+        {0x1, "ACTION_BACKHAUL_REGISTER_RESPONSE"},
+        {0x2, "ACTION_BACKHAUL_ENABLE"},
+        {0x3, "ACTION_BACKHAUL_CONNECTED_NOTIFICATION"},
+        {0x4, "ACTION_BACKHAUL_DISCONNECTED_NOTIFICATION"},
+        {0x5, "ACTION_BACKHAUL_ROAM_REQUEST"},
+        {0x6, "ACTION_BACKHAUL_ROAM_RESPONSE"},
+        {0x7, "ACTION_BACKHAUL_4ADDR_CONNECTED"},
+        {0x8, "ACTION_BACKHAUL_DL_RSSI_REPORT_NOTIFICATION"},
+        {0x9, "ACTION_BACKHAUL_UPDATE_STOP_ON_FAILURE_ATTEMPTS_REQUEST"},
+        {0xa, "ACTION_BACKHAUL_RESET"},
+        {0xb, "ACTION_BACKHAUL_BUSY_NOTIFICATION"},
+        {0xc, "ACTION_BACKHAUL_ENABLE_APS_REQUEST"},
+        {0xd, "ACTION_BACKHAUL_ONBOARDING_FINISHED_NOTIFICATION"},
+        {0xe, "ACTION_BACKHAUL_HOSTAP_VAPS_LIST_UPDATE_NOTIFICATION"},
+        {0xf, "ACTION_BACKHAUL_CLIENT_ASSOCIATED_NOTIFICATION"},
+        {0x10, "ACTION_BACKHAUL_CLIENT_DISCONNECTED_NOTIFICATION"},
+        {0x28, "ACTION_BACKHAUL_CLIENT_RX_RSSI_MEASUREMENT_REQUEST"},
+        {0x29, "ACTION_BACKHAUL_CLIENT_RX_RSSI_MEASUREMENT_RESPONSE"},
+        {0x2a, "ACTION_BACKHAUL_CLIENT_RX_RSSI_MEASUREMENT_CMD_RESPONSE"},
+        {0x2b, "ACTION_BACKHAUL_ENUM_END"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), false);
+}
 
 enum eActionOp_PLATFORM: uint8_t {
     ACTION_PLATFORM_SON_SLAVE_REGISTER_REQUEST = 0x0,
@@ -173,6 +375,40 @@ enum eActionOp_PLATFORM: uint8_t {
     ACTION_PLATFORM_ERROR_NOTIFICATION = 0x64,
     ACTION_PLATFORM_ENUM_END = 0x65,
 };
+inline const char *eActionOp_PLATFORM_str(eActionOp_PLATFORM value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "ACTION_PLATFORM_SON_SLAVE_REGISTER_REQUEST"},
+        {0x1, "ACTION_PLATFORM_SON_SLAVE_REGISTER_RESPONSE"},
+        {0x2, "ACTION_PLATFORM_SETTINGS_REQUEST"},
+        {0x3, "ACTION_PLATFORM_SETTINGS_RESPONSE"},
+        {0x4, "ACTION_PLATFORM_ARP_MONITOR_NOTIFICATION"},
+        {0x5, "ACTION_PLATFORM_DHCP_MONITOR_NOTIFICATION"},
+        {0x6, "ACTION_PLATFORM_CHANGE_MODULE_LOGGING_LEVEL"},
+        {0x8, "ACTION_PLATFORM_ARP_QUERY_REQUEST"},
+        {0x9, "ACTION_PLATFORM_ARP_QUERY_RESPONSE"},
+        {0xa, "ACTION_PLATFORM_ONBOARD_QUERY_REQUEST"},
+        {0xb, "ACTION_PLATFORM_ONBOARD_QUERY_RESPONSE"},
+        {0xe, "ACTION_PLATFORM_WIFI_CREDENTIALS_GET_REQUEST"},
+        {0xf, "ACTION_PLATFORM_WIFI_CREDENTIALS_GET_RESPONSE"},
+        {0x10, "ACTION_PLATFORM_ADMIN_CREDENTIALS_GET_REQUEST"},
+        {0x11, "ACTION_PLATFORM_ADMIN_CREDENTIALS_GET_RESPONSE"},
+        {0x12, "ACTION_PLATFORM_DEVICE_INFO_GET_REQUEST"},
+        {0x13, "ACTION_PLATFORM_DEVICE_INFO_GET_RESPONSE"},
+        {0x14, "ACTION_PLATFORM_LOCAL_MASTER_GET_REQUEST"},
+        {0x15, "ACTION_PLATFORM_LOCAL_MASTER_GET_RESPONSE"},
+        {0x1a, "ACTION_PLATFORM_WLAN_PARAMS_CHANGED_NOTIFICATION"},
+        {0x24, "ACTION_PLATFORM_ONBOARD_SET_REQUEST"},
+        {0x25, "ACTION_PLATFORM_WPS_ONBOARDING_REQUEST"},
+        {0x32, "ACTION_PLATFORM_GET_MASTER_SLAVE_VERSIONS_REQUEST"},
+        {0x33, "ACTION_PLATFORM_GET_MASTER_SLAVE_VERSIONS_RESPONSE"},
+        {0x34, "ACTION_PLATFORM_VERSION_MISMATCH_NOTIFICATION"},
+        {0x35, "ACTION_PLATFORM_MASTER_SLAVE_VERSIONS_NOTIFICATION"},
+        {0x36, "ACTION_PLATFORM_SON_SLAVE_BACKHAUL_CONNECTION_COMPLETE_NOTIFICATION"},
+        {0x64, "ACTION_PLATFORM_ERROR_NOTIFICATION"},
+        {0x65, "ACTION_PLATFORM_ENUM_END"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), false);
+}
 
 enum eActionOp_APMANAGER: uint8_t {
     ACTION_APMANAGER_INIT_DONE_NOTIFICATION = 0x0,
@@ -221,6 +457,86 @@ enum eActionOp_APMANAGER: uint8_t {
     ACTION_APMANAGER_READ_ACS_REPORT_RESPONSE = 0x49,
     ACTION_APMANAGER_ENUM_END = 0x4a,
 };
+inline const char *eActionOp_APMANAGER_str(eActionOp_APMANAGER value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "ACTION_APMANAGER_INIT_DONE_NOTIFICATION"},
+        {0x1, "ACTION_APMANAGER_JOINED_NOTIFICATION"},
+        {0x2, "ACTION_APMANAGER_ENABLE_APS_REQUEST"},
+        {0x3, "ACTION_APMANAGER_ENABLE_APS_RESPONSE"},
+        {0x4, "ACTION_APMANAGER_ACK"},
+        {0x5, nullptr},
+        {0x6, nullptr},
+        {0x7, nullptr},
+        {0x8, nullptr},
+        {0x9, nullptr},
+        {0xa, nullptr},
+        {0xb, nullptr},
+        {0xc, "ACTION_APMANAGER_HOSTAP_CHANNEL_SWITCH_ACS_START"},
+        {0xd, "ACTION_APMANAGER_HOSTAP_CSA_ERROR_NOTIFICATION"},
+        {0xe, "ACTION_APMANAGER_HOSTAP_CSA_NOTIFICATION"},
+        {0xf, "ACTION_APMANAGER_HOSTAP_ACS_ERROR_NOTIFICATION"},
+        {0x10, "ACTION_APMANAGER_HOSTAP_ACS_NOTIFICATION"},
+        {0x11, "ACTION_APMANAGER_HOSTAP_SET_NEIGHBOR_11K_REQUEST"},
+        {0x12, "ACTION_APMANAGER_HOSTAP_REMOVE_NEIGHBOR_11K_REQUEST"},
+        {0x13, "ACTION_APMANAGER_HOSTAP_DFS_CAC_COMPLETED_NOTIFICATION"},
+        {0x14, "ACTION_APMANAGER_HOSTAP_DFS_CHANNEL_AVAILABLE_NOTIFICATION"},
+        {0x15, "ACTION_APMANAGER_HOSTAP_ADD_4ADDR_STA_UPDATE"},
+        {0x16, "ACTION_APMANAGER_HOSTAP_DEL_4ADDR_STA_UPDATE"},
+        {0x17, "ACTION_APMANAGER_HOSTAP_SET_RESTRICTED_FAILSAFE_CHANNEL_REQUEST"},
+        {0x18, "ACTION_APMANAGER_HOSTAP_SET_RESTRICTED_FAILSAFE_CHANNEL_RESPONSE"},
+        {0x19, "ACTION_APMANAGER_HOSTAP_AP_DISABLED_NOTIFICATION"},
+        {0x1a, "ACTION_APMANAGER_HOSTAP_AP_ENABLED_NOTIFICATION"},
+        {0x1b, "ACTION_APMANAGER_HOSTAP_VAPS_LIST_UPDATE_REQUEST"},
+        {0x1c, "ACTION_APMANAGER_HOSTAP_VAPS_LIST_UPDATE_NOTIFICATION"},
+        {0x1d, "ACTION_APMANAGER_HOSTAP_GENERATE_CLIENT_ASSOCIATION_NOTIFICATIONS_REQUEST"},
+        {0x1e, nullptr},
+        {0x1f, nullptr},
+        {0x20, nullptr},
+        {0x21, nullptr},
+        {0x22, nullptr},
+        {0x23, nullptr},
+        {0x24, nullptr},
+        {0x25, nullptr},
+        {0x26, nullptr},
+        {0x27, nullptr},
+        {0x28, "ACTION_APMANAGER_CLIENT_ASSOCIATED_NOTIFICATION"},
+        {0x29, "ACTION_APMANAGER_CLIENT_DISCONNECTED_NOTIFICATION"},
+        {0x2a, "ACTION_APMANAGER_CLIENT_DISCONNECT_REQUEST"},
+        {0x2b, "ACTION_APMANAGER_CLIENT_DISCONNECT_RESPONSE"},
+        {0x2c, "ACTION_APMANAGER_CLIENT_DISALLOW_REQUEST"},
+        {0x2d, "ACTION_APMANAGER_CLIENT_ALLOW_REQUEST"},
+        {0x2e, "ACTION_APMANAGER_CLIENT_RX_RSSI_MEASUREMENT_REQUEST"},
+        {0x2f, "ACTION_APMANAGER_CLIENT_RX_RSSI_MEASUREMENT_RESPONSE"},
+        {0x30, "ACTION_APMANAGER_CLIENT_BSS_STEER_REQUEST"},
+        {0x31, "ACTION_APMANAGER_CLIENT_BSS_STEER_RESPONSE"},
+        {0x32, "ACTION_APMANAGER_CLIENT_RX_RSSI_MEASUREMENT_CMD_RESPONSE"},
+        {0x33, "ACTION_APMANAGER_CLIENT_IRE_CONNECTED_NOTIFICATION"},
+        {0x34, "ACTION_APMANAGER_STEERING_CLIENT_SET_REQUEST"},
+        {0x35, "ACTION_APMANAGER_STEERING_CLIENT_SET_RESPONSE"},
+        {0x36, "ACTION_APMANAGER_STEERING_EVENT_PROBE_REQ_NOTIFICATION"},
+        {0x37, "ACTION_APMANAGER_STEERING_EVENT_AUTH_FAIL_NOTIFICATION"},
+        {0x38, "ACTION_APMANAGER_WIFI_CREDENTIALS_UPDATE_REQUEST"},
+        {0x39, nullptr},
+        {0x3a, nullptr},
+        {0x3b, nullptr},
+        {0x3c, nullptr},
+        {0x3d, nullptr},
+        {0x3e, nullptr},
+        {0x3f, nullptr},
+        {0x40, nullptr},
+        {0x41, nullptr},
+        {0x42, nullptr},
+        {0x43, nullptr},
+        {0x44, nullptr},
+        {0x45, nullptr},
+        {0x46, "ACTION_APMANAGER_4ADDR_STA_JOINED"},
+        {0x47, "ACTION_APMANAGER_HEARTBEAT_NOTIFICATION"},
+        {0x48, "ACTION_APMANAGER_READ_ACS_REPORT_REQUEST"},
+        {0x49, "ACTION_APMANAGER_READ_ACS_REPORT_RESPONSE"},
+        {0x4a, "ACTION_APMANAGER_ENUM_END"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 enum eActionOp_MONITOR: uint8_t {
     ACTION_MONITOR_JOINED_NOTIFICATION = 0x0,
@@ -271,6 +587,98 @@ enum eActionOp_MONITOR: uint8_t {
     ACTION_MONITOR_STEERING_EVENT_SNR_XING_NOTIFICATION = 0x55,
     ACTION_MONITOR_ENUM_END = 0x56,
 };
+inline const char *eActionOp_MONITOR_str(eActionOp_MONITOR value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "ACTION_MONITOR_JOINED_NOTIFICATION"},
+        {0x1, "ACTION_MONITOR_SON_CONFIG_UPDATE"},
+        {0x2, "ACTION_MONITOR_CHANGE_MODULE_LOGGING_LEVEL"},
+        {0x3, "ACTION_MONITOR_ERROR_NOTIFICATION"},
+        {0x4, "ACTION_MONITOR_ERROR_NOTIFICATION_ACK"},
+        {0x5, "ACTION_MONITOR_HEARTBEAT_NOTIFICATION"},
+        {0x6, "ACTION_MONITOR_HOSTAP_AP_DISABLED_NOTIFICATION"},
+        {0x7, nullptr},
+        {0x8, nullptr},
+        {0x9, nullptr},
+        {0xa, nullptr},
+        {0xb, nullptr},
+        {0xc, nullptr},
+        {0xd, nullptr},
+        {0xe, nullptr},
+        {0xf, nullptr},
+        {0x10, nullptr},
+        {0x11, nullptr},
+        {0x12, nullptr},
+        {0x13, nullptr},
+        {0x14, "ACTION_MONITOR_CLIENT_START_MONITORING_REQUEST"},
+        {0x15, "ACTION_MONITOR_CLIENT_START_MONITORING_RESPONSE"},
+        {0x16, "ACTION_MONITOR_CLIENT_STOP_MONITORING_REQUEST"},
+        {0x17, "ACTION_MONITOR_CLIENT_RX_RSSI_MEASUREMENT_REQUEST"},
+        {0x18, "ACTION_MONITOR_CLIENT_DISCONNECT_REQUEST"},
+        {0x19, "ACTION_MONITOR_CLIENT_RX_RSSI_MEASUREMENT_NOTIFICATION"},
+        {0x1a, "ACTION_MONITOR_CLIENT_RX_RSSI_MEASUREMENT_RESPONSE"},
+        {0x1b, "ACTION_MONITOR_CLIENT_NO_RESPONSE_NOTIFICATION"},
+        {0x1c, "ACTION_MONITOR_CLIENT_RX_RSSI_MEASUREMENT_START_NOTIFICATION"},
+        {0x1d, "ACTION_MONITOR_CLIENT_BEACON_11K_REQUEST"},
+        {0x1e, "ACTION_MONITOR_CLIENT_BEACON_11K_RESPONSE"},
+        {0x1f, "ACTION_MONITOR_CLIENT_CHANNEL_LOAD_11K_REQUEST"},
+        {0x20, "ACTION_MONITOR_CLIENT_CHANNEL_LOAD_11K_RESPONSE"},
+        {0x21, "ACTION_MONITOR_CLIENT_STATISTICS_11K_REQUEST"},
+        {0x22, "ACTION_MONITOR_CLIENT_STATISTICS_11K_RESPONSE"},
+        {0x23, "ACTION_MONITOR_CLIENT_LINK_MEASUREMENT_11K_REQUEST"},
+        {0x24, "ACTION_MONITOR_CLIENT_LINK_MEASUREMENTS_11K_RESPONSE"},
+        {0x25, "ACTION_MONITOR_CLIENT_RX_RSSI_MEASUREMENT_CMD_RESPONSE"},
+        {0x26, "ACTION_MONITOR_CLIENT_NO_ACTIVITY_NOTIFICATION"},
+        {0x27, "ACTION_MONITOR_CLIENT_NEW_IP_ADDRESS_NOTIFICATION"},
+        {0x28, nullptr},
+        {0x29, nullptr},
+        {0x2a, nullptr},
+        {0x2b, nullptr},
+        {0x2c, nullptr},
+        {0x2d, nullptr},
+        {0x2e, nullptr},
+        {0x2f, nullptr},
+        {0x30, nullptr},
+        {0x31, nullptr},
+        {0x32, "ACTION_MONITOR_HOSTAP_STATS_MEASUREMENT_REQUEST"},
+        {0x33, "ACTION_MONITOR_HOSTAP_STATS_MEASUREMENT_RESPONSE"},
+        {0x34, "ACTION_MONITOR_HOSTAP_LOAD_MEASUREMENT_NOTIFICATION"},
+        {0x35, "ACTION_MONITOR_HOSTAP_ACTIVITY_NOTIFICATION"},
+        {0x36, "ACTION_MONITOR_HOSTAP_STATUS_CHANGED_NOTIFICATION"},
+        {0x37, nullptr},
+        {0x38, nullptr},
+        {0x39, nullptr},
+        {0x3a, nullptr},
+        {0x3b, nullptr},
+        {0x3c, "ACTION_MONITOR_CHANNEL_SCAN_TRIGGER_SCAN_REQUEST"},
+        {0x3d, "ACTION_MONITOR_CHANNEL_SCAN_TRIGGER_SCAN_RESPONSE"},
+        {0x3e, "ACTION_MONITOR_CHANNEL_SCAN_TRIGGERED_NOTIFICATION"},
+        {0x3f, "ACTION_MONITOR_CHANNEL_SCAN_DUMP_RESULTS_REQUEST"},
+        {0x40, "ACTION_MONITOR_CHANNEL_SCAN_DUMP_RESULTS_RESPONSE"},
+        {0x41, "ACTION_MONITOR_CHANNEL_SCAN_RESULTS_NOTIFICATION"},
+        {0x42, "ACTION_MONITOR_CHANNEL_SCAN_ABORT_NOTIFICATION"},
+        {0x43, "ACTION_MONITOR_CHANNEL_SCAN_FINISHED_NOTIFICATION"},
+        {0x44, nullptr},
+        {0x45, nullptr},
+        {0x46, nullptr},
+        {0x47, nullptr},
+        {0x48, nullptr},
+        {0x49, nullptr},
+        {0x4a, nullptr},
+        {0x4b, nullptr},
+        {0x4c, nullptr},
+        {0x4d, nullptr},
+        {0x4e, nullptr},
+        {0x4f, nullptr},
+        {0x50, "ACTION_MONITOR_STEERING_CLIENT_SET_GROUP_REQUEST"},
+        {0x51, "ACTION_MONITOR_STEERING_CLIENT_SET_GROUP_RESPONSE"},
+        {0x52, "ACTION_MONITOR_STEERING_CLIENT_SET_REQUEST"},
+        {0x53, "ACTION_MONITOR_STEERING_CLIENT_SET_RESPONSE"},
+        {0x54, "ACTION_MONITOR_STEERING_EVENT_CLIENT_ACTIVITY_NOTIFICATION"},
+        {0x55, "ACTION_MONITOR_STEERING_EVENT_SNR_XING_NOTIFICATION"},
+        {0x56, "ACTION_MONITOR_ENUM_END"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 enum eActionOp_CLI: uint8_t {
     ACTION_CLI_RESPONSE_NONE = 0x0,
@@ -303,6 +711,40 @@ enum eActionOp_CLI: uint8_t {
     ACTION_CLI_HOSTAP_STATS_MEASUREMENT = 0x7d,
     ACTION_CLI_ENUM_END = 0x7e,
 };
+inline const char *eActionOp_CLI_str(eActionOp_CLI value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "ACTION_CLI_RESPONSE_NONE"},
+        {0x1, "ACTION_CLI_RESPONSE_STR"},
+        {0x2, "ACTION_CLI_RESPONSE_INT"},
+        {0x3, "ACTION_CLI_ENABLE_DEBUG"},
+        {0x14, "ACTION_CLI_ENABLE_DIAGNOSTICS_MEASUREMENTS"},
+        {0x15, "ACTION_CLI_SET_SLAVES_STOP_ON_FAILURE_ATTEMPTS"},
+        {0x16, "ACTION_CLI_ENABLE_LOAD_BALANCER"},
+        {0x1e, "ACTION_CLI_DUMP_NODE_INFO"},
+        {0x1f, "ACTION_CLI_CROSS_RX_RSSI_MEASUREMENT"},
+        {0x21, "ACTION_CLI_OPTIMAL_PATH_TASK"},
+        {0x22, "ACTION_CLI_LOAD_BALANCER_TASK"},
+        {0x23, "ACTION_CLI_IRE_NETWORK_OPTIMIZATION_TASK"},
+        {0x24, "ACTION_CLI_BACKHAUL_SCAN_RESULTS"},
+        {0x25, "ACTION_CLI_BACKHAUL_ROAM_REQUEST"},
+        {0x26, "ACTION_CLI_PING_SLAVE_REQUEST"},
+        {0x27, "ACTION_CLI_PING_ALL_SLAVES_REQUEST"},
+        {0x50, "ACTION_CLI_CLIENT_ALLOW_REQUEST"},
+        {0x51, "ACTION_CLI_CLIENT_DISALLOW_REQUEST"},
+        {0x52, "ACTION_CLI_CLIENT_DISCONNECT_REQUEST"},
+        {0x53, "ACTION_CLI_CLIENT_BSS_STEER_REQUEST"},
+        {0x54, "ACTION_CLI_CLIENT_LINK_MEASUREMENT_11K_REQUEST"},
+        {0x55, "ACTION_CLI_CLIENT_CHANNEL_LOAD_11K_REQUEST"},
+        {0x56, "ACTION_CLI_CLIENT_BEACON_11K_REQUEST"},
+        {0x57, "ACTION_CLI_CLIENT_STATISTICS_11K_REQUEST"},
+        {0x7a, "ACTION_CLI_HOSTAP_CHANNEL_SWITCH_REQUEST"},
+        {0x7b, "ACTION_CLI_HOSTAP_SET_NEIGHBOR_11K_REQUEST"},
+        {0x7c, "ACTION_CLI_HOSTAP_REMOVE_NEIGHBOR_11K_REQUEST"},
+        {0x7d, "ACTION_CLI_HOSTAP_STATS_MEASUREMENT"},
+        {0x7e, "ACTION_CLI_ENUM_END"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), false);
+}
 
 enum eActionOp_BML: uint8_t {
     ACTION_BML_PING_REQUEST = 0x0,
@@ -408,6 +850,113 @@ enum eActionOp_BML: uint8_t {
     ACTION_BML_CHANNEL_SCAN_DUMP_RESULTS_RESPONSE = 0xd5,
     ACTION_BML_ENUM_END = 0xd6,
 };
+inline const char *eActionOp_BML_str(eActionOp_BML value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "ACTION_BML_PING_REQUEST"},
+        {0x1, "ACTION_BML_PING_RESPONSE"},
+        {0x2, "ACTION_BML_NW_MAP_REQUEST"},
+        {0x3, "ACTION_BML_NW_MAP_RESPONSE"},
+        {0xa, "ACTION_BML_REGISTER_TO_NW_MAP_UPDATES_REQUEST"},
+        {0xb, "ACTION_BML_REGISTER_TO_NW_MAP_UPDATES_RESPONSE"},
+        {0xc, "ACTION_BML_UNREGISTER_FROM_NW_MAP_UPDATES_REQUEST"},
+        {0xd, "ACTION_BML_UNREGISTER_FROM_NW_MAP_UPDATES_RESPONSE"},
+        {0xe, "ACTION_BML_REGISTER_TO_STATS_UPDATES_REQUEST"},
+        {0xf, "ACTION_BML_REGISTER_TO_STATS_UPDATES_RESPONSE"},
+        {0x10, "ACTION_BML_UNREGISTER_FROM_STATS_UPDATES_REQUEST"},
+        {0x11, "ACTION_BML_UNREGISTER_FROM_STATS_UPDATES_RESPONSE"},
+        {0x12, "ACTION_BML_REGISTER_TO_EVENTS_UPDATES_REQUEST"},
+        {0x13, "ACTION_BML_REGISTER_TO_EVENTS_UPDATES_RESPONSE"},
+        {0x14, "ACTION_BML_UNREGISTER_FROM_EVENTS_UPDATES_REQUEST"},
+        {0x15, "ACTION_BML_UNREGISTER_FROM_EVENTS_UPDATES_RESPONSE"},
+        {0x1e, "ACTION_BML_NW_MAP_UPDATE"},
+        {0x1f, "ACTION_BML_STATS_UPDATE"},
+        {0x20, "ACTION_BML_EVENTS_UPDATE"},
+        {0x38, "ACTION_BML_SET_LEGACY_CLIENT_ROAMING_REQUEST"},
+        {0x39, "ACTION_BML_SET_LEGACY_CLIENT_ROAMING_RESPONSE"},
+        {0x3a, "ACTION_BML_GET_LEGACY_CLIENT_ROAMING_REQUEST"},
+        {0x3b, "ACTION_BML_GET_LEGACY_CLIENT_ROAMING_RESPONSE"},
+        {0x3c, "ACTION_BML_SET_CLIENT_ROAMING_REQUEST"},
+        {0x3d, "ACTION_BML_SET_CLIENT_ROAMING_RESPONSE"},
+        {0x3e, "ACTION_BML_GET_CLIENT_ROAMING_REQUEST"},
+        {0x3f, "ACTION_BML_GET_CLIENT_ROAMING_RESPONSE"},
+        {0x40, "ACTION_BML_SET_CLIENT_BAND_STEERING_REQUEST"},
+        {0x41, "ACTION_BML_SET_CLIENT_BAND_STEERING_RESPONSE"},
+        {0x42, "ACTION_BML_GET_CLIENT_BAND_STEERING_REQUEST"},
+        {0x43, "ACTION_BML_GET_CLIENT_BAND_STEERING_RESPONSE"},
+        {0x44, "ACTION_BML_SET_IRE_ROAMING_REQUEST"},
+        {0x45, "ACTION_BML_SET_IRE_ROAMING_RESPONSE"},
+        {0x46, "ACTION_BML_GET_IRE_ROAMING_REQUEST"},
+        {0x47, "ACTION_BML_GET_IRE_ROAMING_RESPONSE"},
+        {0x48, "ACTION_BML_SET_LOAD_BALANCER_REQUEST"},
+        {0x49, "ACTION_BML_SET_LOAD_BALANCER_RESPONSE"},
+        {0x4a, "ACTION_BML_GET_LOAD_BALANCER_REQUEST"},
+        {0x4b, "ACTION_BML_GET_LOAD_BALANCER_RESPONSE"},
+        {0x4c, "ACTION_BML_SET_SERVICE_FAIRNESS_REQUEST"},
+        {0x4d, "ACTION_BML_SET_SERVICE_FAIRNESS_RESPONSE"},
+        {0x4e, "ACTION_BML_GET_SERVICE_FAIRNESS_REQUEST"},
+        {0x4f, "ACTION_BML_GET_SERVICE_FAIRNESS_RESPONSE"},
+        {0x50, "ACTION_BML_SET_CLIENT_ROAMING_PREFER_SIGNAL_STRENGTH_REQUEST"},
+        {0x51, "ACTION_BML_SET_CLIENT_ROAMING_PREFER_SIGNAL_STRENGTH_RESPONSE"},
+        {0x52, "ACTION_BML_GET_CLIENT_ROAMING_PREFER_SIGNAL_STRENGTH_REQUEST"},
+        {0x53, "ACTION_BML_GET_CLIENT_ROAMING_PREFER_SIGNAL_STRENGTH_RESPONSE"},
+        {0x54, "ACTION_BML_SET_DFS_REENTRY_REQUEST"},
+        {0x55, "ACTION_BML_SET_DFS_REENTRY_RESPONSE"},
+        {0x56, "ACTION_BML_GET_DFS_REENTRY_REQUEST"},
+        {0x57, "ACTION_BML_GET_DFS_REENTRY_RESPONSE"},
+        {0x5a, "ACTION_BML_WIFI_CREDENTIALS_UPDATE_REQUEST"},
+        {0x5b, "ACTION_BML_WIFI_CREDENTIALS_UPDATE_RESPONSE"},
+        {0x5c, "ACTION_BML_SET_RESTRICTED_CHANNELS_REQUEST"},
+        {0x5d, "ACTION_BML_SET_RESTRICTED_CHANNELS_RESPONSE"},
+        {0x5e, "ACTION_BML_GET_RESTRICTED_CHANNELS_REQUEST"},
+        {0x5f, "ACTION_BML_GET_RESTRICTED_CHANNELS_RESPONSE"},
+        {0x60, "ACTION_BML_SET_CERTIFICATION_MODE_REQUEST"},
+        {0x61, "ACTION_BML_SET_CERTIFICATION_MODE_RESPONSE"},
+        {0x62, "ACTION_BML_GET_CERTIFICATION_MODE_REQUEST"},
+        {0x63, "ACTION_BML_GET_CERTIFICATION_MODE_RESPONSE"},
+        {0x8c, "ACTION_BML_CHANGE_MODULE_LOGGING_LEVEL_REQUEST"},
+        {0x8d, "ACTION_BML_CHANGE_MODULE_LOGGING_LEVEL_RESPONSE"},
+        {0x96, "ACTION_BML_SET_VAP_LIST_CREDENTIALS_REQUEST"},
+        {0x97, "ACTION_BML_SET_VAP_LIST_CREDENTIALS_RESPONSE"},
+        {0x98, "ACTION_BML_GET_VAP_LIST_CREDENTIALS_REQUEST"},
+        {0x99, "ACTION_BML_GET_VAP_LIST_CREDENTIALS_RESPONSE"},
+        {0xa3, "ACTION_BML_STEERING_SET_GROUP_REQUEST"},
+        {0xa4, "ACTION_BML_STEERING_SET_GROUP_RESPONSE"},
+        {0xa5, "ACTION_BML_STEERING_CLIENT_SET_REQUEST"},
+        {0xa6, "ACTION_BML_STEERING_CLIENT_SET_RESPONSE"},
+        {0xa7, "ACTION_BML_STEERING_EVENT_REGISTER_UNREGISTER_REQUEST"},
+        {0xa8, "ACTION_BML_STEERING_EVENT_REGISTER_UNREGISTER_RESPONSE"},
+        {0xa9, "ACTION_BML_STEERING_CLIENT_DISCONNECT_REQUEST"},
+        {0xaa, "ACTION_BML_STEERING_CLIENT_DISCONNECT_RESPONSE"},
+        {0xab, "ACTION_BML_STEERING_CLIENT_MEASURE_REQUEST"},
+        {0xac, "ACTION_BML_STEERING_CLIENT_MEASURE_RESPONSE"},
+        {0xb2, "ACTION_BML_STEERING_EVENT_PROBE_REQ_NOTIFICATION"},
+        {0xb3, "ACTION_BML_STEERING_EVENT_CLIENT_CONNECT_NOTIFICATION"},
+        {0xb4, "ACTION_BML_STEERING_EVENT_CLIENT_DISCONNECT_NOTIFICATION"},
+        {0xb5, "ACTION_BML_STEERING_EVENT_CLIENT_ACTIVITY_NOTIFICATION"},
+        {0xb6, "ACTION_BML_STEERING_EVENT_SNR_XING_NOTIFICATION"},
+        {0xb7, "ACTION_BML_STEERING_EVENT_SNR_NOTIFICATION"},
+        {0xb8, "ACTION_BML_STEERING_EVENT_AUTH_FAIL_NOTIFICATION"},
+        {0xb9, "ACTION_BML_STEERING_EVENTS_UPDATE"},
+        {0xbe, "ACTION_BML_TRIGGER_CHANNEL_SELECTION_REQUEST"},
+        {0xbf, "ACTION_BML_TRIGGER_TOPOLOGY_QUERY"},
+        {0xc8, "ACTION_BML_CHANNEL_SCAN_SET_CONTINUOUS_PARAMS_REQUEST"},
+        {0xc9, "ACTION_BML_CHANNEL_SCAN_SET_CONTINUOUS_PARAMS_RESPONSE"},
+        {0xca, "ACTION_BML_CHANNEL_SCAN_GET_CONTINUOUS_PARAMS_REQUEST"},
+        {0xcb, "ACTION_BML_CHANNEL_SCAN_GET_CONTINUOUS_PARAMS_RESPONSE"},
+        {0xcc, "ACTION_BML_CHANNEL_SCAN_SET_CONTINUOUS_ENABLE_REQUEST"},
+        {0xcd, "ACTION_BML_CHANNEL_SCAN_SET_CONTINUOUS_ENABLE_RESPONSE"},
+        {0xce, "ACTION_BML_CHANNEL_SCAN_GET_CONTINUOUS_ENABLE_REQUEST"},
+        {0xcf, "ACTION_BML_CHANNEL_SCAN_GET_CONTINUOUS_ENABLE_RESPONSE"},
+        {0xd0, "ACTION_BML_CHANNEL_SCAN_START_SCAN_REQUEST"},
+        {0xd1, "ACTION_BML_CHANNEL_SCAN_START_SCAN_RESPONSE"},
+        {0xd2, "ACTION_BML_CHANNEL_SCAN_GET_RESULTS_REQUEST"},
+        {0xd3, "ACTION_BML_CHANNEL_SCAN_GET_RESULTS_RESPONSE"},
+        {0xd4, "ACTION_BML_CHANNEL_SCAN_DUMP_RESULTS_REQUEST"},
+        {0xd5, "ACTION_BML_CHANNEL_SCAN_DUMP_RESULTS_RESPONSE"},
+        {0xd6, "ACTION_BML_ENUM_END"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), false);
+}
 
 
 }; // close namespace: beerocks_message
@@ -16,11 +16,10 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
-#include <string.h>
 #include <memory>
 #include <tlvf/BaseClass.h>
-#include <tlvf/ClassList.h>
 #include <tuple>
+#include <string.h>
 #include <tlvf/tlvfutils.h>
 #include "beerocks/tlvf/beerocks_message_common.h"
 #include "beerocks/tlvf/beerocks_message_cli_net_map.h"
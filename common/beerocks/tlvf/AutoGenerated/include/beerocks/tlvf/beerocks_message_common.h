@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 #include "beerocks/tlvf/beerocks_message_action.h"
 #include "bcl/beerocks_message_structs.h"
 
@@ -29,12 +30,31 @@ enum eWiFiSec: uint8_t {
     eWiFiSec_WPA2_PSK = 0x4,
     eWiFiSec_WPA_WPA2_PSK = 0x5,
 };
+inline const char *eWiFiSec_str(eWiFiSec value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "eWiFiSec_None"},
+        {0x1, "eWiFiSec_WEP64"},
+        {0x2, "eWiFiSec_WEP128"},
+        {0x3, "eWiFiSec_WPA_PSK"},
+        {0x4, "eWiFiSec_WPA2_PSK"},
+        {0x5, "eWiFiSec_WPA_WPA2_PSK"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 enum eDHCPOp: uint8_t {
     eDHCPOp_Add = 0x0,
     eDHCPOp_Del = 0x1,
     eDHCPOp_Old = 0x2,
 };
+inline const char *eDHCPOp_str(eDHCPOp value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "eDHCPOp_Add"},
+        {0x1, "eDHCPOp_Del"},
+        {0x2, "eDHCPOp_Old"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 typedef struct sVapInfo {
     sMacAddr mac;
@@ -1083,18 +1103,42 @@ enum eDisconnectSource: uint8_t {
     eDisconnect_Source_Local = 0x1,
     eDisconnect_Source_Remote = 0x2,
 };
+inline const char *eDisconnectSource_str(eDisconnectSource value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "eDisconnect_Source_Unknown"},
+        {0x1, "eDisconnect_Source_Local"},
+        {0x2, "eDisconnect_Source_Remote"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 enum eDisconnectType: uint8_t {
     eDisconnect_Type_Unknown = 0x0,
     eDisconnect_Type_Disassoc = 0x1,
     eDisconnect_Type_Deauth = 0x2,
 };
+inline const char *eDisconnectType_str(eDisconnectType value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "eDisconnect_Type_Unknown"},
+        {0x1, "eDisconnect_Type_Disassoc"},
+        {0x2, "eDisconnect_Type_Deauth"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 enum eSteeringSnrChange: uint8_t {
     eWifi_Steering_Snr_Unchanged = 0x0,
     eWifi_Steering_Snr_Higher = 0x1,
     eWifi_Steering_Snr_Lower = 0x2,
 };
+inline const char *eSteeringSnrChange_str(eSteeringSnrChange value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "eWifi_Steering_Snr_Unchanged"},
+        {0x1, "eWifi_Steering_Snr_Higher"},
+        {0x2, "eWifi_Steering_Snr_Lower"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 enum eSteeringEventType: uint8_t {
     eWifi_Steering_Event_Probe_Req = 0x1,
@@ -1105,6 +1149,18 @@ enum eSteeringEventType: uint8_t {
     eWifi_Steering_Event_Snr = 0x6,
     eWifi_Steering_Event_Auth_Fail = 0x7,
 };
+inline const char *eSteeringEventType_str(eSteeringEventType value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x1, "eWifi_Steering_Event_Probe_Req"},
+        {0x2, "eWifi_Steering_Event_Client_Connect"},
+        {0x3, "eWifi_Steering_Event_Client_Disconnect"},
+        {0x4, "eWifi_Steering_Event_Client_Activity"},
+        {0x5, "eWifi_Steering_Event_Snr_Xing"},
+        {0x6, "eWifi_Steering_Event_Snr"},
+        {0x7, "eWifi_Steering_Event_Auth_Fail"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 typedef struct sSteeringEvConnect {
     sMacAddr client_mac;
@@ -1243,12 +1299,28 @@ enum eChannelScanResultMode: uint8_t {
     eMode_AdHoc = 0x1,
     eMode_Infrastructure = 0x2,
 };
+inline const char *eChannelScanResultMode_str(eChannelScanResultMode value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "eMode_NA"},
+        {0x1, "eMode_AdHoc"},
+        {0x2, "eMode_Infrastructure"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 enum eChannelScanResultEncryptionMode: uint8_t {
     eEncryption_Mode_NA = 0x0,
     eEncryption_Mode_AES = 0x1,
     eEncryption_Mode_TKIP = 0x2,
 };
+inline const char *eChannelScanResultEncryptionMode_str(eChannelScanResultEncryptionMode value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "eEncryption_Mode_NA"},
+        {0x1, "eEncryption_Mode_AES"},
+        {0x2, "eEncryption_Mode_TKIP"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 enum eChannelScanResultSecurityMode: uint8_t {
     eSecurity_Mode_None = 0x0,
@@ -1256,12 +1328,29 @@ enum eChannelScanResultSecurityMode: uint8_t {
     eSecurity_Mode_WPA = 0x2,
     eSecurity_Mode_WPA2 = 0x3,
 };
+inline const char *eChannelScanResultSecurityMode_str(eChannelScanResultSecurityMode value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "eSecurity_Mode_None"},
+        {0x1, "eSecurity_Mode_WEP"},
+        {0x2, "eSecurity_Mode_WPA"},
+        {0x3, "eSecurity_Mode_WPA2"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 enum eChannelScanResultOperatingFrequencyBand: uint8_t {
     eOperating_Freq_Band_NA = 0x0,
     eOperating_Freq_Band_2_4GHz = 0x1,
     eOperating_Freq_Band_5GHz = 0x2,
 };
+inline const char *eChannelScanResultOperatingFrequencyBand_str(eChannelScanResultOperatingFrequencyBand value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "eOperating_Freq_Band_NA"},
+        {0x1, "eOperating_Freq_Band_2_4GHz"},
+        {0x2, "eOperating_Freq_Band_5GHz"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 enum eChannelScanResultStandards: uint8_t {
     eStandard_NA = 0x0,
@@ -1271,6 +1360,17 @@ enum eChannelScanResultStandards: uint8_t {
     eStandard_802_11n = 0x4,
     eStandard_802_11ac = 0x5,
 };
+inline const char *eChannelScanResultStandards_str(eChannelScanResultStandards value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "eStandard_NA"},
+        {0x1, "eStandard_802_11a"},
+        {0x2, "eStandard_802_11b"},
+        {0x3, "eStandard_802_11g"},
+        {0x4, "eStandard_802_11n"},
+        {0x5, "eStandard_802_11ac"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 enum eChannelScanResultChannelBandwidth: uint8_t {
     eChannel_Bandwidth_NA = 0x0,
@@ -1280,6 +1380,17 @@ enum eChannelScanResultChannelBandwidth: uint8_t {
     eChannel_Bandwidth_160MHz = 0x4,
     eChannel_Bandwidth_80_80 = 0x5,
 };
+inline const char *eChannelScanResultChannelBandwidth_str(eChannelScanResultChannelBandwidth value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "eChannel_Bandwidth_NA"},
+        {0x1, "eChannel_Bandwidth_20MHz"},
+        {0x2, "eChannel_Bandwidth_40MHz"},
+        {0x3, "eChannel_Bandwidth_80MHz"},
+        {0x4, "eChannel_Bandwidth_160MHz"},
+        {0x5, "eChannel_Bandwidth_80_80"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 typedef struct sChannelScanResults {
     //The current service set identifier in use by the neighboring WiFi SSID. The value MAY be empty for hidden SSIDs.
@@ -0,0 +1,2553 @@
+///////////////////////////////////////
+// AUTO GENERATED FILE - DO NOT EDIT //
+///////////////////////////////////////
+
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#ifndef _BEEROCKS_TLVF_WIRE_SIZES_H_
+#define _BEEROCKS_TLVF_WIRE_SIZES_H_
+
+#include <cstddef>
+#include <stdint.h>
+#include <beerocks/tlvf/beerocks_message_header.h>
+#include <beerocks/tlvf/beerocks_message_backhaul.h>
+#include <beerocks/tlvf/beerocks_message_common.h>
+#include <beerocks/tlvf/beerocks_message_platform.h>
+#include <beerocks/tlvf/beerocks_message_bml.h>
+#include <beerocks/tlvf/beerocks_message_cli.h>
+#include <beerocks/tlvf/beerocks_message_monitor.h>
+#include <beerocks/tlvf/beerocks_message_cli_net_map.h>
+#include <beerocks/tlvf/beerocks_message_control.h>
+#include <beerocks/tlvf/beerocks_message_1905_vs.h>
+#include <beerocks/tlvf/beerocks_message_apmanager.h>
+
+namespace beerocks_message {
+namespace wire_size {
+
+struct cACTION_HEADER {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 13; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 13; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BACKHAUL_REGISTER_REQUEST {
+    static constexpr size_t min() { return 2 * beerocks::message::IFACE_NAME_LENGTH + sizeof(sMacAddr) + 6; }
+    static constexpr size_t max() { return 2 * beerocks::message::IFACE_NAME_LENGTH + sizeof(sMacAddr) + 6; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t sta_iface_element_min() { return 1; }
+    static constexpr size_t sta_iface_element_max() { return 1; }
+    static constexpr size_t sta_iface_count_max() { return beerocks::message::IFACE_NAME_LENGTH; }
+    static constexpr size_t hostap_iface_element_min() { return 1; }
+    static constexpr size_t hostap_iface_element_max() { return 1; }
+    static constexpr size_t hostap_iface_count_max() { return beerocks::message::IFACE_NAME_LENGTH; }
+};
+
+struct cACTION_BACKHAUL_REGISTER_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BACKHAUL_BUSY_NOTIFICATION {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BACKHAUL_ENABLE {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 3 * beerocks::message::IFACE_NAME_LENGTH + beerocks::message::WIFI_SSID_MAX_LENGTH + beerocks::message::WIFI_PASS_MAX_LENGTH + beerocks::message::SUPPORTED_CHANNELS_LENGTH * sizeof(beerocks::message::sWifiChannel) + 10; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 3 * beerocks::message::IFACE_NAME_LENGTH + beerocks::message::WIFI_SSID_MAX_LENGTH + beerocks::message::WIFI_PASS_MAX_LENGTH + beerocks::message::SUPPORTED_CHANNELS_LENGTH * sizeof(beerocks::message::sWifiChannel) + 10; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t wire_iface_element_min() { return 1; }
+    static constexpr size_t wire_iface_element_max() { return 1; }
+    static constexpr size_t wire_iface_count_max() { return beerocks::message::IFACE_NAME_LENGTH; }
+    static constexpr size_t sta_iface_element_min() { return 1; }
+    static constexpr size_t sta_iface_element_max() { return 1; }
+    static constexpr size_t sta_iface_count_max() { return beerocks::message::IFACE_NAME_LENGTH; }
+    static constexpr size_t ap_iface_element_min() { return 1; }
+    static constexpr size_t ap_iface_element_max() { return 1; }
+    static constexpr size_t ap_iface_count_max() { return beerocks::message::IFACE_NAME_LENGTH; }
+    static constexpr size_t ssid_element_min() { return 1; }
+    static constexpr size_t ssid_element_max() { return 1; }
+    static constexpr size_t ssid_count_max() { return beerocks::message::WIFI_SSID_MAX_LENGTH; }
+    static constexpr size_t pass_element_min() { return 1; }
+    static constexpr size_t pass_element_max() { return 1; }
+    static constexpr size_t pass_count_max() { return beerocks::message::WIFI_PASS_MAX_LENGTH; }
+    static constexpr size_t supported_channels_list_element_min() { return sizeof(beerocks::message::sWifiChannel); }
+    static constexpr size_t supported_channels_list_element_max() { return sizeof(beerocks::message::sWifiChannel); }
+    static constexpr size_t supported_channels_list_count_max() { return beerocks::message::SUPPORTED_CHANNELS_LENGTH; }
+};
+
+struct cACTION_BACKHAUL_CONNECTED_NOTIFICATION {
+    static constexpr size_t min() { return 3 * sizeof(beerocks::net::sIpv4Addr) + 5 * sizeof(sMacAddr) + beerocks::message::BACKHAUL_SCAN_MEASUREMENT_MAX_LENGTH * sizeof(beerocks::net::sScanResult) + 6; }
+    static constexpr size_t max() { return 3 * sizeof(beerocks::net::sIpv4Addr) + 5 * sizeof(sMacAddr) + beerocks::message::BACKHAUL_SCAN_MEASUREMENT_MAX_LENGTH * sizeof(beerocks::net::sScanResult) + 6; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BACKHAUL_DISCONNECTED_NOTIFICATION {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BACKHAUL_ENABLE_APS_REQUEST {
+    static constexpr size_t min() { return 7; }
+    static constexpr size_t max() { return 7; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BACKHAUL_ROAM_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 2; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BACKHAUL_ROAM_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BACKHAUL_RESET {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BACKHAUL_4ADDR_CONNECTED {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BACKHAUL_DL_RSSI_REPORT_NOTIFICATION {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BACKHAUL_UPDATE_STOP_ON_FAILURE_ATTEMPTS_REQUEST {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BACKHAUL_ONBOARDING_FINISHED_NOTIFICATION {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BACKHAUL_CLIENT_RX_RSSI_MEASUREMENT_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 8; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 8; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BACKHAUL_CLIENT_RX_RSSI_MEASUREMENT_RESPONSE {
+    static constexpr size_t min() { return sizeof(beerocks::net::sScanResult) + 10; }
+    static constexpr size_t max() { return sizeof(beerocks::net::sScanResult) + 10; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BACKHAUL_CLIENT_RX_RSSI_MEASUREMENT_CMD_RESPONSE {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BACKHAUL_HOSTAP_VAPS_LIST_UPDATE_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(sMacAddr) + beerocks::IFACE_TOTAL_VAPS + beerocks::IFACE_TOTAL_VAPS * sizeof(sMacAddr) + beerocks::IFACE_TOTAL_VAPS * beerocks::message::WIFI_SSID_MAX_LENGTH + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + beerocks::IFACE_TOTAL_VAPS + beerocks::IFACE_TOTAL_VAPS * sizeof(sMacAddr) + beerocks::IFACE_TOTAL_VAPS * beerocks::message::WIFI_SSID_MAX_LENGTH + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BACKHAUL_CLIENT_ASSOCIATED_NOTIFICATION {
+    static constexpr size_t min() { return 3 * sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return 3 * sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BACKHAUL_CLIENT_DISCONNECTED_NOTIFICATION {
+    static constexpr size_t min() { return 3 * sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return 3 * sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sVapInfo {
+    static constexpr size_t min() { return sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sSonConfig {
+    static constexpr size_t min() { return 21; }
+    static constexpr size_t max() { return 21; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sPlatformSettings {
+    static constexpr size_t min() { return 2 * beerocks::message::WIFI_SSID_MAX_LENGTH + 2 * beerocks::message::WIFI_PASS_MAX_LENGTH + 2 * beerocks::message::WIFI_SECURITY_TYPE_MAX_LENGTH + 12 * sizeof(sMacAddr) + 19; }
+    static constexpr size_t max() { return 2 * beerocks::message::WIFI_SSID_MAX_LENGTH + 2 * beerocks::message::WIFI_PASS_MAX_LENGTH + 2 * beerocks::message::WIFI_SECURITY_TYPE_MAX_LENGTH + 12 * sizeof(sMacAddr) + 19; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sWlanSettings {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sApSetRestrictedFailsafe {
+    static constexpr size_t min() { return beerocks::message::RESTRICTED_CHANNEL_LENGTH + 4; }
+    static constexpr size_t max() { return beerocks::message::RESTRICTED_CHANNEL_LENGTH + 4; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sApChannelSwitch {
+    static constexpr size_t min() { return 8; }
+    static constexpr size_t max() { return 8; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sDfsCacCompleted {
+    static constexpr size_t min() { return 11; }
+    static constexpr size_t max() { return 11; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sDfsChannelAvailable {
+    static constexpr size_t min() { return 8; }
+    static constexpr size_t max() { return 8; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sClientAssociationParams {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + sizeof(beerocks::message::sRadioCapabilities) + 1; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + sizeof(beerocks::message::sRadioCapabilities) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sClientDisconnectionParams {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 4; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 4; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sClientMonitoringParams {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 3; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 3; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sConfigVapInfo {
+    static constexpr size_t min() { return 3 * beerocks::net::MAC_ADDR_LEN + beerocks::message::WIFI_SSID_MAX_LENGTH + beerocks::message::WIFI_PASS_MAX_LENGTH + 3; }
+    static constexpr size_t max() { return 3 * beerocks::net::MAC_ADDR_LEN + beerocks::message::WIFI_SSID_MAX_LENGTH + beerocks::message::WIFI_PASS_MAX_LENGTH + 3; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sStaStatsParams {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 29; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 29; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sApStatsParams {
+    static constexpr size_t min() { return 36; }
+    static constexpr size_t max() { return 36; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sApLoadNotificationParams {
+    static constexpr size_t min() { return 7; }
+    static constexpr size_t max() { return 7; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sApActivityNotificationParams {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sNodeRssiMeasurementRequest {
+    static constexpr size_t min() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 7; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 7; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sNodeRssiMeasurement {
+    static constexpr size_t min() { return sizeof(beerocks::net::sScanResult) + 9; }
+    static constexpr size_t max() { return sizeof(beerocks::net::sScanResult) + 9; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sNodeHostap {
+    static constexpr size_t min() { return beerocks::message::IFACE_NAME_LENGTH + sizeof(sMacAddr) + beerocks::message::WIFI_DRIVER_VER_LENGTH + beerocks::message::SUPPORTED_CHANNELS_LENGTH * sizeof(beerocks::message::sWifiChannel) + 5; }
+    static constexpr size_t max() { return beerocks::message::IFACE_NAME_LENGTH + sizeof(sMacAddr) + beerocks::message::WIFI_DRIVER_VER_LENGTH + beerocks::message::SUPPORTED_CHANNELS_LENGTH * sizeof(beerocks::message::sWifiChannel) + 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sVapsList {
+    static constexpr size_t min() { return beerocks::IFACE_TOTAL_VAPS + beerocks::IFACE_TOTAL_VAPS * sizeof(sMacAddr) + beerocks::IFACE_TOTAL_VAPS * beerocks::message::WIFI_SSID_MAX_LENGTH; }
+    static constexpr size_t max() { return beerocks::IFACE_TOTAL_VAPS + beerocks::IFACE_TOTAL_VAPS * sizeof(sMacAddr) + beerocks::IFACE_TOTAL_VAPS * beerocks::message::WIFI_SSID_MAX_LENGTH; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sArpMonitorData {
+    static constexpr size_t min() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 7; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 7; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sArpQuery {
+    static constexpr size_t min() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr); }
+    static constexpr size_t max() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr); }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sNodeBssSteerTarget {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 2; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sNodeBssSteerRequest {
+    static constexpr size_t min() { return 3 * sizeof(sMacAddr) + 5; }
+    static constexpr size_t max() { return 3 * sizeof(sMacAddr) + 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sNodeBssSteerResponse {
+    static constexpr size_t min() { return 3 * sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return 3 * sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sNeighborSetParams11k {
+    static constexpr size_t min() { return sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 18; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 18; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sNeighborRemoveParams11k {
+    static constexpr size_t min() { return sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sStaChannelLoadRequest11k {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 29; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 29; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sStaChannelLoadResponse11k {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 29; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 29; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sBeaconRequest11k {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 282; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 282; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sBeaconResponse11k {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 37; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 37; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sStatisticsRequest11k {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 45; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 45; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sStatisticsResponse11k {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 64; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 64; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sLinkMeasurementsResponse11k {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 23; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 23; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sBackhaulParams {
+    static constexpr size_t min() { return 3 * sizeof(beerocks::net::sIpv4Addr) + 5 * sizeof(sMacAddr) + beerocks::message::BACKHAUL_SCAN_MEASUREMENT_MAX_LENGTH * sizeof(beerocks::net::sScanResult) + 5; }
+    static constexpr size_t max() { return 3 * sizeof(beerocks::net::sIpv4Addr) + 5 * sizeof(sMacAddr) + beerocks::message::BACKHAUL_SCAN_MEASUREMENT_MAX_LENGTH * sizeof(beerocks::net::sScanResult) + 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sBackhaulRoam {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sBackhaulRssi {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sLoggingLevelChange {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 3; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 3; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sVersions {
+    static constexpr size_t min() { return 2 * beerocks::message::VERSION_LENGTH; }
+    static constexpr size_t max() { return 2 * beerocks::message::VERSION_LENGTH; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sWifiCredentials {
+    static constexpr size_t min() { return beerocks::message::WIFI_SSID_MAX_LENGTH + beerocks::message::WIFI_PASS_MAX_LENGTH + 5; }
+    static constexpr size_t max() { return beerocks::message::WIFI_SSID_MAX_LENGTH + beerocks::message::WIFI_PASS_MAX_LENGTH + 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sOnboarding {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sAdminCredentials {
+    static constexpr size_t min() { return beerocks::message::USER_PASS_LEN; }
+    static constexpr size_t max() { return beerocks::message::USER_PASS_LEN; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sDeviceInfo {
+    static constexpr size_t min() { return 3 * beerocks::message::DEV_INFO_STR_MAX_LEN + 2 * beerocks::message::IFACE_NAME_LENGTH + 16; }
+    static constexpr size_t max() { return 3 * beerocks::message::DEV_INFO_STR_MAX_LEN + 2 * beerocks::message::IFACE_NAME_LENGTH + 16; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sRestrictedChannels {
+    static constexpr size_t min() { return sizeof(sMacAddr) + beerocks::message::RESTRICTED_CHANNEL_LENGTH + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + beerocks::message::RESTRICTED_CHANNEL_LENGTH + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sSteeringApConfig {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 16; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 16; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sSteeringClientConfig {
+    static constexpr size_t min() { return 32; }
+    static constexpr size_t max() { return 32; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sSteeringSetGroupRequest {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 21; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 21; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sSteeringSetGroupResponse {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return 4; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sSteeringClientSetRequest {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 37; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 37; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sSteeringClientSetResponse {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return 4; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sSteeringEvProbeReq {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 3; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 3; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sSteeringEvAuthFail {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 4; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 4; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sClientDisconnectResponse {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return 4; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sSteeringDatarateInfo {
+    static constexpr size_t min() { return 7; }
+    static constexpr size_t max() { return 7; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sSteeringRrmCaps {
+    static constexpr size_t min() { return 7; }
+    static constexpr size_t max() { return 7; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sSteeringEvConnect {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 24; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 24; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sSteeringEvDisconnect {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 6; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 6; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sSteeringEvActivity {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sSteeringEvSnrXing {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 7; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 7; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sSteeringEvSnr {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 4; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 4; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sTriggerChannelScanParams {
+    static constexpr size_t min() { return sizeof(sMacAddr) + beerocks::message::SUPPORTED_CHANNELS_LENGTH + 5; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + beerocks::message::SUPPORTED_CHANNELS_LENGTH + 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sChannelScanRequestParams {
+    static constexpr size_t min() { return beerocks::message::SUPPORTED_CHANNELS_LENGTH + 9; }
+    static constexpr size_t max() { return beerocks::message::SUPPORTED_CHANNELS_LENGTH + 9; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sChannelScanResults {
+    static constexpr size_t min() { return beerocks::message::WIFI_SSID_MAX_LENGTH + sizeof(sMacAddr) + 11 * beerocks::message::CHANNEL_SCAN_LIST_LENGTH + 28; }
+    static constexpr size_t max() { return beerocks::message::WIFI_SSID_MAX_LENGTH + sizeof(sMacAddr) + 11 * beerocks::message::CHANNEL_SCAN_LIST_LENGTH + 28; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_SON_SLAVE_BACKHAUL_CONNECTION_COMPLETE_NOTIFICATION {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_SON_SLAVE_REGISTER_REQUEST {
+    static constexpr size_t min() { return beerocks::message::IFACE_NAME_LENGTH + 1; }
+    static constexpr size_t max() { return beerocks::message::IFACE_NAME_LENGTH + 1; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t iface_name_element_min() { return 1; }
+    static constexpr size_t iface_name_element_max() { return 1; }
+    static constexpr size_t iface_name_count_max() { return beerocks::message::IFACE_NAME_LENGTH; }
+};
+
+struct cACTION_PLATFORM_SON_SLAVE_REGISTER_RESPONSE {
+    static constexpr size_t min() { return 2 * beerocks::message::WIFI_SSID_MAX_LENGTH + 2 * beerocks::message::WIFI_PASS_MAX_LENGTH + 2 * beerocks::message::WIFI_SECURITY_TYPE_MAX_LENGTH + 12 * sizeof(sMacAddr) + 26; }
+    static constexpr size_t max() { return 2 * beerocks::message::WIFI_SSID_MAX_LENGTH + 2 * beerocks::message::WIFI_PASS_MAX_LENGTH + 2 * beerocks::message::WIFI_SECURITY_TYPE_MAX_LENGTH + 12 * sizeof(sMacAddr) + 26; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_ARP_MONITOR_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 8; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 8; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_WLAN_PARAMS_CHANGED_NOTIFICATION {
+    static constexpr size_t min() { return 3; }
+    static constexpr size_t max() { return 3; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_DHCP_MONITOR_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + beerocks::message::NODE_NAME_LENGTH + 6; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + beerocks::message::NODE_NAME_LENGTH + 6; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t hostname_element_min() { return 1; }
+    static constexpr size_t hostname_element_max() { return 1; }
+    static constexpr size_t hostname_count_max() { return beerocks::message::NODE_NAME_LENGTH; }
+};
+
+struct cACTION_PLATFORM_CHANGE_MODULE_LOGGING_LEVEL {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 4; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 4; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_ARP_QUERY_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_ARP_QUERY_RESPONSE {
+    static constexpr size_t min() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 8; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 8; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_ONBOARD_QUERY_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_ONBOARD_QUERY_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_ONBOARD_SET_REQUEST {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_WPS_ONBOARDING_REQUEST {
+    static constexpr size_t min() { return beerocks::message::IFACE_NAME_LENGTH + 1; }
+    static constexpr size_t max() { return beerocks::message::IFACE_NAME_LENGTH + 1; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t iface_name_element_min() { return 1; }
+    static constexpr size_t iface_name_element_max() { return 1; }
+    static constexpr size_t iface_name_count_max() { return beerocks::message::IFACE_NAME_LENGTH; }
+};
+
+struct cACTION_PLATFORM_WIFI_CREDENTIALS_GET_REQUEST {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_WIFI_CREDENTIALS_GET_RESPONSE {
+    static constexpr size_t min() { return 2 * beerocks::message::WIFI_SSID_MAX_LENGTH + 2 * beerocks::message::WIFI_PASS_MAX_LENGTH + 15; }
+    static constexpr size_t max() { return 2 * beerocks::message::WIFI_SSID_MAX_LENGTH + 2 * beerocks::message::WIFI_PASS_MAX_LENGTH + 15; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_ADMIN_CREDENTIALS_GET_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_ADMIN_CREDENTIALS_GET_RESPONSE {
+    static constexpr size_t min() { return beerocks::message::USER_PASS_LEN + 5; }
+    static constexpr size_t max() { return beerocks::message::USER_PASS_LEN + 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_DEVICE_INFO_GET_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_DEVICE_INFO_GET_RESPONSE {
+    static constexpr size_t min() { return 3 * beerocks::message::DEV_INFO_STR_MAX_LEN + 2 * beerocks::message::IFACE_NAME_LENGTH + 21; }
+    static constexpr size_t max() { return 3 * beerocks::message::DEV_INFO_STR_MAX_LEN + 2 * beerocks::message::IFACE_NAME_LENGTH + 21; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_LOCAL_MASTER_GET_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_LOCAL_MASTER_GET_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_VERSION_MISMATCH_NOTIFICATION {
+    static constexpr size_t min() { return 2 * beerocks::message::VERSION_LENGTH + 1; }
+    static constexpr size_t max() { return 2 * beerocks::message::VERSION_LENGTH + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_MASTER_SLAVE_VERSIONS_NOTIFICATION {
+    static constexpr size_t min() { return 2 * beerocks::message::VERSION_LENGTH + 1; }
+    static constexpr size_t max() { return 2 * beerocks::message::VERSION_LENGTH + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_GET_MASTER_SLAVE_VERSIONS_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_GET_MASTER_SLAVE_VERSIONS_RESPONSE {
+    static constexpr size_t min() { return 2 * beerocks::message::VERSION_LENGTH + 5; }
+    static constexpr size_t max() { return 2 * beerocks::message::VERSION_LENGTH + 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_PLATFORM_ERROR_NOTIFICATION {
+    static constexpr size_t min() { return 261; }
+    static constexpr size_t max() { return 261; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t data_element_min() { return 1; }
+    static constexpr size_t data_element_max() { return 1; }
+    static constexpr size_t data_count_max() { return 256; }
+};
+
+struct cACTION_BML_PING_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_PING_RESPONSE {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_NW_MAP_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_NW_MAP_RESPONSE {
+    static constexpr size_t min() { return 9; }
+    static constexpr size_t max() { return 4294967304; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t buffer_element_min() { return 1; }
+    static constexpr size_t buffer_element_max() { return 1; }
+    static constexpr size_t buffer_count_max() { return 4294967295; }
+};
+
+struct cACTION_BML_NW_MAP_UPDATE {
+    static constexpr size_t min() { return 9; }
+    static constexpr size_t max() { return 4294967304; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t buffer_element_min() { return 1; }
+    static constexpr size_t buffer_element_max() { return 1; }
+    static constexpr size_t buffer_count_max() { return 4294967295; }
+};
+
+struct cACTION_BML_STATS_UPDATE {
+    static constexpr size_t min() { return 9; }
+    static constexpr size_t max() { return 4294967304; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t buffer_element_min() { return 1; }
+    static constexpr size_t buffer_element_max() { return 1; }
+    static constexpr size_t buffer_count_max() { return 4294967295; }
+};
+
+struct cACTION_BML_EVENTS_UPDATE {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 4294967300; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t buffer_element_min() { return 1; }
+    static constexpr size_t buffer_element_max() { return 1; }
+    static constexpr size_t buffer_count_max() { return 4294967295; }
+};
+
+struct cACTION_BML_REGISTER_TO_NW_MAP_UPDATES_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_REGISTER_TO_NW_MAP_UPDATES_RESPONSE {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_UNREGISTER_FROM_NW_MAP_UPDATES_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_UNREGISTER_FROM_NW_MAP_UPDATES_RESPONSE {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_LEGACY_CLIENT_ROAMING_RESPONSE {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_LEGACY_CLIENT_ROAMING_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_REGISTER_TO_EVENTS_UPDATES_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_REGISTER_TO_EVENTS_UPDATES_RESPONSE {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_UNREGISTER_FROM_EVENTS_UPDATES_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_UNREGISTER_FROM_EVENTS_UPDATES_RESPONSE {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_REGISTER_TO_STATS_UPDATES_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_REGISTER_TO_STATS_UPDATES_RESPONSE {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_UNREGISTER_FROM_STATS_UPDATES_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_UNREGISTER_FROM_STATS_UPDATES_RESPONSE {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_LEGACY_CLIENT_ROAMING_REQUEST {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_LEGACY_CLIENT_ROAMING_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_CLIENT_ROAMING_REQUEST {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_CLIENT_ROAMING_RESPONSE {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_CLIENT_ROAMING_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_CLIENT_ROAMING_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_DFS_REENTRY_REQUEST {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_DFS_REENTRY_RESPONSE {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_DFS_REENTRY_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_DFS_REENTRY_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_CLIENT_ROAMING_PREFER_SIGNAL_STRENGTH_REQUEST {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_CLIENT_ROAMING_PREFER_SIGNAL_STRENGTH_RESPONSE {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_CLIENT_ROAMING_PREFER_SIGNAL_STRENGTH_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_CLIENT_ROAMING_PREFER_SIGNAL_STRENGTH_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_CLIENT_BAND_STEERING_REQUEST {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_CLIENT_BAND_STEERING_RESPONSE {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_CLIENT_BAND_STEERING_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_CLIENT_BAND_STEERING_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_IRE_ROAMING_REQUEST {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_IRE_ROAMING_RESPONSE {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_IRE_ROAMING_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_IRE_ROAMING_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_LOAD_BALANCER_REQUEST {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_LOAD_BALANCER_RESPONSE {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_LOAD_BALANCER_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_LOAD_BALANCER_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_SERVICE_FAIRNESS_REQUEST {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_SERVICE_FAIRNESS_RESPONSE {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_SERVICE_FAIRNESS_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_SERVICE_FAIRNESS_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_CHANGE_MODULE_LOGGING_LEVEL_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 4; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 4; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_CHANGE_MODULE_LOGGING_LEVEL_RESPONSE {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_WIFI_CREDENTIALS_UPDATE_REQUEST {
+    static constexpr size_t min() { return beerocks::message::WIFI_SSID_MAX_LENGTH + beerocks::message::WIFI_PASS_MAX_LENGTH + 6; }
+    static constexpr size_t max() { return beerocks::message::WIFI_SSID_MAX_LENGTH + beerocks::message::WIFI_PASS_MAX_LENGTH + 6; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_WIFI_CREDENTIALS_UPDATE_RESPONSE {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_RESTRICTED_CHANNELS_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + beerocks::message::RESTRICTED_CHANNEL_LENGTH + 2; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + beerocks::message::RESTRICTED_CHANNEL_LENGTH + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_RESTRICTED_CHANNELS_RESPONSE {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_RESTRICTED_CHANNELS_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + beerocks::message::RESTRICTED_CHANNEL_LENGTH + 2; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + beerocks::message::RESTRICTED_CHANNEL_LENGTH + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_RESTRICTED_CHANNELS_RESPONSE {
+    static constexpr size_t min() { return sizeof(sMacAddr) + beerocks::message::RESTRICTED_CHANNEL_LENGTH + 2; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + beerocks::message::RESTRICTED_CHANNEL_LENGTH + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_CERTIFICATION_MODE_REQUEST {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_CERTIFICATION_MODE_RESPONSE {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_CERTIFICATION_MODE_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_CERTIFICATION_MODE_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_SET_VAP_LIST_CREDENTIALS_REQUEST {
+    static constexpr size_t min() { return 6; }
+    static constexpr size_t max() { return 765 * beerocks::net::MAC_ADDR_LEN + 255 * beerocks::message::WIFI_SSID_MAX_LENGTH + 255 * beerocks::message::WIFI_PASS_MAX_LENGTH + 771; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t vap_list_element_min() { return 3 * beerocks::net::MAC_ADDR_LEN + beerocks::message::WIFI_SSID_MAX_LENGTH + beerocks::message::WIFI_PASS_MAX_LENGTH + 3; }
+    static constexpr size_t vap_list_element_max() { return 3 * beerocks::net::MAC_ADDR_LEN + beerocks::message::WIFI_SSID_MAX_LENGTH + beerocks::message::WIFI_PASS_MAX_LENGTH + 3; }
+    static constexpr size_t vap_list_count_max() { return 255; }
+};
+
+struct cACTION_BML_SET_VAP_LIST_CREDENTIALS_RESPONSE {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_GET_VAP_LIST_CREDENTIALS_RESPONSE {
+    static constexpr size_t min() { return 6; }
+    static constexpr size_t max() { return 765 * beerocks::net::MAC_ADDR_LEN + 255 * beerocks::message::WIFI_SSID_MAX_LENGTH + 255 * beerocks::message::WIFI_PASS_MAX_LENGTH + 771; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t vap_list_element_min() { return 3 * beerocks::net::MAC_ADDR_LEN + beerocks::message::WIFI_SSID_MAX_LENGTH + beerocks::message::WIFI_PASS_MAX_LENGTH + 3; }
+    static constexpr size_t vap_list_element_max() { return 3 * beerocks::net::MAC_ADDR_LEN + beerocks::message::WIFI_SSID_MAX_LENGTH + beerocks::message::WIFI_PASS_MAX_LENGTH + 3; }
+    static constexpr size_t vap_list_count_max() { return 255; }
+};
+
+struct cACTION_BML_GET_VAP_LIST_CREDENTIALS_REQUEST {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_STEERING_SET_GROUP_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 38; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 38; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_STEERING_SET_GROUP_RESPONSE {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_STEERING_CLIENT_SET_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 38; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 38; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_STEERING_CLIENT_SET_RESPONSE {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_STEERING_EVENT_REGISTER_UNREGISTER_REQUEST {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_STEERING_EVENT_REGISTER_UNREGISTER_RESPONSE {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_STEERING_CLIENT_DISCONNECT_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 10; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 10; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_STEERING_CLIENT_DISCONNECT_RESPONSE {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_STEERING_CLIENT_MEASURE_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 5; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_STEERING_CLIENT_MEASURE_RESPONSE {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_STEERING_EVENTS_UPDATE {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 4294967300; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t buffer_element_min() { return 1; }
+    static constexpr size_t buffer_element_max() { return 1; }
+    static constexpr size_t buffer_count_max() { return 4294967295; }
+};
+
+struct cACTION_BML_TRIGGER_TOPOLOGY_QUERY {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_TRIGGER_CHANNEL_SELECTION_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_CHANNEL_SCAN_SET_CONTINUOUS_PARAMS_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + beerocks::message::SUPPORTED_CHANNELS_LENGTH + 10; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + beerocks::message::SUPPORTED_CHANNELS_LENGTH + 10; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_CHANNEL_SCAN_SET_CONTINUOUS_PARAMS_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_CHANNEL_SCAN_GET_CONTINUOUS_PARAMS_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_CHANNEL_SCAN_GET_CONTINUOUS_PARAMS_RESPONSE {
+    static constexpr size_t min() { return beerocks::message::SUPPORTED_CHANNELS_LENGTH + 10; }
+    static constexpr size_t max() { return beerocks::message::SUPPORTED_CHANNELS_LENGTH + 10; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_CHANNEL_SCAN_SET_CONTINUOUS_ENABLE_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 2; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_CHANNEL_SCAN_SET_CONTINUOUS_ENABLE_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_CHANNEL_SCAN_GET_CONTINUOUS_ENABLE_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_CHANNEL_SCAN_GET_CONTINUOUS_ENABLE_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_CHANNEL_SCAN_START_SCAN_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + beerocks::message::SUPPORTED_CHANNELS_LENGTH + 6; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + beerocks::message::SUPPORTED_CHANNELS_LENGTH + 6; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_CHANNEL_SCAN_START_SCAN_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_CHANNEL_SCAN_GET_RESULTS_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 2; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_CHANNEL_SCAN_GET_RESULTS_RESPONSE {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 255 * beerocks::message::WIFI_SSID_MAX_LENGTH + 255 * sizeof(sMacAddr) + 2805 * beerocks::message::CHANNEL_SCAN_LIST_LENGTH + 7145; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t results_element_min() { return beerocks::message::WIFI_SSID_MAX_LENGTH + sizeof(sMacAddr) + 11 * beerocks::message::CHANNEL_SCAN_LIST_LENGTH + 28; }
+    static constexpr size_t results_element_max() { return beerocks::message::WIFI_SSID_MAX_LENGTH + sizeof(sMacAddr) + 11 * beerocks::message::CHANNEL_SCAN_LIST_LENGTH + 28; }
+    static constexpr size_t results_count_max() { return 255; }
+};
+
+struct cACTION_BML_CHANNEL_SCAN_DUMP_RESULTS_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_BML_CHANNEL_SCAN_DUMP_RESULTS_RESPONSE {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_ENABLE_DIAGNOSTICS_MEASUREMENTS {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_ENABLE_LOAD_BALANCER {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_ENABLE_DEBUG {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_SET_SLAVES_STOP_ON_FAILURE_ATTEMPTS {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_RESPONSE_INT {
+    static constexpr size_t min() { return 3; }
+    static constexpr size_t max() { return 3; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_RESPONSE_STR {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 4294967300; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t buffer_element_min() { return 1; }
+    static constexpr size_t buffer_element_max() { return 1; }
+    static constexpr size_t buffer_count_max() { return 4294967295; }
+};
+
+struct cACTION_CLI_CROSS_RX_RSSI_MEASUREMENT {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 3; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 3; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_OPTIMAL_PATH_TASK {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_LOAD_BALANCER_TASK {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_IRE_NETWORK_OPTIMIZATION_TASK {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_DUMP_NODE_INFO {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_PING_SLAVE_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 5; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_PING_ALL_SLAVES_REQUEST {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_BACKHAUL_SCAN_RESULTS {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_BACKHAUL_ROAM_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_CLIENT_ALLOW_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_CLIENT_DISALLOW_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_CLIENT_DISCONNECT_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 6; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 6; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_CLIENT_BSS_STEER_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 5; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_CLIENT_LINK_MEASUREMENT_11K_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_CLIENT_CHANNEL_LOAD_11K_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 2; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_CLIENT_BEACON_11K_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 12; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 12; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t ssid_element_min() { return 1; }
+    static constexpr size_t ssid_element_max() { return 1; }
+    static constexpr size_t ssid_count_max() { return beerocks::message::WIFI_SSID_MAX_LENGTH; }
+};
+
+struct cACTION_CLI_CLIENT_STATISTICS_11K_REQUEST {
+    static constexpr size_t min() { return 3 * sizeof(sMacAddr) + 2; }
+    static constexpr size_t max() { return 3 * sizeof(sMacAddr) + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_HOSTAP_CHANNEL_SWITCH_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 9; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 9; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_HOSTAP_SET_NEIGHBOR_11K_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 3; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 3; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_HOSTAP_REMOVE_NEIGHBOR_11K_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 2; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CLI_HOSTAP_STATS_MEASUREMENT {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_HOSTAP_AP_DISABLED_NOTIFICATION {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_JOINED_NOTIFICATION {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_SON_CONFIG_UPDATE {
+    static constexpr size_t min() { return 22; }
+    static constexpr size_t max() { return 22; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CHANGE_MODULE_LOGGING_LEVEL {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 4; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 4; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_ERROR_NOTIFICATION {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_ERROR_NOTIFICATION_ACK {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_HEARTBEAT_NOTIFICATION {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CLIENT_START_MONITORING_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 4; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 4; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CLIENT_START_MONITORING_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CLIENT_STOP_MONITORING_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CLIENT_RX_RSSI_MEASUREMENT_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 8; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 8; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CLIENT_DISCONNECT_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 2; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CLIENT_RX_RSSI_MEASUREMENT_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(beerocks::net::sScanResult) + 10; }
+    static constexpr size_t max() { return sizeof(beerocks::net::sScanResult) + 10; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CLIENT_RX_RSSI_MEASUREMENT_RESPONSE {
+    static constexpr size_t min() { return sizeof(beerocks::net::sScanResult) + 10; }
+    static constexpr size_t max() { return sizeof(beerocks::net::sScanResult) + 10; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CLIENT_NO_RESPONSE_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CLIENT_RX_RSSI_MEASUREMENT_START_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CLIENT_RX_RSSI_MEASUREMENT_CMD_RESPONSE {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CLIENT_NO_ACTIVITY_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_HOSTAP_ACTIVITY_NOTIFICATION {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_HOSTAP_STATS_MEASUREMENT_REQUEST {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_HOSTAP_STATUS_CHANGED_NOTIFICATION {
+    static constexpr size_t min() { return 3; }
+    static constexpr size_t max() { return 3; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_HOSTAP_STATS_MEASUREMENT_RESPONSE {
+    static constexpr size_t min() { return 38; }
+    static constexpr size_t max() { return 255 * sizeof(sMacAddr) + 7433; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t sta_stats_element_min() { return sizeof(sMacAddr) + 29; }
+    static constexpr size_t sta_stats_element_max() { return sizeof(sMacAddr) + 29; }
+    static constexpr size_t sta_stats_count_max() { return 255; }
+};
+
+struct cACTION_MONITOR_HOSTAP_LOAD_MEASUREMENT_NOTIFICATION {
+    static constexpr size_t min() { return 8; }
+    static constexpr size_t max() { return 8; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CLIENT_BEACON_11K_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 283; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 283; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CLIENT_BEACON_11K_RESPONSE {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 38; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 38; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CLIENT_CHANNEL_LOAD_11K_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 30; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 30; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CLIENT_CHANNEL_LOAD_11K_RESPONSE {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 30; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 30; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CLIENT_STATISTICS_11K_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 46; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 46; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CLIENT_STATISTICS_11K_RESPONSE {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 65; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 65; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CLIENT_LINK_MEASUREMENT_11K_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CLIENT_LINK_MEASUREMENTS_11K_RESPONSE {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 24; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 24; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CLIENT_NEW_IP_ADDRESS_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_STEERING_CLIENT_SET_GROUP_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 22; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 22; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_STEERING_CLIENT_SET_GROUP_RESPONSE {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_STEERING_CLIENT_SET_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 38; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 38; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_STEERING_CLIENT_SET_RESPONSE {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_STEERING_EVENT_CLIENT_ACTIVITY_NOTIFICATION {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 2; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_STEERING_EVENT_SNR_XING_NOTIFICATION {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 8; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 8; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CHANNEL_SCAN_TRIGGER_SCAN_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + beerocks::message::SUPPORTED_CHANNELS_LENGTH + 6; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + beerocks::message::SUPPORTED_CHANNELS_LENGTH + 6; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CHANNEL_SCAN_TRIGGER_SCAN_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CHANNEL_SCAN_DUMP_RESULTS_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CHANNEL_SCAN_DUMP_RESULTS_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CHANNEL_SCAN_TRIGGERED_NOTIFICATION {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CHANNEL_SCAN_RESULTS_NOTIFICATION {
+    static constexpr size_t min() { return beerocks::message::WIFI_SSID_MAX_LENGTH + sizeof(sMacAddr) + 11 * beerocks::message::CHANNEL_SCAN_LIST_LENGTH + 30; }
+    static constexpr size_t max() { return beerocks::message::WIFI_SSID_MAX_LENGTH + sizeof(sMacAddr) + 11 * beerocks::message::CHANNEL_SCAN_LIST_LENGTH + 30; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CHANNEL_SCAN_ABORT_NOTIFICATION {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_MONITOR_CHANNEL_SCAN_FINISHED_NOTIFICATION {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sCliNetworkMapNodeAp {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 3; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 3; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sCliNetworkMapNodeSta {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 2; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sCliNetworkMapsNodeInfo {
+    static constexpr size_t min() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + beerocks::message::NODE_NAME_LENGTH + 22; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + beerocks::message::NODE_NAME_LENGTH + 22; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_SLAVE_HANDSHAKE_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_SLAVE_HANDSHAKE_RESPONSE {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_SLAVE_JOINED_NOTIFICATION {
+    static constexpr size_t min() { return beerocks::message::VERSION_LENGTH + 2 * beerocks::message::WIFI_SSID_MAX_LENGTH + 2 * beerocks::message::WIFI_PASS_MAX_LENGTH + 2 * beerocks::message::WIFI_SECURITY_TYPE_MAX_LENGTH + 19 * sizeof(sMacAddr) + 3 * sizeof(beerocks::net::sIpv4Addr) + beerocks::message::BACKHAUL_SCAN_MEASUREMENT_MAX_LENGTH * sizeof(beerocks::net::sScanResult) + beerocks::message::IFACE_NAME_LENGTH + beerocks::message::WIFI_DRIVER_VER_LENGTH + beerocks::message::SUPPORTED_CHANNELS_LENGTH * sizeof(beerocks::message::sWifiChannel) + 43; }
+    static constexpr size_t max() { return beerocks::message::VERSION_LENGTH + 2 * beerocks::message::WIFI_SSID_MAX_LENGTH + 2 * beerocks::message::WIFI_PASS_MAX_LENGTH + 2 * beerocks::message::WIFI_SECURITY_TYPE_MAX_LENGTH + 19 * sizeof(sMacAddr) + 3 * sizeof(beerocks::net::sIpv4Addr) + beerocks::message::BACKHAUL_SCAN_MEASUREMENT_MAX_LENGTH * sizeof(beerocks::net::sScanResult) + beerocks::message::IFACE_NAME_LENGTH + beerocks::message::WIFI_DRIVER_VER_LENGTH + beerocks::message::SUPPORTED_CHANNELS_LENGTH * sizeof(beerocks::message::sWifiChannel) + 43; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t slave_version_element_min() { return 1; }
+    static constexpr size_t slave_version_element_max() { return 1; }
+    static constexpr size_t slave_version_count_max() { return beerocks::message::VERSION_LENGTH; }
+};
+
+struct cACTION_CONTROL_SLAVE_JOINED_RESPONSE {
+    static constexpr size_t min() { return beerocks::message::VERSION_LENGTH + 23; }
+    static constexpr size_t max() { return beerocks::message::VERSION_LENGTH + 23; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t master_version_element_min() { return 1; }
+    static constexpr size_t master_version_element_max() { return 1; }
+    static constexpr size_t master_version_count_max() { return beerocks::message::VERSION_LENGTH; }
+};
+
+struct cACTION_CONTROL_SLAVE_JOINED_4ADDR_MODE_NOTIFICATION {
+    static constexpr size_t min() { return 3 * sizeof(sMacAddr) + 2 * sizeof(beerocks::net::sIpv4Addr) + beerocks::message::IFACE_NAME_LENGTH + beerocks::message::WIFI_DRIVER_VER_LENGTH + beerocks::message::SUPPORTED_CHANNELS_LENGTH * sizeof(beerocks::message::sWifiChannel) + 6; }
+    static constexpr size_t max() { return 3 * sizeof(sMacAddr) + 2 * sizeof(beerocks::net::sIpv4Addr) + beerocks::message::IFACE_NAME_LENGTH + beerocks::message::WIFI_DRIVER_VER_LENGTH + beerocks::message::SUPPORTED_CHANNELS_LENGTH * sizeof(beerocks::message::sWifiChannel) + 6; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_SON_CONFIG_UPDATE {
+    static constexpr size_t min() { return 22; }
+    static constexpr size_t max() { return 22; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CONTROLLER_PING_REQUEST {
+    static constexpr size_t min() { return 7; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t data_element_min() { return 1; }
+    static constexpr size_t data_element_max() { return 1; }
+    static constexpr size_t data_count_max() { return SIZE_MAX; }
+};
+
+struct cACTION_CONTROL_CONTROLLER_PING_RESPONSE {
+    static constexpr size_t min() { return 7; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t data_element_min() { return 1; }
+    static constexpr size_t data_element_max() { return 1; }
+    static constexpr size_t data_count_max() { return SIZE_MAX; }
+};
+
+struct cACTION_CONTROL_AGENT_PING_REQUEST {
+    static constexpr size_t min() { return 7; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t data_element_min() { return 1; }
+    static constexpr size_t data_element_max() { return 1; }
+    static constexpr size_t data_count_max() { return SIZE_MAX; }
+};
+
+struct cACTION_CONTROL_AGENT_PING_RESPONSE {
+    static constexpr size_t min() { return 7; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t data_element_min() { return 1; }
+    static constexpr size_t data_element_max() { return 1; }
+    static constexpr size_t data_count_max() { return SIZE_MAX; }
+};
+
+struct cACTION_CONTROL_ARP_QUERY_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_ARP_QUERY_RESPONSE {
+    static constexpr size_t min() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 8; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 8; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_PLATFORM_OPERATIONAL_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 2; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_BACKHAUL_DL_RSSI_REPORT_NOTIFICATION {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_BACKHAUL_RESET {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_BACKHAUL_ROAM_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 2; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CHANGE_MODULE_LOGGING_LEVEL {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 4; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 4; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_HOSTAP_CSA_ERROR_NOTIFICATION {
+    static constexpr size_t min() { return 9; }
+    static constexpr size_t max() { return 9; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_HOSTAP_CSA_NOTIFICATION {
+    static constexpr size_t min() { return 9; }
+    static constexpr size_t max() { return 9; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_HOSTAP_ACS_ERROR_NOTIFICATION {
+    static constexpr size_t min() { return 9; }
+    static constexpr size_t max() { return 9; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_HOSTAP_ACS_NOTIFICATION {
+    static constexpr size_t min() { return beerocks::message::SUPPORTED_CHANNELS_LENGTH * sizeof(beerocks::message::sWifiChannel) + 9; }
+    static constexpr size_t max() { return beerocks::message::SUPPORTED_CHANNELS_LENGTH * sizeof(beerocks::message::sWifiChannel) + 9; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t supported_channels_element_min() { return sizeof(beerocks::message::sWifiChannel); }
+    static constexpr size_t supported_channels_element_max() { return sizeof(beerocks::message::sWifiChannel); }
+    static constexpr size_t supported_channels_count_max() { return beerocks::message::SUPPORTED_CHANNELS_LENGTH; }
+};
+
+struct cACTION_CONTROL_HOSTAP_DFS_CAC_COMPLETED_NOTIFICATION {
+    static constexpr size_t min() { return 12; }
+    static constexpr size_t max() { return 12; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_HOSTAP_DFS_CHANNEL_AVAILABLE_NOTIFICATION {
+    static constexpr size_t min() { return 9; }
+    static constexpr size_t max() { return 9; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_HOSTAP_SET_RESTRICTED_FAILSAFE_CHANNEL_REQUEST {
+    static constexpr size_t min() { return beerocks::message::RESTRICTED_CHANNEL_LENGTH + 5; }
+    static constexpr size_t max() { return beerocks::message::RESTRICTED_CHANNEL_LENGTH + 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_HOSTAP_SET_RESTRICTED_FAILSAFE_CHANNEL_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_HOSTAP_CHANNEL_SWITCH_ACS_START {
+    static constexpr size_t min() { return 9; }
+    static constexpr size_t max() { return 9; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_HOSTAP_UPDATE_STOP_ON_FAILURE_ATTEMPTS_REQUEST {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_HOSTAP_DISABLED_BY_MASTER {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_HOSTAP_CHANNEL_SWITCH_REQUEST {
+    static constexpr size_t min() { return 9; }
+    static constexpr size_t max() { return 9; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_HOSTAP_STATS_MEASUREMENT_REQUEST {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_HOSTAP_STATS_MEASUREMENT_RESPONSE {
+    static constexpr size_t min() { return 38; }
+    static constexpr size_t max() { return 255 * sizeof(sMacAddr) + 7433; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t sta_stats_element_min() { return sizeof(sMacAddr) + 29; }
+    static constexpr size_t sta_stats_element_max() { return sizeof(sMacAddr) + 29; }
+    static constexpr size_t sta_stats_count_max() { return 255; }
+};
+
+struct cACTION_CONTROL_HOSTAP_LOAD_MEASUREMENT_NOTIFICATION {
+    static constexpr size_t min() { return 8; }
+    static constexpr size_t max() { return 8; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_HOSTAP_SET_NEIGHBOR_11K_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 19; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 19; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_HOSTAP_REMOVE_NEIGHBOR_11K_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 2; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_HOSTAP_ACTIVITY_NOTIFICATION {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_HOSTAP_VAPS_LIST_UPDATE_NOTIFICATION {
+    static constexpr size_t min() { return beerocks::IFACE_TOTAL_VAPS + beerocks::IFACE_TOTAL_VAPS * sizeof(sMacAddr) + beerocks::IFACE_TOTAL_VAPS * beerocks::message::WIFI_SSID_MAX_LENGTH + 1; }
+    static constexpr size_t max() { return beerocks::IFACE_TOTAL_VAPS + beerocks::IFACE_TOTAL_VAPS * sizeof(sMacAddr) + beerocks::IFACE_TOTAL_VAPS * beerocks::message::WIFI_SSID_MAX_LENGTH + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_HOSTAP_AP_DISABLED_NOTIFICATION {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_HOSTAP_AP_ENABLED_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 3; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 3; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_START_MONITORING_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 4; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 4; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_START_MONITORING_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_STOP_MONITORING_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_RX_RSSI_MEASUREMENT_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 8; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 8; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_RX_RSSI_MEASUREMENT_RESPONSE {
+    static constexpr size_t min() { return sizeof(beerocks::net::sScanResult) + 10; }
+    static constexpr size_t max() { return sizeof(beerocks::net::sScanResult) + 10; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_RX_RSSI_MEASUREMENT_START_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_RX_RSSI_MEASUREMENT_CMD_RESPONSE {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_RX_RSSI_MEASUREMENT_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(beerocks::net::sScanResult) + 10; }
+    static constexpr size_t max() { return sizeof(beerocks::net::sScanResult) + 10; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_NO_ACTIVITY_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_NO_RESPONSE_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_NEW_IP_ADDRESS_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_DISCONNECT_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 7; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 7; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_DISCONNECT_RESPONSE {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_DHCP_COMPLETE_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + beerocks::message::NODE_NAME_LENGTH + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + beerocks::message::NODE_NAME_LENGTH + 1; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t name_element_min() { return 1; }
+    static constexpr size_t name_element_max() { return 1; }
+    static constexpr size_t name_count_max() { return beerocks::message::NODE_NAME_LENGTH; }
+};
+
+struct cACTION_CONTROL_CLIENT_ARP_MONITOR_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 8; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 8; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_BEACON_11K_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 283; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 283; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_BEACON_11K_RESPONSE {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 38; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 38; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_CHANNEL_LOAD_11K_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 30; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 30; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_CHANNEL_LOAD_11K_RESPONSE {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 30; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 30; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_STATISTICS_11K_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 46; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 46; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_STATISTICS_11K_RESPONSE {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 65; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 65; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_LINK_MEASUREMENT_11K_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CLIENT_LINK_MEASUREMENTS_11K_RESPONSE {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 24; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 24; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_STEERING_CLIENT_SET_GROUP_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 22; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 22; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_STEERING_CLIENT_SET_GROUP_RESPONSE {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_STEERING_CLIENT_SET_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 38; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 38; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_STEERING_CLIENT_SET_RESPONSE {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_STEERING_EVENT_CLIENT_ACTIVITY_NOTIFICATION {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 2; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_STEERING_EVENT_SNR_XING_NOTIFICATION {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 8; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 8; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_STEERING_EVENT_PROBE_REQ_NOTIFICATION {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 4; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 4; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_STEERING_EVENT_AUTH_FAIL_NOTIFICATION {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 5; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CHANNEL_SCAN_TRIGGER_SCAN_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + beerocks::message::SUPPORTED_CHANNELS_LENGTH + 6; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + beerocks::message::SUPPORTED_CHANNELS_LENGTH + 6; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CHANNEL_SCAN_TRIGGER_SCAN_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CHANNEL_SCAN_DUMP_RESULTS_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CHANNEL_SCAN_DUMP_RESULTS_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CHANNEL_SCAN_TRIGGERED_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CHANNEL_SCAN_RESULTS_NOTIFICATION {
+    static constexpr size_t min() { return beerocks::message::WIFI_SSID_MAX_LENGTH + 2 * sizeof(sMacAddr) + 11 * beerocks::message::CHANNEL_SCAN_LIST_LENGTH + 30; }
+    static constexpr size_t max() { return beerocks::message::WIFI_SSID_MAX_LENGTH + 2 * sizeof(sMacAddr) + 11 * beerocks::message::CHANNEL_SCAN_LIST_LENGTH + 30; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CHANNEL_SCAN_ABORT_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 2; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_CONTROL_CHANNEL_SCAN_FINISHED_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct tlvVsClientAssociationEvent {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + sizeof(beerocks::message::sRadioCapabilities) + 5; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + sizeof(beerocks::message::sRadioCapabilities) + 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_4ADDR_STA_JOINED {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_JOINED_NOTIFICATION {
+    static constexpr size_t min() { return beerocks::message::IFACE_NAME_LENGTH + sizeof(sMacAddr) + beerocks::message::WIFI_DRIVER_VER_LENGTH + beerocks::message::SUPPORTED_CHANNELS_LENGTH * sizeof(beerocks::message::sWifiChannel) + 14; }
+    static constexpr size_t max() { return beerocks::message::IFACE_NAME_LENGTH + sizeof(sMacAddr) + beerocks::message::WIFI_DRIVER_VER_LENGTH + beerocks::message::SUPPORTED_CHANNELS_LENGTH * sizeof(beerocks::message::sWifiChannel) + 14; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_ENABLE_APS_REQUEST {
+    static constexpr size_t min() { return 7; }
+    static constexpr size_t max() { return 7; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_ENABLE_APS_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_INIT_DONE_NOTIFICATION {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_HOSTAP_SET_RESTRICTED_FAILSAFE_CHANNEL_REQUEST {
+    static constexpr size_t min() { return beerocks::message::RESTRICTED_CHANNEL_LENGTH + 5; }
+    static constexpr size_t max() { return beerocks::message::RESTRICTED_CHANNEL_LENGTH + 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_HOSTAP_SET_RESTRICTED_FAILSAFE_CHANNEL_RESPONSE {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_HOSTAP_AP_DISABLED_NOTIFICATION {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_HOSTAP_AP_ENABLED_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 3; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 3; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_HOSTAP_VAPS_LIST_UPDATE_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_HOSTAP_GENERATE_CLIENT_ASSOCIATION_NOTIFICATIONS_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_HOSTAP_VAPS_LIST_UPDATE_NOTIFICATION {
+    static constexpr size_t min() { return beerocks::IFACE_TOTAL_VAPS + beerocks::IFACE_TOTAL_VAPS * sizeof(sMacAddr) + beerocks::IFACE_TOTAL_VAPS * beerocks::message::WIFI_SSID_MAX_LENGTH + 1; }
+    static constexpr size_t max() { return beerocks::IFACE_TOTAL_VAPS + beerocks::IFACE_TOTAL_VAPS * sizeof(sMacAddr) + beerocks::IFACE_TOTAL_VAPS * beerocks::message::WIFI_SSID_MAX_LENGTH + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_HOSTAP_CHANNEL_SWITCH_ACS_START {
+    static constexpr size_t min() { return 11; }
+    static constexpr size_t max() { return 11; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_HOSTAP_CSA_ERROR_NOTIFICATION {
+    static constexpr size_t min() { return 9; }
+    static constexpr size_t max() { return 9; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_HOSTAP_CSA_NOTIFICATION {
+    static constexpr size_t min() { return 9; }
+    static constexpr size_t max() { return 9; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_HOSTAP_ACS_ERROR_NOTIFICATION {
+    static constexpr size_t min() { return 9; }
+    static constexpr size_t max() { return 9; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_HOSTAP_ACS_NOTIFICATION {
+    static constexpr size_t min() { return beerocks::message::SUPPORTED_CHANNELS_LENGTH * sizeof(beerocks::message::sWifiChannel) + 9; }
+    static constexpr size_t max() { return beerocks::message::SUPPORTED_CHANNELS_LENGTH * sizeof(beerocks::message::sWifiChannel) + 9; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t supported_channels_list_element_min() { return sizeof(beerocks::message::sWifiChannel); }
+    static constexpr size_t supported_channels_list_element_max() { return sizeof(beerocks::message::sWifiChannel); }
+    static constexpr size_t supported_channels_list_count_max() { return beerocks::message::SUPPORTED_CHANNELS_LENGTH; }
+};
+
+struct cACTION_APMANAGER_HOSTAP_DFS_CAC_COMPLETED_NOTIFICATION {
+    static constexpr size_t min() { return 12; }
+    static constexpr size_t max() { return 12; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_HOSTAP_DFS_CHANNEL_AVAILABLE_NOTIFICATION {
+    static constexpr size_t min() { return 9; }
+    static constexpr size_t max() { return 9; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_HOSTAP_ADD_4ADDR_STA_UPDATE {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_HOSTAP_DEL_4ADDR_STA_UPDATE {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_HOSTAP_SET_NEIGHBOR_11K_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 19; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 19; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_HOSTAP_REMOVE_NEIGHBOR_11K_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 2; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + beerocks::message::WIFI_SSID_MAX_LENGTH + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_CLIENT_ASSOCIATED_NOTIFICATION {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + sizeof(beerocks::message::sRadioCapabilities) + 2; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + sizeof(beerocks::message::sRadioCapabilities) + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_CLIENT_DISCONNECTED_NOTIFICATION {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 5; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_CLIENT_DISCONNECT_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 7; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 7; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_CLIENT_DISCONNECT_RESPONSE {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_CLIENT_DISALLOW_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_CLIENT_ALLOW_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_CLIENT_RX_RSSI_MEASUREMENT_REQUEST {
+    static constexpr size_t min() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 8; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + sizeof(beerocks::net::sIpv4Addr) + 8; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_CLIENT_RX_RSSI_MEASUREMENT_RESPONSE {
+    static constexpr size_t min() { return sizeof(beerocks::net::sScanResult) + 10; }
+    static constexpr size_t max() { return sizeof(beerocks::net::sScanResult) + 10; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_CLIENT_IRE_CONNECTED_NOTIFICATION {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_ACK {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 2; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_CLIENT_BSS_STEER_REQUEST {
+    static constexpr size_t min() { return 3 * sizeof(sMacAddr) + 6; }
+    static constexpr size_t max() { return 3 * sizeof(sMacAddr) + 6; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_CLIENT_BSS_STEER_RESPONSE {
+    static constexpr size_t min() { return 3 * sizeof(sMacAddr) + 2; }
+    static constexpr size_t max() { return 3 * sizeof(sMacAddr) + 2; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_CLIENT_RX_RSSI_MEASUREMENT_CMD_RESPONSE {
+    static constexpr size_t min() { return sizeof(sMacAddr) + 1; }
+    static constexpr size_t max() { return sizeof(sMacAddr) + 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_STEERING_CLIENT_SET_REQUEST {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 38; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 38; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_STEERING_CLIENT_SET_RESPONSE {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_STEERING_EVENT_PROBE_REQ_NOTIFICATION {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 4; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 4; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_STEERING_EVENT_AUTH_FAIL_NOTIFICATION {
+    static constexpr size_t min() { return 2 * sizeof(sMacAddr) + 5; }
+    static constexpr size_t max() { return 2 * sizeof(sMacAddr) + 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_WIFI_CREDENTIALS_UPDATE_REQUEST {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 255 * sizeof(WSC::cConfigData) + 2; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t wifi_credentials_element_min() { return sizeof(WSC::cConfigData); }
+    static constexpr size_t wifi_credentials_element_max() { return sizeof(WSC::cConfigData); }
+    static constexpr size_t wifi_credentials_count_max() { return 255; }
+};
+
+struct cACTION_APMANAGER_HEARTBEAT_NOTIFICATION {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_READ_ACS_REPORT_REQUEST {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cACTION_APMANAGER_READ_ACS_REPORT_RESPONSE {
+    static constexpr size_t min() { return beerocks::message::SUPPORTED_CHANNELS_LENGTH * sizeof(beerocks::message::sWifiChannel) + 1; }
+    static constexpr size_t max() { return beerocks::message::SUPPORTED_CHANNELS_LENGTH * sizeof(beerocks::message::sWifiChannel) + 1; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t supported_channels_list_element_min() { return sizeof(beerocks::message::sWifiChannel); }
+    static constexpr size_t supported_channels_list_element_max() { return sizeof(beerocks::message::sWifiChannel); }
+    static constexpr size_t supported_channels_list_count_max() { return beerocks::message::SUPPORTED_CHANNELS_LENGTH; }
+};
+
+} // namespace wire_size
+}; // close namespace: beerocks_message
+
+#endif //_BEEROCKS_TLVF_WIRE_SIZES_H_
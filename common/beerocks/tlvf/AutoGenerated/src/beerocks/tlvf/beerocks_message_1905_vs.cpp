@@ -12,6 +12,8 @@
 
 #include <beerocks/tlvf/beerocks_message_1905_vs.h>
 #include <tlvf/tlvflogging.h>
+#include <string.h>
+#include <tlvf/ClassList.h>
 
 using namespace beerocks_message;
 
@@ -12,6 +12,8 @@
 
 #include <beerocks/tlvf/beerocks_message_apmanager.h>
 #include <tlvf/tlvflogging.h>
+#include <string.h>
+#include <tlvf/ClassList.h>
 
 using namespace beerocks_message;
 
@@ -3017,7 +3019,7 @@ bool cACTION_APMANAGER_WIFI_CREDENTIALS_UPDATE_REQUEST::add_wifi_credentials(std
 void cACTION_APMANAGER_WIFI_CREDENTIALS_UPDATE_REQUEST::class_swap()
 {
     tlvf_swap(8*sizeof(eActionOp_APMANAGER), reinterpret_cast<uint8_t*>(m_action_op));
-    for (size_t i = 0; i < (size_t)*m_wifi_credentials_size; i++){
+    for (size_t i = 0; i < m_wifi_credentials_idx__; i++){
         std::get<1>(wifi_credentials(i)).class_swap();
     }
 }
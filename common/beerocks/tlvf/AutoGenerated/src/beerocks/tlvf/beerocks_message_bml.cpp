@@ -12,6 +12,8 @@
 
 #include <beerocks/tlvf/beerocks_message_bml.h>
 #include <tlvf/tlvflogging.h>
+#include <string.h>
+#include <tlvf/ClassList.h>
 
 using namespace beerocks_message;
 
@@ -4304,7 +4306,7 @@ void cACTION_BML_SET_VAP_LIST_CREDENTIALS_REQUEST::class_swap()
 {
     tlvf_swap(8*sizeof(eActionOp_BML), reinterpret_cast<uint8_t*>(m_action_op));
     tlvf_swap(32, reinterpret_cast<uint8_t*>(m_result));
-    for (size_t i = 0; i < (size_t)*m_vap_list_size; i++){
+    for (size_t i = 0; i < m_vap_list_idx__; i++){
         m_vap_list[i].struct_swap();
     }
 }
@@ -4501,7 +4503,7 @@ void cACTION_BML_GET_VAP_LIST_CREDENTIALS_RESPONSE::class_swap()
 {
     tlvf_swap(8*sizeof(eActionOp_BML), reinterpret_cast<uint8_t*>(m_action_op));
     tlvf_swap(32, reinterpret_cast<uint8_t*>(m_result));
-    for (size_t i = 0; i < (size_t)*m_vap_list_size; i++){
+    for (size_t i = 0; i < m_vap_list_idx__; i++){
         m_vap_list[i].struct_swap();
     }
 }
@@ -6618,7 +6620,7 @@ bool cACTION_BML_CHANNEL_SCAN_GET_RESULTS_RESPONSE::alloc_results(size_t count)
 void cACTION_BML_CHANNEL_SCAN_GET_RESULTS_RESPONSE::class_swap()
 {
     tlvf_swap(8*sizeof(eActionOp_BML), reinterpret_cast<uint8_t*>(m_action_op));
-    for (size_t i = 0; i < (size_t)*m_results_size; i++){
+    for (size_t i = 0; i < m_results_idx__; i++){
         m_results[i].struct_swap();
     }
 }
@@ -12,6 +12,8 @@
 
 #include <beerocks/tlvf/beerocks_message_control.h>
 #include <tlvf/tlvflogging.h>
+#include <string.h>
+#include <tlvf/ClassList.h>
 
 using namespace beerocks_message;
 
@@ -2630,7 +2632,7 @@ void cACTION_CONTROL_HOSTAP_STATS_MEASUREMENT_RESPONSE::class_swap()
 {
     tlvf_swap(8*sizeof(eActionOp_CONTROL), reinterpret_cast<uint8_t*>(m_action_op));
     m_ap_stats->struct_swap();
-    for (size_t i = 0; i < (size_t)*m_sta_stats_size; i++){
+    for (size_t i = 0; i < m_sta_stats_idx__; i++){
         m_sta_stats[i].struct_swap();
     }
 }
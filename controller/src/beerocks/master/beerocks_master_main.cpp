@@ -12,6 +12,8 @@
 #include <bcl/network/network_utils.h>
 #include <bpl/bpl_cfg.h>
 #include <easylogging++.h>
+#include <sstream>
+#include <tlvf/tlvfstats.h>
 
 #include "db/db.h"
 #include "son_master_thread.h"
@@ -56,6 +58,14 @@ static void handle_signal()
         break;
     }
 
+    // Dump the tlvf class counters (generated with tlvf.py --stats)
+    case SIGUSR2: {
+        std::stringstream ss;
+        tlvf_stats_dump(ss);
+        LOG(INFO) << ss.str();
+        break;
+    }
+
     default:
         LOG(WARNING) << "Unhandled Signal: '" << strsignal(s_signal) << "' Ignoring...";
         break;
@@ -86,6 +96,12 @@ static void init_signals()
     sigemptyset(&sigusr1_action.sa_mask);
     sigusr1_action.sa_flags = 0;
     sigaction(SIGUSR1, &sigusr1_action, NULL);
+
+    struct sigaction sigusr2_action;
+    sigusr2_action.sa_handler = signal_handler;
+    sigemptyset(&sigusr2_action.sa_mask);
+    sigusr2_action.sa_flags = 0;
+    sigaction(SIGUSR2, &sigusr2_action, NULL);
 }
 
 static bool parse_arguments(int argc, char *argv[])
@@ -19,11 +19,10 @@
 #include "tlvf/WSC/eWscAttributes.h"
 #include "tlvf/WSC/eWscAuth.h"
 #include "tlvf/WSC/eWscEncr.h"
-#include <string.h>
 #include <memory>
 #include <tlvf/BaseClass.h>
-#include <tlvf/ClassList.h>
 #include <tuple>
+#include <string.h>
 #include <tlvf/tlvfutils.h>
 #include "tlvf/WSC/eWscValues8.h"
 #include "tlvf/WSC/eWscMessageType.h"
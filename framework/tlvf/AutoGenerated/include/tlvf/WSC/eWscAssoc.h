@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 
 namespace WSC {
 
@@ -23,6 +24,13 @@ enum eWscAssoc: uint16_t {
     WSC_ASSOC_NOT_ASSOC = 0x0,
     WSC_ASSOC_CONN_SUCCESS = 0x1,
 };
+inline const char *eWscAssoc_str(eWscAssoc value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "WSC_ASSOC_NOT_ASSOC"},
+        {0x1, "WSC_ASSOC_CONN_SUCCESS"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 
 }; // close namespace: WSC
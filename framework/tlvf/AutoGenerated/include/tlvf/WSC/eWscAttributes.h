@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 
 namespace WSC {
 
@@ -53,6 +54,43 @@ enum eWscAttributes: uint16_t {
     ATTR_VERSION = 0x104a,
     ATTR_PRIMARY_DEV_TYPE = 0x1054,
 };
+inline const char *eWscAttributes_str(eWscAttributes value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x1002, "ATTR_ASSOC_STATE"},
+        {0x1003, "ATTR_AUTH_TYPE"},
+        {0x1004, "ATTR_AUTH_TYPE_FLAGS"},
+        {0x1005, "ATTR_AUTHENTICATOR"},
+        {0x1008, "ATTR_CONFIG_METHODS"},
+        {0x1009, "ATTR_CONFIG_ERROR"},
+        {0x100d, "ATTR_CONN_TYPE_FLAGS"},
+        {0x100f, "ATTR_ENCR_TYPE"},
+        {0x1010, "ATTR_ENCR_TYPE_FLAGS"},
+        {0x1011, "ATTR_DEV_NAME"},
+        {0x1012, "ATTR_DEV_PASSWORD_ID"},
+        {0x1018, "ATTR_ENCR_SETTINGS"},
+        {0x101a, "ATTR_ENROLLEE_NONCE"},
+        {0x101e, "ATTR_KEY_WRAP_AUTH"},
+        {0x1020, "ATTR_MAC_ADDR"},
+        {0x1021, "ATTR_MANUFACTURER"},
+        {0x1022, "ATTR_MSG_TYPE"},
+        {0x1023, "ATTR_MODEL_NAME"},
+        {0x1024, "ATTR_MODEL_NUMBER"},
+        {0x1027, "ATTR_NETWORK_KEY"},
+        {0x102d, "ATTR_OS_VERSION"},
+        {0x1032, "ATTR_PUBLIC_KEY"},
+        {0x1039, "ATTR_REGISTRAR_NONCE"},
+        {0x103c, "ATTR_RF_BANDS"},
+        {0x1042, "ATTR_SERIAL_NUMBER"},
+        {0x1044, "ATTR_WSC_STATE"},
+        {0x1045, "ATTR_SSID"},
+        {0x1047, "ATTR_UUID_E"},
+        {0x1048, "ATTR_UUID_R"},
+        {0x1049, "ATTR_VENDOR_EXTENSION"},
+        {0x104a, "ATTR_VERSION"},
+        {0x1054, "ATTR_PRIMARY_DEV_TYPE"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), false);
+}
 
 
 }; // close namespace: WSC
@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 
 namespace WSC {
 
@@ -28,25 +29,26 @@ enum class eWscAuth : uint16_t {
     WSC_AUTH_WPA2PSK = 0x20,
     WSC_AUTH_INVALID = 0xffff,
 };
+inline const char *eWscAuth_str(eWscAuth value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x1, "WSC_AUTH_OPEN"},
+        {0x2, "WSC_AUTH_WPAPSK"},
+        {0x4, "WSC_AUTH_SHARED"},
+        {0x8, "WSC_AUTH_WPA"},
+        {0x10, "WSC_AUTH_WPA2"},
+        {0x20, "WSC_AUTH_WPA2PSK"},
+        {0xffff, "WSC_AUTH_INVALID"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), false);
+}
 class eWscAuthValidate {
 public:
     static bool check(uint16_t value) {
-        bool ret = false;
-        switch (value) {
-        case 0x1:
-        case 0x2:
-        case 0x4:
-        case 0x8:
-        case 0x10:
-        case 0x20:
-        case 0xffff:
-                ret = true;
-                break;
-            default:
-                ret = false;
-                break;
-        }
-        return ret;
+        static constexpr sTlvfEnumBits bitmap[] = {
+            {0x0, 0x100010116},
+            {0x3ff, 0x8000000000000000},
+        };
+        return tlvf_enum_check(bitmap, static_cast<uint64_t>(value), false);
     }
 };
 
@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 
 namespace WSC {
 
@@ -23,6 +24,13 @@ enum eWscConn: uint8_t {
     WSC_CONN_ESS = 0x1,
     WSC_CONN_IBSS = 0x2,
 };
+inline const char *eWscConn_str(eWscConn value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x1, "WSC_CONN_ESS"},
+        {0x2, "WSC_CONN_IBSS"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 
 }; // close namespace: WSC
@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 
 namespace WSC {
 
@@ -27,6 +28,17 @@ enum eWscDev: uint16_t {
     WSC_DEV_NETWORK_INFRA_BRIDGE = 0x5,
     WSC_DEV_NETWORK_INFRA = 0x6,
 };
+inline const char *eWscDev_str(eWscDev value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x1, "WSC_DEV_NETWORK_INFRA_AP"},
+        {0x2, "WSC_DEV_NETWORK_INFRA_ROUTER"},
+        {0x3, "WSC_DEV_NETWORK_INFRA_SWITCH"},
+        {0x4, "WSC_DEV_NETWORK_INFRA_GATEWAY"},
+        {0x5, "WSC_DEV_NETWORK_INFRA_BRIDGE"},
+        {0x6, "WSC_DEV_NETWORK_INFRA"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 
 }; // close namespace: WSC
@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 
 namespace WSC {
 
@@ -26,23 +27,24 @@ enum class eWscEncr : uint16_t {
     WSC_ENCR_AES = 0x8,
     WSC_ENCR_INVALID = 0xffff,
 };
+inline const char *eWscEncr_str(eWscEncr value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x1, "WSC_ENCR_NONE"},
+        {0x2, "WSC_ENCR_WEP"},
+        {0x4, "WSC_ENCR_TKIP"},
+        {0x8, "WSC_ENCR_AES"},
+        {0xffff, "WSC_ENCR_INVALID"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), false);
+}
 class eWscEncrValidate {
 public:
     static bool check(uint16_t value) {
-        bool ret = false;
-        switch (value) {
-        case 0x1:
-        case 0x2:
-        case 0x4:
-        case 0x8:
-        case 0xffff:
-                ret = true;
-                break;
-            default:
-                ret = false;
-                break;
-        }
-        return ret;
+        static constexpr sTlvfEnumBits bitmap[] = {
+            {0x0, 0x116},
+            {0x3ff, 0x8000000000000000},
+        };
+        return tlvf_enum_check(bitmap, static_cast<uint64_t>(value), false);
     }
 };
 
@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 
 namespace WSC {
 
@@ -39,6 +40,18 @@ enum eWscLengths: uint16_t {
     WSC_AUTHENTICATOR_LENGTH = 0x8,
     WSC_ENCRYPTED_SETTINGS_IV_LENGTH = 0x10,
 };
+inline const char *eWscLengths_str(eWscLengths value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x4, "WSC_PRIMARY_DEV_TYPE_OUI_LENGTH"},
+        {0x6, "WSC_MAC_LENGTH"},
+        {0x8, "WSC_PRIMARY_DEV_TYPE_LENGTH"},
+        {0x10, "WSC_NONCE_LENGTH"},
+        {0x20, "WSC_MAX_MODEL_NAME_LENGTH"},
+        {0x40, "WSC_MAX_MANUFACTURER_LENGTH"},
+        {0xc0, "WSC_PUBLIC_KEY_LENGTH"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), false);
+}
 
 
 }; // close namespace: WSC
@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 
 namespace WSC {
 
@@ -24,6 +25,14 @@ enum eWscMessageType: uint8_t {
     WSC_MSG_TYPE_M2 = 0x5,
     WSC_MSG_TYPE_INVALID = 0xff,
 };
+inline const char *eWscMessageType_str(eWscMessageType value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x4, "WSC_MSG_TYPE_M1"},
+        {0x5, "WSC_MSG_TYPE_M2"},
+        {0xff, "WSC_MSG_TYPE_INVALID"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), false);
+}
 
 
 }; // close namespace: WSC
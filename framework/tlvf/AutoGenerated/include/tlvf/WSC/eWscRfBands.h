@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 
 namespace WSC {
 
@@ -24,6 +25,15 @@ enum eWscRfBands: uint8_t {
     WSC_RF_BAND_5GHZ = 0x2,
     WSC_RF_BAND_60GHZ = 0x4,
 };
+inline const char *eWscRfBands_str(eWscRfBands value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x1, "WSC_RF_BAND_2GHZ"},
+        {0x2, "WSC_RF_BAND_5GHZ"},
+        {0x3, nullptr},
+        {0x4, "WSC_RF_BAND_60GHZ"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 
 }; // close namespace: WSC
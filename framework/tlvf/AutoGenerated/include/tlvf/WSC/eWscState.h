@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 
 namespace WSC {
 
@@ -23,6 +24,13 @@ enum eWscState: uint8_t {
     WSC_STATE_NOT_CONFIGURED = 0x1,
     WSC_STATE_CONFIGURED = 0x2,
 };
+inline const char *eWscState_str(eWscState value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x1, "WSC_STATE_NOT_CONFIGURED"},
+        {0x2, "WSC_STATE_CONFIGURED"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 
 }; // close namespace: WSC
@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 
 namespace WSC {
 
@@ -25,6 +26,15 @@ enum eWscValues16: uint16_t {
     DEV_PW_PUSHBUTTON = 0x4,
     WSC_CFG_NO_ERROR = 0x0,
 };
+inline const char *eWscValues16_str(eWscValues16 value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "WSC_CFG_NO_ERROR"},
+        {0x4, "DEV_PW_PUSHBUTTON"},
+        {0x280, "WSC_CONFIG_VIRT_PUSHBUTTON"},
+        {0x480, "WSC_CONFIG_PHY_PUSHBUTTON"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), false);
+}
 
 
 }; // close namespace: WSC
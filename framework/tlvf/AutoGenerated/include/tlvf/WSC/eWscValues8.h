@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 
 namespace WSC {
 
@@ -23,6 +24,13 @@ enum eWscValues8: uint8_t {
     WSC_VERSION = 0x10,
     WFA_ELEM_VERSION2 = 0x0,
 };
+inline const char *eWscValues8_str(eWscValues8 value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "WFA_ELEM_VERSION2"},
+        {0x10, "WSC_VERSION"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), false);
+}
 
 
 }; // close namespace: WSC
@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 
 namespace WSC {
 
@@ -25,10 +26,25 @@ enum eWscVendorExtSubelementBssType {
     FRONTHAUL_BSS = 0x20,
     TEARDOWN = 0x10,
 };
+inline const char *eWscVendorExtSubelementBssType_str(eWscVendorExtSubelementBssType value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x10, "TEARDOWN"},
+        {0x20, "FRONTHAUL_BSS"},
+        {0x40, "BACKHAUL_BSS"},
+        {0x80, "BACKHAUL_STA"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), false);
+}
 
 enum eWscVendorExtVersionIE {
     WSC_VERSION2 = 0x20,
 };
+inline const char *eWscVendorExtVersionIE_str(eWscVendorExtVersionIE value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x20, "WSC_VERSION2"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 
 }; // close namespace: WSC
@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 
 namespace WSC {
 
@@ -24,6 +25,14 @@ enum eWscVendorId {
     WSC_VENDOR_ID_WFA_2 = 0x37,
     WSC_VENDOR_ID_WFA_3 = 0x2a,
 };
+inline const char *eWscVendorId_str(eWscVendorId value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "WSC_VENDOR_ID_WFA_1"},
+        {0x2a, "WSC_VENDOR_ID_WFA_3"},
+        {0x37, "WSC_VENDOR_ID_WFA_2"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), false);
+}
 
 
 }; // close namespace: WSC
@@ -16,10 +16,8 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
-#include <string.h>
 #include <memory>
 #include <tlvf/BaseClass.h>
-#include <tlvf/ClassList.h>
 #include "tlvf/ieee_1905_1/eMessageType.h"
 #include <asm/byteorder.h>
 
@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 
 namespace ieee1905_1 {
 
@@ -23,6 +24,13 @@ enum eLinkMetricNeighborType: uint8_t {
     ALL_NEIGHBORS = 0x0,
     SPECIFIC_NEIGHBOR = 0x1,
 };
+inline const char *eLinkMetricNeighborType_str(eLinkMetricNeighborType value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "ALL_NEIGHBORS"},
+        {0x1, "SPECIFIC_NEIGHBOR"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 
 }; // close namespace: ieee1905_1
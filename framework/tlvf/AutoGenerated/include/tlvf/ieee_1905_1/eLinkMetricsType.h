@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 
 namespace ieee1905_1 {
 
@@ -24,6 +25,14 @@ enum eLinkMetricsType: uint8_t {
     RX_LINK_METRICS_ONLY = 0x1,
     BOTH_TX_AND_RX_LINK_METRICS = 0x2,
 };
+inline const char *eLinkMetricsType_str(eLinkMetricsType value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "TX_LINK_METRICS_ONLY"},
+        {0x1, "RX_LINK_METRICS_ONLY"},
+        {0x2, "BOTH_TX_AND_RX_LINK_METRICS"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 
 
 }; // close namespace: ieee1905_1
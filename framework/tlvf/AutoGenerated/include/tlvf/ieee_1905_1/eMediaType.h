@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 
 namespace ieee1905_1 {
 
@@ -35,6 +36,25 @@ enum eMediaType: uint16_t {
     MOCA_V1_1 = 0x300,
     UNKNONWN_MEDIA = 0xffff,
 };
+inline const char *eMediaType_str(eMediaType value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "IEEE_802_3U_FAST_ETHERNET"},
+        {0x1, "IEEE_802_3AB_GIGABIT_ETHERNET"},
+        {0x100, "IEEE_802_11B_2_4_GHZ"},
+        {0x101, "IEEE_802_11G_2_4_GHZ"},
+        {0x102, "IEEE_802_11A_5_GHZ"},
+        {0x103, "IEEE_802_11N_2_4_GHZ"},
+        {0x104, "IEEE_802_11N_5_GHZ"},
+        {0x105, "IEEE_802_11AC_5_GHZ"},
+        {0x106, "IEEE_802_11AD_60_GHZ"},
+        {0x107, "IEEE_802_11AF"},
+        {0x200, "IEEE_1901_WAVELET"},
+        {0x201, "IEEE_1901_FFT"},
+        {0x300, "MOCA_V1_1"},
+        {0xffff, "UNKNONWN_MEDIA"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), false);
+}
 
 enum eMediaTypeGroup: uint8_t {
     IEEE_802_3 = 0x0,
@@ -43,6 +63,16 @@ enum eMediaTypeGroup: uint8_t {
     MoCA = 0x3,
     UNKNOWN = 0xff,
 };
+inline const char *eMediaTypeGroup_str(eMediaTypeGroup value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "IEEE_802_3"},
+        {0x1, "IEEE_802_11"},
+        {0x2, "IEEE_1901"},
+        {0x3, "MoCA"},
+        {0xff, "UNKNOWN"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), false);
+}
 
 
 }; // close namespace: ieee1905_1
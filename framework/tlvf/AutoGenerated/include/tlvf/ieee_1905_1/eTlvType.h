@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 
 namespace ieee1905_1 {
 
@@ -40,37 +41,38 @@ enum class eTlvType : uint8_t {
     TLV_PUSH_BUTTON_EVENT_NOTIFICATION = 0x12,
     TLV_PUSH_BUTTON_JOIN_NOTIFICATION = 0x13,
 };
+inline const char *eTlvType_str(eTlvType value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "TLV_END_OF_MESSAGE"},
+        {0x1, "TLV_AL_MAC_ADDRESS_TYPE"},
+        {0x2, "TLV_MAC_ADDRESS"},
+        {0x3, "TLV_DEVICE_INFORMATION"},
+        {0x4, "TLV_DEVICE_BRIDGING_CAPABILITY"},
+        {0x5, nullptr},
+        {0x6, "TLV_NON_1905_NEIGHBOR_DEVICE_LIST"},
+        {0x7, "TLV_1905_NEIGHBOR_DEVICE"},
+        {0x8, "TLV_LINK_METRIC_QUERY"},
+        {0x9, "TLV_TRANSMITTER_LINK_METRIC"},
+        {0xa, "TLV_RECEIVER_LINK_METRIC"},
+        {0xb, "TLV_VENDOR_SPECIFIC"},
+        {0xc, "TLV_LINK_METRIC_RESULT_CODE"},
+        {0xd, "TLV_SEARCHED_ROLE"},
+        {0xe, "TLV_AUTOCONFIG_FREQ_BAND"},
+        {0xf, "TLV_SUPPORTED_ROLE"},
+        {0x10, "TLV_SUPPORTED_FREQ_BAND"},
+        {0x11, "TLV_WSC"},
+        {0x12, "TLV_PUSH_BUTTON_EVENT_NOTIFICATION"},
+        {0x13, "TLV_PUSH_BUTTON_JOIN_NOTIFICATION"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
 class eTlvTypeValidate {
 public:
     static bool check(uint8_t value) {
-        bool ret = false;
-        switch (value) {
-        case 0x0:
-        case 0x1:
-        case 0x2:
-        case 0x3:
-        case 0x4:
-        case 0x6:
-        case 0x7:
-        case 0x8:
-        case 0x9:
-        case 0xa:
-        case 0xb:
-        case 0xc:
-        case 0xd:
-        case 0xe:
-        case 0xf:
-        case 0x10:
-        case 0x11:
-        case 0x12:
-        case 0x13:
-                ret = true;
-                break;
-            default:
-                ret = false;
-                break;
-        }
-        return ret;
+        static constexpr sTlvfEnumBits bitmap[] = {
+            {0x0, 0xfffdf},
+        };
+        return tlvf_enum_check(bitmap, static_cast<uint64_t>(value), true);
     }
 };
 
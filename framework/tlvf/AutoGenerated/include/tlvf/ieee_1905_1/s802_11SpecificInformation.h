@@ -16,6 +16,7 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
 #include "tlvf/common/sMacAddr.h"
 
 namespace ieee1905_1 {
@@ -27,6 +28,16 @@ enum eRole: uint8_t {
     WI_FI_P2P_GROUP_OWNER = 0x90,
     IEEE_802_11AD_PCP = 0xa0,
 };
+inline const char *eRole_str(eRole value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x0, "AP"},
+        {0x40, "NON_AP_NON_PCP_STA"},
+        {0x80, "WI_FI_P2P_CLIENT"},
+        {0x90, "WI_FI_P2P_GROUP_OWNER"},
+        {0xa0, "IEEE_802_11AD_PCP"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), false);
+}
 
 typedef struct s802_11SpecificInformation {
     sMacAddr network_membership;
@@ -16,13 +16,12 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
-#include <string.h>
 #include <memory>
 #include <tlvf/BaseClass.h>
-#include <tlvf/ClassList.h>
 #include "tlvf/ieee_1905_1/eTlvType.h"
 #include "tlvf/common/sMacAddr.h"
 #include <tuple>
+#include <tlvf/tlvfenum.h>
 
 namespace ieee1905_1 {
 
@@ -38,6 +37,13 @@ class tlv1905NeighborDevice : public BaseClass
             NO_BRIDGES_EXIST = 0x0,
             AT_LEAST_ONE_BRIDGES_EXIST = 0x80,
         };
+        static const char *eBridgesExist_str(eBridgesExist value) {
+            static constexpr sTlvfEnumName names[] = {
+                {0x0, "NO_BRIDGES_EXIST"},
+                {0x80, "AT_LEAST_ONE_BRIDGES_EXIST"},
+            };
+            return tlvf_enum_name(names, static_cast<uint64_t>(value), false);
+        }
         
         typedef struct sMacAl1905Device {
             sMacAddr mac;
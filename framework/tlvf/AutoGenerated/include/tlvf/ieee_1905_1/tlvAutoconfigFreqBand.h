@@ -16,11 +16,10 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
-#include <string.h>
 #include <memory>
 #include <tlvf/BaseClass.h>
-#include <tlvf/ClassList.h>
 #include "tlvf/ieee_1905_1/eTlvType.h"
+#include <tlvf/tlvfenum.h>
 
 namespace ieee1905_1 {
 
@@ -37,6 +36,14 @@ class tlvAutoconfigFreqBand : public BaseClass
             IEEE_802_11_5_GHZ = 0x1,
             IEEE_802_11_60_GHZ = 0x2,
         };
+        static const char *eValue_str(eValue value) {
+            static constexpr sTlvfEnumName names[] = {
+                {0x0, "IEEE_802_11_2_4_GHZ"},
+                {0x1, "IEEE_802_11_5_GHZ"},
+                {0x2, "IEEE_802_11_60_GHZ"},
+            };
+            return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+        }
         
         const eTlvType& type();
         const uint16_t& length();
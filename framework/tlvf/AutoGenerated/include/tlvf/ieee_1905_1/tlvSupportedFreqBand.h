@@ -16,11 +16,10 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
-#include <string.h>
 #include <memory>
 #include <tlvf/BaseClass.h>
-#include <tlvf/ClassList.h>
 #include "tlvf/ieee_1905_1/eTlvType.h"
+#include <tlvf/tlvfenum.h>
 
 namespace ieee1905_1 {
 
@@ -37,6 +36,14 @@ class tlvSupportedFreqBand : public BaseClass
             BAND_5G = 0x1,
             BAND_60G = 0x2,
         };
+        static const char *eValue_str(eValue value) {
+            static constexpr sTlvfEnumName names[] = {
+                {0x0, "BAND_2_4G"},
+                {0x1, "BAND_5G"},
+                {0x2, "BAND_60G"},
+            };
+            return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+        }
         
         const eTlvType& type();
         const uint16_t& length();
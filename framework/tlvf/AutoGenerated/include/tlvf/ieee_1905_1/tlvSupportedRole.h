@@ -16,11 +16,10 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
-#include <string.h>
 #include <memory>
 #include <tlvf/BaseClass.h>
-#include <tlvf/ClassList.h>
 #include "tlvf/ieee_1905_1/eTlvType.h"
+#include <tlvf/tlvfenum.h>
 
 namespace ieee1905_1 {
 
@@ -35,6 +34,12 @@ class tlvSupportedRole : public BaseClass
         enum eValue: uint8_t {
             REGISTRAR = 0x0,
         };
+        static const char *eValue_str(eValue value) {
+            static constexpr sTlvfEnumName names[] = {
+                {0x0, "REGISTRAR"},
+            };
+            return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+        }
         
         const eTlvType& type();
         const uint16_t& length();
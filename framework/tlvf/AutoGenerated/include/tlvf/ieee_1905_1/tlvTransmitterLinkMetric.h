@@ -16,13 +16,12 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
-#include <string.h>
 #include <memory>
 #include <tlvf/BaseClass.h>
-#include <tlvf/ClassList.h>
 #include "tlvf/ieee_1905_1/eTlvType.h"
 #include "tlvf/common/sMacAddr.h"
 #include <tuple>
+#include <tlvf/tlvfenum.h>
 #include "tlvf/ieee_1905_1/eMediaType.h"
 
 namespace ieee1905_1 {
@@ -39,6 +38,13 @@ class tlvTransmitterLinkMetric : public BaseClass
             LINK_DOES_NOT_INCLUDE_BRIDGE = 0x0,
             LINK_DOES_INCLUDE_ONE_OR_MORE_BRIDGE = 0x1,
         };
+        static const char *eIEEE802_1BridgeFlag_str(eIEEE802_1BridgeFlag value) {
+            static constexpr sTlvfEnumName names[] = {
+                {0x0, "LINK_DOES_NOT_INCLUDE_BRIDGE"},
+                {0x1, "LINK_DOES_INCLUDE_ONE_OR_MORE_BRIDGE"},
+            };
+            return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+        }
         
         typedef struct sLinkMetricInfo {
             //The underlying network technology
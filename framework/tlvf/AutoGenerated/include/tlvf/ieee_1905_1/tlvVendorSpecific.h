@@ -16,13 +16,12 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
-#include <string.h>
 #include <memory>
 #include <tlvf/BaseClass.h>
-#include <tlvf/ClassList.h>
 #include "tlvf/ieee_1905_1/eTlvType.h"
 #include "tlvf/ieee_1905_1/sVendorOUI.h"
 #include <tuple>
+#include <tlvf/tlvfenum.h>
 
 namespace ieee1905_1 {
 
@@ -38,6 +37,13 @@ class tlvVendorSpecific : public BaseClass
             OUI_BYTES = 0x3,
             OUI_INTEL = 0x470300,
         };
+        static const char *eVendorOUI_str(eVendorOUI value) {
+            static constexpr sTlvfEnumName names[] = {
+                {0x3, "OUI_BYTES"},
+                {0x470300, "OUI_INTEL"},
+            };
+            return tlvf_enum_name(names, static_cast<uint64_t>(value), false);
+        }
         
         const eTlvType& type();
         const uint16_t& length();
@@ -0,0 +1,58 @@
+///////////////////////////////////////
+// AUTO GENERATED FILE - DO NOT EDIT //
+///////////////////////////////////////
+
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#ifndef _TLVF_IEEE_1905_1_MSG_MSGLINKMETRICQUERY_H_
+#define _TLVF_IEEE_1905_1_MSG_MSGLINKMETRICQUERY_H_
+
+#include <cstddef>
+#include <stdint.h>
+#include <tlvf/swap.h>
+#include <functional>
+#include <list>
+#include <memory>
+#include <tlvf/CmduMessageRx.h>
+#include <tlvf/CmduMessageTx.h>
+#include <tlvf/CmduTemplate.h>
+#include "tlvf/ieee_1905_1/eMessageType.h"
+#include "tlvf/ieee_1905_1/tlvLinkMetricQuery.h"
+
+namespace ieee1905_1 {
+
+
+class msgLinkMetricQuery
+{
+    public:
+        static ieee1905_1::eMessageType get_message_type();
+
+        // number of optional and repeated TLVs, and of variable length list elements, to build
+        typedef struct sCounts {
+        } sCounts;
+
+        // called once per added TLV (with its index for repeated TLVs), before the next TLV is added
+        typedef struct sFill {
+            std::function<bool(tlvLinkMetricQuery &tlv)> tlv_link_metric_query;
+        } sFill;
+
+        typedef struct sTlvs {
+            std::shared_ptr<tlvLinkMetricQuery> tlv_link_metric_query;
+        } sTlvs;
+
+        static size_t get_wire_size(const sCounts &counts);
+        static bool build(ieee1905_1::CmduMessageTx &cmdu_tx, uint16_t mid, const sCounts &counts, const sFill &fill);
+        // build() on the template Tx message and freeze it, fill may take field handles with tmpl.get_patch()
+        static bool build_template(ieee1905_1::CmduTemplate &tmpl, const sCounts &counts, const sFill &fill);
+        static bool parse(const ieee1905_1::CmduMessageRx &cmdu_rx, sTlvs &tlvs);
+};
+
+}; // close namespace: ieee1905_1
+
+#endif //_TLVF/IEEE_1905_1_MSG_MSGLINKMETRICQUERY_H_
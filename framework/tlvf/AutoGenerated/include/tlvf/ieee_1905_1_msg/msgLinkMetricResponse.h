@@ -0,0 +1,67 @@
+///////////////////////////////////////
+// AUTO GENERATED FILE - DO NOT EDIT //
+///////////////////////////////////////
+
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#ifndef _TLVF_IEEE_1905_1_MSG_MSGLINKMETRICRESPONSE_H_
+#define _TLVF_IEEE_1905_1_MSG_MSGLINKMETRICRESPONSE_H_
+
+#include <cstddef>
+#include <stdint.h>
+#include <tlvf/swap.h>
+#include <functional>
+#include <list>
+#include <memory>
+#include <tlvf/CmduMessageRx.h>
+#include <tlvf/CmduMessageTx.h>
+#include <tlvf/CmduTemplate.h>
+#include "tlvf/ieee_1905_1/eMessageType.h"
+#include "tlvf/ieee_1905_1/tlvTransmitterLinkMetric.h"
+#include "tlvf/ieee_1905_1/tlvReceiverLinkMetric.h"
+
+namespace ieee1905_1 {
+
+
+class msgLinkMetricResponse
+{
+    public:
+        static ieee1905_1::eMessageType get_message_type();
+
+        // number of optional and repeated TLVs, and of variable length list elements, to build
+        typedef struct sCounts {
+            size_t tlv_transmitter_link_metric = 0;
+            size_t tlv_receiver_link_metric = 0;
+            // total number of elements of the interface_pair_info lists in the tlv_transmitter_link_metric TLVs
+            size_t tlv_transmitter_link_metric_interface_pair_info = 0;
+            // total number of elements of the interface_pair_info lists in the tlv_receiver_link_metric TLVs
+            size_t tlv_receiver_link_metric_interface_pair_info = 0;
+        } sCounts;
+
+        // called once per added TLV (with its index for repeated TLVs), before the next TLV is added
+        typedef struct sFill {
+            std::function<bool(tlvTransmitterLinkMetric &tlv, size_t idx)> tlv_transmitter_link_metric;
+            std::function<bool(tlvReceiverLinkMetric &tlv, size_t idx)> tlv_receiver_link_metric;
+        } sFill;
+
+        typedef struct sTlvs {
+            std::list<std::shared_ptr<tlvTransmitterLinkMetric>> tlv_transmitter_link_metric;
+            std::list<std::shared_ptr<tlvReceiverLinkMetric>> tlv_receiver_link_metric;
+        } sTlvs;
+
+        static size_t get_wire_size(const sCounts &counts);
+        static bool build(ieee1905_1::CmduMessageTx &cmdu_tx, uint16_t mid, const sCounts &counts, const sFill &fill);
+        // build() on the template Tx message and freeze it, fill may take field handles with tmpl.get_patch()
+        static bool build_template(ieee1905_1::CmduTemplate &tmpl, const sCounts &counts, const sFill &fill);
+        static bool parse(const ieee1905_1::CmduMessageRx &cmdu_rx, sTlvs &tlvs);
+};
+
+}; // close namespace: ieee1905_1
+
+#endif //_TLVF/IEEE_1905_1_MSG_MSGLINKMETRICRESPONSE_H_
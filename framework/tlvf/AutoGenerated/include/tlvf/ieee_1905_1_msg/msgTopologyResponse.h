@@ -0,0 +1,82 @@
+///////////////////////////////////////
+// AUTO GENERATED FILE - DO NOT EDIT //
+///////////////////////////////////////
+
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#ifndef _TLVF_IEEE_1905_1_MSG_MSGTOPOLOGYRESPONSE_H_
+#define _TLVF_IEEE_1905_1_MSG_MSGTOPOLOGYRESPONSE_H_
+
+#include <cstddef>
+#include <stdint.h>
+#include <tlvf/swap.h>
+#include <functional>
+#include <list>
+#include <memory>
+#include <tlvf/CmduMessageRx.h>
+#include <tlvf/CmduMessageTx.h>
+#include <tlvf/CmduTemplate.h>
+#include "tlvf/ieee_1905_1/eMessageType.h"
+#include "tlvf/ieee_1905_1/tlvDeviceInformation.h"
+#include "tlvf/ieee_1905_1/tlvDeviceBridgingCapability.h"
+#include "tlvf/ieee_1905_1/tlvNon1905neighborDeviceList.h"
+#include "tlvf/ieee_1905_1/tlv1905NeighborDevice.h"
+
+namespace ieee1905_1 {
+
+
+class msgTopologyResponse
+{
+    public:
+        static ieee1905_1::eMessageType get_message_type();
+
+        // number of optional and repeated TLVs, and of variable length list elements, to build
+        typedef struct sCounts {
+            size_t tlv_device_bridging_capability = 0;
+            size_t tlv_non_1905_neighbor_device_list = 0;
+            size_t tlv_1905_neighbor_device = 0;
+            // total number of elements of the local_interface_list lists in the tlv_device_information TLVs
+            size_t tlv_device_information_local_interface_list = 0;
+            // total number of elements of the media_info lists in the tlv_device_information TLVs
+            size_t tlv_device_information_local_interface_list_media_info = 0;
+            // total number of elements of the bridging_tuples_list lists in the tlv_device_bridging_capability TLVs
+            size_t tlv_device_bridging_capability_bridging_tuples_list = 0;
+            // total number of elements of the mac_list lists in the tlv_device_bridging_capability TLVs
+            size_t tlv_device_bridging_capability_bridging_tuples_list_mac_list = 0;
+            // total number of elements of the mac_non_1905_device lists in the tlv_non_1905_neighbor_device_list TLVs
+            size_t tlv_non_1905_neighbor_device_list_mac_non_1905_device = 0;
+            // total number of elements of the mac_al_1905_device lists in the tlv_1905_neighbor_device TLVs
+            size_t tlv_1905_neighbor_device_mac_al_1905_device = 0;
+        } sCounts;
+
+        // called once per added TLV (with its index for repeated TLVs), before the next TLV is added
+        typedef struct sFill {
+            std::function<bool(tlvDeviceInformation &tlv)> tlv_device_information;
+            std::function<bool(tlvDeviceBridgingCapability &tlv, size_t idx)> tlv_device_bridging_capability;
+            std::function<bool(tlvNon1905neighborDeviceList &tlv, size_t idx)> tlv_non_1905_neighbor_device_list;
+            std::function<bool(tlv1905NeighborDevice &tlv, size_t idx)> tlv_1905_neighbor_device;
+        } sFill;
+
+        typedef struct sTlvs {
+            std::shared_ptr<tlvDeviceInformation> tlv_device_information;
+            std::list<std::shared_ptr<tlvDeviceBridgingCapability>> tlv_device_bridging_capability;
+            std::list<std::shared_ptr<tlvNon1905neighborDeviceList>> tlv_non_1905_neighbor_device_list;
+            std::list<std::shared_ptr<tlv1905NeighborDevice>> tlv_1905_neighbor_device;
+        } sTlvs;
+
+        static size_t get_wire_size(const sCounts &counts);
+        static bool build(ieee1905_1::CmduMessageTx &cmdu_tx, uint16_t mid, const sCounts &counts, const sFill &fill);
+        // build() on the template Tx message and freeze it, fill may take field handles with tmpl.get_patch()
+        static bool build_template(ieee1905_1::CmduTemplate &tmpl, const sCounts &counts, const sFill &fill);
+        static bool parse(const ieee1905_1::CmduMessageRx &cmdu_rx, sTlvs &tlvs);
+};
+
+}; // close namespace: ieee1905_1
+
+#endif //_TLVF/IEEE_1905_1_MSG_MSGTOPOLOGYRESPONSE_H_
@@ -0,0 +1,51 @@
+///////////////////////////////////////
+// AUTO GENERATED FILE - DO NOT EDIT //
+///////////////////////////////////////
+
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#ifndef _TLVF_TEST_TLVNESTED_H_
+#define _TLVF_TEST_TLVNESTED_H_
+
+#include <cstddef>
+#include <stdint.h>
+#include <tlvf/swap.h>
+#include <memory>
+#include <tlvf/BaseClass.h>
+#include "tlvf/test/tlvVarList.h"
+
+class tlvTestNested : public BaseClass
+{
+    public:
+        tlvTestNested(uint8_t* buff, size_t buff_len, bool parse = false);
+        explicit tlvTestNested(std::shared_ptr<BaseClass> base, bool parse = false);
+        ~tlvTestNested();
+
+        const uint8_t& type();
+        const uint16_t& length();
+        bool isPostInitSucceeded();
+        std::shared_ptr<cInner> create_inner();
+        bool add_inner(std::shared_ptr<cInner> ptr);
+        std::shared_ptr<cInner> inner() { return m_inner_ptr; }
+        void class_swap() override;
+        bool finalize() override;
+        static size_t get_initial_size();
+
+    private:
+        bool init();
+        uint8_t* m_type = nullptr;
+        uint16_t* m_length = nullptr;
+        cInner *m_inner = nullptr;
+        std::shared_ptr<cInner> m_inner_ptr = nullptr;
+        bool m_inner_init = false;
+        bool m_lock_allocation__ = false;
+        int m_lock_order_counter__ = 0;
+};
+
+#endif //_TLVF/TEST_TLVNESTED_H_
@@ -0,0 +1,77 @@
+///////////////////////////////////////
+// AUTO GENERATED FILE - DO NOT EDIT //
+///////////////////////////////////////
+
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#ifndef _TLVF_TEST_TLVTESTLENGTH_H_
+#define _TLVF_TEST_TLVTESTLENGTH_H_
+
+#include <cstddef>
+#include <stdint.h>
+#include <tlvf/swap.h>
+#include <tlvf/tlvfenum.h>
+#include <memory>
+#include <tlvf/BaseClass.h>
+#include <tuple>
+enum eTestLength: uint8_t {
+    TEST_LENGTH = 0x4,
+};
+inline const char *eTestLength_str(eTestLength value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x4, "TEST_LENGTH"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
+
+enum class eTestLengthClass : uint8_t {
+    TEST_LENGTH = 0x6,
+};
+inline const char *eTestLengthClass_str(eTestLengthClass value) {
+    static constexpr sTlvfEnumName names[] = {
+        {0x6, "TEST_LENGTH"},
+    };
+    return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+}
+class eTestLengthClassValidate {
+public:
+    static bool check(uint8_t value) {
+        static constexpr sTlvfEnumBits bitmap[] = {
+            {0x0, 0x40},
+        };
+        return tlvf_enum_check(bitmap, static_cast<uint64_t>(value), true);
+    }
+};
+
+
+class tlvTestLength : public BaseClass
+{
+    public:
+        tlvTestLength(uint8_t* buff, size_t buff_len, bool parse = false);
+        explicit tlvTestLength(std::shared_ptr<BaseClass> base, bool parse = false);
+        ~tlvTestLength();
+
+        const uint8_t& type();
+        const uint16_t& length();
+        uint8_t* fixed_list(size_t idx = 0);
+        bool set_fixed_list(const void* buffer, size_t size);
+        void class_swap() override;
+        bool finalize() override;
+        static size_t get_initial_size();
+
+    private:
+        bool init();
+        uint8_t* m_type = nullptr;
+        uint16_t* m_length = nullptr;
+        uint8_t* m_fixed_list = nullptr;
+        size_t m_fixed_list_idx__ = 0;
+        int m_lock_order_counter__ = 0;
+};
+
+#endif //_TLVF/TEST_TLVTESTLENGTH_H_
@@ -16,14 +16,13 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
-#include <string.h>
 #include <memory>
 #include <tlvf/BaseClass.h>
-#include <tlvf/ClassList.h>
 #include "tlvf/wfa_map/eTlvTypeMap.h"
 #include <tuple>
 #include <vector>
 #include "tlvf/common/sMacAddr.h"
+#include <string.h>
 #include <tlvf/tlvfutils.h>
 
 namespace wfa_map {
@@ -16,14 +16,13 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
-#include <string.h>
 #include <memory>
 #include <tlvf/BaseClass.h>
-#include <tlvf/ClassList.h>
 #include "tlvf/wfa_map/eTlvTypeMap.h"
 #include "tlvf/common/sMacAddr.h"
 #include <tuple>
 #include <vector>
+#include <tlvf/tlvfenum.h>
 #include <asm/byteorder.h>
 
 namespace wfa_map {
@@ -86,6 +85,27 @@ class cPreferenceOperatingClasses : public BaseClass
             PREFERRED14 = 0xe,
             RESERVED = 0xf,
         };
+        static const char *ePreference_str(ePreference value) {
+            static constexpr sTlvfEnumName names[] = {
+                {0x0, "NON_OPERABLE"},
+                {0x1, "PREFERRED1"},
+                {0x2, "PREFERRED2"},
+                {0x3, "PREFERRED3"},
+                {0x4, "PREFERRED4"},
+                {0x5, "PREFERRED5"},
+                {0x6, "PREFERRED6"},
+                {0x7, "PREFERRED7"},
+                {0x8, "PREFERRED8"},
+                {0x9, "PREFERRED9"},
+                {0xa, "PREFERRED10"},
+                {0xb, "PREFERRED11"},
+                {0xc, "PREFERRED12"},
+                {0xd, "PREFERRED13"},
+                {0xe, "PREFERRED14"},
+                {0xf, "RESERVED"},
+            };
+            return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+        }
         
         enum eReasonCode {
             UNSPECIFIED = 0x0,
@@ -100,6 +120,22 @@ class cPreferenceOperatingClasses : public BaseClass
             IMMEDIATE_OPERATION_POSSIBLE_ON_A_DFS_CHANNEL_CAC_HAS_BEEN_RUN__CHANNEL_HAS_BEEN_CLEARED_FOR_USE = 0x9,
             DFS_CHANNEL_STATE_UNKNOWN_CAC_HAS_NOT_RUN = 0xa,
         };
+        static const char *eReasonCode_str(eReasonCode value) {
+            static constexpr sTlvfEnumName names[] = {
+                {0x0, "UNSPECIFIED"},
+                {0x1, "PROXIMATE_NON_802_11_INTERFERER_IN_LOCAL_ENVIRONMENT"},
+                {0x2, "INTRA_NETWORK_802_11_OBSS_INTERFERENCE_MANAGEMENT"},
+                {0x3, "EXTERNAL_NETWORK_802_11_OBSS_INTERFERENCE_MANAGEMENT"},
+                {0x4, "REDUCED_COVERAGE_LIMITED_TRANSMIT_POWER"},
+                {0x5, "REDUCED_THROUGHPUT_LIMITED_CHANNEL_BANDWIDTH"},
+                {0x6, "IN_DEVICE_INTERFERER_WITHIN_AP"},
+                {0x7, "OPERATION_DISALLOWED_DUE_TO_RADAR_DETECTION_ON_A_DFS_CHANNEL"},
+                {0x8, "OPERATION_WOULD_PREVENT_BACKHAUL_OPERATION_USING_SHARED_RADIO"},
+                {0x9, "IMMEDIATE_OPERATION_POSSIBLE_ON_A_DFS_CHANNEL_CAC_HAS_BEEN_RUN__CHANNEL_HAS_BEEN_CLEARED_FOR_USE"},
+                {0xa, "DFS_CHANNEL_STATE_UNKNOWN_CAC_HAS_NOT_RUN"},
+            };
+            return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+        }
         
         typedef struct sFlags {
             #if defined(__LITTLE_ENDIAN_BITFIELD)
@@ -16,12 +16,11 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
-#include <string.h>
 #include <memory>
 #include <tlvf/BaseClass.h>
-#include <tlvf/ClassList.h>
 #include "tlvf/wfa_map/eTlvTypeMap.h"
 #include "tlvf/common/sMacAddr.h"
+#include <tlvf/tlvfenum.h>
 
 namespace wfa_map {
 
@@ -39,6 +38,15 @@ class tlvChannelSelectionResponse : public BaseClass
             DECLINE_VIOLATES_MOST_RECENTLY_REPORTED_PREFERENCES = 0x2,
             DECLINE_PREVENT_OPERATION_OF_BACKHAUL_LINK = 0x3,
         };
+        static const char *eResponseCode_str(eResponseCode value) {
+            static constexpr sTlvfEnumName names[] = {
+                {0x0, "ACCEPT"},
+                {0x1, "DECLINE_VIOLATES_CURRENT_PREFERENCES"},
+                {0x2, "DECLINE_VIOLATES_MOST_RECENTLY_REPORTED_PREFERENCES"},
+                {0x3, "DECLINE_PREVENT_OPERATION_OF_BACKHAUL_LINK"},
+            };
+            return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+        }
         
         const eTlvTypeMap& type();
         const uint16_t& length();
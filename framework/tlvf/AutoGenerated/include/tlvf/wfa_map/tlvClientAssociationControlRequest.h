@@ -16,13 +16,12 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
-#include <string.h>
 #include <memory>
 #include <tlvf/BaseClass.h>
-#include <tlvf/ClassList.h>
 #include "tlvf/wfa_map/eTlvTypeMap.h"
 #include "tlvf/common/sMacAddr.h"
 #include <tuple>
+#include <tlvf/tlvfenum.h>
 
 namespace wfa_map {
 
@@ -38,6 +37,13 @@ class tlvClientAssociationControlRequest : public BaseClass
             BLOCK = 0x0,
             UNBLOCK = 0x1,
         };
+        static const char *eAssociationControl_str(eAssociationControl value) {
+            static constexpr sTlvfEnumName names[] = {
+                {0x0, "BLOCK"},
+                {0x1, "UNBLOCK"},
+            };
+            return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+        }
         
         const eTlvTypeMap& type();
         const uint16_t& length();
@@ -16,12 +16,11 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
-#include <string.h>
 #include <memory>
 #include <tlvf/BaseClass.h>
-#include <tlvf/ClassList.h>
 #include "tlvf/wfa_map/eTlvTypeMap.h"
 #include "tlvf/common/sMacAddr.h"
+#include <tlvf/tlvfenum.h>
 
 namespace wfa_map {
 
@@ -37,6 +36,13 @@ class tlvClientAssociationEvent : public BaseClass
             CLIENT_HAS_JOINED_THE_BSS = 0x80,
             CLIENT_HAS_LEFT_THE_BSS = 0x0,
         };
+        static const char *eAssociationEvent_str(eAssociationEvent value) {
+            static constexpr sTlvfEnumName names[] = {
+                {0x0, "CLIENT_HAS_LEFT_THE_BSS"},
+                {0x80, "CLIENT_HAS_JOINED_THE_BSS"},
+            };
+            return tlvf_enum_name(names, static_cast<uint64_t>(value), false);
+        }
         
         const eTlvTypeMap& type();
         const uint16_t& length();
@@ -16,12 +16,11 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
-#include <string.h>
 #include <memory>
 #include <tlvf/BaseClass.h>
-#include <tlvf/ClassList.h>
 #include "tlvf/wfa_map/eTlvTypeMap.h"
 #include "tlvf/common/sMacAddr.h"
+#include <tlvf/tlvfenum.h>
 
 namespace wfa_map {
 
@@ -42,6 +41,18 @@ class tlvErrorCode : public BaseClass
             BACKHAUL_STEERING_REQUEST_REJECTED_TARGET_BSS_SIGNAL_NOT_SUITABLE = 0x5,
             BACKHAUL_STEERING_REQUEST_AUTHENTICATION_OR_ASSOCIATION_REJECTED = 0x6,
         };
+        static const char *eReasonCode_str(eReasonCode value) {
+            static constexpr sTlvfEnumName names[] = {
+                {0x0, "RESERVED"},
+                {0x1, "STA_ASSOCIATED_WITH_A_BSS_OPERATED_BY_THE_AGENT"},
+                {0x2, "STA_NOT_ASSOCIATED_WITH_ANY_BSS_OPERATED_BY_THE_AGENT"},
+                {0x3, "CLIENT_CAPABILITY_REPORT_UNSPECIFIED_FAILURE"},
+                {0x4, "BACKHAUL_STEERING_REQUEST_REJECTED_CANNOT_OPERATE_ON_CHANNEL_SPECIFIED"},
+                {0x5, "BACKHAUL_STEERING_REQUEST_REJECTED_TARGET_BSS_SIGNAL_NOT_SUITABLE"},
+                {0x6, "BACKHAUL_STEERING_REQUEST_AUTHENTICATION_OR_ASSOCIATION_REJECTED"},
+            };
+            return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+        }
         
         const eTlvTypeMap& type();
         const uint16_t& length();
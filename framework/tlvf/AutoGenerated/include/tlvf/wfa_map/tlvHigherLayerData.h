@@ -16,12 +16,11 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
-#include <string.h>
 #include <memory>
 #include <tlvf/BaseClass.h>
-#include <tlvf/ClassList.h>
 #include "tlvf/wfa_map/eTlvTypeMap.h"
 #include <tuple>
+#include <tlvf/tlvfenum.h>
 
 namespace wfa_map {
 
@@ -36,6 +35,12 @@ class tlvHigherLayerData : public BaseClass
         enum eProtocol: uint8_t {
             TR_181 = 0x1,
         };
+        static const char *eProtocol_str(eProtocol value) {
+            static constexpr sTlvfEnumName names[] = {
+                {0x1, "TR_181"},
+            };
+            return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+        }
         
         const eTlvTypeMap& type();
         const uint16_t& length();
@@ -16,12 +16,11 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
-#include <string.h>
 #include <memory>
 #include <tlvf/BaseClass.h>
-#include <tlvf/ClassList.h>
 #include "tlvf/wfa_map/eTlvTypeMap.h"
 #include <tuple>
+#include <tlvf/tlvfenum.h>
 
 namespace wfa_map {
 
@@ -36,6 +35,12 @@ class tlvSearchedService : public BaseClass
         enum eSearchedService: uint8_t {
             MULTI_AP_CONTROLLER = 0x0,
         };
+        static const char *eSearchedService_str(eSearchedService value) {
+            static constexpr sTlvfEnumName names[] = {
+                {0x0, "MULTI_AP_CONTROLLER"},
+            };
+            return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+        }
         
         const eTlvTypeMap& type();
         const uint16_t& length();
@@ -16,14 +16,13 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
-#include <string.h>
 #include <memory>
 #include <tlvf/BaseClass.h>
-#include <tlvf/ClassList.h>
 #include "tlvf/wfa_map/eTlvTypeMap.h"
 #include "tlvf/common/sMacAddr.h"
 #include <tuple>
 #include <asm/byteorder.h>
+#include <tlvf/tlvfenum.h>
 
 namespace wfa_map {
 
@@ -60,6 +59,13 @@ class tlvSteeringRequest : public BaseClass
             REQUEST_IS_A_STEERING_OPPORTUNITY = 0x0,
             REQUEST_IS_A_STEERING_MANDATE_TO_TRIGGER_STEERING = 0x1,
         };
+        static const char *eRequestMode_str(eRequestMode value) {
+            static constexpr sTlvfEnumName names[] = {
+                {0x0, "REQUEST_IS_A_STEERING_OPPORTUNITY"},
+                {0x1, "REQUEST_IS_A_STEERING_MANDATE_TO_TRIGGER_STEERING"},
+            };
+            return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+        }
         
         typedef struct sTargetBssidInfo {
             //Wildcard BSSID is represented by FF:FF:FF:FF:FF:FF.
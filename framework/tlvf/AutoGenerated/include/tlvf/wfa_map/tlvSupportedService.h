@@ -16,12 +16,11 @@
 #include <cstddef>
 #include <stdint.h>
 #include <tlvf/swap.h>
-#include <string.h>
 #include <memory>
 #include <tlvf/BaseClass.h>
-#include <tlvf/ClassList.h>
 #include "tlvf/wfa_map/eTlvTypeMap.h"
 #include <tuple>
+#include <tlvf/tlvfenum.h>
 
 namespace wfa_map {
 
@@ -37,6 +36,13 @@ class tlvSupportedService : public BaseClass
             MULTI_AP_CONTROLLER = 0x0,
             MULTI_AP_AGENT = 0x1,
         };
+        static const char *eSupportedService_str(eSupportedService value) {
+            static constexpr sTlvfEnumName names[] = {
+                {0x0, "MULTI_AP_CONTROLLER"},
+                {0x1, "MULTI_AP_AGENT"},
+            };
+            return tlvf_enum_name(names, static_cast<uint64_t>(value), true);
+        }
         
         const eTlvTypeMap& type();
         const uint16_t& length();
@@ -0,0 +1,920 @@
+///////////////////////////////////////
+// AUTO GENERATED FILE - DO NOT EDIT //
+///////////////////////////////////////
+
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#ifndef _TLVF_WIRE_SIZES_H_
+#define _TLVF_WIRE_SIZES_H_
+
+#include <cstddef>
+#include <stdint.h>
+#include <tlvf/ieee_1905_1/tlvVendorSpecific.h>
+
+namespace ieee1905_1 {
+namespace wire_size {
+
+struct tlvLinkMetricResultCode {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return 4; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct tlvMacAddress {
+    static constexpr size_t min() { return 9; }
+    static constexpr size_t max() { return 9; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct tlvSupportedFreqBand {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return 4; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct tlvPushButtonJoinNotification {
+    static constexpr size_t min() { return 23; }
+    static constexpr size_t max() { return 23; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct tlvUnknown {
+    static constexpr size_t min() { return 3; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t data_element_min() { return 1; }
+    static constexpr size_t data_element_max() { return 1; }
+    static constexpr size_t data_count_max() { return SIZE_MAX; }
+};
+
+struct tlv1905NeighborDevice {
+    static constexpr size_t min() { return 9; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t mac_al_1905_device_element_min() { return 7; }
+    static constexpr size_t mac_al_1905_device_element_max() { return 7; }
+    static constexpr size_t mac_al_1905_device_count_max() { return SIZE_MAX; }
+    struct sMacAl1905Device {
+        static constexpr size_t min() { return 7; }
+        static constexpr size_t max() { return 7; }
+        static constexpr bool bounded() { return true; }
+    };
+};
+
+struct s802_11SpecificInformation {
+    static constexpr size_t min() { return 10; }
+    static constexpr size_t max() { return 10; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct tlvTransmitterLinkMetric {
+    static constexpr size_t min() { return 15; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t interface_pair_info_element_min() { return 29; }
+    static constexpr size_t interface_pair_info_element_max() { return 29; }
+    static constexpr size_t interface_pair_info_count_max() { return SIZE_MAX; }
+    struct sLinkMetricInfo {
+        static constexpr size_t min() { return 17; }
+        static constexpr size_t max() { return 17; }
+        static constexpr bool bounded() { return true; }
+    };
+    struct sInterfacePairInfo {
+        static constexpr size_t min() { return 29; }
+        static constexpr size_t max() { return 29; }
+        static constexpr bool bounded() { return true; }
+    };
+};
+
+struct tlvAutoconfigFreqBand {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return 4; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct tlvDeviceInformation {
+    static constexpr size_t min() { return 10; }
+    static constexpr size_t max() { return 67330; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t local_interface_list_element_min() { return 9; }
+    static constexpr size_t local_interface_list_element_max() { return 264; }
+    static constexpr size_t local_interface_list_count_max() { return 255; }
+};
+
+struct cLocalInterfaceInfo {
+    static constexpr size_t min() { return 9; }
+    static constexpr size_t max() { return 264; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t media_info_element_min() { return 1; }
+    static constexpr size_t media_info_element_max() { return 1; }
+    static constexpr size_t media_info_count_max() { return 255; }
+};
+
+struct cCmduHeader {
+    static constexpr size_t min() { return 8; }
+    static constexpr size_t max() { return 8; }
+    static constexpr bool bounded() { return true; }
+    struct sFlags {
+        static constexpr size_t min() { return 1; }
+        static constexpr size_t max() { return 1; }
+        static constexpr bool bounded() { return true; }
+    };
+};
+
+struct tlvSupportedRole {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return 4; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct tlvDeviceBridgingCapability {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return 390409; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t bridging_tuples_list_element_min() { return 1; }
+    static constexpr size_t bridging_tuples_list_element_max() { return 1531; }
+    static constexpr size_t bridging_tuples_list_count_max() { return 255; }
+};
+
+struct cMacList {
+    static constexpr size_t min() { return 1; }
+    static constexpr size_t max() { return 1531; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t mac_list_element_min() { return 6; }
+    static constexpr size_t mac_list_element_max() { return 6; }
+    static constexpr size_t mac_list_count_max() { return 255; }
+};
+
+struct tlvPushButtonEventNotification {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return 3319; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t media_type_list_element_min() { return 13; }
+    static constexpr size_t media_type_list_element_max() { return 13; }
+    static constexpr size_t media_type_list_count_max() { return 255; }
+    struct sMediaType {
+        static constexpr size_t min() { return 13; }
+        static constexpr size_t max() { return 13; }
+        static constexpr bool bounded() { return true; }
+    };
+};
+
+struct tlvWsc {
+    static constexpr size_t min() { return 3; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t payload_element_min() { return 1; }
+    static constexpr size_t payload_element_max() { return 1; }
+    static constexpr size_t payload_count_max() { return SIZE_MAX; }
+};
+
+struct tlvReceiverLinkMetric {
+    static constexpr size_t min() { return 15; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t interface_pair_info_element_min() { return 23; }
+    static constexpr size_t interface_pair_info_element_max() { return 23; }
+    static constexpr size_t interface_pair_info_count_max() { return SIZE_MAX; }
+    struct sLinkMetricInfo {
+        static constexpr size_t min() { return 11; }
+        static constexpr size_t max() { return 11; }
+        static constexpr bool bounded() { return true; }
+    };
+    struct sInterfacePairInfo {
+        static constexpr size_t min() { return 23; }
+        static constexpr size_t max() { return 23; }
+        static constexpr bool bounded() { return true; }
+    };
+};
+
+struct tlvSearchedRole {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return 4; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct tlvNon1905neighborDeviceList {
+    static constexpr size_t min() { return 9; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t mac_non_1905_device_element_min() { return 6; }
+    static constexpr size_t mac_non_1905_device_element_max() { return 6; }
+    static constexpr size_t mac_non_1905_device_count_max() { return SIZE_MAX; }
+};
+
+struct tlvAlMacAddressType {
+    static constexpr size_t min() { return 9; }
+    static constexpr size_t max() { return 9; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct tlvVendorSpecific {
+    static constexpr size_t min() { return sizeof(sVendorOUI) + 3; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t payload_element_min() { return 1; }
+    static constexpr size_t payload_element_max() { return 1; }
+    static constexpr size_t payload_count_max() { return SIZE_MAX; }
+};
+
+struct tlvLinkMetricQueryAllNeighbors {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct tlvLinkMetricQuery {
+    static constexpr size_t min() { return 11; }
+    static constexpr size_t max() { return 11; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct tlvEndOfMessage {
+    static constexpr size_t min() { return 3; }
+    static constexpr size_t max() { return 3; }
+    static constexpr bool bounded() { return true; }
+};
+
+} // namespace wire_size
+}; // close namespace: ieee1905_1
+
+namespace wire_size {
+
+struct sMacAddr {
+    static constexpr size_t min() { return 6; }
+    static constexpr size_t max() { return 6; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct tlvTestLength {
+    static constexpr size_t min() { return 7; }
+    static constexpr size_t max() { return 7; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t fixed_list_element_min() { return 1; }
+    static constexpr size_t fixed_list_element_max() { return 1; }
+    static constexpr size_t fixed_list_count_max() { return 4; }
+};
+
+struct tlvTestVarList {
+    static constexpr size_t min() { return 30; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t simple_list_element_min() { return 2; }
+    static constexpr size_t simple_list_element_max() { return 2; }
+    static constexpr size_t simple_list_count_max() { return 255; }
+    static constexpr size_t test_string_element_min() { return 1; }
+    static constexpr size_t test_string_element_max() { return 1; }
+    static constexpr size_t test_string_count_max() { return 8; }
+    static constexpr size_t complex_list_element_min() { return 9; }
+    static constexpr size_t complex_list_element_max() { return SIZE_MAX; }
+    static constexpr size_t complex_list_count_max() { return 255; }
+    static constexpr size_t unknown_length_list_element_min() { return 9; }
+    static constexpr size_t unknown_length_list_element_max() { return SIZE_MAX; }
+    static constexpr size_t unknown_length_list_count_max() { return SIZE_MAX; }
+};
+
+struct cInner {
+    static constexpr size_t min() { return 9; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t list_element_min() { return 1; }
+    static constexpr size_t list_element_max() { return 1; }
+    static constexpr size_t list_count_max() { return 255; }
+    static constexpr size_t unknown_length_list_inner_element_min() { return 1; }
+    static constexpr size_t unknown_length_list_inner_element_max() { return 1; }
+    static constexpr size_t unknown_length_list_inner_count_max() { return SIZE_MAX; }
+};
+
+struct tlvTestNested {
+    static constexpr size_t min() { return 12; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+};
+
+} // namespace wire_size
+
+namespace WSC {
+namespace wire_size {
+
+struct sWscAttrVersion2 {
+    static constexpr size_t min() { return 10; }
+    static constexpr size_t max() { return 10; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sWscAttrVendorExtMultiAp {
+    static constexpr size_t min() { return 10; }
+    static constexpr size_t max() { return 10; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sWscAttrKeyWrapAuthenticator {
+    static constexpr size_t min() { return 12; }
+    static constexpr size_t max() { return 12; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sWscAttrAuthenticationType {
+    static constexpr size_t min() { return 6; }
+    static constexpr size_t max() { return 6; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sWscAttrEncryptionType {
+    static constexpr size_t min() { return 6; }
+    static constexpr size_t max() { return 6; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct sWscAttrBssid {
+    static constexpr size_t min() { return 10; }
+    static constexpr size_t max() { return 10; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cConfigData {
+    static constexpr size_t min() { return 40; }
+    static constexpr size_t max() { return 136; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t ssid_element_min() { return 1; }
+    static constexpr size_t ssid_element_max() { return 1; }
+    static constexpr size_t ssid_count_max() { return 32; }
+    static constexpr size_t network_key_element_min() { return 1; }
+    static constexpr size_t network_key_element_max() { return 1; }
+    static constexpr size_t network_key_count_max() { return 64; }
+};
+
+struct cWscAttrEncryptedSettings {
+    static constexpr size_t min() { return 20; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t iv_element_min() { return 1; }
+    static constexpr size_t iv_element_max() { return 1; }
+    static constexpr size_t iv_count_max() { return 16; }
+    static constexpr size_t encrypted_settings_element_min() { return 1; }
+    static constexpr size_t encrypted_settings_element_max() { return 1; }
+    static constexpr size_t encrypted_settings_count_max() { return SIZE_MAX; }
+};
+
+struct cWscVendorExtWfa {
+    static constexpr size_t min() { return 10; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t vs_data_element_min() { return 1; }
+    static constexpr size_t vs_data_element_max() { return 1; }
+    static constexpr size_t vs_data_count_max() { return SIZE_MAX; }
+};
+
+struct cWscAttrVersion {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cWscAttrMessageType {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cWscAttrEnrolleeNonce {
+    static constexpr size_t min() { return 20; }
+    static constexpr size_t max() { return 20; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t nonce_element_min() { return 1; }
+    static constexpr size_t nonce_element_max() { return 1; }
+    static constexpr size_t nonce_count_max() { return 16; }
+};
+
+struct cWscAttrPublicKey {
+    static constexpr size_t min() { return 196; }
+    static constexpr size_t max() { return 196; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t public_key_element_min() { return 1; }
+    static constexpr size_t public_key_element_max() { return 1; }
+    static constexpr size_t public_key_count_max() { return 192; }
+};
+
+struct cWscAttrAuthenticationTypeFlags {
+    static constexpr size_t min() { return 6; }
+    static constexpr size_t max() { return 6; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cWscAttrEncryptionTypeFlags {
+    static constexpr size_t min() { return 6; }
+    static constexpr size_t max() { return 6; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cWscAttrConnectionTypeFlags {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cWscAttrConfigurationMethods {
+    static constexpr size_t min() { return 6; }
+    static constexpr size_t max() { return 6; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cWscAttrManufacturer {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t manufacturer_element_min() { return 1; }
+    static constexpr size_t manufacturer_element_max() { return 1; }
+    static constexpr size_t manufacturer_count_max() { return SIZE_MAX; }
+};
+
+struct cWscAttrModelName {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t model_element_min() { return 1; }
+    static constexpr size_t model_element_max() { return 1; }
+    static constexpr size_t model_count_max() { return SIZE_MAX; }
+};
+
+struct cWscAttrModelNumber {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t model_number_element_min() { return 1; }
+    static constexpr size_t model_number_element_max() { return 1; }
+    static constexpr size_t model_number_count_max() { return SIZE_MAX; }
+};
+
+struct cWscAttrSerialNumber {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t serial_number_element_min() { return 1; }
+    static constexpr size_t serial_number_element_max() { return 1; }
+    static constexpr size_t serial_number_count_max() { return SIZE_MAX; }
+};
+
+struct cWscAttrPrimaryDeviceType {
+    static constexpr size_t min() { return 12; }
+    static constexpr size_t max() { return 12; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cWscAttrDeviceName {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t device_name_element_min() { return 1; }
+    static constexpr size_t device_name_element_max() { return 1; }
+    static constexpr size_t device_name_count_max() { return SIZE_MAX; }
+};
+
+struct cWscAttrRfBands {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cWscAttrAssociationState {
+    static constexpr size_t min() { return 6; }
+    static constexpr size_t max() { return 6; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cWscAttrDevicePasswordID {
+    static constexpr size_t min() { return 6; }
+    static constexpr size_t max() { return 6; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cWscAttrConfigurationError {
+    static constexpr size_t min() { return 6; }
+    static constexpr size_t max() { return 6; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cWscAttrOsVersion {
+    static constexpr size_t min() { return 8; }
+    static constexpr size_t max() { return 8; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cWscAttrMac {
+    static constexpr size_t min() { return 10; }
+    static constexpr size_t max() { return 10; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cWscAttrUuidE {
+    static constexpr size_t min() { return 20; }
+    static constexpr size_t max() { return 20; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t data_element_min() { return 1; }
+    static constexpr size_t data_element_max() { return 1; }
+    static constexpr size_t data_count_max() { return 16; }
+};
+
+struct cWscAttrWscState {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 5; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cWscAttrUuidR {
+    static constexpr size_t min() { return 20; }
+    static constexpr size_t max() { return 20; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t data_element_min() { return 1; }
+    static constexpr size_t data_element_max() { return 1; }
+    static constexpr size_t data_count_max() { return 16; }
+};
+
+struct cWscAttrAuthenticator {
+    static constexpr size_t min() { return 12; }
+    static constexpr size_t max() { return 12; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t data_element_min() { return 1; }
+    static constexpr size_t data_element_max() { return 1; }
+    static constexpr size_t data_count_max() { return 8; }
+};
+
+struct cWscAttrRegistrarNonce {
+    static constexpr size_t min() { return 20; }
+    static constexpr size_t max() { return 20; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t nonce_element_min() { return 1; }
+    static constexpr size_t nonce_element_max() { return 1; }
+    static constexpr size_t nonce_count_max() { return 16; }
+};
+
+struct cWscAttrVersion2 {
+    static constexpr size_t min() { return 10; }
+    static constexpr size_t max() { return 10; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cWscAttrSsid {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t ssid_element_min() { return 1; }
+    static constexpr size_t ssid_element_max() { return 1; }
+    static constexpr size_t ssid_count_max() { return SIZE_MAX; }
+};
+
+struct cWscAttrAuthenticationType {
+    static constexpr size_t min() { return 6; }
+    static constexpr size_t max() { return 6; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cWscAttrEncryptionType {
+    static constexpr size_t min() { return 6; }
+    static constexpr size_t max() { return 6; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct cWscAttrNetworkKey {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t key_element_min() { return 1; }
+    static constexpr size_t key_element_max() { return 1; }
+    static constexpr size_t key_count_max() { return SIZE_MAX; }
+};
+
+} // namespace wire_size
+}; // close namespace: WSC
+
+namespace wfa_map {
+namespace wire_size {
+
+struct tlvApCapability {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return 4; }
+    static constexpr bool bounded() { return true; }
+    struct sValue {
+        static constexpr size_t min() { return 1; }
+        static constexpr size_t max() { return 1; }
+        static constexpr bool bounded() { return true; }
+    };
+};
+
+struct tlvChannelPreference {
+    static constexpr size_t min() { return 10; }
+    static constexpr size_t max() { return 65800; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t operating_classes_list_element_min() { return 3; }
+    static constexpr size_t operating_classes_list_element_max() { return 258; }
+    static constexpr size_t operating_classes_list_count_max() { return 255; }
+};
+
+struct cPreferenceOperatingClasses {
+    static constexpr size_t min() { return 3; }
+    static constexpr size_t max() { return 258; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t channel_list_element_min() { return 1; }
+    static constexpr size_t channel_list_element_max() { return 1; }
+    static constexpr size_t channel_list_count_max() { return 255; }
+    struct sFlags {
+        static constexpr size_t min() { return 1; }
+        static constexpr size_t max() { return 1; }
+        static constexpr bool bounded() { return true; }
+    };
+};
+
+struct tlvSupportedService {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return 259; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t supported_service_list_element_min() { return 1; }
+    static constexpr size_t supported_service_list_element_max() { return 1; }
+    static constexpr size_t supported_service_list_count_max() { return 255; }
+};
+
+struct tlvApOperationalBSS {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return 17038339; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t radio_list_element_min() { return 7; }
+    static constexpr size_t radio_list_element_max() { return 66817; }
+    static constexpr size_t radio_list_count_max() { return 255; }
+};
+
+struct cRadioInfo {
+    static constexpr size_t min() { return 7; }
+    static constexpr size_t max() { return 66817; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t radio_bss_list_element_min() { return 7; }
+    static constexpr size_t radio_bss_list_element_max() { return 262; }
+    static constexpr size_t radio_bss_list_count_max() { return 255; }
+};
+
+struct cRadioBssInfo {
+    static constexpr size_t min() { return 7; }
+    static constexpr size_t max() { return 262; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t ssid_element_min() { return 1; }
+    static constexpr size_t ssid_element_max() { return 1; }
+    static constexpr size_t ssid_count_max() { return 255; }
+};
+
+struct tlvAssociatedClients {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return 133693444; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t bss_list_element_min() { return 8; }
+    static constexpr size_t bss_list_element_max() { return 524288; }
+    static constexpr size_t bss_list_count_max() { return 255; }
+};
+
+struct cBssInfo {
+    static constexpr size_t min() { return 8; }
+    static constexpr size_t max() { return 524288; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t clients_associated_list_element_min() { return 8; }
+    static constexpr size_t clients_associated_list_element_max() { return 8; }
+    static constexpr size_t clients_associated_list_count_max() { return 65535; }
+};
+
+struct cClientInfo {
+    static constexpr size_t min() { return 8; }
+    static constexpr size_t max() { return 8; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct tlvSearchedService {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return 259; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t searched_service_list_element_min() { return 1; }
+    static constexpr size_t searched_service_list_element_max() { return 1; }
+    static constexpr size_t searched_service_list_count_max() { return 255; }
+};
+
+struct tlvApRadioBasicCapabilities {
+    static constexpr size_t min() { return 11; }
+    static constexpr size_t max() { return 65801; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t operating_classes_info_list_element_min() { return 3; }
+    static constexpr size_t operating_classes_info_list_element_max() { return 258; }
+    static constexpr size_t operating_classes_info_list_count_max() { return 255; }
+};
+
+struct cOperatingClassesInfo {
+    static constexpr size_t min() { return 3; }
+    static constexpr size_t max() { return 258; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t statically_non_operable_channels_list_element_min() { return 1; }
+    static constexpr size_t statically_non_operable_channels_list_element_max() { return 1; }
+    static constexpr size_t statically_non_operable_channels_list_count_max() { return 255; }
+};
+
+struct tlvApRadioIdentifier {
+    static constexpr size_t min() { return 9; }
+    static constexpr size_t max() { return 9; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct tlvRadioOperationRestriction {
+    static constexpr size_t min() { return 10; }
+    static constexpr size_t max() { return 130570; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t operating_classes_list_element_min() { return 2; }
+    static constexpr size_t operating_classes_list_element_max() { return 512; }
+    static constexpr size_t operating_classes_list_count_max() { return 255; }
+};
+
+struct cRestrictedOperatingClasses {
+    static constexpr size_t min() { return 2; }
+    static constexpr size_t max() { return 512; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t channel_list_element_min() { return 2; }
+    static constexpr size_t channel_list_element_max() { return 2; }
+    static constexpr size_t channel_list_count_max() { return 255; }
+    struct sChannelInfo {
+        static constexpr size_t min() { return 2; }
+        static constexpr size_t max() { return 2; }
+        static constexpr bool bounded() { return true; }
+    };
+};
+
+struct tlvChannelSelectionResponse {
+    static constexpr size_t min() { return 10; }
+    static constexpr size_t max() { return 10; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct tlvTransmitPowerLimit {
+    static constexpr size_t min() { return 10; }
+    static constexpr size_t max() { return 10; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct tlvOperatingChannelReport {
+    static constexpr size_t min() { return 11; }
+    static constexpr size_t max() { return 521; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t operating_classes_list_element_min() { return 2; }
+    static constexpr size_t operating_classes_list_element_max() { return 2; }
+    static constexpr size_t operating_classes_list_count_max() { return 255; }
+    struct sOperatingClasses {
+        static constexpr size_t min() { return 2; }
+        static constexpr size_t max() { return 2; }
+        static constexpr bool bounded() { return true; }
+    };
+};
+
+struct tlvHigherLayerData {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t payload_element_min() { return 1; }
+    static constexpr size_t payload_element_max() { return 1; }
+    static constexpr size_t payload_count_max() { return SIZE_MAX; }
+};
+
+struct tlvSteeringBTMReport {
+    static constexpr size_t min() { return 22; }
+    static constexpr size_t max() { return 22; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct tlvSteeringRequest {
+    static constexpr size_t min() { return 16; }
+    static constexpr size_t max() { return 3586; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t sta_list_element_min() { return 6; }
+    static constexpr size_t sta_list_element_max() { return 6; }
+    static constexpr size_t sta_list_count_max() { return 255; }
+    static constexpr size_t target_bssid_list_element_min() { return 8; }
+    static constexpr size_t target_bssid_list_element_max() { return 8; }
+    static constexpr size_t target_bssid_list_count_max() { return 255; }
+    struct sRequestFlags {
+        static constexpr size_t min() { return 1; }
+        static constexpr size_t max() { return 1; }
+        static constexpr bool bounded() { return true; }
+    };
+    struct sTargetBssidInfo {
+        static constexpr size_t min() { return 8; }
+        static constexpr size_t max() { return 8; }
+        static constexpr bool bounded() { return true; }
+    };
+};
+
+struct tlvApMetric {
+    static constexpr size_t min() { return 13; }
+    static constexpr size_t max() { return SIZE_MAX; }
+    static constexpr bool bounded() { return false; }
+    static constexpr size_t estimated_service_info_field_element_min() { return 1; }
+    static constexpr size_t estimated_service_info_field_element_max() { return 1; }
+    static constexpr size_t estimated_service_info_field_count_max() { return SIZE_MAX; }
+    struct sEstimatedService {
+        static constexpr size_t min() { return 1; }
+        static constexpr size_t max() { return 1; }
+        static constexpr bool bounded() { return true; }
+    };
+};
+
+struct tlvApMetricQuery {
+    static constexpr size_t min() { return 4; }
+    static constexpr size_t max() { return 1534; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t bssid_list_element_min() { return 6; }
+    static constexpr size_t bssid_list_element_max() { return 6; }
+    static constexpr size_t bssid_list_count_max() { return 255; }
+};
+
+struct tlvClientAssociationEvent {
+    static constexpr size_t min() { return 16; }
+    static constexpr size_t max() { return 16; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct tlvClientAssociationControlRequest {
+    static constexpr size_t min() { return 13; }
+    static constexpr size_t max() { return 1543; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t sta_list_element_min() { return 6; }
+    static constexpr size_t sta_list_element_max() { return 6; }
+    static constexpr size_t sta_list_count_max() { return 255; }
+};
+
+struct tlvApHtCapabilities {
+    static constexpr size_t min() { return 10; }
+    static constexpr size_t max() { return 10; }
+    static constexpr bool bounded() { return true; }
+    struct sFalgs {
+        static constexpr size_t min() { return 1; }
+        static constexpr size_t max() { return 1; }
+        static constexpr bool bounded() { return true; }
+    };
+};
+
+struct tlvApHeCapabilities {
+    static constexpr size_t min() { return 12; }
+    static constexpr size_t max() { return 267; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t supported_he_mcs_element_min() { return 1; }
+    static constexpr size_t supported_he_mcs_element_max() { return 1; }
+    static constexpr size_t supported_he_mcs_count_max() { return 255; }
+    struct sFlags1 {
+        static constexpr size_t min() { return 1; }
+        static constexpr size_t max() { return 1; }
+        static constexpr bool bounded() { return true; }
+    };
+    struct sFlags2 {
+        static constexpr size_t min() { return 1; }
+        static constexpr size_t max() { return 1; }
+        static constexpr bool bounded() { return true; }
+    };
+};
+
+struct tlvApVhtCapabilities {
+    static constexpr size_t min() { return 15; }
+    static constexpr size_t max() { return 15; }
+    static constexpr bool bounded() { return true; }
+    struct sFlags1 {
+        static constexpr size_t min() { return 1; }
+        static constexpr size_t max() { return 1; }
+        static constexpr bool bounded() { return true; }
+    };
+    struct sFlags2 {
+        static constexpr size_t min() { return 1; }
+        static constexpr size_t max() { return 1; }
+        static constexpr bool bounded() { return true; }
+    };
+};
+
+struct tlvClientInfo {
+    static constexpr size_t min() { return 15; }
+    static constexpr size_t max() { return 15; }
+    static constexpr bool bounded() { return true; }
+};
+
+struct tlvClientCapabilityReport {
+    static constexpr size_t min() { return 5; }
+    static constexpr size_t max() { return 260; }
+    static constexpr bool bounded() { return true; }
+    static constexpr size_t association_frame_element_min() { return 1; }
+    static constexpr size_t association_frame_element_max() { return 1; }
+    static constexpr size_t association_frame_count_max() { return 255; }
+};
+
+struct tlvErrorCode {
+    static constexpr size_t min() { return 10; }
+    static constexpr size_t max() { return 10; }
+    static constexpr bool bounded() { return true; }
+};
+
+} // namespace wire_size
+}; // close namespace: wfa_map
+
+#endif //_TLVF_WIRE_SIZES_H_
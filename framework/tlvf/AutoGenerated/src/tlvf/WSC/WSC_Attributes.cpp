@@ -12,6 +12,8 @@
 
 #include <tlvf/WSC/WSC_Attributes.h>
 #include <tlvf/tlvflogging.h>
+#include <string.h>
+#include <tlvf/ClassList.h>
 
 using namespace WSC;
 
@@ -12,6 +12,8 @@
 
 #include <tlvf/ieee_1905_1/tlvPushButtonEventNotification.h>
 #include <tlvf/tlvflogging.h>
+#include <string.h>
+#include <tlvf/ClassList.h>
 
 using namespace ieee1905_1;
 
@@ -79,7 +81,7 @@ bool tlvPushButtonEventNotification::alloc_media_type_list(size_t count) {
 void tlvPushButtonEventNotification::class_swap()
 {
     tlvf_swap(16, reinterpret_cast<uint8_t*>(m_length));
-    for (size_t i = 0; i < (size_t)*m_media_type_list_length; i++){
+    for (size_t i = 0; i < m_media_type_list_idx__; i++){
         m_media_type_list[i].struct_swap();
     }
 }
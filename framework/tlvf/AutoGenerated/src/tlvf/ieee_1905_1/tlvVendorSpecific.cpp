@@ -12,6 +12,8 @@
 
 #include <tlvf/ieee_1905_1/tlvVendorSpecific.h>
 #include <tlvf/tlvflogging.h>
+#include <string.h>
+#include <tlvf/ClassList.h>
 
 using namespace ieee1905_1;
 
@@ -0,0 +1,146 @@
+///////////////////////////////////////
+// AUTO GENERATED FILE - DO NOT EDIT //
+///////////////////////////////////////
+
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#include <tlvf/ieee_1905_1_msg/msgApAutoConfigurationSearch.h>
+#include <tlvf/tlvflogging.h>
+#include <tlvf/ieee_1905_1/tlvEndOfMessage.h>
+#include <tlvf/wire_sizes.h>
+
+using namespace ieee1905_1;
+
+ieee1905_1::eMessageType msgApAutoConfigurationSearch::get_message_type() { return ieee1905_1::eMessageType::AP_AUTOCONFIGURATION_SEARCH_MESSAGE; }
+
+size_t msgApAutoConfigurationSearch::get_wire_size(const sCounts &counts)
+{
+    size_t wire_size = ieee1905_1::cCmduHeader::get_initial_size();
+    wire_size += ieee1905_1::wire_size::tlvAlMacAddressType::min();
+    wire_size += ieee1905_1::wire_size::tlvSearchedRole::min();
+    wire_size += ieee1905_1::wire_size::tlvAutoconfigFreqBand::min();
+    if (counts.tlv_supported_service) {
+        wire_size += wfa_map::wire_size::tlvSupportedService::min();
+    }
+    wire_size += counts.tlv_supported_service_supported_service_list * wfa_map::wire_size::tlvSupportedService::supported_service_list_element_min();
+    if (counts.tlv_searched_service) {
+        wire_size += wfa_map::wire_size::tlvSearchedService::min();
+    }
+    wire_size += counts.tlv_searched_service_searched_service_list * wfa_map::wire_size::tlvSearchedService::searched_service_list_element_min();
+    wire_size += ieee1905_1::tlvEndOfMessage::get_initial_size();
+    return wire_size;
+}
+
+bool msgApAutoConfigurationSearch::build(ieee1905_1::CmduMessageTx &cmdu_tx, uint16_t mid, const sCounts &counts, const sFill &fill)
+{
+    auto wire_size = get_wire_size(counts);
+    if (wire_size > cmdu_tx.getMessageBuffLength()) {
+        TLVF_LOG(ERROR) << "msgApAutoConfigurationSearch wire size " << wire_size << " exceeds the buffer length " << cmdu_tx.getMessageBuffLength();
+        return false;
+    }
+    if (!cmdu_tx.create(mid, get_message_type())) {
+        TLVF_LOG(ERROR) << "create() failed";
+        return false;
+    }
+    auto tlv_al_mac = cmdu_tx.addClass<tlvAlMacAddressType>();
+    if (!tlv_al_mac) {
+        TLVF_LOG(ERROR) << "addClass<tlvAlMacAddressType>() failed";
+        return false;
+    }
+    if (fill.tlv_al_mac && !fill.tlv_al_mac(*tlv_al_mac)) {
+        TLVF_LOG(ERROR) << "fill tlv_al_mac failed";
+        return false;
+    }
+    auto tlv_searched_role = cmdu_tx.addClass<tlvSearchedRole>();
+    if (!tlv_searched_role) {
+        TLVF_LOG(ERROR) << "addClass<tlvSearchedRole>() failed";
+        return false;
+    }
+    if (fill.tlv_searched_role && !fill.tlv_searched_role(*tlv_searched_role)) {
+        TLVF_LOG(ERROR) << "fill tlv_searched_role failed";
+        return false;
+    }
+    auto tlv_autoconfig_freq_band = cmdu_tx.addClass<tlvAutoconfigFreqBand>();
+    if (!tlv_autoconfig_freq_band) {
+        TLVF_LOG(ERROR) << "addClass<tlvAutoconfigFreqBand>() failed";
+        return false;
+    }
+    if (fill.tlv_autoconfig_freq_band && !fill.tlv_autoconfig_freq_band(*tlv_autoconfig_freq_band)) {
+        TLVF_LOG(ERROR) << "fill tlv_autoconfig_freq_band failed";
+        return false;
+    }
+    if (counts.tlv_supported_service) {
+        auto tlv_supported_service = cmdu_tx.addClass<wfa_map::tlvSupportedService>();
+        if (!tlv_supported_service) {
+            TLVF_LOG(ERROR) << "addClass<wfa_map::tlvSupportedService>() failed";
+            return false;
+        }
+        if (fill.tlv_supported_service && !fill.tlv_supported_service(*tlv_supported_service)) {
+            TLVF_LOG(ERROR) << "fill tlv_supported_service failed";
+            return false;
+        }
+    }
+    if (counts.tlv_searched_service) {
+        auto tlv_searched_service = cmdu_tx.addClass<wfa_map::tlvSearchedService>();
+        if (!tlv_searched_service) {
+            TLVF_LOG(ERROR) << "addClass<wfa_map::tlvSearchedService>() failed";
+            return false;
+        }
+        if (fill.tlv_searched_service && !fill.tlv_searched_service(*tlv_searched_service)) {
+            TLVF_LOG(ERROR) << "fill tlv_searched_service failed";
+            return false;
+        }
+    }
+    if (!cmdu_tx.finalize()) {
+        TLVF_LOG(ERROR) << "finalize() failed";
+        return false;
+    }
+    if (cmdu_tx.getMessageLength() != wire_size) {
+        TLVF_LOG(WARNING) << "msgApAutoConfigurationSearch length " << cmdu_tx.getMessageLength() << " differs from the computed wire size " << wire_size << ", check the list counts of sCounts";
+    }
+    return true;
+}
+
+bool msgApAutoConfigurationSearch::build_template(ieee1905_1::CmduTemplate &tmpl, const sCounts &counts, const sFill &fill)
+{
+    tmpl.reset();
+    if (!build(tmpl.cmdu_tx(), 0, counts, fill)) {
+        return false;
+    }
+    return tmpl.freeze();
+}
+
+bool msgApAutoConfigurationSearch::parse(const ieee1905_1::CmduMessageRx &cmdu_rx, sTlvs &tlvs)
+{
+    auto cmdu_header = cmdu_rx.getCmduHeader();
+    if (!cmdu_header || cmdu_header->message_type() != get_message_type()) {
+        TLVF_LOG(ERROR) << "not a msgApAutoConfigurationSearch";
+        return false;
+    }
+    tlvs.tlv_al_mac = cmdu_rx.getClass<tlvAlMacAddressType>();
+    if (!tlvs.tlv_al_mac) {
+        TLVF_LOG(ERROR) << "msgApAutoConfigurationSearch is missing the required tlvAlMacAddressType";
+        return false;
+    }
+    tlvs.tlv_searched_role = cmdu_rx.getClass<tlvSearchedRole>();
+    if (!tlvs.tlv_searched_role) {
+        TLVF_LOG(ERROR) << "msgApAutoConfigurationSearch is missing the required tlvSearchedRole";
+        return false;
+    }
+    tlvs.tlv_autoconfig_freq_band = cmdu_rx.getClass<tlvAutoconfigFreqBand>();
+    if (!tlvs.tlv_autoconfig_freq_band) {
+        TLVF_LOG(ERROR) << "msgApAutoConfigurationSearch is missing the required tlvAutoconfigFreqBand";
+        return false;
+    }
+    tlvs.tlv_supported_service = cmdu_rx.getClass<wfa_map::tlvSupportedService>();
+    tlvs.tlv_searched_service = cmdu_rx.getClass<wfa_map::tlvSearchedService>();
+    return true;
+}
+
+
@@ -0,0 +1,85 @@
+///////////////////////////////////////
+// AUTO GENERATED FILE - DO NOT EDIT //
+///////////////////////////////////////
+
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#include <tlvf/ieee_1905_1_msg/msgApAutoConfigurationWSC.h>
+#include <tlvf/tlvflogging.h>
+#include <tlvf/ieee_1905_1/tlvEndOfMessage.h>
+#include <tlvf/wire_sizes.h>
+
+using namespace ieee1905_1;
+
+ieee1905_1::eMessageType msgApAutoConfigurationWSC::get_message_type() { return ieee1905_1::eMessageType::AP_AUTOCONFIGURATION_WSC_MESSAGE; }
+
+size_t msgApAutoConfigurationWSC::get_wire_size(const sCounts &counts)
+{
+    size_t wire_size = ieee1905_1::cCmduHeader::get_initial_size();
+    wire_size += ieee1905_1::wire_size::tlvWsc::min();
+    wire_size += counts.tlv_wsc_payload * ieee1905_1::wire_size::tlvWsc::payload_element_min();
+    wire_size += ieee1905_1::tlvEndOfMessage::get_initial_size();
+    return wire_size;
+}
+
+bool msgApAutoConfigurationWSC::build(ieee1905_1::CmduMessageTx &cmdu_tx, uint16_t mid, const sCounts &counts, const sFill &fill)
+{
+    auto wire_size = get_wire_size(counts);
+    if (wire_size > cmdu_tx.getMessageBuffLength()) {
+        TLVF_LOG(ERROR) << "msgApAutoConfigurationWSC wire size " << wire_size << " exceeds the buffer length " << cmdu_tx.getMessageBuffLength();
+        return false;
+    }
+    if (!cmdu_tx.create(mid, get_message_type())) {
+        TLVF_LOG(ERROR) << "create() failed";
+        return false;
+    }
+    auto tlv_wsc = cmdu_tx.addClass<tlvWsc>();
+    if (!tlv_wsc) {
+        TLVF_LOG(ERROR) << "addClass<tlvWsc>() failed";
+        return false;
+    }
+    if (fill.tlv_wsc && !fill.tlv_wsc(*tlv_wsc)) {
+        TLVF_LOG(ERROR) << "fill tlv_wsc failed";
+        return false;
+    }
+    if (!cmdu_tx.finalize()) {
+        TLVF_LOG(ERROR) << "finalize() failed";
+        return false;
+    }
+    if (cmdu_tx.getMessageLength() != wire_size) {
+        TLVF_LOG(WARNING) << "msgApAutoConfigurationWSC length " << cmdu_tx.getMessageLength() << " differs from the computed wire size " << wire_size << ", check the list counts of sCounts";
+    }
+    return true;
+}
+
+bool msgApAutoConfigurationWSC::build_template(ieee1905_1::CmduTemplate &tmpl, const sCounts &counts, const sFill &fill)
+{
+    tmpl.reset();
+    if (!build(tmpl.cmdu_tx(), 0, counts, fill)) {
+        return false;
+    }
+    return tmpl.freeze();
+}
+
+bool msgApAutoConfigurationWSC::parse(const ieee1905_1::CmduMessageRx &cmdu_rx, sTlvs &tlvs)
+{
+    auto cmdu_header = cmdu_rx.getCmduHeader();
+    if (!cmdu_header || cmdu_header->message_type() != get_message_type()) {
+        TLVF_LOG(ERROR) << "not a msgApAutoConfigurationWSC";
+        return false;
+    }
+    tlvs.tlv_wsc = cmdu_rx.getClass<tlvWsc>();
+    if (!tlvs.tlv_wsc) {
+        TLVF_LOG(ERROR) << "msgApAutoConfigurationWSC is missing the required tlvWsc";
+        return false;
+    }
+    return true;
+}
+
+
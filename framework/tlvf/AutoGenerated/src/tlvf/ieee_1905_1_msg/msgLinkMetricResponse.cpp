@@ -0,0 +1,97 @@
+///////////////////////////////////////
+// AUTO GENERATED FILE - DO NOT EDIT //
+///////////////////////////////////////
+
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#include <tlvf/ieee_1905_1_msg/msgLinkMetricResponse.h>
+#include <tlvf/tlvflogging.h>
+#include <tlvf/ieee_1905_1/tlvEndOfMessage.h>
+#include <tlvf/wire_sizes.h>
+
+using namespace ieee1905_1;
+
+ieee1905_1::eMessageType msgLinkMetricResponse::get_message_type() { return ieee1905_1::eMessageType::LINK_METRIC_RESPONSE_MESSAGE; }
+
+size_t msgLinkMetricResponse::get_wire_size(const sCounts &counts)
+{
+    size_t wire_size = ieee1905_1::cCmduHeader::get_initial_size();
+    wire_size += counts.tlv_transmitter_link_metric * ieee1905_1::wire_size::tlvTransmitterLinkMetric::min();
+    wire_size += counts.tlv_transmitter_link_metric_interface_pair_info * ieee1905_1::wire_size::tlvTransmitterLinkMetric::interface_pair_info_element_min();
+    wire_size += counts.tlv_receiver_link_metric * ieee1905_1::wire_size::tlvReceiverLinkMetric::min();
+    wire_size += counts.tlv_receiver_link_metric_interface_pair_info * ieee1905_1::wire_size::tlvReceiverLinkMetric::interface_pair_info_element_min();
+    wire_size += ieee1905_1::tlvEndOfMessage::get_initial_size();
+    return wire_size;
+}
+
+bool msgLinkMetricResponse::build(ieee1905_1::CmduMessageTx &cmdu_tx, uint16_t mid, const sCounts &counts, const sFill &fill)
+{
+    auto wire_size = get_wire_size(counts);
+    if (wire_size > cmdu_tx.getMessageBuffLength()) {
+        TLVF_LOG(ERROR) << "msgLinkMetricResponse wire size " << wire_size << " exceeds the buffer length " << cmdu_tx.getMessageBuffLength();
+        return false;
+    }
+    if (!cmdu_tx.create(mid, get_message_type())) {
+        TLVF_LOG(ERROR) << "create() failed";
+        return false;
+    }
+    for (size_t i = 0; i < counts.tlv_transmitter_link_metric; i++) {
+        auto tlv_transmitter_link_metric = cmdu_tx.addClass<tlvTransmitterLinkMetric>();
+        if (!tlv_transmitter_link_metric) {
+            TLVF_LOG(ERROR) << "addClass<tlvTransmitterLinkMetric>() failed";
+            return false;
+        }
+        if (fill.tlv_transmitter_link_metric && !fill.tlv_transmitter_link_metric(*tlv_transmitter_link_metric, i)) {
+            TLVF_LOG(ERROR) << "fill tlv_transmitter_link_metric failed";
+            return false;
+        }
+    }
+    for (size_t i = 0; i < counts.tlv_receiver_link_metric; i++) {
+        auto tlv_receiver_link_metric = cmdu_tx.addClass<tlvReceiverLinkMetric>();
+        if (!tlv_receiver_link_metric) {
+            TLVF_LOG(ERROR) << "addClass<tlvReceiverLinkMetric>() failed";
+            return false;
+        }
+        if (fill.tlv_receiver_link_metric && !fill.tlv_receiver_link_metric(*tlv_receiver_link_metric, i)) {
+            TLVF_LOG(ERROR) << "fill tlv_receiver_link_metric failed";
+            return false;
+        }
+    }
+    if (!cmdu_tx.finalize()) {
+        TLVF_LOG(ERROR) << "finalize() failed";
+        return false;
+    }
+    if (cmdu_tx.getMessageLength() != wire_size) {
+        TLVF_LOG(WARNING) << "msgLinkMetricResponse length " << cmdu_tx.getMessageLength() << " differs from the computed wire size " << wire_size << ", check the list counts of sCounts";
+    }
+    return true;
+}
+
+bool msgLinkMetricResponse::build_template(ieee1905_1::CmduTemplate &tmpl, const sCounts &counts, const sFill &fill)
+{
+    tmpl.reset();
+    if (!build(tmpl.cmdu_tx(), 0, counts, fill)) {
+        return false;
+    }
+    return tmpl.freeze();
+}
+
+bool msgLinkMetricResponse::parse(const ieee1905_1::CmduMessageRx &cmdu_rx, sTlvs &tlvs)
+{
+    auto cmdu_header = cmdu_rx.getCmduHeader();
+    if (!cmdu_header || cmdu_header->message_type() != get_message_type()) {
+        TLVF_LOG(ERROR) << "not a msgLinkMetricResponse";
+        return false;
+    }
+    tlvs.tlv_transmitter_link_metric = cmdu_rx.getClassList<tlvTransmitterLinkMetric>();
+    tlvs.tlv_receiver_link_metric = cmdu_rx.getClassList<tlvReceiverLinkMetric>();
+    return true;
+}
+
+
@@ -0,0 +1,100 @@
+///////////////////////////////////////
+// AUTO GENERATED FILE - DO NOT EDIT //
+///////////////////////////////////////
+
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#include <tlvf/ieee_1905_1_msg/msgPushButtonEventNotification.h>
+#include <tlvf/tlvflogging.h>
+#include <tlvf/ieee_1905_1/tlvEndOfMessage.h>
+#include <tlvf/wire_sizes.h>
+
+using namespace ieee1905_1;
+
+ieee1905_1::eMessageType msgPushButtonEventNotification::get_message_type() { return ieee1905_1::eMessageType::PUSH_BUTTON_EVENT_NOTIFICATION_MESSAGE; }
+
+size_t msgPushButtonEventNotification::get_wire_size(const sCounts &counts)
+{
+    size_t wire_size = ieee1905_1::cCmduHeader::get_initial_size();
+    wire_size += ieee1905_1::wire_size::tlvAlMacAddressType::min();
+    wire_size += ieee1905_1::wire_size::tlvPushButtonEventNotification::min();
+    wire_size += counts.tlv_push_button_event_notification_media_type_list * ieee1905_1::wire_size::tlvPushButtonEventNotification::media_type_list_element_min();
+    wire_size += ieee1905_1::tlvEndOfMessage::get_initial_size();
+    return wire_size;
+}
+
+bool msgPushButtonEventNotification::build(ieee1905_1::CmduMessageTx &cmdu_tx, uint16_t mid, const sCounts &counts, const sFill &fill)
+{
+    auto wire_size = get_wire_size(counts);
+    if (wire_size > cmdu_tx.getMessageBuffLength()) {
+        TLVF_LOG(ERROR) << "msgPushButtonEventNotification wire size " << wire_size << " exceeds the buffer length " << cmdu_tx.getMessageBuffLength();
+        return false;
+    }
+    if (!cmdu_tx.create(mid, get_message_type())) {
+        TLVF_LOG(ERROR) << "create() failed";
+        return false;
+    }
+    auto tlv_al_mac = cmdu_tx.addClass<tlvAlMacAddressType>();
+    if (!tlv_al_mac) {
+        TLVF_LOG(ERROR) << "addClass<tlvAlMacAddressType>() failed";
+        return false;
+    }
+    if (fill.tlv_al_mac && !fill.tlv_al_mac(*tlv_al_mac)) {
+        TLVF_LOG(ERROR) << "fill tlv_al_mac failed";
+        return false;
+    }
+    auto tlv_push_button_event_notification = cmdu_tx.addClass<tlvPushButtonEventNotification>();
+    if (!tlv_push_button_event_notification) {
+        TLVF_LOG(ERROR) << "addClass<tlvPushButtonEventNotification>() failed";
+        return false;
+    }
+    if (fill.tlv_push_button_event_notification && !fill.tlv_push_button_event_notification(*tlv_push_button_event_notification)) {
+        TLVF_LOG(ERROR) << "fill tlv_push_button_event_notification failed";
+        return false;
+    }
+    if (!cmdu_tx.finalize()) {
+        TLVF_LOG(ERROR) << "finalize() failed";
+        return false;
+    }
+    if (cmdu_tx.getMessageLength() != wire_size) {
+        TLVF_LOG(WARNING) << "msgPushButtonEventNotification length " << cmdu_tx.getMessageLength() << " differs from the computed wire size " << wire_size << ", check the list counts of sCounts";
+    }
+    return true;
+}
+
+bool msgPushButtonEventNotification::build_template(ieee1905_1::CmduTemplate &tmpl, const sCounts &counts, const sFill &fill)
+{
+    tmpl.reset();
+    if (!build(tmpl.cmdu_tx(), 0, counts, fill)) {
+        return false;
+    }
+    return tmpl.freeze();
+}
+
+bool msgPushButtonEventNotification::parse(const ieee1905_1::CmduMessageRx &cmdu_rx, sTlvs &tlvs)
+{
+    auto cmdu_header = cmdu_rx.getCmduHeader();
+    if (!cmdu_header || cmdu_header->message_type() != get_message_type()) {
+        TLVF_LOG(ERROR) << "not a msgPushButtonEventNotification";
+        return false;
+    }
+    tlvs.tlv_al_mac = cmdu_rx.getClass<tlvAlMacAddressType>();
+    if (!tlvs.tlv_al_mac) {
+        TLVF_LOG(ERROR) << "msgPushButtonEventNotification is missing the required tlvAlMacAddressType";
+        return false;
+    }
+    tlvs.tlv_push_button_event_notification = cmdu_rx.getClass<tlvPushButtonEventNotification>();
+    if (!tlvs.tlv_push_button_event_notification) {
+        TLVF_LOG(ERROR) << "msgPushButtonEventNotification is missing the required tlvPushButtonEventNotification";
+        return false;
+    }
+    return true;
+}
+
+
@@ -0,0 +1,129 @@
+///////////////////////////////////////
+// AUTO GENERATED FILE - DO NOT EDIT //
+///////////////////////////////////////
+
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#include <tlvf/ieee_1905_1_msg/msgTopologyResponse.h>
+#include <tlvf/tlvflogging.h>
+#include <tlvf/ieee_1905_1/tlvEndOfMessage.h>
+#include <tlvf/wire_sizes.h>
+
+using namespace ieee1905_1;
+
+ieee1905_1::eMessageType msgTopologyResponse::get_message_type() { return ieee1905_1::eMessageType::TOPOLOGY_RESPONSE_MESSAGE; }
+
+size_t msgTopologyResponse::get_wire_size(const sCounts &counts)
+{
+    size_t wire_size = ieee1905_1::cCmduHeader::get_initial_size();
+    wire_size += ieee1905_1::wire_size::tlvDeviceInformation::min();
+    wire_size += counts.tlv_device_information_local_interface_list * ieee1905_1::wire_size::tlvDeviceInformation::local_interface_list_element_min();
+    wire_size += counts.tlv_device_information_local_interface_list_media_info * ieee1905_1::wire_size::cLocalInterfaceInfo::media_info_element_min();
+    wire_size += counts.tlv_device_bridging_capability * ieee1905_1::wire_size::tlvDeviceBridgingCapability::min();
+    wire_size += counts.tlv_device_bridging_capability_bridging_tuples_list * ieee1905_1::wire_size::tlvDeviceBridgingCapability::bridging_tuples_list_element_min();
+    wire_size += counts.tlv_device_bridging_capability_bridging_tuples_list_mac_list * ieee1905_1::wire_size::cMacList::mac_list_element_min();
+    wire_size += counts.tlv_non_1905_neighbor_device_list * ieee1905_1::wire_size::tlvNon1905neighborDeviceList::min();
+    wire_size += counts.tlv_non_1905_neighbor_device_list_mac_non_1905_device * ieee1905_1::wire_size::tlvNon1905neighborDeviceList::mac_non_1905_device_element_min();
+    wire_size += counts.tlv_1905_neighbor_device * ieee1905_1::wire_size::tlv1905NeighborDevice::min();
+    wire_size += counts.tlv_1905_neighbor_device_mac_al_1905_device * ieee1905_1::wire_size::tlv1905NeighborDevice::mac_al_1905_device_element_min();
+    wire_size += ieee1905_1::tlvEndOfMessage::get_initial_size();
+    return wire_size;
+}
+
+bool msgTopologyResponse::build(ieee1905_1::CmduMessageTx &cmdu_tx, uint16_t mid, const sCounts &counts, const sFill &fill)
+{
+    auto wire_size = get_wire_size(counts);
+    if (wire_size > cmdu_tx.getMessageBuffLength()) {
+        TLVF_LOG(ERROR) << "msgTopologyResponse wire size " << wire_size << " exceeds the buffer length " << cmdu_tx.getMessageBuffLength();
+        return false;
+    }
+    if (!cmdu_tx.create(mid, get_message_type())) {
+        TLVF_LOG(ERROR) << "create() failed";
+        return false;
+    }
+    auto tlv_device_information = cmdu_tx.addClass<tlvDeviceInformation>();
+    if (!tlv_device_information) {
+        TLVF_LOG(ERROR) << "addClass<tlvDeviceInformation>() failed";
+        return false;
+    }
+    if (fill.tlv_device_information && !fill.tlv_device_information(*tlv_device_information)) {
+        TLVF_LOG(ERROR) << "fill tlv_device_information failed";
+        return false;
+    }
+    for (size_t i = 0; i < counts.tlv_device_bridging_capability; i++) {
+        auto tlv_device_bridging_capability = cmdu_tx.addClass<tlvDeviceBridgingCapability>();
+        if (!tlv_device_bridging_capability) {
+            TLVF_LOG(ERROR) << "addClass<tlvDeviceBridgingCapability>() failed";
+            return false;
+        }
+        if (fill.tlv_device_bridging_capability && !fill.tlv_device_bridging_capability(*tlv_device_bridging_capability, i)) {
+            TLVF_LOG(ERROR) << "fill tlv_device_bridging_capability failed";
+            return false;
+        }
+    }
+    for (size_t i = 0; i < counts.tlv_non_1905_neighbor_device_list; i++) {
+        auto tlv_non_1905_neighbor_device_list = cmdu_tx.addClass<tlvNon1905neighborDeviceList>();
+        if (!tlv_non_1905_neighbor_device_list) {
+            TLVF_LOG(ERROR) << "addClass<tlvNon1905neighborDeviceList>() failed";
+            return false;
+        }
+        if (fill.tlv_non_1905_neighbor_device_list && !fill.tlv_non_1905_neighbor_device_list(*tlv_non_1905_neighbor_device_list, i)) {
+            TLVF_LOG(ERROR) << "fill tlv_non_1905_neighbor_device_list failed";
+            return false;
+        }
+    }
+    for (size_t i = 0; i < counts.tlv_1905_neighbor_device; i++) {
+        auto tlv_1905_neighbor_device = cmdu_tx.addClass<tlv1905NeighborDevice>();
+        if (!tlv_1905_neighbor_device) {
+            TLVF_LOG(ERROR) << "addClass<tlv1905NeighborDevice>() failed";
+            return false;
+        }
+        if (fill.tlv_1905_neighbor_device && !fill.tlv_1905_neighbor_device(*tlv_1905_neighbor_device, i)) {
+            TLVF_LOG(ERROR) << "fill tlv_1905_neighbor_device failed";
+            return false;
+        }
+    }
+    if (!cmdu_tx.finalize()) {
+        TLVF_LOG(ERROR) << "finalize() failed";
+        return false;
+    }
+    if (cmdu_tx.getMessageLength() != wire_size) {
+        TLVF_LOG(WARNING) << "msgTopologyResponse length " << cmdu_tx.getMessageLength() << " differs from the computed wire size " << wire_size << ", check the list counts of sCounts";
+    }
+    return true;
+}
+
+bool msgTopologyResponse::build_template(ieee1905_1::CmduTemplate &tmpl, const sCounts &counts, const sFill &fill)
+{
+    tmpl.reset();
+    if (!build(tmpl.cmdu_tx(), 0, counts, fill)) {
+        return false;
+    }
+    return tmpl.freeze();
+}
+
+bool msgTopologyResponse::parse(const ieee1905_1::CmduMessageRx &cmdu_rx, sTlvs &tlvs)
+{
+    auto cmdu_header = cmdu_rx.getCmduHeader();
+    if (!cmdu_header || cmdu_header->message_type() != get_message_type()) {
+        TLVF_LOG(ERROR) << "not a msgTopologyResponse";
+        return false;
+    }
+    tlvs.tlv_device_information = cmdu_rx.getClass<tlvDeviceInformation>();
+    if (!tlvs.tlv_device_information) {
+        TLVF_LOG(ERROR) << "msgTopologyResponse is missing the required tlvDeviceInformation";
+        return false;
+    }
+    tlvs.tlv_device_bridging_capability = cmdu_rx.getClassList<tlvDeviceBridgingCapability>();
+    tlvs.tlv_non_1905_neighbor_device_list = cmdu_rx.getClassList<tlvNon1905neighborDeviceList>();
+    tlvs.tlv_1905_neighbor_device = cmdu_rx.getClassList<tlv1905NeighborDevice>();
+    return true;
+}
+
+
@@ -0,0 +1,179 @@
+///////////////////////////////////////
+// AUTO GENERATED FILE - DO NOT EDIT //
+///////////////////////////////////////
+
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#include <tlvf/test/tlvNested.h>
+#include <tlvf/tlvflogging.h>
+#include <string.h>
+#include <tlvf/ClassList.h>
+
+tlvTestNested::tlvTestNested(uint8_t* buff, size_t buff_len, bool parse) :
+    BaseClass(buff, buff_len, parse) {
+    m_init_succeeded = init();
+}
+tlvTestNested::tlvTestNested(std::shared_ptr<BaseClass> base, bool parse) :
+BaseClass(base->getBuffPtr(), base->getBuffRemainingBytes(), parse){
+    m_init_succeeded = init();
+}
+tlvTestNested::~tlvTestNested() {
+}
+const uint8_t& tlvTestNested::type() {
+    return (const uint8_t&)(*m_type);
+}
+
+const uint16_t& tlvTestNested::length() {
+    return (const uint16_t&)(*m_length);
+}
+
+bool tlvTestNested::isPostInitSucceeded() {
+    if (!m_inner_init) {
+        TLVF_LOG(ERROR) << "inner is not initialized";
+        return false;
+    }
+    return true; 
+}
+
+std::shared_ptr<cInner> tlvTestNested::create_inner() {
+    if (m_lock_order_counter__ > 0) {
+        TLVF_LOG(ERROR) << "Out of order allocation for variable length list inner, abort!";
+        return nullptr;
+    }
+    size_t len = cInner::get_initial_size();
+    if (m_lock_allocation__ || getBuffRemainingBytes() < len) {
+        TLVF_LOG(ERROR) << "Not enough available space on buffer";
+        return nullptr;
+    }
+    m_lock_order_counter__ = 0;
+    m_lock_allocation__ = true;
+    uint8_t *src = (uint8_t *)m_inner;
+    if (!m_parse__) {
+        uint8_t *dst = src + len;
+        size_t move_length = getBuffRemainingBytes(src) - len;
+        std::copy_n(src, move_length, dst);
+    }
+    return std::make_shared<cInner>(src, getBuffRemainingBytes(src), m_parse__);
+}
+
+bool tlvTestNested::add_inner(std::shared_ptr<cInner> ptr) {
+    if (ptr == nullptr) {
+        TLVF_LOG(ERROR) << "Received entry is nullptr";
+        return false;
+    }
+    if (m_lock_allocation__ == false) {
+        TLVF_LOG(ERROR) << "No call to create_inner was called before add_inner";
+        return false;
+    }
+    uint8_t *src = (uint8_t *)m_inner;
+    if (ptr->getStartBuffPtr() != src) {
+        TLVF_LOG(ERROR) << "Received entry pointer is different than expected (expecting the same pointer returned from add method)";
+        return false;
+    }
+    if (ptr->getLen() > getBuffRemainingBytes(ptr->getStartBuffPtr())) {;
+        TLVF_LOG(ERROR) << "Not enough available space on buffer";
+        return false;
+    }
+    m_inner_init = true;
+    size_t len = ptr->getLen();
+    m_inner_ptr = ptr;
+    if (!buffPtrIncrementSafe(len)) {
+        LOG(ERROR) << "buffPtrIncrementSafe(" << std::dec << len << ") Failed!";
+        return false;
+    }
+    if(!m_parse__ && m_length){ (*m_length) += len; }
+    m_lock_allocation__ = false;
+    return true;
+}
+
+void tlvTestNested::class_swap()
+{
+    tlvf_swap(16, reinterpret_cast<uint8_t*>(m_length));
+    if (m_inner_ptr) { m_inner_ptr->class_swap(); }
+}
+
+bool tlvTestNested::finalize()
+{
+    if (m_parse__) {
+        TLVF_LOG(DEBUG) << "finalize() called but m_parse__ is set";
+        return true;
+    }
+    if (m_finalized__) {
+        TLVF_LOG(DEBUG) << "finalize() called for already finalized class";
+        return true;
+    }
+    if (!isPostInitSucceeded()) {
+        TLVF_LOG(ERROR) << "post init check failed";
+        return false;
+    }
+    if (m_inner__) {
+        if (!m_inner__->finalize()) {
+            TLVF_LOG(ERROR) << "m_inner__->finalize() failed";
+            return false;
+        }
+        auto tailroom = m_inner__->getMessageBuffLength() - m_inner__->getMessageLength();
+        m_buff_ptr__ -= tailroom;
+        *m_length -= tailroom;
+    }
+    class_swap();
+    m_finalized__ = true;
+    return true;
+}
+
+size_t tlvTestNested::get_initial_size()
+{
+    size_t class_size = 0;
+    class_size += sizeof(uint8_t); // type
+    class_size += sizeof(uint16_t); // length
+    return class_size;
+}
+
+bool tlvTestNested::init()
+{
+    if (getBuffRemainingBytes() < get_initial_size()) {
+        TLVF_LOG(ERROR) << "Not enough available space on buffer. Class init failed";
+        return false;
+    }
+    m_type = (uint8_t*)m_buff_ptr__;
+    if (!m_parse__) *m_type = 0xfe;
+    if (!buffPtrIncrementSafe(sizeof(uint8_t))) {
+        LOG(ERROR) << "buffPtrIncrementSafe(" << std::dec << sizeof(uint8_t) << ") Failed!";
+        return false;
+    }
+    m_length = (uint16_t*)m_buff_ptr__;
+    if (!m_parse__) *m_length = 0;
+    if (!buffPtrIncrementSafe(sizeof(uint16_t))) {
+        LOG(ERROR) << "buffPtrIncrementSafe(" << std::dec << sizeof(uint16_t) << ") Failed!";
+        return false;
+    }
+    m_inner = (cInner*)m_buff_ptr__;
+    if (m_parse__) {
+        auto inner = create_inner();
+        if (!inner) {
+            TLVF_LOG(ERROR) << "create_inner() failed";
+            return false;
+        }
+        if (!add_inner(inner)) {
+            TLVF_LOG(ERROR) << "add_inner() failed";
+            return false;
+        }
+        // swap back since inner will be swapped as part of the whole class swap
+        inner->class_swap();
+    }
+    if (m_parse__) { class_swap(); }
+    if (m_parse__) {
+        if (*m_type != 0xfe) {
+            TLVF_LOG(ERROR) << "TLV type mismatch. Expected value: " << int(0xfe) << ", received value: " << int(*m_type);
+            return false;
+        }
+    }
+    return true;
+}
+
+
@@ -0,0 +1,135 @@
+///////////////////////////////////////
+// AUTO GENERATED FILE - DO NOT EDIT //
+///////////////////////////////////////
+
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#include <tlvf/test/tlvTestLength.h>
+#include <tlvf/tlvflogging.h>
+#include <string.h>
+#include <tlvf/ClassList.h>
+
+tlvTestLength::tlvTestLength(uint8_t* buff, size_t buff_len, bool parse) :
+    BaseClass(buff, buff_len, parse) {
+    m_init_succeeded = init();
+}
+tlvTestLength::tlvTestLength(std::shared_ptr<BaseClass> base, bool parse) :
+BaseClass(base->getBuffPtr(), base->getBuffRemainingBytes(), parse){
+    m_init_succeeded = init();
+}
+tlvTestLength::~tlvTestLength() {
+}
+const uint8_t& tlvTestLength::type() {
+    return (const uint8_t&)(*m_type);
+}
+
+const uint16_t& tlvTestLength::length() {
+    return (const uint16_t&)(*m_length);
+}
+
+uint8_t* tlvTestLength::fixed_list(size_t idx) {
+    if ( (m_fixed_list_idx__ == 0) || (m_fixed_list_idx__ <= idx) ) {
+        TLVF_LOG(ERROR) << "Requested index is greater than the number of available entries";
+        return nullptr;
+    }
+    return &(m_fixed_list[idx]);
+}
+
+bool tlvTestLength::set_fixed_list(const void* buffer, size_t size) {
+    if (buffer == nullptr) {
+        TLVF_LOG(WARNING) << "set_fixed_list received a null pointer.";
+        return false;
+    }
+    if (size > TEST_LENGTH) {
+        TLVF_LOG(ERROR) << "Received buffer size is smaller than buffer length";
+        return false;
+    }
+    std::copy_n(reinterpret_cast<const uint8_t *>(buffer), size, m_fixed_list);
+    return true;
+}
+void tlvTestLength::class_swap()
+{
+    tlvf_swap(16, reinterpret_cast<uint8_t*>(m_length));
+}
+
+bool tlvTestLength::finalize()
+{
+    if (m_parse__) {
+        TLVF_LOG(DEBUG) << "finalize() called but m_parse__ is set";
+        return true;
+    }
+    if (m_finalized__) {
+        TLVF_LOG(DEBUG) << "finalize() called for already finalized class";
+        return true;
+    }
+    if (!isPostInitSucceeded()) {
+        TLVF_LOG(ERROR) << "post init check failed";
+        return false;
+    }
+    if (m_inner__) {
+        if (!m_inner__->finalize()) {
+            TLVF_LOG(ERROR) << "m_inner__->finalize() failed";
+            return false;
+        }
+        auto tailroom = m_inner__->getMessageBuffLength() - m_inner__->getMessageLength();
+        m_buff_ptr__ -= tailroom;
+        *m_length -= tailroom;
+    }
+    class_swap();
+    m_finalized__ = true;
+    return true;
+}
+
+size_t tlvTestLength::get_initial_size()
+{
+    size_t class_size = 0;
+    class_size += sizeof(uint8_t); // type
+    class_size += sizeof(uint16_t); // length
+    class_size += TEST_LENGTH * sizeof(uint8_t); // fixed_list
+    return class_size;
+}
+
+bool tlvTestLength::init()
+{
+    if (getBuffRemainingBytes() < get_initial_size()) {
+        TLVF_LOG(ERROR) << "Not enough available space on buffer. Class init failed";
+        return false;
+    }
+    m_type = (uint8_t*)m_buff_ptr__;
+    if (!m_parse__) *m_type = 0xfd;
+    if (!buffPtrIncrementSafe(sizeof(uint8_t))) {
+        LOG(ERROR) << "buffPtrIncrementSafe(" << std::dec << sizeof(uint8_t) << ") Failed!";
+        return false;
+    }
+    m_length = (uint16_t*)m_buff_ptr__;
+    if (!m_parse__) *m_length = 0;
+    if (!buffPtrIncrementSafe(sizeof(uint16_t))) {
+        LOG(ERROR) << "buffPtrIncrementSafe(" << std::dec << sizeof(uint16_t) << ") Failed!";
+        return false;
+    }
+    m_fixed_list = (uint8_t*)m_buff_ptr__;
+    if (!buffPtrIncrementSafe(sizeof(uint8_t) * (TEST_LENGTH))) {
+        LOG(ERROR) << "buffPtrIncrementSafe(" << std::dec << sizeof(uint8_t) * (TEST_LENGTH) << ") Failed!";
+        return false;
+    }
+    m_fixed_list_idx__  = TEST_LENGTH;
+    if (!m_parse__) {
+        if (m_length) { (*m_length) += (sizeof(uint8_t) * TEST_LENGTH); }
+    }
+    if (m_parse__) { class_swap(); }
+    if (m_parse__) {
+        if (*m_type != 0xfd) {
+            TLVF_LOG(ERROR) << "TLV type mismatch. Expected value: " << int(0xfd) << ", received value: " << int(*m_type);
+            return false;
+        }
+    }
+    return true;
+}
+
+
@@ -12,6 +12,8 @@
 
 #include <tlvf/wfa_map/tlvClientAssociationControlRequest.h>
 #include <tlvf/tlvflogging.h>
+#include <string.h>
+#include <tlvf/ClassList.h>
 
 using namespace wfa_map;
 
@@ -94,7 +96,7 @@ void tlvClientAssociationControlRequest::class_swap()
     m_bssid_to_block_client->struct_swap();
     tlvf_swap(8*sizeof(eAssociationControl), reinterpret_cast<uint8_t*>(m_association_control));
     tlvf_swap(16, reinterpret_cast<uint8_t*>(m_validity_period_sec));
-    for (size_t i = 0; i < (size_t)*m_sta_list_length; i++){
+    for (size_t i = 0; i < m_sta_list_idx__; i++){
         m_sta_list[i].struct_swap();
     }
 }
@@ -12,6 +12,8 @@
 
 #include <tlvf/wfa_map/tlvClientCapabilityReport.h>
 #include <tlvf/tlvflogging.h>
+#include <string.h>
+#include <tlvf/ClassList.h>
 
 using namespace wfa_map;
 
@@ -12,6 +12,8 @@
 
 #include <tlvf/wfa_map/tlvRadioOperationRestriction.h>
 #include <tlvf/tlvflogging.h>
+#include <string.h>
+#include <tlvf/ClassList.h>
 
 using namespace wfa_map;
 
@@ -112,7 +114,7 @@ void tlvRadioOperationRestriction::class_swap()
 {
     tlvf_swap(16, reinterpret_cast<uint8_t*>(m_length));
     m_radio_uid->struct_swap();
-    for (size_t i = 0; i < (size_t)*m_operating_classes_list_length; i++){
+    for (size_t i = 0; i < m_operating_classes_list_idx__; i++){
         std::get<1>(operating_classes_list(i)).class_swap();
     }
 }
@@ -271,7 +273,7 @@ bool cRestrictedOperatingClasses::alloc_channel_list(size_t count) {
 
 void cRestrictedOperatingClasses::class_swap()
 {
-    for (size_t i = 0; i < (size_t)*m_channel_list_length; i++){
+    for (size_t i = 0; i < m_channel_list_idx__; i++){
         m_channel_list[i].struct_swap();
     }
 }
@@ -0,0 +1,165 @@
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#ifndef _CmduTemplate_H_
+#define _CmduTemplate_H_
+
+#include <string.h>
+#include <tlvf/CmduMessageTx.h>
+#include <tlvf/swap.h>
+#include <tlvf/tlvflogging.h>
+#include <type_traits>
+#include <vector>
+
+namespace ieee1905_1 {
+
+/**
+ * @brief Typed handle of a field in a frozen CMDU.
+ *
+ * Holds the field offset from the start of the CMDU and its swap width, so
+ * that CmduTemplate::set() can store a new value in network byte order
+ * without going through the TLV classes.
+ *
+ * @tparam T field type (an integral or enum type of 1, 2, 4 or 8 bytes)
+ */
+template <class T> struct sCmduPatch {
+    static_assert(std::is_integral<T>::value || std::is_enum<T>::value,
+                  "only integral and enum fields can be patched");
+    static_assert(sizeof(T) == 1 || sizeof(T) == 2 || sizeof(T) == 4 || sizeof(T) == 8,
+                  "unsupported field size");
+    // field offset from the start of the CMDU
+    size_t offset = 0;
+    // swap width in bits (16, 32 or 64), 0 for single byte fields
+    uint8_t width = sizeof(T) > 1 ? sizeof(T) * 8 : 0;
+};
+
+/**
+ * @brief Pre-rendered CMDU which is built once and resent with a few patched fields.
+ *
+ * The message is built with the regular TLV classes on the template Tx
+ * message (cmdu_tx()), and then frozen: its finalized wire bytes are kept,
+ * along with handles of the fields which change between sends (the message
+ * id, counters, etc.). Sending it again is then a copy of the frozen bytes
+ * and a few stores, instead of the full create / alloc / finalize sequence.
+ *
+ * Usage:
+ * - build the message on cmdu_tx() (for example with a generated message
+ *   build_template()) and take the field handles with get_patch() from the
+ *   TLV accessors, before or after finalize()
+ * - freeze()
+ * - per send: set_message_id() and set() the patched fields, then render()
+ *   and send the returned message (it is already finalized)
+ */
+class CmduTemplate {
+
+public:
+    /**
+     * @brief Construct a new template
+     *
+     * @param buff_len length of the template Tx message buffer
+     * @param headroom bytes reserved in front of the Tx message buffer, for
+     *        transports which prepend their own header (e.g. the beerocks UDS header)
+     */
+    explicit CmduTemplate(size_t buff_len = CmduMessage::kMaxCmduLength, size_t headroom = 0);
+    ~CmduTemplate() = default;
+
+    CmduTemplate(const CmduTemplate &)            = delete;
+    CmduTemplate &operator=(const CmduTemplate &) = delete;
+
+    /**
+     * @brief Get the template Tx message, used to build the message before freeze()
+     */
+    CmduMessageTx &cmdu_tx() { return m_cmdu_tx; }
+
+    /**
+     * @brief Keep the wire bytes of the finalized template Tx message
+     *
+     * @return true on success, false if the message is not finalized
+     */
+    bool freeze();
+
+    /**
+     * @brief Drop the frozen bytes and reset the template Tx message, to build a new message
+     */
+    void reset();
+
+    bool is_frozen() const { return m_frozen; }
+
+    /**
+     * @brief Get a typed handle of a field of the template Tx message
+     *
+     * @param field reference to the field, as returned by a TLV accessor of
+     *        a class added to cmdu_tx()
+     * @param[out] patch field handle
+     * @return true on success, false if the field is not within the message
+     */
+    template <class T> bool get_patch(const T &field, sCmduPatch<T> &patch) const
+    {
+        return get_offset(reinterpret_cast<const uint8_t *>(&field), sizeof(T), patch.offset);
+    }
+
+    /**
+     * @brief Store a field value in network byte order in the frozen bytes
+     *
+     * @param patch field handle, from get_patch()
+     * @param value new field value, in host byte order
+     * @return true on success, false if the template is not frozen or the
+     *         field is not within the frozen bytes
+     */
+    template <class T> bool set(const sCmduPatch<T> &patch, T value)
+    {
+        if (!m_frozen) {
+            TLVF_LOG(ERROR) << "set() called before freeze()";
+            return false;
+        }
+        if (patch.offset + sizeof(T) > m_frozen_buff.size()) {
+            TLVF_LOG(ERROR) << "field at offset " << patch.offset
+                            << " is not within the frozen message (length " << m_frozen_buff.size()
+                            << ")";
+            return false;
+        }
+        uint8_t bytes[sizeof(T)];
+        memcpy(bytes, &value, sizeof(T));
+        tlvf_swap(patch.width, bytes);
+        memcpy(&m_frozen_buff[patch.offset], bytes, sizeof(T));
+        return true;
+    }
+
+    /**
+     * @brief Set the CMDU header message id in the frozen bytes
+     *
+     * @return true on success, false if the template is not frozen
+     */
+    bool set_message_id(uint16_t mid) { return set(m_message_id, mid); }
+
+    /**
+     * @brief Copy the frozen bytes (with the patched fields) to the template Tx message
+     *
+     * @return the template Tx message, finalized, ready to be sent as is
+     */
+    CmduMessageTx &render();
+
+    /**
+     * @brief Get the frozen bytes, for senders which take a plain buffer
+     */
+    const uint8_t *data() const { return m_frozen_buff.data(); }
+    size_t size() const { return m_frozen_buff.size(); }
+
+private:
+    bool get_offset(const uint8_t *field, size_t length, size_t &offset) const;
+
+    std::vector<uint8_t> m_buff;
+    CmduMessageTx m_cmdu_tx;
+    std::vector<uint8_t> m_frozen_buff;
+    sCmduPatch<uint16_t> m_message_id;
+    bool m_frozen = false;
+};
+
+}; // namespace ieee1905_1
+
+#endif //_CmduTemplate_H_
@@ -0,0 +1,98 @@
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#ifndef _TLVF_ENUM_H_
+#define _TLVF_ENUM_H_
+
+#include <cstddef>
+#include <stdint.h>
+
+/**
+ * @brief Entry of a generated enum value to name table.
+ *
+ * Each generated enum has a table of these, sorted by value, used by the
+ * generated <enum>_str() functions. Dense tables are indexed directly and
+ * may contain holes, with a nullptr name.
+ */
+typedef struct sTlvfEnumName {
+    uint64_t value;
+    const char *name;
+} sTlvfEnumName;
+
+/**
+ * @brief Word of a generated enum membership bitmap.
+ *
+ * Bit i of bits is set if (word * 64 + i) is a value of the enum. Only non
+ * empty words are generated, sorted by word, so sparse enums stay small.
+ */
+typedef struct sTlvfEnumBits {
+    uint64_t word;
+    uint64_t bits;
+} sTlvfEnumBits;
+
+/**
+ * @brief get the name of an enum value
+ *
+ * @param names enum value to name table, sorted by value
+ * @param value enum value
+ * @param dense true if the table covers a contiguous value range (with
+ *        nullptr names for holes), in which case the lookup is a direct
+ *        index, otherwise a binary search
+ * @return the value name, "UNKNOWN" if value is not in the table
+ */
+template <size_t N>
+const char *tlvf_enum_name(const sTlvfEnumName (&names)[N], uint64_t value, bool dense)
+{
+    if (dense) {
+        uint64_t idx = value - names[0].value;
+        return (value >= names[0].value && idx < N && names[idx].name) ? names[idx].name
+                                                                       : "UNKNOWN";
+    }
+    size_t low = 0, high = N;
+    while (low < high) {
+        size_t mid = low + (high - low) / 2;
+        if (names[mid].value < value) {
+            low = mid + 1;
+        } else {
+            high = mid;
+        }
+    }
+    return (low < N && names[low].value == value) ? names[low].name : "UNKNOWN";
+}
+
+/**
+ * @brief check if a value is a member of an enum
+ *
+ * @param bitmap enum membership bitmap, sorted by word
+ * @param value value to check
+ * @param dense true if the bitmap words are contiguous, in which case the
+ *        word lookup is a direct index, otherwise a binary search
+ * @return true if value is a member of the enum
+ */
+template <size_t N>
+bool tlvf_enum_check(const sTlvfEnumBits (&bitmap)[N], uint64_t value, bool dense)
+{
+    uint64_t word = value / 64;
+    uint64_t bit  = uint64_t(1) << (value % 64);
+    if (dense) {
+        uint64_t idx = word - bitmap[0].word;
+        return word >= bitmap[0].word && idx < N && (bitmap[idx].bits & bit);
+    }
+    size_t low = 0, high = N;
+    while (low < high) {
+        size_t mid = low + (high - low) / 2;
+        if (bitmap[mid].word < word) {
+            low = mid + 1;
+        } else {
+            high = mid;
+        }
+    }
+    return low < N && bitmap[low].word == word && (bitmap[low].bits & bit);
+}
+
+#endif
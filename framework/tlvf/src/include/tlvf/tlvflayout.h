@@ -0,0 +1,93 @@
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#ifndef _TLVF_LAYOUT_H_
+#define _TLVF_LAYOUT_H_
+
+#include <cstddef>
+#include <stdint.h>
+
+class BaseClass;
+
+/**
+ * @brief Layout descriptor of a single swappable member.
+ *
+ * Used by the table driven tlvf.py backend (--backend table). Instead of
+ * emitting straight-line swap code per member, each generated struct / class
+ * emits a static array of descriptors which is interpreted by the shared
+ * tlvf_swap_*_layout() functions below.
+ */
+typedef struct sTlvfSwapField {
+    // member offset from the start of the struct (struct layouts only)
+    size_t offset;
+    // swap width in bits (16, 32 or 64), 0 for nested structs
+    uint8_t width;
+    // number of elements (struct layouts only)
+    size_t count;
+    // size in bytes of a single element
+    size_t stride;
+    // element swap function for nested structs, nullptr otherwise
+    void (*swap)(uint8_t *elem);
+} sTlvfSwapField;
+
+/**
+ * @brief Runtime location of a class member described by a sTlvfSwapField.
+ *
+ * Class members are not at fixed offsets (they move when variable length lists
+ * are allocated), so the generated class_swap() passes the current member
+ * pointers and element counts alongside the static layout.
+ */
+typedef struct sTlvfSwapRef {
+    uint8_t *ptr;
+    size_t count;
+} sTlvfSwapRef;
+
+/**
+ * @brief swap a single nested struct element
+ *
+ * Used as the sTlvfSwapField::swap callback for members which are structs.
+ *
+ * @tparam T struct type
+ * @param elem pointer to the struct element
+ */
+template <class T> void tlvf_swap_struct(uint8_t *elem)
+{
+    reinterpret_cast<T *>(elem)->struct_swap();
+}
+
+/**
+ * @brief swap all members of a packed struct according to its layout
+ *
+ * @param base pointer to the start of the struct
+ * @param layout array of member descriptors
+ * @param size number of entries in layout
+ */
+void tlvf_swap_struct_layout(uint8_t *base, const sTlvfSwapField *layout, size_t size);
+
+/**
+ * @brief swap all members of a class according to its layout
+ *
+ * @param layout array of member descriptors
+ * @param refs array of member pointers and element counts, matching layout
+ * @param size number of entries in layout and refs
+ */
+void tlvf_swap_class_layout(const sTlvfSwapField *layout, const sTlvfSwapRef *refs, size_t size);
+
+/**
+ * @brief Increment the class buffer pointer, logging on failure.
+ *
+ * Shared replacement for the per-member buffPtrIncrementSafe() error path
+ * emitted in every generated init() / alloc_*() / add_*().
+ *
+ * @param obj class whose buffer pointer is incremented
+ * @param length size to increment by
+ * @return true on success, false if there is not enough space on the buffer
+ */
+bool tlvf_buff_ptr_increment(BaseClass &obj, size_t length);
+
+#endif
@@ -13,4 +13,22 @@
 
 #define TLVF_LOG(a) (LOG(a) << "TLVF: ")
 
+/**
+ * @brief log a generated error by code
+ *
+ * Code generated with the release profile (tlvf.py --profile release) calls
+ * this instead of logging the error string. The code to message map is in
+ * tlvf_error_codes.txt in the generated output folder.
+ *
+ * @param code error code
+ */
+void tlvf_log_error_code(int code);
+
+/**
+ * @brief log a generated warning by code
+ *
+ * @param code warning code, see tlvf_log_error_code()
+ */
+void tlvf_log_warning_code(int code);
+
 #endif
\ No newline at end of file
@@ -0,0 +1,67 @@
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#ifndef _TLVF_STATS_H_
+#define _TLVF_STATS_H_
+
+#include <atomic>
+#include <cstddef>
+#include <ostream>
+
+/**
+ * @brief Runtime counters of a single generated class.
+ *
+ * Only used by code generated with tlvf.py --stats, which defines a static
+ * instance per class. Each instance registers itself on construction in a
+ * process wide registry, which can be read with tlvf_stats_first() or dumped
+ * with tlvf_stats_dump().
+ * The counters are updated with relaxed atomics, without any locking.
+ */
+typedef struct sTlvfClassStats {
+    explicit sTlvfClassStats(const char *class_name);
+    sTlvfClassStats(const sTlvfClassStats &) = delete;
+    sTlvfClassStats &operator=(const sTlvfClassStats &) = delete;
+
+    // class name, including its namespace
+    const char *name;
+    // number of instances successfully initialized for parsing
+    std::atomic<size_t> parsed;
+    // number of instances successfully initialized for building
+    std::atomic<size_t> built;
+    // number of bytes swapped by class_swap(), excluding nested classes
+    std::atomic<size_t> swapped_bytes;
+    // number of bytes moved by create_*() / alloc_*() of variable length lists
+    std::atomic<size_t> memmove_bytes;
+    // number of failed buffer bounds checks
+    std::atomic<size_t> bounds_failures;
+    // next registered class, nullptr for the last one
+    sTlvfClassStats *next;
+} sTlvfClassStats;
+
+/**
+ * @brief get the first registered class stats
+ *
+ * @return the first class of the registry, nullptr if no class is instrumented
+ */
+const sTlvfClassStats *tlvf_stats_first();
+
+/**
+ * @brief zero the counters of all registered classes
+ */
+void tlvf_stats_reset();
+
+/**
+ * @brief print the counters of all registered classes
+ *
+ * Prints one line per class which has at least one non zero counter.
+ *
+ * @param os output stream
+ */
+void tlvf_stats_dump(std::ostream &os);
+
+#endif
@@ -53,6 +53,9 @@ std::shared_ptr<tlvVendorSpecific> CmduMessageTx::add_vs_tlv(tlvVendorSpecific::
 
 bool CmduMessageTx::finalize()
 {
+    // already finalized (e.g. a rendered CmduTemplate) - do not add another end of message TLV
+    if (is_finalized())
+        return true;
     if (!addClass<tlvEndOfMessage>())
         return false;
     return msg.finalize();
@@ -0,0 +1,64 @@
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#include <algorithm>
+#include <tlvf/CmduTemplate.h>
+#include <tlvf/tlvflogging.h>
+
+using namespace ieee1905_1;
+
+CmduTemplate::CmduTemplate(size_t buff_len, size_t headroom)
+    : m_buff(headroom + buff_len), m_cmdu_tx(m_buff.data() + headroom, buff_len)
+{
+}
+
+bool CmduTemplate::freeze()
+{
+    if (!m_cmdu_tx.is_finalized()) {
+        TLVF_LOG(ERROR) << "freeze() called on a message which is not finalized";
+        return false;
+    }
+    auto cmdu_header = m_cmdu_tx.getCmduHeader();
+    if (!cmdu_header || !get_patch(cmdu_header->message_id(), m_message_id)) {
+        TLVF_LOG(ERROR) << "freeze() called on a message without a CMDU header";
+        return false;
+    }
+    auto buff = m_cmdu_tx.getMessageBuff();
+    m_frozen_buff.assign(buff, buff + m_cmdu_tx.getMessageLength());
+    m_frozen = true;
+    return true;
+}
+
+void CmduTemplate::reset()
+{
+    m_cmdu_tx.reset();
+    m_frozen_buff.clear();
+    m_frozen = false;
+}
+
+CmduMessageTx &CmduTemplate::render()
+{
+    if (!m_frozen) {
+        TLVF_LOG(ERROR) << "render() called before freeze()";
+        return m_cmdu_tx;
+    }
+    std::copy(m_frozen_buff.begin(), m_frozen_buff.end(), m_cmdu_tx.getMessageBuff());
+    return m_cmdu_tx;
+}
+
+bool CmduTemplate::get_offset(const uint8_t *field, size_t length, size_t &offset) const
+{
+    auto buff       = m_cmdu_tx.getMessageBuff();
+    auto msg_length = m_cmdu_tx.getMessageLength();
+    if (field < buff || field + length > buff + msg_length) {
+        TLVF_LOG(ERROR) << "field is not within the message (length " << msg_length << ")";
+        return false;
+    }
+    offset = field - buff;
+    return true;
+}
@@ -0,0 +1,76 @@
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#include <tlvf/BaseClass.h>
+#include <tlvf/swap.h>
+#include <tlvf/tlvflayout.h>
+#include <tlvf/tlvflogging.h>
+
+static inline bool host_is_network_order() { return htons(1) == 1; }
+
+static void swap_elements(uint8_t *ptr, const sTlvfSwapField &field, size_t count)
+{
+    if (!ptr) {
+        return;
+    }
+    if (field.swap) {
+        for (size_t i = 0; i < count; i++, ptr += field.stride) {
+            field.swap(ptr);
+        }
+        return;
+    }
+    switch (field.width) {
+    case 16:
+        for (size_t i = 0; i < count; i++, ptr += field.stride) {
+            swap_16(*reinterpret_cast<uint16_t *>(ptr));
+        }
+        break;
+    case 32:
+        for (size_t i = 0; i < count; i++, ptr += field.stride) {
+            swap_32(*reinterpret_cast<uint32_t *>(ptr));
+        }
+        break;
+    case 64:
+        for (size_t i = 0; i < count; i++, ptr += field.stride) {
+            swap_64(*reinterpret_cast<uint64_t *>(ptr));
+        }
+        break;
+    default:
+        break;
+    }
+}
+
+void tlvf_swap_struct_layout(uint8_t *base, const sTlvfSwapField *layout, size_t size)
+{
+    // Network order is big endian - all swaps are no-ops on big endian hosts
+    if (host_is_network_order()) {
+        return;
+    }
+    for (size_t i = 0; i < size; i++) {
+        swap_elements(base + layout[i].offset, layout[i], layout[i].count);
+    }
+}
+
+void tlvf_swap_class_layout(const sTlvfSwapField *layout, const sTlvfSwapRef *refs, size_t size)
+{
+    if (host_is_network_order()) {
+        return;
+    }
+    for (size_t i = 0; i < size; i++) {
+        swap_elements(refs[i].ptr, layout[i], refs[i].count);
+    }
+}
+
+bool tlvf_buff_ptr_increment(BaseClass &obj, size_t length)
+{
+    if (!obj.buffPtrIncrementSafe(length)) {
+        LOG(ERROR) << "buffPtrIncrementSafe(" << std::dec << length << ") Failed!";
+        return false;
+    }
+    return true;
+}
@@ -0,0 +1,13 @@
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#include <tlvf/tlvflogging.h>
+
+void tlvf_log_error_code(int code) { TLVF_LOG(ERROR) << "error code " << code; }
+
+void tlvf_log_warning_code(int code) { TLVF_LOG(WARNING) << "warning code " << code; }
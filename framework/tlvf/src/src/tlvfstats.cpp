@@ -0,0 +1,51 @@
+/* SPDX-License-Identifier: BSD-2-Clause-Patent
+ *
+ * Copyright (c) 2016-2019 Intel Corporation
+ *
+ * This code is subject to the terms of the BSD+Patent license.
+ * See LICENSE file for more details.
+ */
+
+#include <tlvf/tlvfstats.h>
+
+// Registered from the static initializers of the generated classes,
+// constant initialized so it is valid before any of them runs.
+static sTlvfClassStats *s_stats_head = nullptr;
+
+sTlvfClassStats::sTlvfClassStats(const char *class_name)
+    : name(class_name), parsed(0), built(0), swapped_bytes(0), memmove_bytes(0), bounds_failures(0),
+      next(s_stats_head)
+{
+    s_stats_head = this;
+}
+
+const sTlvfClassStats *tlvf_stats_first() { return s_stats_head; }
+
+void tlvf_stats_reset()
+{
+    for (auto stats = s_stats_head; stats; stats = stats->next) {
+        stats->parsed          = 0;
+        stats->built           = 0;
+        stats->swapped_bytes   = 0;
+        stats->memmove_bytes   = 0;
+        stats->bounds_failures = 0;
+    }
+}
+
+void tlvf_stats_dump(std::ostream &os)
+{
+    if (!s_stats_head) {
+        os << "tlvf stats: no instrumented classes (generate with tlvf.py --stats)" << std::endl;
+        return;
+    }
+    os << "tlvf stats: class parsed built swapped_bytes memmove_bytes bounds_failures" << std::endl;
+    for (auto stats = s_stats_head; stats; stats = stats->next) {
+        if (!stats->parsed && !stats->built && !stats->swapped_bytes && !stats->memmove_bytes &&
+            !stats->bounds_failures) {
+            continue;
+        }
+        os << stats->name << " " << stats->parsed << " " << stats->built << " "
+           << stats->swapped_bytes << " " << stats->memmove_bytes << " " << stats->bounds_failures
+           << std::endl;
+    }
+}
@@ -22,8 +22,14 @@
 #include "tlvf/ieee_1905_1/tlvUnknown.h"
 #include "tlvf/ieee_1905_1/tlvVendorSpecific.h"
 #include "tlvf/ieee_1905_1/tlvWsc.h"
+#include "tlvf/ieee_1905_1_msg/msgPushButtonJoinNotification.h"
+#include "tlvf/ieee_1905_1_msg/msgTopologyResponse.h"
 #include "tlvf/wfa_map/tlvApCapability.h"
+#include <tlvf/test/tlvNested.h>
+#include <tlvf/test/tlvTestLength.h>
 #include <tlvf/test/tlvVarList.h>
+#include <tlvf/tlvfstats.h>
+#include <tlvf/wire_sizes.h>
 
 #include <mapf/common/encryption.h>
 #include <mapf/common/err.h>
@@ -758,6 +764,307 @@ int test_all()
     return errors;
 }
 
+int test_nested_class_include()
+{
+    int errors = 0;
+    uint8_t tx_buffer[256];
+
+    MAPF_INFO(__FUNCTION__ << " start");
+    // tlvTestNested holds a cInner, a class which is not named like its yaml file (tlvVarList.yaml)
+    tlvTestNested tlv(tx_buffer, sizeof(tx_buffer));
+    auto inner = tlv.create_inner();
+    if (!inner || !inner->alloc_list(2)) {
+        LOG(ERROR) << "create_inner failed";
+        return ++errors;
+    }
+    inner->var1() = 0x12345678;
+    if (!tlv.add_inner(inner) || !tlv.finalize()) {
+        LOG(ERROR) << "building tlvTestNested failed";
+        return ++errors;
+    }
+
+    tlvTestNested parsed(tx_buffer, tlv.getLen(), true);
+    if (!parsed.inner() || parsed.inner()->var1() != 0x12345678 ||
+        parsed.inner()->list_length() != 2) {
+        LOG(ERROR) << "parsed tlvTestNested does not match";
+        errors++;
+    }
+
+    MAPF_INFO(__FUNCTION__ << " Finished, errors = " << errors << std::endl);
+    return errors;
+}
+
+int test_message_builder()
+{
+    int errors = 0;
+    uint8_t tx_buffer[1024];
+    const size_t num_neighbor_lists = 2;
+    const size_t num_neighbors      = 3;
+    const size_t num_interfaces     = 2;
+    const size_t media_info_length  = 4;
+
+    MAPF_INFO(__FUNCTION__ << " start");
+    msgTopologyResponse::sCounts counts;
+    counts.tlv_non_1905_neighbor_device_list = num_neighbor_lists;
+    counts.tlv_non_1905_neighbor_device_list_mac_non_1905_device =
+        num_neighbor_lists * num_neighbors;
+    // a list of a nested class
+    counts.tlv_device_information_local_interface_list = num_interfaces;
+    counts.tlv_device_information_local_interface_list_media_info =
+        num_interfaces * media_info_length;
+    auto wire_size = msgTopologyResponse::get_wire_size(counts);
+
+    msgTopologyResponse::sFill fill;
+    fill.tlv_device_information = [&](tlvDeviceInformation &tlv) {
+        for (size_t i = 0; i < num_interfaces; i++) {
+            auto iface = tlv.create_local_interface_list();
+            if (!iface || !iface->alloc_media_info(media_info_length) ||
+                !tlv.add_local_interface_list(iface)) {
+                return false;
+            }
+        }
+        return true;
+    };
+    fill.tlv_non_1905_neighbor_device_list = [&](tlvNon1905neighborDeviceList &tlv, size_t idx) {
+        tlv.mac_local_iface().oct[5] = idx;
+        return tlv.alloc_mac_non_1905_device(num_neighbors);
+    };
+
+    CmduMessageTx too_small(tx_buffer, wire_size - 1);
+    if (msgTopologyResponse::build(too_small, 0, counts, fill)) {
+        LOG(ERROR) << "build should fail since the buffer is smaller than the wire size";
+        errors++;
+    }
+
+    CmduMessageTx msg(tx_buffer, sizeof(tx_buffer));
+    if (!msgTopologyResponse::build(msg, 0x1234, counts, fill)) {
+        LOG(ERROR) << "build failed";
+        errors++;
+    }
+    if (msg.getMessageLength() != wire_size) {
+        LOG(ERROR) << "message length " << msg.getMessageLength() << " != wire size " << wire_size;
+        errors++;
+    }
+
+    uint8_t recv_buffer[sizeof(tx_buffer)];
+    memcpy(recv_buffer, tx_buffer, sizeof(recv_buffer));
+    CmduMessageRx received_message(recv_buffer, sizeof(recv_buffer));
+    received_message.parse();
+    msgTopologyResponse::sTlvs tlvs;
+    if (!msgTopologyResponse::parse(received_message, tlvs)) {
+        LOG(ERROR) << "parse failed";
+        errors++;
+    }
+    if (tlvs.tlv_non_1905_neighbor_device_list.size() != num_neighbor_lists) {
+        LOG(ERROR) << "expected " << num_neighbor_lists << " neighbor device lists, got "
+                   << tlvs.tlv_non_1905_neighbor_device_list.size();
+        errors++;
+    }
+    size_t idx = 0;
+    for (auto tlv : tlvs.tlv_non_1905_neighbor_device_list) {
+        if (tlv->mac_local_iface().oct[5] != idx++ ||
+            tlv->mac_non_1905_device_length() != num_neighbors * sizeof(sMacAddr)) {
+            LOG(ERROR) << "neighbor device list " << idx - 1 << " does not match";
+            errors++;
+        }
+    }
+
+    MAPF_INFO(__FUNCTION__ << " Finished, errors = " << errors << std::endl);
+    return errors;
+}
+
+int test_message_template()
+{
+    int errors = 0;
+
+    MAPF_INFO(__FUNCTION__ << " start");
+    CmduTemplate tmpl;
+    sCmduPatch<uint16_t> notification_mid;
+    sCmduPatch<uint8_t> new_device_mac;
+    msgPushButtonJoinNotification::sCounts counts;
+    msgPushButtonJoinNotification::sFill fill;
+    fill.tlv_push_button_join_notification = [&](tlvPushButtonJoinNotification &tlv) {
+        tlv.al_mac_notification_src().oct[5] = 0x11;
+        return tmpl.get_patch(tlv.mid_of_the_notification(), notification_mid) &&
+               tmpl.get_patch(tlv.iface_mac_of_new_device_joined().oct[5], new_device_mac);
+    };
+    if (!msgPushButtonJoinNotification::build_template(tmpl, counts, fill)) {
+        LOG(ERROR) << "build_template failed";
+        return ++errors;
+    }
+    if (tmpl.size() != msgPushButtonJoinNotification::get_wire_size(counts)) {
+        LOG(ERROR) << "frozen size " << tmpl.size() << " != wire size "
+                   << msgPushButtonJoinNotification::get_wire_size(counts);
+        errors++;
+    }
+    sCmduPatch<uint16_t> out_of_message;
+    uint16_t not_in_message = 0;
+    if (tmpl.get_patch(not_in_message, out_of_message)) {
+        LOG(ERROR) << "get_patch should fail for a field which is not within the message";
+        errors++;
+    }
+
+    sCmduPatch<uint16_t> past_the_end;
+    past_the_end.offset = tmpl.size() - 1;
+    if (tmpl.set(past_the_end, uint16_t(0))) {
+        LOG(ERROR) << "set should fail for a field which is not within the frozen bytes";
+        errors++;
+    }
+
+    for (uint16_t mid = 0x100; mid < 0x103; mid++) {
+        if (!tmpl.set_message_id(mid) || !tmpl.set(notification_mid, uint16_t(mid + 0x1000)) ||
+            !tmpl.set(new_device_mac, uint8_t(mid))) {
+            LOG(ERROR) << "set failed";
+            errors++;
+        }
+        auto &cmdu_tx = tmpl.render();
+        if (!cmdu_tx.finalize() || cmdu_tx.getMessageLength() != tmpl.size()) {
+            LOG(ERROR) << "rendered message should already be finalized";
+            errors++;
+        }
+        if (cmdu_tx.getMessageId() != mid) {
+            LOG(ERROR) << "rendered message id " << cmdu_tx.getMessageId() << " != " << mid;
+            errors++;
+        }
+
+        uint8_t recv_buffer[CmduMessage::kMaxCmduLength];
+        memcpy(recv_buffer, cmdu_tx.getMessageBuff(), cmdu_tx.getMessageLength());
+        CmduMessageRx received_message(recv_buffer, sizeof(recv_buffer));
+        received_message.parse();
+        msgPushButtonJoinNotification::sTlvs tlvs;
+        if (!msgPushButtonJoinNotification::parse(received_message, tlvs)) {
+            LOG(ERROR) << "parse failed";
+            errors++;
+            continue;
+        }
+        auto tlv = tlvs.tlv_push_button_join_notification;
+        if (received_message.getCmduHeader()->message_id() != mid ||
+            tlv->mid_of_the_notification() != mid + 0x1000 ||
+            tlv->iface_mac_of_new_device_joined().oct[5] != uint8_t(mid) ||
+            tlv->al_mac_notification_src().oct[5] != 0x11) {
+            LOG(ERROR) << "patched message " << mid << " does not match";
+            errors++;
+        }
+    }
+
+    tmpl.reset();
+    if (tmpl.set_message_id(0x100)) {
+        LOG(ERROR) << "set_message_id should fail after reset()";
+        errors++;
+    }
+
+    MAPF_INFO(__FUNCTION__ << " Finished, errors = " << errors << std::endl);
+    return errors;
+}
+
+int test_enum_lookup()
+{
+    int errors = 0;
+
+    MAPF_INFO(__FUNCTION__ << " start");
+    if (std::string(eTlvType_str(eTlvType::TLV_WSC)) != "TLV_WSC" ||
+        std::string(eMessageType_str(eMessageType::ACK_MESSAGE)) != "ACK_MESSAGE") {
+        LOG(ERROR) << "enum value name lookup failed";
+        errors++;
+    }
+    if (std::string(eTlvType_str(static_cast<eTlvType>(0x5))) != "UNKNOWN") {
+        LOG(ERROR) << "unknown enum value should not have a name";
+        errors++;
+    }
+    if (!eTlvTypeValidate::check(0x13) || eTlvTypeValidate::check(0x5) ||
+        eTlvTypeValidate::check(0xff)) {
+        LOG(ERROR) << "eTlvTypeValidate failed";
+        errors++;
+    }
+    if (!eMessageTypeValidate::check(0x8000) || eMessageTypeValidate::check(0x7fff)) {
+        LOG(ERROR) << "eMessageTypeValidate failed";
+        errors++;
+    }
+
+    MAPF_INFO(__FUNCTION__ << " Finished, errors = " << errors << std::endl);
+    return errors;
+}
+
+int test_stats()
+{
+    int errors = 0;
+
+    MAPF_INFO(__FUNCTION__ << " start");
+    std::stringstream dump;
+    tlvf_stats_dump(dump);
+    if (dump.str().empty()) {
+        LOG(ERROR) << "empty stats dump";
+        errors++;
+    }
+    // counters are only generated with tlvf.py --stats
+    const sTlvfClassStats *var_list_stats = nullptr;
+    for (auto stats = tlvf_stats_first(); stats; stats = stats->next) {
+        if (std::string(stats->name) == "tlvTestVarList") {
+            var_list_stats = stats;
+        }
+    }
+    if (var_list_stats) {
+        MAPF_INFO(dump.str());
+        // test_complex_list built and parsed a tlvTestVarList, with list allocations
+        if (!var_list_stats->built || !var_list_stats->parsed || !var_list_stats->swapped_bytes ||
+            !var_list_stats->memmove_bytes) {
+            LOG(ERROR) << "missing tlvTestVarList counters";
+            errors++;
+        }
+        tlvf_stats_reset();
+        if (var_list_stats->built || var_list_stats->memmove_bytes) {
+            LOG(ERROR) << "tlvf_stats_reset failed";
+            errors++;
+        }
+    } else if (tlvf_stats_first()) {
+        LOG(ERROR) << "tlvTestVarList is not registered";
+        errors++;
+    }
+
+    MAPF_INFO(__FUNCTION__ << " Finished, errors = " << errors << std::endl);
+    return errors;
+}
+
+int test_wire_sizes()
+{
+    int errors = 0;
+
+    MAPF_INFO(__FUNCTION__ << " start");
+    // the minimal wire size is the size of a class with all its variable length lists empty,
+    // including its nested classes (var1 and var3 in tlvTestVarList), unlike get_initial_size()
+    if (ieee1905_1::wire_size::tlvMacAddress::min() != tlvMacAddress::get_initial_size() ||
+        ieee1905_1::wire_size::tlvVendorSpecific::min() != tlvVendorSpecific::get_initial_size() ||
+        ::wire_size::tlvTestVarList::min() !=
+            tlvTestVarList::get_initial_size() + 2 * ::wire_size::cInner::min()) {
+        LOG(ERROR) << "wire size min does not match get_initial_size()";
+        errors++;
+    }
+    if (!ieee1905_1::wire_size::tlvMacAddress::bounded() ||
+        ieee1905_1::wire_size::tlvMacAddress::max() !=
+            ieee1905_1::wire_size::tlvMacAddress::min()) {
+        LOG(ERROR) << "fixed size tlvMacAddress should be bounded";
+        errors++;
+    }
+    if (::wire_size::tlvTestVarList::bounded() || ::wire_size::tlvTestVarList::max() != SIZE_MAX) {
+        LOG(ERROR) << "tlvTestVarList has an unbounded list";
+        errors++;
+    }
+    if (::wire_size::tlvTestVarList::test_string_count_max() != 8 ||
+        ::wire_size::tlvTestVarList::simple_list_element_max() != sizeof(uint16_t)) {
+        LOG(ERROR) << "wrong tlvTestVarList list bounds";
+        errors++;
+    }
+    // the enum class value of the same name must not replace the plain enum _length
+    if (::wire_size::tlvTestLength::fixed_list_count_max() != TEST_LENGTH ||
+        ::wire_size::tlvTestLength::min() != tlvTestLength::get_initial_size()) {
+        LOG(ERROR) << "wrong tlvTestLength fixed_list length";
+        errors++;
+    }
+
+    MAPF_INFO(__FUNCTION__ << " Finished, errors = " << errors << std::endl);
+    return errors;
+}
+
 int main(int argc, char *argv[])
 {
     int errors = 0;
@@ -767,6 +1074,12 @@ int main(int argc, char *argv[])
     errors += test_complex_list();
     errors += test_all();
     errors += test_parser();
+    errors += test_nested_class_include();
+    errors += test_message_builder();
+    errors += test_message_template();
+    errors += test_enum_lookup();
+    errors += test_stats();
+    errors += test_wire_sizes();
     MAPF_INFO(__FUNCTION__ << " Finished, errors = " << errors << std::endl);
     return errors;
 }
@@ -23,6 +23,10 @@ import pprint
 import logging
 import traceback
 import shutil
+import re
+import copy
+import json
+import time
 
 #https://pyyaml.org/wiki/PyYAMLDocumentation
 #https://learnxinyminutes.com/docs/yaml/
@@ -98,6 +102,23 @@ class TypeInfo:
     INT64 = "INT64"
     UINT64 = "UINT64"
     STD_TYPES = [INT8, UINT8, INT16, UINT16, INT32, UINT32, INT64, UINT64]
+    STD_TYPE_SIZES = {INT8: 1, UINT8: 1, INT16: 2, UINT16: 2, INT32: 4, UINT32: 4, INT64: 8,
+                      UINT64: 8}
+
+    # interned instances, see get() - they must not be modified
+    interned = {}
+
+    @staticmethod
+    def get(type_str, override_type=None):
+        # type_str parsed once, optionally with its type overridden (enums with a storage type)
+        key = (type(type_str), str(type_str), override_type)
+        type_info = TypeInfo.interned.get(key)
+        if type_info is None:
+            type_info = TypeInfo(type_str)
+            if override_type:
+                type_info.set_type(override_type)
+            TypeInfo.interned[key] = type_info
+        return type_info
 
     def __init__(self, type_str):
         self.type_str = type_str
@@ -106,6 +127,7 @@ class TypeInfo:
         self.swap_prefix = ""
         self.swap_suffix = ""
         self.swap_is_func = False
+        self.swap_width = None
         self.is_std_type = False
 
         if type(self.type_str) == str:
@@ -116,14 +138,17 @@ class TypeInfo:
                 if self.type == TypeInfo.INT64 or self.type == TypeInfo.UINT64:
                     self.swap_prefix = "tlvf_swap(64, reinterpret_cast<uint8_t*>("
                     self.swap_suffix = "))"
+                    self.swap_width = "64"
                     self.swap_needed = True
                 elif self.type == TypeInfo.INT32 or self.type == TypeInfo.UINT32:
                     self.swap_prefix = "tlvf_swap(32, reinterpret_cast<uint8_t*>("
                     self.swap_suffix = "))"
+                    self.swap_width = "32"
                     self.swap_needed = True
                 elif self.type == TypeInfo.INT16 or self.type == TypeInfo.UINT16:
                     self.swap_prefix = "tlvf_swap(16, reinterpret_cast<uint8_t*>("
                     self.swap_suffix = "))"
+                    self.swap_width = "16"
                     self.swap_needed = True
                 elif not (self.type == TypeInfo.INT8 or self.type == TypeInfo.UINT8):
                     self.set_type(TypeInfo.ERROR)
@@ -138,6 +163,7 @@ class TypeInfo:
                     self.set_type(TypeInfo.ENUM)
                     self.swap_prefix = "tlvf_swap(8*sizeof(" + self.type_str + "), reinterpret_cast<uint8_t*>("
                     self.swap_suffix = "))"
+                    self.swap_width = "8*sizeof(" + self.type_str + ")"
                     self.swap_needed = True
                 elif self.type_str[0] == "s":
                     self.set_type(TypeInfo.STRUCT)
@@ -166,6 +192,7 @@ class MetaData:
     TYPE_STRUCT = "struct"
     TYPE_ENUM   = "enum"
     TYPE_ENUM_CLASS   = "enum_class"
+    TYPE_MESSAGE = "message"
     META_PREFIX = "_"
     KEY_TYPE = "_type"
     KEY_ENUM_STORAGE = "_enum_storage"
@@ -180,6 +207,8 @@ class MetaData:
     KEY_LENGTH = "_length"
     KEY_LENGTH_VAR = "_length_var"
     KEY_LENGTH_MAX = "_length_max"
+    KEY_MESSAGE_TYPE = "_message_type"
+    KEY_REPEATED = "_repeated"
     LENGTH_TYPE_INT = "_int_"
     LENGTH_TYPE_CONST = "_const_"
     LENGTH_TYPE_VAR = "_var_"
@@ -215,17 +244,36 @@ class MetaData:
         self.length_var_tlv = False
         self.comment = None
         self.optional = False
+        self.repeated = False
+        self.message_type = None
         self.is_tlv_class = False
+        self.fillMetaData(dict)
+        self.errorCheck(dict)
+        self.resetGenerationState()
+
+    # state filled while generating the code of the object
+    def resetGenerationState(self):
         self.constractor_h_lines = []
         self.constractor_cpp_lines = []
         self.alloc_list = []
-        self.fillMetaData(dict)
-        self.errorCheck(dict)
+        self.swap_layout = []
+        self.enum_values = []
+        self.swap_lines = []
+        self.stats_swap_terms = []
+        self.num_var_len_lists = 0
+        self.num_alloc_fixups = 0
+        self.num_shared_ptr_members = 0
         self.children_types = {}
         self.list_index = 0
         self.lock_allocation_member_added = False
         self.lock_order_member_added = False
         self.marker_post_init_method_added = False
+
+    # copy of the parsed metadata, with a fresh generation state
+    def copy(self):
+        meta = copy.copy(self)
+        meta.resetGenerationState()
+        return meta
         
     def errPrefix(self):
         return "%s.yaml, param name=%s --> " % (self.fname, self.name)
@@ -234,12 +282,11 @@ class MetaData:
         for key , value in dict.items():
             if key.startswith(MetaData.META_PREFIX):
                 if key == MetaData.KEY_TYPE:
-                    if ( value == MetaData.TYPE_CLASS or
-                           value == MetaData.TYPE_STRUCT or
-                           value == MetaData.TYPE_ENUM ):
+                    if value in [MetaData.TYPE_CLASS, MetaData.TYPE_STRUCT, MetaData.TYPE_ENUM,
+                                 MetaData.TYPE_MESSAGE]:
                         self.type = value
                     else:
-                        self.type_info = TypeInfo(value)
+                        self.type_info = TypeInfo.get(value)
                         if self.type_info == TypeInfo.ERROR:
                             self.error = self.errPrefix() + "bad type %s in dict=%s" % (value, str(dict))
                         else:
@@ -248,7 +295,7 @@ class MetaData:
                     self.is_tlv_class = value
                 elif key == MetaData.KEY_ENUM_STORAGE:
                     self.enum_storage = value
-                    self.type_info = TypeInfo(value)
+                    self.type_info = TypeInfo.get(value)
                 elif key == MetaData.KEY_BIT_FIELD:
                     self.bit_field = value
                     if value.find("32") != -1:   self.abort("bit field of more than 8 bit is not supported")
@@ -266,6 +313,10 @@ class MetaData:
                     self.value_const = value
                 elif key == MetaData.KEY_OPTIONAL:
                     self.optional = value
+                elif key == MetaData.KEY_REPEATED:
+                    self.repeated = value
+                elif key == MetaData.KEY_MESSAGE_TYPE:
+                    self.message_type = value
                 elif key == MetaData.KEY_COMMENT:
                     self.comment = value
                 elif key == MetaData.KEY_LENGTH:
@@ -328,9 +379,102 @@ class MetaData:
         return retVal
 
 
+# Size expression of the wire size analysis (see TlvF.getWireSize): a number of bytes plus
+# multiples of products of C++ symbols the script can't evaluate - constants defined outside of
+# the yaml files (e.g. beerocks::message::IFACE_NAME_LENGTH) and sizeof() of external types.
+class WireSize:
+    def __init__(self, value=0, symbol=None):
+        self.value = value
+        self.terms = OrderedDict()          # sorted tuple of symbols -> coefficient
+        if symbol:
+            self.terms[(symbol,)] = 1
+
+    def is_number(self):
+        return len(self.terms) == 0
+
+    def add(self, other):
+        ret = WireSize(self.value + other.value)
+        ret.terms = OrderedDict(self.terms)
+        for symbols, coef in other.terms.items():
+            ret.terms[symbols] = ret.terms.get(symbols, 0) + coef
+        return ret
+
+    def mul(self, other):
+        ret = WireSize(self.value * other.value)
+        for (a_symbols, a_coef) in [((), self.value)] + list(self.terms.items()):
+            for (b_symbols, b_coef) in [((), other.value)] + list(other.terms.items()):
+                symbols = tuple(sorted(a_symbols + b_symbols))
+                if not symbols or a_coef * b_coef == 0:
+                    continue
+                ret.terms[symbols] = ret.terms.get(symbols, 0) + a_coef * b_coef
+        return ret
+
+    # C++ expression
+    def __str__(self):
+        parts = [" * ".join(([str(coef)] if coef != 1 else []) + list(symbols))
+                 for symbols, coef in self.terms.items()]
+        if self.value or not parts:
+            parts.append(str(self.value))
+        return " + ".join(parts)
+
+    # JSON value: the number of bytes, or the C++ expression if it has symbols
+    def json(self):
+        return self.value if self.is_number() else str(self)
+
+
+# Raised by TlvF.abort() with --check, which collects the errors instead of exiting
+class CheckError(Exception):
+    pass
+
+
+# Resolved parameter of an object in the TlvF IR (see TlvF.buildIR)
+class ParamIR:
+    def __init__(self, name, type, type_info, meta, local_include):
+        self.name = name
+        self.type = type
+        self.type_info = type_info      # interned TypeInfo, with the enum storage type applied
+        self.meta = meta                # parsed MetaData, None for "name: type" params
+        self.local_include = local_include
+
 
 class TlvF:
-    def __init__(self, src_path, yaml_path, out_path, conf_path, print_dependencies, print_outputs):
+    BACKEND_INLINE = "inline"
+    BACKEND_TABLE = "table"
+    BACKENDS = [BACKEND_INLINE, BACKEND_TABLE]
+    PROFILE_DEBUG = "debug"
+    PROFILE_RELEASE = "release"
+    PROFILES = [PROFILE_DEBUG, PROFILE_RELEASE]
+    # release profile: generated log statements, replaced by numeric error codes
+    RELEASE_LOG_RE = re.compile(
+        r'(?:TLVF_)?LOG\((ERROR|WARNING|DEBUG|INFO)\)\s*<<((?:"(?:[^"\\]|\\.)*"|[^;"])*);')
+    RELEASE_LOG_FUNCS = {"ERROR": "tlvf_log_error_code", "WARNING": "tlvf_log_warning_code"}
+    ERROR_CODES_FILE = "tlvf_error_codes.txt"
+    # --watch poll interval, in seconds
+    WATCH_POLL_INTERVAL = 0.5
+    # --unity: amalgamated sources directory (under the src output path), and the
+    # generated source bytes above which a namespace is split to another unity file
+    UNITY_DIR = "unity"
+    UNITY_MAX_BYTES = 128 * 1024
+    BENCHMARK_ITERATIONS = 10000
+    BENCHMARK_LIST_SIZES = "0,1,8"
+    BENCHMARK_BUFFER_SIZE = 64 * 1024
+
+    # Rough compiled size estimate of generated .cpp code (g++ -Os, x86_64):
+    # bytes per generated statement line, and per logging statement line
+    EST_BYTES_PER_LINE = 50
+    EST_BYTES_PER_LOG_LINE = 290
+    BUDGET_TOLERANCE_KEY = "_tolerance_percent"
+    BUDGET_KEYS = ["lines", "methods", "est_bytes"]
+    REPORT_KEYS = BUDGET_KEYS + ["var_len_lists", "alloc_fixups", "shared_ptr_members"]
+    # --lint-performance thresholds, per class
+    LINT_MAX_VAR_LEN_LISTS = 1
+    LINT_MAX_SHARED_PTR_MEMBERS = 2
+
+    def __init__(self, src_path, yaml_path, out_path, conf_path, print_dependencies, print_outputs,
+                 backend=BACKEND_INLINE, report_path=None, budget_path=None, update_budget=False,
+                 lint_performance=False, profile=PROFILE_DEBUG, stats=False, watch=False,
+                 unity=False, check=False, wire_size_report_path=None,
+                 benchmark_path=None):
         self.CMAKE_PROPERTIES_VERSION = "1.0.0"
         self.CMAKE_SO_VERSION         = "1.0.0"
         
@@ -359,6 +503,7 @@ class TlvF:
         self.CODE_CLASS_IS_INIT_FUNC                = "//~class_is_init_func"
         self.CODE_ENUM_INSERT                       = "//~enum_insert"
         self.CODE_ENUM_VALIDATION_INSERT            = "//~enum_validation_insert"
+        self.CODE_ENUM_NAMES_INSERT = "//~enum_names_insert"
         self.CODE_STRUCT_INSERT                     = "//~struct_insert"
         self.CODE_STRUCT_BITFIELD_INSERT            = "//~struct_bitfield_insert"
         self.CODE_STRUCT_REVERSED_BITFIELD_INSERT   = "//~struct_reversed_bitfield_insert"
@@ -377,6 +522,27 @@ class TlvF:
         self.conf_output_path = os.path.abspath(out_path)
         self.print_dependencies = print_dependencies
         self.print_outputs = print_outputs
+        self.backend = backend
+        self.dry_run = False
+        self.size_report = OrderedDict()
+        self.report_path = report_path
+        self.budget_path = budget_path
+        self.update_budget = update_budget
+        self.lint_performance = lint_performance
+        self.profile = profile
+        self.stats = stats
+        self.watch = watch
+        self.written_file_list = []
+        self.unity = unity
+        self.unity_sources = OrderedDict()
+        self.check = check
+        self.check_errors = None
+        self.wire_size_report_path = wire_size_report_path
+        self.wire_sizes = {}
+        self.benchmark_path = benchmark_path
+        self.error_codes = []
+        self.report_schemas = OrderedDict()
+        self.report_classes = OrderedDict()
         global logConsoleDisable
         if print_dependencies or print_outputs: logConsoleDisable = True
         self.logger = None
@@ -385,6 +551,7 @@ class TlvF:
         self.copied_file_list = []
         self.db = LastUpdatedOrderedDict()
         self.db_enum_storage_type = {}
+        self.ir = {}
         self.db_yaml_paths = {}
         self.output_directories_h = []
         self.output_directories_cpp = []        
@@ -399,19 +566,54 @@ class TlvF:
             sys.stdout.write(dependencies)
             sys.exit(0)
 
+        if self.check:
+            errors = self.checkSchemas()
+            sys.exit(1 if errors else 0)
+
+        if self.lint_performance:
+            # lint only - the per file db dumps make loading quadratic
+            self.conf_debug_dump_db = False
+            self.conf_debug_dump_yaml = False
+            self.loadAllYamlFilesToDB()
+            findings = self.lintPerformance()
+            sys.exit(1 if findings else 0)
+
         self.loadAllYamlFilesToDB()
+        self.buildIR()
+        if self.backend != TlvF.BACKEND_INLINE:
+            # generate the inline backend without writing anything, as a size reference
+            self.backend = TlvF.BACKEND_INLINE
+            self.dry_run = True
+            self.generateCode()
+            self.backend = backend
+            self.dry_run = False
         self.generateCode()
+        if self.profile == TlvF.PROFILE_RELEASE:
+            self.writeErrorCodes()
+        if self.backend != TlvF.BACKEND_INLINE:
+            self.printSizeReport()
+        if self.report_path:
+            self.writeReport()
+        if self.budget_path:
+            self.checkBudget()
+        if self.watch:
+            self.watchSchemas()
 
         if self.print_outputs:
-            outputs = ";".join(self.generated_file_list + self.copied_file_list)
+            # with --unity, the amalgamated sources are compiled instead of the per schema sources
+            # and the benchmark is not part of the library
+            outputs = [f for f in self.generated_file_list
+                       if f not in self.unity_sources and f != self.benchmark_path]
+            outputs = ";".join(outputs + self.copied_file_list)
             sys.stdout.write(outputs)
 
         logConsole("All Done.\n")
         sys.exit(0)
        
-    def generateCode(self):
+    def generateCode(self, file_list=None):
         logConsole("Generating source code...")
-        for filename in self.yaml_file_list:
+        self.initWireSizes()
+        for filename in (self.yaml_file_list if file_list is None else file_list):
             self.openFile(filename)
             # first iteration: list local objects in order
             for (fname, obj_name) , dict_value in self.db.items():
@@ -436,21 +638,403 @@ class TlvF:
                 # self.logger.debug("fname=%s, name=%s, obj_meta:\n%s" % (fname, name, obj_meta) )
                 self.logger.debug("fname=%s, name=%s\n" % (fname, obj_name) )
 
-                obj_meta = MetaData(fname, obj_name, dict_value)
-                if obj_meta.error: self.abort(obj_meta.error)
-                if obj_meta.type == None: self.abort("%s.yaml --> '_type' not defined" % (self.yaml_fname))
+                (obj_meta, params) = self.ir[(fname, obj_name)]
+                obj_meta = obj_meta.copy()
+
+                if obj_meta.type == MetaData.TYPE_MESSAGE:
+                    self.addInitialCode(obj_meta)
+                    self.generateMessage(obj_meta, dict_value)
+                    self.is_root_obj = False
+                    continue
 
                 self.openObject(obj_meta, dict_value, root_obj_meta)
                 if (obj_meta.type == MetaData.TYPE_CLASS and not self.multi_class):
                     root_obj_meta = obj_meta
                 if self.root_obj_meta == None: self.root_obj_meta = obj_meta
 
-                self.generateObject(obj_meta, dict_value)
+                self.generateObject(obj_meta, params)
 
                 self.closeObject(obj_meta)
             self.closeFile()
 
         logConsole("Done\n")
+        if self.unity and not self.dry_run:
+            self.writeUnityFiles()
+        if not self.dry_run:
+            self.writeWireSizes()
+        if self.benchmark_path and not self.dry_run:
+            self.writeBenchmark()
+
+    def printSizeReport(self):
+        totals = {}
+        for (file_path, backend), (lines, size) in self.size_report.items():
+            suffix = os.path.splitext(file_path)[1]
+            (t_lines, t_size) = totals.get((suffix, backend), (0, 0))
+            totals[(suffix, backend)] = (t_lines + lines, t_size + size)
+        logConsole("Generated code size (%s -> %s backend):\n" %
+                   (TlvF.BACKEND_INLINE, self.backend))
+        for suffix in [".h", ".cpp"]:
+            (before_lines, before) = totals.get((suffix, TlvF.BACKEND_INLINE), (0, 0))
+            (after_lines, after) = totals.get((suffix, self.backend), (0, 0))
+            ratio = (100.0 * (after - before) / before) if before else 0
+            logConsole("    %-4s %8d -> %8d lines, %9d -> %9d bytes (%+.1f%%)\n" %
+                       (suffix, before_lines, after_lines, before, after, ratio))
+
+    ##########################################################################
+    # code size and complexity report
+    #
+    # For every schema (yaml file) and every class, collect the number of
+    # emitted lines, the number of out-of-line generated methods and a rough
+    # estimate of the compiled contribution, together with the layout
+    # features which are known to be costly at runtime: variable length
+    # lists, the memmove pointer fix-ups they require and nested classes held
+    # by std::shared_ptr.
+    ##########################################################################
+    def getReportSchema(self):
+        schema = self.yaml_path + "/" + self.yaml_fname
+        if schema not in self.report_schemas:
+            self.report_schemas[schema] = OrderedDict((k, 0) for k in TlvF.REPORT_KEYS)
+        return self.report_schemas[schema]
+
+    def getReportClass(self, name):
+        key = (self.yaml_path + "/" + self.yaml_fname, name)
+        if key not in self.report_classes:
+            self.report_classes[key] = OrderedDict((k, 0) for k in TlvF.REPORT_KEYS)
+        return self.report_classes[key]
+
+    def getEstimatedBytes(self, line):
+        line = line.strip()
+        if len(line) == 0 or line in ["{", "}", "};"] or line.startswith(("//", "/*", "*", "#")):
+            return 0
+        if line.find("LOG(") != -1:
+            return TlvF.EST_BYTES_PER_LOG_LINE
+        return TlvF.EST_BYTES_PER_LINE
+
+    def addReportLines(self, lines, file_suffix):
+        schema = self.getReportSchema()
+        method_def = re.compile(r"^[A-Za-z_][^(;]*?\b(\w+)::~?\w+\(")
+        class_stats = None
+        for line in lines:
+            schema["lines"] += 1
+            if file_suffix != ".cpp":
+                continue
+            est = self.getEstimatedBytes(line)
+            schema["est_bytes"] += est
+            m = method_def.match(line)
+            if m and m.group(1) in self.local_obj_list:
+                class_stats = self.getReportClass(m.group(1))
+                class_stats["methods"] += 1
+                schema["methods"] += 1
+            if class_stats:
+                class_stats["lines"] += 1
+                class_stats["est_bytes"] += est
+
+    def addReportObject(self, obj_meta):
+        if obj_meta.type != MetaData.TYPE_CLASS:
+            return
+        schema = self.getReportSchema()
+        class_stats = self.getReportClass(obj_meta.name)
+        class_stats["var_len_lists"] += obj_meta.num_var_len_lists
+        class_stats["alloc_fixups"] += obj_meta.num_alloc_fixups
+        class_stats["shared_ptr_members"] += obj_meta.num_shared_ptr_members
+        schema["var_len_lists"] += obj_meta.num_var_len_lists
+        schema["alloc_fixups"] += obj_meta.num_alloc_fixups
+        schema["shared_ptr_members"] += obj_meta.num_shared_ptr_members
+
+    def writeReport(self):
+        columns = TlvF.REPORT_KEYS
+        header = "%-48s" % "schema / class" + "".join(["%20s" % c for c in columns])
+        lines = [header, "-" * len(header)]
+        totals = dict((c, 0) for c in columns)
+        for schema, schema_stats in self.report_schemas.items():
+            lines.append("%-48s" % schema + "".join(["%20d" % schema_stats[c] for c in columns]))
+            for c in columns:
+                totals[c] += schema_stats[c]
+            for (class_schema, name), class_stats in self.report_classes.items():
+                if class_schema != schema:
+                    continue
+                lines.append("%-48s" % ("    " + name) +
+                             "".join(["%20d" % class_stats[c] for c in columns]))
+        lines.append("-" * len(header))
+        lines.append("%-48s" % "total" + "".join(["%20d" % totals[c] for c in columns]))
+        self.mkdir_p(os.path.dirname(os.path.abspath(self.report_path)))
+        with open(self.report_path, "w") as f:
+            for line in lines:
+                f.write(line + "\n")
+        logConsole("Code size report written to %s (%d lines, ~%d bytes estimated)\n" %
+                   (self.report_path, totals["lines"], totals["est_bytes"]))
+
+    def checkBudget(self):
+        if self.update_budget:
+            budget = OrderedDict()
+            budget[TlvF.BUDGET_TOLERANCE_KEY] = 0
+            if os.path.isfile(self.budget_path):
+                old_budget = self.loadYaml(self.budget_path)
+                if isinstance(old_budget, dict):
+                    budget[TlvF.BUDGET_TOLERANCE_KEY] = old_budget.get(TlvF.BUDGET_TOLERANCE_KEY, 0)
+            for schema, schema_stats in self.report_schemas.items():
+                budget[schema] = OrderedDict((k, schema_stats[k]) for k in TlvF.BUDGET_KEYS)
+            with open(self.budget_path, "w") as f:
+                f.write("# tlvf code size budget - updated by tlvf.py --update-budget\n")
+                f.write("%s: %s\n" % (TlvF.BUDGET_TOLERANCE_KEY, budget[TlvF.BUDGET_TOLERANCE_KEY]))
+                for schema in self.report_schemas.keys():
+                    sizes = ["%s: %d" % (k, budget[schema][k]) for k in TlvF.BUDGET_KEYS]
+                    f.write("%s: {%s}\n" % (schema, ", ".join(sizes)))
+            logConsole("Code size budget written to %s\n" % self.budget_path)
+            return
+
+        try:
+            budget = self.loadYaml(self.budget_path) or {}
+        except Exception as e:
+            self.abort("can't read budget file %s: %s" % (self.budget_path, str(e)))
+        if not isinstance(budget, dict):
+            self.abort("budget file %s is not a mapping of schema names to code sizes" %
+                       self.budget_path)
+        tolerance = budget.get(TlvF.BUDGET_TOLERANCE_KEY, 0)
+        errors = []
+        for schema, schema_stats in self.report_schemas.items():
+            if schema not in budget:
+                self.logger.warning("%s.yaml is not in the code size budget %s" %
+                                    (schema, self.budget_path))
+                continue
+            for key in TlvF.BUDGET_KEYS:
+                if key not in budget[schema]:
+                    continue
+                limit = budget[schema][key] * (100 + tolerance) / 100.0
+                if schema_stats[key] > limit:
+                    errors.append("%s.yaml: %s %d exceeds budget %d (tolerance %s%%)" %
+                                  (schema, key, schema_stats[key], budget[schema][key], tolerance))
+        if errors:
+            self.abort("code size budget exceeded:\n" + "\n".join(errors) +
+                       "\nrun with --update-budget to accept the new sizes")
+
+    #########################################################################
+    # --watch support
+    #
+    # After the first generation, the db and the list of generated files stay
+    # in memory. The include_yaml_path trees are polled for modified, added
+    # and removed yaml files every WATCH_POLL_INTERVAL seconds.
+    # Only the changed schemas are reloaded, and only they and the schemas
+    # referring to their objects (directly or not) are regenerated.
+    #########################################################################
+    def watchSchemas(self):
+        mtimes = self.getSchemaMtimes()
+        logConsole("Watching %d yaml files, press Ctrl-C to stop...\n" % len(self.yaml_file_list))
+        try:
+            while True:
+                time.sleep(TlvF.WATCH_POLL_INTERVAL)
+                mtimes = self.watchRegenerate(mtimes)
+        except KeyboardInterrupt:
+            logConsole("\n")
+
+    def getSchemaMtimes(self):
+        self.yaml_file_list = []
+        self.loadYamlFileNames()
+        mtimes = OrderedDict()
+        for fname in self.yaml_file_list + [self.yaml_conf_name]:
+            try:
+                mtimes[fname] = os.stat(fname).st_mtime
+            except OSError:
+                pass
+        return mtimes
+
+    def getSchemaReferences(self, value, refs):
+        if isinstance(value, dict):
+            for v in value.values():
+                self.getSchemaReferences(v, refs)
+        elif isinstance(value, list):
+            for v in value:
+                self.getSchemaReferences(v, refs)
+        elif hasattr(value, "split"):
+            refs.add(value.split("::")[-1])
+        return refs
+
+    def getSchemaDependents(self, yaml_fnames):
+        defined = {}
+        references = OrderedDict()
+        for (fname, obj_name), value in self.db.items():
+            if not obj_name.startswith(MetaData.META_PREFIX):
+                defined[obj_name] = fname
+            self.getSchemaReferences(value, references.setdefault(fname, set()))
+        dependents = set(yaml_fnames)
+        while True:
+            added = set(fname for fname, refs in references.items()
+                        if fname not in dependents and
+                        any(defined.get(ref) in dependents for ref in refs))
+            if not added:
+                return dependents
+            dependents |= added
+
+    def watchRegenerate(self, mtimes):
+        try:
+            new_mtimes = self.getSchemaMtimes()
+        except SystemExit:
+            logConsole("Can't list the yaml files, waiting for the next change...\n")
+            return mtimes
+        if new_mtimes.get(self.yaml_conf_name) != mtimes.get(self.yaml_conf_name):
+            logConsole("Configuration file changed, restarting...\n")
+            os.execv(sys.executable, [sys.executable] + sys.argv)
+        changed = [fname for fname in new_mtimes if new_mtimes[fname] != mtimes.get(fname)]
+        removed = [fname for fname in mtimes if fname not in new_mtimes]
+        if not changed and not removed:
+            return new_mtimes
+
+        start = time.time()
+        self.written_file_list = []
+        try:
+            yaml_fnames = set()
+            for fname in removed + changed:
+                yaml_fname = os.path.splitext(os.path.basename(fname))[0]
+                self.unloadYamlFromDB(yaml_fname)
+                yaml_fnames.add(yaml_fname)
+            for fname in changed:
+                self.loadYamlFileToDB(fname)
+            dependents = self.getSchemaDependents(yaml_fnames)
+            self.unloadIR(dependents)
+            self.buildIR(dependents)
+            file_list = [fname for fname in self.yaml_file_list
+                         if os.path.splitext(os.path.basename(fname))[0] in dependents]
+            if self.profile == TlvF.PROFILE_RELEASE:
+                # error codes are numbered over all the schemas
+                file_list = None
+                self.error_codes = []
+            self.generateCode(file_list)
+            if self.profile == TlvF.PROFILE_RELEASE:
+                self.writeErrorCodes()
+        except (Exception, SystemExit) as e:
+            reason = "see the errors above" if isinstance(e, SystemExit) else str(e)
+            logConsole("Regeneration failed (%s), waiting for the next change...\n" % reason)
+            return new_mtimes
+        for fname in removed:
+            logConsole("Removed %s, its generated files are left in place\n" % fname)
+        logConsole("%d schemas regenerated, %d files written in %d ms\n" %
+                   (len(self.yaml_file_list) if file_list is None else len(file_list),
+                    len(self.written_file_list), (time.time() - start) * 1000))
+        return new_mtimes
+
+    def checkSchemas(self):
+        # --check: run all the validations of loading, building the IR and generating the code (dry
+        # run), collecting the abort() errors of every yaml file and object instead of exiting on
+        # the first one
+        global logConsoleDisable
+        logConsole("Checking yaml files...\n")
+        self.conf_debug_dump_db = False
+        self.conf_debug_dump_yaml = False
+        self.dry_run = True
+        self.check_errors = []
+        failed = set()
+        for fname in self.yaml_file_list:
+            try:
+                self.loadYamlFileToDB(fname)
+            except CheckError:
+                failed.add(fname)
+            except Exception as e:
+                self.check_errors.append("%s --> %s" %
+                                         (os.path.relpath(fname, self.yaml_root_path), e))
+                failed.add(fname)
+        for (fname, obj_name), dict_value in self.db.items():
+            if obj_name.startswith(MetaData.META_PREFIX):
+                continue
+            try:
+                self.buildObjectIR(fname, obj_name, dict_value)
+            except CheckError:
+                failed.add(fname)
+
+        console_disabled = logConsoleDisable
+        logConsoleDisable = True
+        for filename in self.yaml_file_list:
+            yaml_fname = os.path.splitext(os.path.basename(filename))[0]
+            if filename in failed or yaml_fname in failed:
+                continue
+            try:
+                self.generateCode([filename])
+            except CheckError:
+                pass
+            except Exception as e:
+                self.check_errors.append("%s.yaml --> internal error: %s" % (yaml_fname, e))
+        logConsoleDisable = console_disabled
+
+        for msg in self.check_errors:
+            logConsole("error: %s\n" % msg)
+        logConsole("%d yaml files checked, %d error(s)\n" %
+                   (len(self.yaml_file_list), len(self.check_errors)))
+        return len(self.check_errors)
+
+    ##########################################################################
+    # performance lint
+    #
+    # Flags class layouts which are legal but slow, without generating code:
+    # - several variable length lists: every alloc/create/add call on a list
+    #   memmoves the rest of the buffer and fixes up the pointer of every
+    #   member which comes after the list;
+    # - many nested class members: each one is held by its own shared_ptr,
+    #   allocated on every parse and build;
+    # - _length_var counters placed after the list they count: the list size
+    #   is not known when the list is reached, and the counter moves (and is
+    #   fixed up) on every allocation.
+    ##########################################################################
+    def lintPerformance(self):
+        logConsole("Linting class layouts...\n")
+        findings = 0
+        for (fname, obj_name), dict_value in self.db.items():
+            if obj_name.startswith(MetaData.META_PREFIX):
+                continue
+            if (type(dict_value) is not OrderedDict or
+                    dict_value.get(MetaData.KEY_TYPE) != MetaData.TYPE_CLASS):
+                continue
+            schema = self.db_yaml_paths[fname] + "/" + fname + ".yaml"
+            for msg in self.lintClass(fname, obj_name, dict_value):
+                logConsole("%s: %s: %s\n" % (schema, obj_name, msg))
+                findings += 1
+        logConsole("%d performance finding(s)\n" % findings)
+        return findings
+
+    def lintClass(self, fname, obj_name, dict_value):
+        params = []
+        for param_name, param_dict in dict_value.items():
+            if param_name.startswith(MetaData.META_PREFIX):
+                continue
+            if type(param_dict) is OrderedDict:
+                param_meta = MetaData(fname, param_name, param_dict)
+                if param_meta.error:
+                    self.abort(param_meta.error)
+            else:
+                param_meta = MetaData(fname, param_name, {MetaData.KEY_TYPE: param_dict})
+            params.append(param_meta)
+        names = [p.name for p in params]
+
+        msgs = []
+        lists = [(i, p) for i, p in enumerate(params)
+                 if p.length_type in [MetaData.LENGTH_TYPE_VAR, MetaData.LENGTH_TYPE_DYNAMIC]]
+        if len(lists) > TlvF.LINT_MAX_VAR_LEN_LISTS:
+            # members after each list are moved and fixed up on every allocation in that list
+            fixups = [len(params) - i - 1 for i, p in lists]
+            msgs.append("%d variable length lists (%s) - every alloc/create/add call on a list "
+                        "memmoves the buffer after it and fixes up the member pointers behind it "
+                        "(%s fix-ups per call respectively, %d for one call on each list), "
+                        "place the lists last or merge them"
+                        % (len(lists), ", ".join([p.name for i, p in lists]),
+                           ", ".join([str(f) for f in fixups]), sum(fixups)))
+
+        classes = [p for p in params if TypeInfo.get(p.type).type == TypeInfo.CLASS]
+        if len(classes) > TlvF.LINT_MAX_SHARED_PTR_MEMBERS:
+            single = len([p for p in classes if p.length_type is None])
+            msgs.append("%d nested class members (%s) - each one is a separate std::shared_ptr "
+                        "heap allocation: %d allocations per parse/build plus one per list "
+                        "element, consider flattening into structs"
+                        % (len(classes), ", ".join([p.name for p in classes]), single))
+
+        for i, p in lists:
+            if p.length_type != MetaData.LENGTH_TYPE_VAR or p.length not in names:
+                continue
+            counter_idx = names.index(p.length)
+            if counter_idx > i:
+                msgs.append("length counter %s is placed after the list %s it counts - the list "
+                            "size is not known when the list is parsed, and the counter is moved "
+                            "and fixed up on every allocation in %s (%d extra fix-ups per "
+                            "element), move it before the list"
+                            % (p.length, p.name, p.name, counter_idx - i))
+        return msgs
 
     def processDeceleration(self, obj_name, dict_value):
         if obj_name == MetaData.DECELERATION_NAMESPACE:
@@ -467,29 +1051,595 @@ class TlvF:
         else:
             self.abort("%s.yaml --> unknown key: %s" % (self.yaml_fname, obj_name))
 
-    def generateObject(self, obj_meta, dict_value):
-        for param_name, param_dict in list(dict_value.items()):
-            if param_name.startswith(MetaData.META_PREFIX): continue
-            if ( type( param_dict ) is OrderedDict ):
-                param_meta = MetaData(self.yaml_fname, param_name, param_dict)
-                if param_meta.error: self.abort(param_meta.error)
-                param_type = param_meta.type
-                param_type_info = param_meta.type_info
-                param_type_real = TypeInfo(param_type)
-                if param_type_real.type == TypeInfo.ENUM:
-                    try:
-                        value = self.db_enum_storage_type[(self.yaml_fname, param_type_real.type_str)]
-                    except:
-                        value = self.db_enum_storage_type[(param_type_real.type_str, param_type_real.type_str)]
-                    param_type_info = TypeInfo(value[MetaData.KEY_ENUM_STORAGE])
-                    param_type_info.set_type(param_meta.type_info.type)
-                    if param_meta.type == param_type_real.type_str:
-                        self.include_list.append('"' + self.yaml_path + "/" + param_type + ".h" + '"')
+    #########################################################################
+    # intermediate representation
+    #
+    # Built once after loading the yaml files, for all the objects in the db:
+    # the parsed and validated MetaData of each object and of its parameters,
+    # with their interned TypeInfo and resolved enum storage types.
+    # The code generation works on copies of the MetaData (see
+    # MetaData.copy()), so the IR is reused as is by the dry run of the table
+    # backend and by --watch, which rebuilds the entries of reloaded files.
+    #########################################################################
+    def buildIR(self, yaml_fnames=None):
+        for (fname, obj_name), dict_value in self.db.items():
+            if obj_name.startswith(MetaData.META_PREFIX):
+                continue
+            if yaml_fnames is not None and fname not in yaml_fnames:
+                continue
+            self.buildObjectIR(fname, obj_name, dict_value)
+
+    def buildObjectIR(self, fname, obj_name, dict_value):
+        obj_meta = MetaData(fname, obj_name, dict_value)
+        if obj_meta.error:
+            self.abort(obj_meta.error)
+        if obj_meta.type is None:
+            self.abort("%s.yaml --> '_type' not defined" % (fname))
+        params = []
+        if obj_meta.type != MetaData.TYPE_MESSAGE:
+            for param_name, param_dict in dict_value.items():
+                if param_name.startswith(MetaData.META_PREFIX):
+                    continue
+                params.append(self.buildParamIR(fname, param_name, param_dict))
+        self.ir[(fname, obj_name)] = (obj_meta, params)
+
+    def buildParamIR(self, fname, param_name, param_dict):
+        if not type(param_dict) is OrderedDict:
+            return ParamIR(param_name, param_dict, TypeInfo.get(param_dict), None, False)
+        param_meta = MetaData(fname, param_name, param_dict)
+        if param_meta.error:
+            self.abort(param_meta.error)
+        param_type = param_meta.type
+        param_type_info = param_meta.type_info
+        param_type_real = TypeInfo.get(param_type)
+        local_include = False
+        if param_type_real.type == TypeInfo.ENUM:
+            enum_name = param_type_real.type_str
+            value = self.db_enum_storage_type.get((fname, enum_name))
+            if value is None:
+                value = self.db_enum_storage_type.get((enum_name, enum_name))
+            if value is None:
+                self.abort("%s.yaml --> enum storage of %s not found" % (fname, param_type))
+            param_type_info = TypeInfo.get(value[MetaData.KEY_ENUM_STORAGE],
+                                           param_meta.type_info.type)
+            local_include = (param_meta.type == param_type_real.type_str)
+        return ParamIR(param_name, param_type, param_type_info, param_meta, local_include)
+
+    def unloadIR(self, yaml_fnames):
+        for key in [key for key in self.ir.keys() if key[0] in yaml_fnames]:
+            del self.ir[key]
+
+    def addTypeInclude(self, obj_meta, param_type, param_type_info, type_path):
+        # objects are not necessarily named like their yaml file, so a class of another yaml file
+        # is included by the header of the yaml file which declares it
+        include = None
+        if (obj_meta.type == MetaData.TYPE_CLASS and param_type_info.type == TypeInfo.CLASS and
+                param_type not in self.local_obj_list):
+            include = self.getObjectInclude(param_type)
+        self.include_list.append(include or '"' + type_path + "/" + param_type + '.h"')
+
+    #########################################################################
+    # wire size analysis
+    #
+    # The minimum and maximum size on the wire of every class and struct,
+    # derived from the IR. Lists of a constant _length always count in full.
+    # Lists of a variable _length are bounded by their _length_max or by the
+    # range of their length parameter. Dynamic lists are bounded by their
+    # _length_max only, otherwise the maximum is unbounded (None).
+    # Nested class members count with their own minimum, which is not the
+    # case of get_initial_size().
+    # Written as constexpr functions to <yaml root>/wire_sizes.h, and as JSON
+    # with --wire-size-report.
+    #########################################################################
+    def getWireSizeObject(self, fname, type_name):
+        name = type_name.split("::")[-1]
+        if (fname, name) in self.ir:
+            return (fname, name)
+        if (name, name) in self.ir:
+            return (name, name)
+        for key in self.ir.keys():
+            if key[1] == name:
+                return key
+        return None
+
+    def getWireSizeConstant(self, fname, value):
+        # a _length / _length_max value: a number, a value of a yaml enum or a C++ constant.
+        # As the compiler does, the name is looked up in the namespace of the yaml file first.
+        if str(value).isdigit():
+            return WireSize(int(value))
+        name = str(value).lstrip(":")
+        namespace = self.db.get((fname, MetaData.DECELERATION_NAMESPACE))
+        for key in ([namespace + "::" + name] if namespace else []) + [name]:
+            if key in self.wire_size_constants:
+                constant = self.wire_size_constants[key]
+                if constant is None:
+                    break
+                return WireSize(constant)
+        return WireSize(symbol=str(value))
+
+    def getWireSizeOfType(self, fname, type_name):
+        # (min, max) size of a single element
+        type_info = TypeInfo.get(type_name)
+        if type_info.type in TypeInfo.STD_TYPES:
+            size = WireSize(TypeInfo.STD_TYPE_SIZES[type_info.type])
+            return (size, size)
+        if type_info.type == TypeInfo.CHAR:
+            return (WireSize(1), WireSize(1))
+        key = self.getWireSizeObject(fname, type_name)
+        if key:
+            obj_meta = self.ir[key][0]
+            if (obj_meta.type in [MetaData.TYPE_ENUM, MetaData.TYPE_ENUM_CLASS] and
+                    obj_meta.enum_storage):
+                return self.getWireSizeOfType(key[0], obj_meta.enum_storage)
+            if obj_meta.type in [MetaData.TYPE_STRUCT, MetaData.TYPE_CLASS]:
+                wire_size = self.getWireSize(key)
+                return (wire_size["min"], wire_size["max"])
+        # defined outside of the yaml files (or an enum without storage), left to the compiler.
+        # The name is looked up from the wire_size namespace, nested in the yaml namespace.
+        size = WireSize(symbol="sizeof(%s)" % type_name)
+        return (size, size)
+
+    def getWireSize(self, key):
+        if key in self.wire_sizes:
+            return self.wire_sizes[key]
+        (fname, obj_name) = key
+        (obj_meta, params) = self.ir[key]
+        wire_size = {"min": WireSize(), "max": WireSize(), "lists": OrderedDict()}
+        if obj_meta.bit_field:
+            (wire_size["min"], wire_size["max"]) = self.getWireSizeOfType(fname, obj_meta.bit_field)
+            params = []
+        auto_insert = self.db.get((fname, MetaData.DECELERATION_MULTI_CLASS_AUTO_INSERT))
+        if obj_meta.type == MetaData.TYPE_CLASS and auto_insert:
+            # as in openObject(), the auto inserted types may be declared in other yaml files
+            auto_params = []
+            for param_name, param_dict in auto_insert.items():
+                param_meta = MetaData(fname, param_name, param_dict)
+                if param_meta.error:
+                    self.abort(param_meta.error)
+                auto_params.append(ParamIR(param_name, param_meta.type, param_meta.type_info,
+                                           param_meta, False))
+            params = auto_params + params
+        for param in params:
+            if param.type is None:
+                continue
+            (elem_min, elem_max) = self.getWireSizeOfType(fname, param.type)
+            meta = param.meta
+            length_type = meta.length_type if meta else None
+            if length_type is None:
+                count_min = count_max = WireSize(1)
+            elif length_type in [MetaData.LENGTH_TYPE_INT, MetaData.LENGTH_TYPE_CONST]:
+                count_min = count_max = self.getWireSizeConstant(fname, meta.length)
+            else:
+                count_min = WireSize(0)
+                count_max = None
+                counter = [p for p in params if p.name == meta.length]
+                counter_type = TypeInfo.get(counter[0].type).type if counter else None
+                if meta.length_max:
+                    count_max = self.getWireSizeConstant(fname, meta.length_max)
+                elif length_type == MetaData.LENGTH_TYPE_VAR and counter_type in TypeInfo.STD_TYPES:
+                    bits = 8 * TypeInfo.STD_TYPE_SIZES[counter_type]
+                    if not counter_type.startswith("U"):
+                        bits -= 1
+                    count_max = WireSize(2 ** bits - 1)
+            if length_type is not None and obj_meta.type == MetaData.TYPE_CLASS:
+                wire_size["lists"][param.name] = {"element_min": elem_min,
+                                                  "element_max": elem_max,
+                                                  "count_max": count_max}
+            wire_size["min"] = wire_size["min"].add(count_min.mul(elem_min))
+            if wire_size["max"] is not None:
+                if count_max is None or elem_max is None:
+                    wire_size["max"] = None
+                else:
+                    wire_size["max"] = wire_size["max"].add(count_max.mul(elem_max))
+        self.wire_sizes[key] = wire_size
+        return wire_size
+
+    def getWireSizeEntries(self):
+        # (fname, namespace, scope, obj_name) of the classes and structs, in generation order, where
+        # scope is the class a struct is nested in (as in openObject()), or None
+        entries = []
+        for filename in self.yaml_file_list:
+            fname = os.path.splitext(os.path.basename(filename))[0]
+            namespace = self.db.get((fname, MetaData.DECELERATION_NAMESPACE))
+            multi_class = self.db.get((fname, MetaData.DECELERATION_MULTI_CLASS), False)
+            scope = None
+            for (obj_fname, obj_name) in self.db.keys():
+                if obj_fname != fname or (obj_fname, obj_name) not in self.ir:
+                    continue
+                obj_meta = self.ir[(obj_fname, obj_name)][0]
+                if obj_meta.type == MetaData.TYPE_CLASS:
+                    entries.append((fname, namespace, None, obj_name))
+                    if not multi_class:
+                        scope = obj_name
+                elif obj_meta.type == MetaData.TYPE_STRUCT:
+                    entries.append((fname, namespace, scope, obj_name))
+        return entries
+
+    def initWireSizes(self):
+        # the sizes are also used by the message generation, so they are computed before
+        # generating the code
+        self.wire_sizes = {}
+        # the values of the yaml enums by qualified name: "<enum>::<value>", and "<value>" for a
+        # plain enum, both also prefixed with the namespace. A name declared with different values
+        # maps to None, and is left to the compiler.
+        self.wire_size_constants = {}
+        for ((fname, enum_name), (obj_meta, params)) in self.ir.items():
+            if obj_meta.type not in [MetaData.TYPE_ENUM, MetaData.TYPE_ENUM_CLASS]:
+                continue
+            namespace = self.db.get((fname, MetaData.DECELERATION_NAMESPACE))
+            for param in params:
+                if type(param.type) is not int:
+                    continue
+                names = [enum_name + "::" + param.name]
+                if obj_meta.type == MetaData.TYPE_ENUM:
+                    names.append(param.name)
+                if namespace:
+                    names += [namespace + "::" + name for name in names]
+                for name in names:
+                    clash = self.wire_size_constants.get(name, param.type) != param.type
+                    self.wire_size_constants[name] = None if clash else param.type
+
+    def writeWireSizes(self):
+        entries = self.getWireSizeEntries()
+        if not entries:
+            return
+
+        # the wire sizes of each namespace, with the structs nested in a class below it
+        namespaces = OrderedDict()
+        includes = []
+        report = OrderedDict()
+        for (fname, namespace, scope, obj_name) in entries:
+            wire_size = self.getWireSize((fname, obj_name))
+            lines = self.getWireSizeLines(obj_name, wire_size)
+            ns_entries = namespaces.setdefault(namespace, OrderedDict())
+            if scope:
+                ns_entries[scope][-1:-1] = [self.getIndentation(1) + line for line in lines]
+            else:
+                ns_entries[obj_name] = lines
+            sizes = [wire_size["min"], wire_size["max"]]
+            sizes += [v for list_sizes in wire_size["lists"].values() for v in list_sizes.values()]
+            if any(size is not None and not size.is_number() for size in sizes):
+                include = "<%s/%s.h>" % (self.db_yaml_paths[fname], fname)
+                if include not in includes:
+                    includes.append(include)
+            name = "::".join([n for n in [namespace, scope, obj_name] if n])
+            max_size = wire_size["max"].json() if wire_size["max"] is not None else None
+            report[name] = OrderedDict([("schema", self.db_yaml_paths[fname] + "/" + fname),
+                                        ("type", self.ir[(fname, obj_name)][0].type),
+                                        ("min", wire_size["min"].json()),
+                                        ("max", max_size)])
+            if wire_size["lists"]:
+                report[name]["lists"] = OrderedDict(
+                    (list_name, OrderedDict((k, v.json() if v is not None else None)
+                                            for k, v in list_sizes.items()))
+                    for list_name, list_sizes in wire_size["lists"].items())
+
+        root = self.getWireSizesRoot()
+        guard = "_%s_WIRE_SIZES_H_" % root.upper().replace('/', '_')
+        lines = self.getFileHeaderLines()
+        lines.extend(["#ifndef %s" % guard, "#define %s" % guard, "", "#include <cstddef>",
+                      "#include <stdint.h>"])
+        lines.extend(["#include %s" % include for include in includes])
+        for namespace, ns_entries in namespaces.items():
+            lines.append("")
+            if namespace:
+                lines.append("namespace %s {" % namespace)
+            lines.append("namespace wire_size {")
+            for obj_lines in ns_entries.values():
+                lines.append("")
+                lines.extend(obj_lines)
+            lines.append("")
+            lines.append("} // namespace wire_size")
+            if namespace:
+                lines.append("}; // close namespace: %s" % namespace)
+        lines.extend(["", "#endif //%s" % guard])
+        self.writeGeneratedFile(os.path.join(self.conf_output_path_include, root, "wire_sizes.h"),
+                                lines)
+
+        if self.wire_size_report_path:
+            self.mkdir_p(os.path.dirname(os.path.abspath(self.wire_size_report_path)))
+            with open(self.wire_size_report_path, "w") as f:
+                json.dump(report, f, indent=4)
+                f.write("\n")
+            logConsole("Wire size report written to %s\n" % self.wire_size_report_path)
+
+    def getWireSizesRoot(self):
+        # the folder of wire_sizes.h, the common directory of all the yaml files
+        paths = [self.db_yaml_paths[fname].split("/")
+                 for (fname, namespace, scope, obj_name) in self.getWireSizeEntries()]
+        root = paths[0]
+        for path in paths[1:]:
+            while path[:len(root)] != root:
+                root = root[:-1]
+        return "/".join(root)
+
+    def getWireSizeLines(self, name, wire_size):
+        i1 = self.getIndentation(1)
+        max_size = str(wire_size["max"]) if wire_size["max"] is not None else "SIZE_MAX"
+        lines = ["struct %s {" % name,
+                 "%sstatic constexpr size_t min() { return %s; }" % (i1, wire_size["min"]),
+                 "%sstatic constexpr size_t max() { return %s; }" % (i1, max_size),
+                 "%sstatic constexpr bool bounded() { return %s; }" %
+                 (i1, "true" if wire_size["max"] is not None else "false")]
+        for list_name, sizes in wire_size["lists"].items():
+            for key, size in sizes.items():
+                lines.append("%sstatic constexpr size_t %s_%s() { return %s; }" %
+                             (i1, list_name, key, str(size) if size is not None else "SIZE_MAX"))
+        lines.append("};")
+        return lines
+
+    #########################################################################
+    # benchmark
+    #
+    # With --benchmark, a standalone translation unit which times a build ->
+    # finalize -> parse -> read round trip of every TLV class, with its lists
+    # filled up to a given count (bounded by the wire size analysis, see
+    # wire_sizes.h). The nested classes are filled and read recursively by a
+    # pair of fill_<class>() / read_<class>() functions per class, with a
+    # single element in their lists, so that the TLV size grows linearly
+    # with the count.
+    #########################################################################
+    def getBenchmarkName(self, key):
+        namespace = self.db.get((key[0], MetaData.DECELERATION_NAMESPACE))
+        return "%s_%s" % (namespace, key[1]) if namespace else key[1]
+
+    def getBenchmarkType(self, key, name=None):
+        namespace = self.db.get((key[0], MetaData.DECELERATION_NAMESPACE))
+        return "::%s%s" % ((namespace + "::") if namespace else "", name if name else key[1])
+
+    def getBenchmarkClasses(self, key, classes):
+        # the classes used by a class (as members or list elements) first, for the fill / read
+        # functions
+        if key in classes:
+            return
+        for param in self.ir[key][1]:
+            if param.type is None or TypeInfo.get(param.type).type != TypeInfo.CLASS:
+                continue
+            param_key = self.getWireSizeObject(key[0], param.type)
+            if param_key is None:
+                self.abort("%s.yaml --> benchmark: class %s not found" % (key[0], param.type))
+            self.getBenchmarkClasses(param_key, classes)
+        classes.append(key)
+
+    def getBenchmarkParams(self, key):
+        # (param, kind, param_key, count) of the members of a class, where kind is "value",
+        # "class" or "list", param_key the class of class members / elements and count the number
+        # of list elements as C++ expression
+        (obj_meta, params) = self.ir[key]
+        wire_size_type = self.getBenchmarkType(key, "wire_size::" + key[1])
+        counters = set(param.meta.length for param in params
+                       if param.meta and param.meta.length_type == MetaData.LENGTH_TYPE_VAR)
+        ret = []
+        for param in params:
+            if param.type is None:
+                continue
+            meta = param.meta
+            is_class = (TypeInfo.get(param.type).type == TypeInfo.CLASS)
+            param_key = self.getWireSizeObject(key[0], param.type) if is_class else None
+            length_type = meta.length_type if meta else None
+            if length_type in [MetaData.LENGTH_TYPE_INT, MetaData.LENGTH_TYPE_CONST]:
+                count = "%s::%s_count_max()" % (wire_size_type, param.name)
+                ret.append((param, "fixed_list", param_key, count))
+            elif length_type:
+                count = "std::min(count, %s::%s_count_max())" % (wire_size_type, param.name)
+                ret.append((param, "list", param_key, count))
+            elif is_class:
+                ret.append((param, "class", param_key, None))
+            elif not (meta and meta.class_const):
+                writable = (param.type_info.is_std_type and
+                            not (meta and (meta.value_const is not None or meta.length_var)) and
+                            param.name not in counters and
+                            not (obj_meta.is_tlv_class and param.name == MetaData.TLV_TYPE_LENGTH))
+                ret.append((param, "value", None, writable))
+        return ret
 
+    def getBenchmarkFillLines(self, key):
+        i1 = self.getIndentation(1)
+        i2 = self.getIndentation(2)
+        lines = ["static bool fill_%s(%s &obj, size_t count)" %
+                 (self.getBenchmarkName(key), self.getBenchmarkType(key)), "{"]
+        for (param, kind, param_key, count) in self.getBenchmarkParams(key):
+            if kind == "value" and count:
+                lines.append("%sobj.%s() = static_cast<%s>(count);" % (i1, param.name, param.type))
+            elif kind == "list" and param_key:
+                lines.append("%sfor (size_t i = 0; i < %s; i++) {" % (i1, count))
+                lines.append("%sauto %s = obj.create_%s();" % (i2, param.name, param.name))
+                lines.append("%sif (!%s || !fill_%s(*%s, 1) || !obj.add_%s(%s)) {" %
+                             (i2, param.name, self.getBenchmarkName(param_key), param.name,
+                              param.name, param.name))
+                lines.append("%sreturn false;" % self.getIndentation(3))
+                lines.append("%s}" % i2)
+                lines.append("%s}" % i1)
+            elif kind == "list":
+                lines.append("%sif (!obj.alloc_%s(%s)) {" % (i1, param.name, count))
+                lines.append("%sreturn false;" % i2)
+                lines.append("%s}" % i1)
+            elif kind == "class":
+                lines.append("%sauto %s = obj.create_%s();" % (i1, param.name, param.name))
+                lines.append("%sif (!%s || !fill_%s(*%s, 1) || !obj.add_%s(%s)) {" %
+                             (i1, param.name, self.getBenchmarkName(param_key), param.name,
+                              param.name, param.name))
+                lines.append("%sreturn false;" % i2)
+                lines.append("%s}" % i1)
+        lines.extend(["%sreturn true;" % i1, "}", ""])
+        return lines
+
+    def getBenchmarkReadLines(self, key):
+        i1 = self.getIndentation(1)
+        i2 = self.getIndentation(2)
+        lines = ["static uint64_t read_%s(%s &obj, size_t count)" %
+                 (self.getBenchmarkName(key), self.getBenchmarkType(key)), "{",
+                 "%suint64_t sum = 0;" % i1]
+        for (param, kind, param_key, count) in self.getBenchmarkParams(key):
+            # the parsed lists are read up to their parsed length, except the dynamic lists of
+            # classes which have no element count
+            if kind == "list" and param.meta.length_type == MetaData.LENGTH_TYPE_VAR:
+                count = "size_t(obj.%s())" % param.meta.length
+            elif kind == "list" and not param_key:
+                count = "obj.%s_length() / %s::%s_element_max()" % (
+                    param.name, self.getBenchmarkType(key, "wire_size::" + key[1]), param.name)
+            if kind == "value":
+                lines.append("%ssum += read_value(obj.%s());" % (i1, param.name))
+            elif kind == "class":
+                lines.append("%ssum += read_%s(*obj.%s(), 1);" %
+                             (i1, self.getBenchmarkName(param_key), param.name))
+            elif TypeInfo.get(param.type).type == TypeInfo.CHAR and kind == "list":
+                # reading an empty string is an error
+                lines.append("%sif (%s) {" % (i1, count))
+                lines.append("%ssum += obj.%s_str().size();" % (i2, param.name))
+                lines.append("%s}" % i1)
+            elif TypeInfo.get(param.type).type == TypeInfo.CHAR:
+                lines.append("%ssum += obj.%s_str().size();" % (i1, param.name))
             else:
-                param_type = param_dict
-                param_meta = None
-                param_type_info = TypeInfo(param_type)
+                lines.append("%sfor (size_t i = 0; i < %s; i++) {" % (i1, count))
+                if param_key:
+                    lines.append("%ssum += read_%s(std::get<1>(obj.%s(i)), 1);" %
+                                 (i2, self.getBenchmarkName(param_key), param.name))
+                elif param.type_info.is_std_type:
+                    lines.append("%ssum += read_value(*obj.%s(i));" % (i2, param.name))
+                else:
+                    lines.append("%ssum += read_value(std::get<1>(obj.%s(i)));" % (i2, param.name))
+                lines.append("%s}" % i1)
+        lines.extend(["%sreturn sum;" % i1, "}", ""])
+        return lines
+
+    def writeBenchmark(self):
+        tlv_classes = [key for key in self.ir.keys()
+                       if self.ir[key][0].type == MetaData.TYPE_CLASS and
+                       self.ir[key][0].is_tlv_class]
+        tlv_classes = [(fname, obj_name) for (fname, obj_name) in self.db.keys()
+                       if (fname, obj_name) in tlv_classes]
+        if not tlv_classes:
+            self.abort("--benchmark: no _is_tlv_class class in the yaml files")
+        classes = []
+        for key in tlv_classes:
+            self.getBenchmarkClasses(key, classes)
+        includes = []
+        for (fname, obj_name) in classes:
+            include = "<%s/%s.h>" % (self.db_yaml_paths[fname], fname)
+            if include not in includes:
+                includes.append(include)
+
+        i1 = self.getIndentation(1)
+        i2 = self.getIndentation(2)
+        i3 = self.getIndentation(3)
+        i4 = self.getIndentation(4)
+        i5 = self.getIndentation(5)
+        program = os.path.splitext(os.path.basename(self.benchmark_path))[0]
+        lines = self.getFileHeaderLines()
+        lines.extend(["// tlvf round trip benchmark, generated by tlvf.py --benchmark", "//",
+                      "// usage: %s [-n <iterations>] [-s <list sizes>] [<class name filter>]" %
+                      program,
+                      "//   -n  number of round trips per class and list size (default %d)" %
+                      TlvF.BENCHMARK_ITERATIONS,
+                      "//   -s  comma separated number of elements allocated in each list of the "
+                      "TLV (default %s)" % TlvF.BENCHMARK_LIST_SIZES,
+                      "//       (capped by the maximal length of the list, the lists of nested "
+                      "classes get one element).",
+                      "//       A TLV which doesn't fit in the buffer is skipped", ""])
+        lines.extend(["#include %s" % include for include in includes])
+        lines.extend(["#include <%s/wire_sizes.h>" % self.getWireSizesRoot(), "",
+                      "#include <algorithm>", "#include <chrono>", "#include <cstdio>",
+                      "#include <cstdlib>", "#include <cstring>", "#include <sstream>",
+                      "#include <string>", "#include <vector>", ""])
+        lines.extend(["static uint8_t g_buffer[%d];" % TlvF.BENCHMARK_BUFFER_SIZE,
+                      "// number of bytes of g_buffer used by the last round trip",
+                      "static size_t g_buffer_used = sizeof(g_buffer);",
+                      "// read results are accumulated here, so the reads are not optimized out",
+                      "static volatile uint64_t g_sink;", "",
+                      "template <class T> static uint64_t read_value(const T &value)", "{",
+                      "%suint64_t ret = 0;" % i1,
+                      "%sstd::memcpy(&ret, &value, std::min(sizeof(T), sizeof(ret)));" % i1,
+                      "%sreturn ret;" % i1, "}", ""])
+        for key in classes:
+            lines.extend(self.getBenchmarkFillLines(key))
+            lines.extend(self.getBenchmarkReadLines(key))
+        lines.extend(["enum eRoundTrip { ROUND_TRIP_OK, ROUND_TRIP_SKIPPED, ROUND_TRIP_FAILED };",
+                      "",
+                      "template <class T, bool (*Fill)(T &, size_t), "
+                      "uint64_t (*Read)(T &, size_t)>",
+                      "static eRoundTrip round_trip(size_t count, size_t &len)", "{",
+                      "%s// classes are built on a zeroed buffer, as done by ClassList::reset()" %
+                      i1,
+                      "%sstd::memset(g_buffer, 0, g_buffer_used);" % i1,
+                      "%sg_buffer_used = sizeof(g_buffer);" % i1,
+                      "%sT tlv(g_buffer, sizeof(g_buffer));" % i1,
+                      "%sif (!tlv.isInitialized()) {" % i1,
+                      "%sreturn ROUND_TRIP_FAILED;" % i2, "%s}" % i1,
+                      "%s// the lists can't be allocated when the TLV doesn't fit in g_buffer" % i1,
+                      "%sif (!Fill(tlv, count)) {" % i1,
+                      "%sreturn ROUND_TRIP_SKIPPED;" % i2, "%s}" % i1,
+                      "%sif (!tlv.finalize()) {" % i1,
+                      "%sreturn ROUND_TRIP_FAILED;" % i2, "%s}" % i1,
+                      "%slen = g_buffer_used = tlv.getLen();" % i1,
+                      "%sT parsed(g_buffer, len, true);" % i1,
+                      "%sif (!parsed.isInitialized()) {" % i1,
+                      "%sreturn ROUND_TRIP_FAILED;" % i2, "%s}" % i1,
+                      "%sg_sink = g_sink + Read(parsed, count);" % i1,
+                      "%sreturn ROUND_TRIP_OK;" % i1, "}", "",
+                      "struct sBenchmark {",
+                      "%sconst char *name;" % i1,
+                      "%seRoundTrip (*run)(size_t count, size_t &len);" % i1, "};", "",
+                      "static const sBenchmark benchmarks[] = {"])
+        for key in tlv_classes:
+            name = self.getBenchmarkName(key)
+            lines.append("%s{\"%s\", round_trip<%s, fill_%s, read_%s>}," %
+                         (i1, self.getBenchmarkType(key)[2:], self.getBenchmarkType(key), name,
+                          name))
+        lines.extend(["};", "",
+                      "int main(int argc, char *argv[])", "{",
+                      "%ssize_t iterations = %d;" % (i1, TlvF.BENCHMARK_ITERATIONS),
+                      "%sstd::string sizes = \"%s\";" % (i1, TlvF.BENCHMARK_LIST_SIZES),
+                      "%sstd::string filter;" % i1,
+                      "%sfor (int i = 1; i < argc; i++) {" % i1,
+                      "%sif (!strcmp(argv[i], \"-n\") && i + 1 < argc) {" % i2,
+                      "%siterations = strtoul(argv[++i], nullptr, 0);" % i3,
+                      "%s} else if (!strcmp(argv[i], \"-s\") && i + 1 < argc) {" % i2,
+                      "%ssizes = argv[++i];" % i3,
+                      "%s} else {" % i2,
+                      "%sfilter = argv[i];" % i3,
+                      "%s}" % i2, "%s}" % i1,
+                      "%sstd::vector<size_t> counts;" % i1,
+                      "%sstd::stringstream sizes_stream(sizes);" % i1,
+                      "%sfor (std::string size; std::getline(sizes_stream, size, ',');) {" % i1,
+                      "%scounts.push_back(strtoul(size.c_str(), nullptr, 0));" % i2, "%s}" % i1,
+                      "",
+                      "%sint errors = 0;" % i1,
+                      "%sprintf(\"%%-56s %%8s %%12s %%10s\\n\", \"class\", \"list len\", "
+                      "\"ns/op\", \"bytes/op\");" % i1,
+                      "%sfor (const auto &benchmark : benchmarks) {" % i1,
+                      "%sif (!filter.empty() && !strstr(benchmark.name, filter.c_str())) {" % i2,
+                      "%scontinue;" % i3, "%s}" % i2,
+                      "%sfor (auto count : counts) {" % i2,
+                      "%ssize_t len = 0;" % i3,
+                      "%sauto result = benchmark.run(count, len);" % i3,
+                      "%sif (result != ROUND_TRIP_OK) {" % i3,
+                      "%sprintf(\"%%-56s %%8zu %%12s %%10s\\n\", benchmark.name, count," % i4,
+                      "%s   result == ROUND_TRIP_SKIPPED ? \"skipped\" : \"FAILED\", \"-\");" %
+                      i5,
+                      "%serrors += (result == ROUND_TRIP_FAILED);" % i4,
+                      "%scontinue;" % i4, "%s}" % i3,
+                      "%sauto start = std::chrono::steady_clock::now();" % i3,
+                      "%sfor (size_t i = 0; i < iterations; i++) {" % i3,
+                      "%sbenchmark.run(count, len);" % i4, "%s}" % i3,
+                      "%sstd::chrono::duration<double, std::nano> elapsed = "
+                      "std::chrono::steady_clock::now() - start;" % i3,
+                      "%sprintf(\"%%-56s %%8zu %%12.1f %%10zu\\n\", benchmark.name, count," % i3,
+                      "%s   iterations ? elapsed.count() / iterations : 0.0, len);" % i4,
+                      "%s}" % i2, "%s}" % i1,
+                      "%sreturn errors;" % i1, "}"])
+        self.writeGeneratedFile(self.benchmark_path, lines)
+        logConsole("Benchmark of %d TLV classes written to %s\n" %
+                   (len(tlv_classes), self.benchmark_path))
+
+    def generateObject(self, obj_meta, params):
+        for param in params:
+            param_name = param.name
+            param_type = param.type
+            param_type_info = param.type_info
+            param_meta = param.meta.copy() if param.meta else None
+            if param.local_include:
+                self.addTypeInclude(obj_meta, param_type, param_type_info, self.yaml_path)
 
             obj_meta.children_types[param_name] = param_type_info
 
@@ -501,14 +1651,17 @@ class TlvF:
                         param_type_info.type == TypeInfo.CLASS or
                         param_type_info.type == TypeInfo.ENUM_CLASS):
                         if (self.db_yaml_paths.__contains__(param_type)):
-                            self.include_list.append('"' + self.db_yaml_paths[param_type] + "/" + param_type + ".h" + '"')
+                            self.addTypeInclude(obj_meta, param_type, param_type_info,
+                                                self.db_yaml_paths[param_type])
                         else:
-                            self.include_list.append('"' + self.yaml_path + "/" + param_type + ".h" + '"')
+                            self.addTypeInclude(obj_meta, param_type, param_type_info,
+                                                self.yaml_path)
 
             if obj_meta.type == MetaData.TYPE_ENUM or obj_meta.type == MetaData.TYPE_ENUM_CLASS:
                 if param_meta: self.abort("%s.yaml --> metadata not supported on enum values" % self.yaml_fname)
                 try: self.insertLineH(obj_meta.name, self.CODE_ENUM_INSERT, "%s = %s," % (param_name, hex(param_type)) )
                 except: self.abort("%s.yaml --> bad param_type=%s" % (self.yaml_fname, str(param_type)) )
+                obj_meta.enum_values.append((param_type, param_name))
             elif obj_meta.type == MetaData.TYPE_STRUCT:
                 self.addStructParam(obj_meta, param_name, param_type, param_type_info, param_meta)
             elif obj_meta.type == MetaData.TYPE_CLASS:
@@ -517,19 +1670,320 @@ class TlvF:
             else:
                 self.abort("%s.yaml --> unknown obj_meta.type:%s" % (self.yaml_fname, obj_meta.type) )
 
-            if obj_meta.type == MetaData.TYPE_ENUM_CLASS:
-                self.insertLineH(obj_meta.name, self.CODE_ENUM_VALIDATION_INSERT, "case %s:" % (hex(param_type)))
-
+    ##########################################################################
+    # message (CMDU) schemas
+    #
+    # A message object lists the TLVs of a complete CMDU in wire order.
+    # Each TLV is required, optional (_optional: True) or repeated
+    # (_repeated: True, 0 or more). The end of message TLV is implicit.
+    # For each message a class with static methods is generated:
+    # - get_wire_size() computes the exact CMDU size from the caller counts of
+    #   the TLVs and of their variable length list elements, with the sizes of
+    #   the wire size analysis (see wire_sizes.h)
+    # - build() checks the size against the Tx buffer once and then adds and
+    #   fills every TLV in a single pass
+    # - build_template() builds the message once on a CmduTemplate and
+    #   freezes it, to be resent with only a few patched fields
+    # - parse() returns all the TLVs of a received CMDU in one call
+    ##########################################################################
+    def getObjectInclude(self, type_name):
+        name = type_name.split("::")[-1]
+        for (fname, obj_name) in self.db.keys():
+            if obj_name == name:
+                return '"' + self.db_yaml_paths[fname] + "/" + fname + '.h"'
+        return None
+
+    def getMessageTlvs(self, obj_meta, dict_value):
+        tlvs = []
+        tlv_keys = [MetaData.KEY_TYPE, MetaData.KEY_OPTIONAL, MetaData.KEY_REPEATED,
+                    MetaData.KEY_COMMENT]
+        for param_name, param_dict in dict_value.items():
+            if param_name.startswith(MetaData.META_PREFIX):
+                continue
+            if type(param_dict) is not OrderedDict:
+                param_dict = OrderedDict([(MetaData.KEY_TYPE, param_dict)])
+            for key in param_dict.keys():
+                if key not in tlv_keys:
+                    self.abort("%s.yaml --> %s: unknown key %s for a message TLV" %
+                               (self.yaml_fname, param_name, key))
+            tlv_type = param_dict.get(MetaData.KEY_TYPE)
+            if not tlv_type:
+                self.abort("%s.yaml --> %s: _type not defined" % (self.yaml_fname, param_name))
+            tlv_optional = param_dict.get(MetaData.KEY_OPTIONAL, False)
+            tlv_repeated = param_dict.get(MetaData.KEY_REPEATED, False)
+            if tlv_optional and tlv_repeated:
+                self.abort("%s.yaml --> %s: _optional and _repeated are not supported together" %
+                           (self.yaml_fname, param_name))
+            tlv_include = self.getObjectInclude(tlv_type)
+            if not tlv_include:
+                self.abort("%s.yaml --> %s: unknown TLV type %s" %
+                           (self.yaml_fname, param_name, tlv_type))
+            self.include_list.append(tlv_include)
+            tlvs.append((param_name, tlv_type, tlv_optional, tlv_repeated))
+        return tlvs
+
+    def getMessageType(self, obj_meta):
+        # (value, enum type) of the _message_type: the enum which declares the value in the yaml
+        # files, qualified with its namespace, or else the message_type_enum of the conf file
+        message_type = obj_meta.message_type
+        value_name = message_type.split("::")[-1]
+        found = []
+        for (fname, enum_name), (enum_meta, params) in self.ir.items():
+            if enum_meta.type not in [MetaData.TYPE_ENUM, MetaData.TYPE_ENUM_CLASS]:
+                continue
+            if not any(param.name == value_name for param in params):
+                continue
+            namespace = self.db.get((fname, MetaData.DECELERATION_NAMESPACE))
+            enum_type = "::".join([n for n in [namespace, enum_name] if n])
+            scope = [namespace]
+            if enum_meta.type == MetaData.TYPE_ENUM_CLASS:
+                scope.append(enum_name)
+            value = "::".join([n for n in scope if n] + [value_name])
+            if value_name == message_type or value == message_type:
+                found.append((value, enum_type, self.getObjectInclude(enum_name)))
+        if len(found) > 1:
+            self.abort("%s.yaml --> %s: %s %s is ambiguous (%s), qualify it" %
+                       (self.yaml_fname, obj_meta.name, MetaData.KEY_MESSAGE_TYPE, message_type,
+                        ", ".join([value for (value, enum_type, include) in found])))
+        if found:
+            (value, enum_type, include) = found[0]
+            self.include_list.append(include)
+            return (value, enum_type)
+        if self.conf_message_type_enum:
+            if message_type.find("::") == -1:
+                message_type = self.conf_message_type_enum + "::" + message_type
+            return (message_type, self.conf_message_type_enum)
+        self.abort("%s.yaml --> %s: unknown %s %s, declare it in an enum of the yaml files or set "
+                   "message_type_enum in the conf file" %
+                   (self.yaml_fname, obj_meta.name, MetaData.KEY_MESSAGE_TYPE, message_type))
+
+    def getMessageListCounts(self, key, count_prefix, tlv_name):
+        # (count, element size, comment) of the variable length lists of a TLV class and of its
+        # nested classes. The size of a class is linear in the number of elements of its lists,
+        # so each count is the total of all the instances of a list, and the classes count with
+        # their minimum size (wire_size::min()).
+        (obj_meta, params) = self.ir[key]
+        namespace = self.db.get((key[0], MetaData.DECELERATION_NAMESPACE))
+        scope = "%swire_size::%s" % ((namespace + "::") if namespace else "", key[1])
+        counts = []
+        for param in params:
+            if param.type is None or TypeInfo.get(param.type).type == TypeInfo.ERROR:
+                continue
+            length_type = param.meta.length_type if param.meta else None
+            if length_type in [MetaData.LENGTH_TYPE_INT, MetaData.LENGTH_TYPE_CONST]:
+                continue
+            count = count_prefix + "_" + param.name
+            param_key = None
+            if TypeInfo.get(param.type).type == TypeInfo.CLASS:
+                param_key = self.getWireSizeObject(key[0], param.type)
+                if param_key is None:
+                    self.abort("%s.yaml --> class %s not found" % (key[0], param.type))
+            if length_type is not None:
+                counts.append((count, "%s::%s_element_min()" % (scope, param.name),
+                               "elements of the %s lists in the %s TLVs" % (param.name, tlv_name)))
+            param_size = self.getWireSize(param_key) if param_key else None
+            if param_size and (param_size["max"] is None or
+                               str(param_size["max"]) != str(param_size["min"])):
+                # a variable size class, as a list element or a member
+                counts.extend(self.getMessageListCounts(param_key, count, tlv_name))
+        return counts
+
+    def generateMessage(self, obj_meta, dict_value):
+        name = obj_meta.name
+        if not obj_meta.message_type:
+            self.abort("%s.yaml --> %s: %s not defined" %
+                       (self.yaml_fname, name, MetaData.KEY_MESSAGE_TYPE))
+        (message_type, message_type_enum) = self.getMessageType(obj_meta)
+        tlvs = self.getMessageTlvs(obj_meta, dict_value)
+        list_counts = OrderedDict()
+        tlv_min_sizes = {}
+        for (param_name, tlv_type, tlv_optional, tlv_repeated) in tlvs:
+            tlv_key = self.getWireSizeObject(self.yaml_fname, tlv_type)
+            if tlv_key is None:
+                self.abort("%s.yaml --> %s: unknown TLV type %s" %
+                           (self.yaml_fname, param_name, tlv_type))
+            namespace = self.db.get((tlv_key[0], MetaData.DECELERATION_NAMESPACE))
+            tlv_min_sizes[param_name] = "%swire_size::%s::min()" % (
+                (namespace + "::") if namespace else "", tlv_key[1])
+            list_counts[param_name] = self.getMessageListCounts(tlv_key, param_name, param_name)
+        fill_arg = "fill" if tlvs else "/*fill*/"
+        i1 = self.getIndentation(1)
+        i2 = self.getIndentation(2)
+        i3 = self.getIndentation(3)
+
+        lines_h = ["", "class %s" % name, "{", "%spublic:" % i1]
+        lines_h.append("%sstatic %s get_message_type();" % (i2, message_type_enum))
+        lines_h.append("")
+        lines_h.append("%s// number of optional and repeated TLVs, and of variable length list "
+                       "elements, to build" % i2)
+        lines_h.append("%stypedef struct sCounts {" % i2)
+        for (param_name, tlv_type, tlv_optional, tlv_repeated) in tlvs:
+            if tlv_repeated:
+                lines_h.append("%ssize_t %s = 0;" % (i3, param_name))
+            elif tlv_optional:
+                lines_h.append("%sbool %s = false;" % (i3, param_name))
+        for (param_name, tlv_type, tlv_optional, tlv_repeated) in tlvs:
+            for (count, element_size, comment) in list_counts[param_name]:
+                lines_h.append("%s// total number of %s" % (i3, comment))
+                lines_h.append("%ssize_t %s = 0;" % (i3, count))
+        lines_h.append("%s} sCounts;" % i2)
+        lines_h.append("")
+        lines_h.append("%s// called once per added TLV (with its index for repeated TLVs), "
+                       "before the next TLV is added" % i2)
+        lines_h.append("%stypedef struct sFill {" % i2)
+        for (param_name, tlv_type, tlv_optional, tlv_repeated) in tlvs:
+            args = "%s &tlv, size_t idx" % tlv_type if tlv_repeated else "%s &tlv" % tlv_type
+            lines_h.append("%sstd::function<bool(%s)> %s;" % (i3, args, param_name))
+        lines_h.append("%s} sFill;" % i2)
+        lines_h.append("")
+        lines_h.append("%stypedef struct sTlvs {" % i2)
+        for (param_name, tlv_type, tlv_optional, tlv_repeated) in tlvs:
+            if tlv_repeated:
+                lines_h.append("%sstd::list<std::shared_ptr<%s>> %s;" % (i3, tlv_type, param_name))
+            else:
+                lines_h.append("%sstd::shared_ptr<%s> %s;" % (i3, tlv_type, param_name))
+        lines_h.append("%s} sTlvs;" % i2)
+        lines_h.append("")
+        lines_h.append("%sstatic size_t get_wire_size(const sCounts &counts);" % i2)
+        lines_h.append("%sstatic bool build(ieee1905_1::CmduMessageTx &cmdu_tx, uint16_t mid, "
+                       "const sCounts &counts, const sFill &fill);" % i2)
+        lines_h.append("%s// build() on the template Tx message and freeze it, fill may take field "
+                       "handles with tmpl.get_patch()" % i2)
+        lines_h.append("%sstatic bool build_template(ieee1905_1::CmduTemplate &tmpl, "
+                       "const sCounts &counts, const sFill &fill);" % i2)
+        lines_h.append("%sstatic bool parse(const ieee1905_1::CmduMessageRx &cmdu_rx, "
+                       "sTlvs &tlvs);" % i2)
+        lines_h.append("};")
+        self.insertLineH("", self.CODE_END_INSERT, lines_h)
+
+        self.insertLineCpp("", self.CODE_INCLUDE_INSERT,
+                           "#include <tlvf/ieee_1905_1/tlvEndOfMessage.h>")
+        if tlvs:
+            self.insertLineCpp("", self.CODE_INCLUDE_INSERT,
+                               "#include <%s/wire_sizes.h>" % self.getWireSizesRoot())
+        lines_cpp = []
+        lines_cpp.append("%s %s::get_message_type() { return %s; }" %
+                         (message_type_enum, name, message_type))
+        lines_cpp.append("")
+        lines_cpp.append("size_t %s::get_wire_size(const sCounts &counts)" % name)
+        lines_cpp.append("{")
+        lines_cpp.append("%ssize_t wire_size = ieee1905_1::cCmduHeader::get_initial_size();" % i1)
+        for (param_name, tlv_type, tlv_optional, tlv_repeated) in tlvs:
+            if tlv_repeated:
+                lines_cpp.append("%swire_size += counts.%s * %s;" %
+                                 (i1, param_name, tlv_min_sizes[param_name]))
+            elif tlv_optional:
+                lines_cpp.append("%sif (counts.%s) {" % (i1, param_name))
+                lines_cpp.append("%swire_size += %s;" % (i2, tlv_min_sizes[param_name]))
+                lines_cpp.append("%s}" % i1)
+            else:
+                lines_cpp.append("%swire_size += %s;" % (i1, tlv_min_sizes[param_name]))
+            for (count, element_size, comment) in list_counts[param_name]:
+                lines_cpp.append("%swire_size += counts.%s * %s;" % (i1, count, element_size))
+        lines_cpp.append("%swire_size += ieee1905_1::tlvEndOfMessage::get_initial_size();" % i1)
+        lines_cpp.append("%sreturn wire_size;" % i1)
+        lines_cpp.append("}")
+        lines_cpp.append("")
+
+        lines_cpp.append("bool %s::build(ieee1905_1::CmduMessageTx &cmdu_tx, uint16_t mid, "
+                         "const sCounts &counts, const sFill &%s)" % (name, fill_arg))
+        lines_cpp.append("{")
+        lines_cpp.append("%sauto wire_size = get_wire_size(counts);" % i1)
+        lines_cpp.append("%sif (wire_size > cmdu_tx.getMessageBuffLength()) {" % i1)
+        lines_cpp.append("%sTLVF_LOG(ERROR) << \"%s wire size \" << wire_size << "
+                         "\" exceeds the buffer length \" << cmdu_tx.getMessageBuffLength();" %
+                         (i2, name))
+        lines_cpp.append("%sreturn false;" % i2)
+        lines_cpp.append("%s}" % i1)
+        lines_cpp.append("%sif (!cmdu_tx.create(mid, get_message_type())) {" % i1)
+        lines_cpp.append("%sTLVF_LOG(ERROR) << \"create() failed\";" % i2)
+        lines_cpp.append("%sreturn false;" % i2)
+        lines_cpp.append("%s}" % i1)
+        for (param_name, tlv_type, tlv_optional, tlv_repeated) in tlvs:
+            level = 1
+            fill_call = "fill.%s(*%s)" % (param_name, param_name)
+            if tlv_repeated:
+                lines_cpp.append("%sfor (size_t i = 0; i < counts.%s; i++) {" % (i1, param_name))
+                fill_call = "fill.%s(*%s, i)" % (param_name, param_name)
+                level = 2
+            elif tlv_optional:
+                lines_cpp.append("%sif (counts.%s) {" % (i1, param_name))
+                level = 2
+            il = self.getIndentation(level)
+            il1 = self.getIndentation(level + 1)
+            lines_cpp.append("%sauto %s = cmdu_tx.addClass<%s>();" % (il, param_name, tlv_type))
+            lines_cpp.append("%sif (!%s) {" % (il, param_name))
+            lines_cpp.append("%sTLVF_LOG(ERROR) << \"addClass<%s>() failed\";" % (il1, tlv_type))
+            lines_cpp.append("%sreturn false;" % il1)
+            lines_cpp.append("%s}" % il)
+            lines_cpp.append("%sif (fill.%s && !%s) {" % (il, param_name, fill_call))
+            lines_cpp.append("%sTLVF_LOG(ERROR) << \"fill %s failed\";" % (il1, param_name))
+            lines_cpp.append("%sreturn false;" % il1)
+            lines_cpp.append("%s}" % il)
+            if level == 2:
+                lines_cpp.append("%s}" % i1)
+        lines_cpp.append("%sif (!cmdu_tx.finalize()) {" % i1)
+        lines_cpp.append("%sTLVF_LOG(ERROR) << \"finalize() failed\";" % i2)
+        lines_cpp.append("%sreturn false;" % i2)
+        lines_cpp.append("%s}" % i1)
+        lines_cpp.append("%sif (cmdu_tx.getMessageLength() != wire_size) {" % i1)
+        lines_cpp.append("%sTLVF_LOG(WARNING) << \"%s length \" << cmdu_tx.getMessageLength() << "
+                         "\" differs from the computed wire size \" << wire_size << "
+                         "\", check the list counts of sCounts\";" % (i2, name))
+        lines_cpp.append("%s}" % i1)
+        lines_cpp.append("%sreturn true;" % i1)
+        lines_cpp.append("}")
+        lines_cpp.append("")
+
+        lines_cpp.append("bool %s::build_template(ieee1905_1::CmduTemplate &tmpl, "
+                         "const sCounts &counts, const sFill &fill)" % name)
+        lines_cpp.append("{")
+        lines_cpp.append("%stmpl.reset();" % i1)
+        lines_cpp.append("%sif (!build(tmpl.cmdu_tx(), 0, counts, fill)) {" % i1)
+        lines_cpp.append("%sreturn false;" % i2)
+        lines_cpp.append("%s}" % i1)
+        lines_cpp.append("%sreturn tmpl.freeze();" % i1)
+        lines_cpp.append("}")
+        lines_cpp.append("")
+
+        lines_cpp.append("bool %s::parse(const ieee1905_1::CmduMessageRx &cmdu_rx, sTlvs &%s)" %
+                         (name, "tlvs" if tlvs else "/*tlvs*/"))
+        lines_cpp.append("{")
+        lines_cpp.append("%sauto cmdu_header = cmdu_rx.getCmduHeader();" % i1)
+        lines_cpp.append("%sif (!cmdu_header || "
+                         "cmdu_header->message_type() != get_message_type()) {" % i1)
+        lines_cpp.append("%sTLVF_LOG(ERROR) << \"not a %s\";" % (i2, name))
+        lines_cpp.append("%sreturn false;" % i2)
+        lines_cpp.append("%s}" % i1)
+        for (param_name, tlv_type, tlv_optional, tlv_repeated) in tlvs:
+            if tlv_repeated:
+                lines_cpp.append("%stlvs.%s = cmdu_rx.getClassList<%s>();" %
+                                 (i1, param_name, tlv_type))
+                continue
+            lines_cpp.append("%stlvs.%s = cmdu_rx.getClass<%s>();" % (i1, param_name, tlv_type))
+            if tlv_optional:
+                continue
+            lines_cpp.append("%sif (!tlvs.%s) {" % (i1, param_name))
+            lines_cpp.append("%sTLVF_LOG(ERROR) << \"%s is missing the required %s\";" %
+                             (i2, name, tlv_type))
+            lines_cpp.append("%sreturn false;" % i2)
+            lines_cpp.append("%s}" % i1)
+        lines_cpp.append("%sreturn true;" % i1)
+        lines_cpp.append("}")
+        lines_cpp.append("")
+        self.insertLineCpp("", self.CODE_END_INSERT, lines_cpp)
 
     def addStructParam(self, obj_meta, param_name, param_type, param_type_info, param_meta):
         bit_field_type = None
         swap_func_lines = []
         if param_meta == None:
             line = "%s %s;" % (param_type, param_name)
-            if param_type_info.swap_needed:
+            if param_type_info.swap_needed and self.backend == TlvF.BACKEND_TABLE:
+                self.addSwapLayoutEntry(obj_meta, param_name, param_type, param_type_info, "1")
+            elif param_type_info.swap_needed:
                 t_name = ("&" if not param_type_info.swap_is_func else "") + param_name + ("." if param_type_info.swap_is_func else "")
                 swap_func_lines.append("%s%s%s;" % (param_type_info.swap_prefix, t_name, param_type_info.swap_suffix))
-            if TypeInfo(param_type).type == TypeInfo.STRUCT:
+            if TypeInfo.get(param_type).type == TypeInfo.STRUCT:
 	            self.insertLineH(obj_meta.name, self.CODE_STRUCT_INIT_FUNC_INSERT, "%s.%s;" %  (param_name, TypeInfo.STRUCT_INIT_FUNCTION_NAME) )
         else:
             if param_meta.value_const != None: self.abort("%s.yaml --> value_const not supported in struct" % self.yaml_fname)
@@ -545,7 +1999,7 @@ class TlvF:
                 if (param_meta.length_type == MetaData.LENGTH_TYPE_INT or
                     param_meta.length_type == MetaData.LENGTH_TYPE_CONST):
                     line = "%s %s[%s];" % (param_meta.type, param_meta.name, param_meta.length)
-                    if TypeInfo(param_meta.type).type == TypeInfo.STRUCT:
+                    if TypeInfo.get(param_meta.type).type == TypeInfo.STRUCT:
                         t_name = "(%s[i]).%s" % (param_name, TypeInfo.STRUCT_INIT_FUNCTION_NAME)
                         self.insertLineH(obj_meta.name, self.CODE_STRUCT_INIT_FUNC_INSERT, "%sfor (size_t i = 0; i < %s; i++) {" %  (self.getIndentation(1), str(param_meta.length)))
                         self.insertLineH(obj_meta.name, self.CODE_STRUCT_INIT_FUNC_INSERT, "%s%s;" %  (self.getIndentation(2), t_name))
@@ -556,7 +2010,10 @@ class TlvF:
                         self.insertLineH(obj_meta.name, self.CODE_STRUCT_INIT_FUNC_INSERT, "%s%s = %s;" %  (self.getIndentation(2), t_name, MetaData.getFormattedValue(param_meta.value)))
                         self.insertLineH(obj_meta.name, self.CODE_STRUCT_INIT_FUNC_INSERT, "%s}" %  (self.getIndentation(1)))
 
-                    if param_type_info.swap_needed:
+                    if param_type_info.swap_needed and self.backend == TlvF.BACKEND_TABLE:
+                        self.addSwapLayoutEntry(obj_meta, param_name, param_meta.type,
+                                                param_type_info, str(param_meta.length))
+                    elif param_type_info.swap_needed:
                         t_name = "%s(%s[i])%s" % (("&" if not param_type_info.swap_is_func else ""), param_name, ("." if param_type_info.swap_is_func else ""))
                         swap_func_lines.append( "for (size_t i = 0; i < %s; i++){" % (str(param_meta.length)) )
                         swap_func_lines.append( "%s%s%s%s;" % (self.getIndentation(1), param_type_info.swap_prefix, t_name, param_type_info.swap_suffix))
@@ -568,7 +2025,10 @@ class TlvF:
                     line = "%s* %s; //TLVF_TODO: not supported yet" % (param_meta.type, param_meta.name)
                 else:
                     line = "%s %s;" % (param_meta.type, param_meta.name)
-                    if param_type_info.swap_needed:
+                    if param_type_info.swap_needed and self.backend == TlvF.BACKEND_TABLE:
+                        self.addSwapLayoutEntry(obj_meta, param_name, param_meta.type,
+                                                param_type_info, "1")
+                    elif param_type_info.swap_needed:
                         t_name = ("&" if not param_type_info.swap_is_func else "") + param_name + ("." if param_type_info.swap_is_func else "")
                         swap_func_lines.append("%s%s%s;" % (param_type_info.swap_prefix, t_name, param_type_info.swap_suffix))
                     if param_meta.value != None: 
@@ -706,20 +2166,22 @@ class TlvF:
                 length_str = "len"
             line = "%sm_%s = (%s *)((uint8_t *)(m_%s) + %s);" %(self.getIndentation(1), param_name, param_type, param_name, length_str)
             self.insertLineCpp("", marker.strip(), line)
+            obj_meta.num_alloc_fixups += 1
 
         lines_h = []
         lines_cpp = []
         if param_length_type == None:
-            if TypeInfo(param_type).type == TypeInfo.CLASS:                
+            if TypeInfo.get(param_type).type == TypeInfo.CLASS:
                 lines_h.append("%s *m_%s = nullptr;" % (param_type, param_name))
                 lines_h.append("std::shared_ptr<%s> m_%s_ptr = nullptr;" % (param_type, param_name))
+                obj_meta.num_shared_ptr_members += 1
                 self.overrideIsPostInitSucceeded(obj_meta,param_name,lines_h)
                 
-                if not obj_meta.lock_allocation_member_added:
+                if not obj_meta.lock_allocation_member_added and self.profile == TlvF.PROFILE_DEBUG:
                     lines_h.append("bool m_%s__ = false;" % self.MEMBER_LOCK_ALLOCATION)
                     obj_meta.lock_allocation_member_added = True
 
-                if not obj_meta.lock_order_member_added:
+                if not obj_meta.lock_order_member_added and self.profile == TlvF.PROFILE_DEBUG:
                     lines_h.append("int m_%s__ = 0;" % self.MEMBER_LOCK_ORDER_COUNTER)
                     obj_meta.lock_order_member_added = True
                 self.insertLineH(obj_meta.name, self.CODE_CLASS_PRIVATE_VARS_INSERT, lines_h)
@@ -786,15 +2248,13 @@ class TlvF:
                         lines_cpp.append("if (!m_%s__) *m_%s = %s;" % ( self.MEMBER_PARSE, param_name, param_val_const) )
                     elif param_val != None: lines_cpp.append("if (!m_%s__) *m_%s = %s;" % ( self.MEMBER_PARSE, param_name, param_val) )
                     elif param_length_var: lines_cpp.append("if (!m_%s__) *m_%s = 0;" % ( self.MEMBER_PARSE, param_name) )
-                    lines_cpp.append("%sif (!buffPtrIncrementSafe(sizeof(%s))) {" % (self.getIndentation(0), param_type) )
-                    lines_cpp.append("%sLOG(ERROR) << \"buffPtrIncrementSafe(\" << std::dec << sizeof(%s) << \") Failed!\";" % (self.getIndentation(1), param_type))
-                    lines_cpp.append("%sreturn false;" %(self.getIndentation(1)))
-                    lines_cpp.append("%s}" %(self.getIndentation(0)))
+                    lines_cpp += self.getBuffPtrIncrementLines(obj_meta, 0,
+                                                               "sizeof(%s)" % (param_type))
 
                     if obj_meta.is_tlv_class and param_name != MetaData.TLV_TYPE_TYPE and param_name != MetaData.TLV_TYPE_LENGTH:
                         lines_cpp.append( "if(m_length && !m_%s__){ (*m_length) += sizeof(%s); }" % ( self.MEMBER_PARSE, param_type) )
 
-                    if TypeInfo(param_type).type == TypeInfo.STRUCT:
+                    if TypeInfo.get(param_type).type == TypeInfo.STRUCT:
                             lines_cpp.append("if (!m_%s__) { m_%s->struct_init(); }" % (self.MEMBER_PARSE, param_name))
                     self.insertLineCpp(obj_meta.name, self.CODE_CLASS_INIT_FUNC_INSERT, lines_cpp)
                     
@@ -813,7 +2273,7 @@ class TlvF:
                     lines_cpp = []
                     
                     # add class size calculation
-                    if TypeInfo(param_type).type == TypeInfo.CLASS:
+                    if TypeInfo.get(param_type).type == TypeInfo.CLASS:
                         lines_cpp.append( "class_size += %s::get_initial_size(); // %s" % ( param_type, param_name) )
                     else:
                         lines_cpp.append( "class_size += sizeof(%s); // %s" % ( param_type, param_name) )
@@ -835,6 +2295,11 @@ class TlvF:
 
                 # add var to swap list
                 if param_type_info.swap_needed:
+                    obj_meta.stats_swap_terms.append("sizeof(%s)" % param_type)
+                if param_type_info.swap_needed and self.backend == TlvF.BACKEND_TABLE:
+                    self.addSwapLayoutEntry(obj_meta, param_name, param_type, param_type_info, "1",
+                                            "m_%s" % param_name)
+                elif param_type_info.swap_needed:
                     t_name = ("m_%s->" % param_name) if param_type_info.swap_is_func else ("m_%s" % param_name)
                     swap_func_lines.append( "%s%s%s;" % (param_type_info.swap_prefix, t_name, param_type_info.swap_suffix) )
 
@@ -844,13 +2309,14 @@ class TlvF:
             self.include_list.append("<tuple>")
             var_lines = ["%s* m_%s = nullptr;" % (param_type, param_name),
                          "size_t m_%s_idx__ = 0;" % (param_name) ]
-            if (is_var_len or is_dynamic_len ) and TypeInfo(param_type).type == TypeInfo.CLASS:
+            if (is_var_len or is_dynamic_len) and TypeInfo.get(param_type).type == TypeInfo.CLASS:
                 self.include_list.append("<vector>")
                 var_lines.append("std::vector<std::shared_ptr<%s>> m_%s_vector;" % (param_type, param_name))
-                if not obj_meta.lock_allocation_member_added:
+                obj_meta.num_shared_ptr_members += 1
+                if not obj_meta.lock_allocation_member_added and self.profile == TlvF.PROFILE_DEBUG:
                     var_lines.append("bool m_%s__ = false;" % self.MEMBER_LOCK_ALLOCATION)
                     obj_meta.lock_allocation_member_added = True
-            if not obj_meta.lock_order_member_added:
+            if not obj_meta.lock_order_member_added and self.profile == TlvF.PROFILE_DEBUG:
                 var_lines.append("int m_%s__ = 0;" % self.MEMBER_LOCK_ORDER_COUNTER)
                 obj_meta.lock_order_member_added = True
             self.insertLineH(obj_meta.name, self.CODE_CLASS_PRIVATE_VARS_INSERT, var_lines)
@@ -866,7 +2332,7 @@ class TlvF:
                     lines_cpp.append("%ssize_t len = *m_length;" % (self.getIndentation(1)))
                     lines_cpp.append("%stlvf_swap(16, reinterpret_cast<uint8_t*>(&len));" % (self.getIndentation(1)))
                     lines_cpp.append("%slen -= (m_%s__ - sizeof(*m_type) - sizeof(*m_length) - m_%s__);" % (self.getIndentation(1), self.MEMBER_BUFF_PTR, self.MEMBER_BUFF))
-                    if TypeInfo(param_type).type == TypeInfo.CLASS:
+                    if TypeInfo.get(param_type).type == TypeInfo.CLASS:
                         lines_cpp.append("%swhile (len > 0) {" % (self.getIndentation(1)))
                         lines_cpp.append("%sif (len < %s::get_initial_size()) {" %(self.getIndentation(2), param_type))
                         lines_cpp.append("%sTLVF_LOG(ERROR) << \"Invalid length (%s)\";" %(self.getIndentation(3), param_name))
@@ -887,23 +2353,21 @@ class TlvF:
                         lines_cpp.append("%s}" %(self.getIndentation(1)))
                     else:
                         lines_cpp.append("%sm_%s_idx__ = len/sizeof(%s);" % (self.getIndentation(1), param_name, param_type))
-                        lines_cpp.append("%sif (!buffPtrIncrementSafe(len)) {" % (self.getIndentation(1)) )
-                        lines_cpp.append("%sLOG(ERROR) << \"buffPtrIncrementSafe(\" << std::dec << len << \") Failed!\";" % (self.getIndentation(2)))
-                        lines_cpp.append("%sreturn false;" %(self.getIndentation(2)))
-                        lines_cpp.append("%s}" %(self.getIndentation(1)))
+                        lines_cpp += self.getBuffPtrIncrementLines(obj_meta, 1, "len")
                     lines_cpp.append("}")
                 else:
                     lines_cpp.append("m_%s_idx__ = getBuffRemainingBytes();" % param_name)
             if is_var_len or is_dynamic_len:
                 param_meta.list_index = obj_meta.list_index
                 obj_meta.list_index = obj_meta.list_index + 1
+                obj_meta.num_var_len_lists += 1
             if is_var_len:
                 # variable length list support - swap length value for calculating list size
                 length_type = obj_meta.children_types[param_length]
                 lines_cpp.append("%s %s = *m_%s;" %(length_type.type_str, param_length, param_length))
                 if length_type.swap_needed:
                     lines_cpp.append("if (m_%s__) {  %s&%s%s; }" %(self.MEMBER_PARSE, length_type.swap_prefix, param_length, length_type.swap_suffix))
-                if TypeInfo(param_type).type == TypeInfo.CLASS:
+                if TypeInfo.get(param_type).type == TypeInfo.CLASS:
                     lines_cpp.append("m_%s_idx__ = 0;" % (param_name))
                     lines_cpp.append("for (size_t i = 0; i < %s; i++) {" % (param_length))
                     # Add param handling to init function
@@ -921,28 +2385,24 @@ class TlvF:
                     lines_cpp.append("}")
                 else:
                     lines_cpp.append("m_%s_idx__ = %s;" % (param_name, param_length))
-                    lines_cpp.append("%sif (!buffPtrIncrementSafe(sizeof(%s) * (%s))) {" % (self.getIndentation(0), param_type, param_length))
-                    lines_cpp.append("%sLOG(ERROR) << \"buffPtrIncrementSafe(\" << std::dec << sizeof(%s) * (%s) << \") Failed!\";" % (self.getIndentation(1), param_type,param_length))
-                    lines_cpp.append("%sreturn false;" %(self.getIndentation(1)))
-                    lines_cpp.append("%s}" %(self.getIndentation(0)))
+                    lines_cpp += self.getBuffPtrIncrementLines(
+                        obj_meta, 0, "sizeof(%s) * (%s)" % (param_type, param_length))
             if is_int_len or is_const_len:
-                lines_cpp.append("%sif (!buffPtrIncrementSafe(sizeof(%s) * (%s))) {" % (self.getIndentation(0), param_type, param_length))
-                lines_cpp.append("%sLOG(ERROR) << \"buffPtrIncrementSafe(\" << std::dec << sizeof(%s) * (%s) << \") Failed!\";" % (self.getIndentation(1), param_type,param_length))
-                lines_cpp.append("%sreturn false;" %(self.getIndentation(1)))
-                lines_cpp.append("%s}" %(self.getIndentation(0)))
+                lines_cpp += self.getBuffPtrIncrementLines(
+                    obj_meta, 0, "sizeof(%s) * (%s)" % (param_type, param_length))
                 lines_cpp.append("m_%s_idx__  = %s;" % (param_name, param_length))
-                if obj_meta.is_tlv_class or TypeInfo(param_type).type == TypeInfo.STRUCT:
+                if obj_meta.is_tlv_class or TypeInfo.get(param_type).type == TypeInfo.STRUCT:
                     lines_cpp.append("if (!m_parse__) {")
                 if obj_meta.is_tlv_class:
                     lines_cpp.append( "%sif (m_length) { (*m_length) += (sizeof(%s) * %s); }" % (self.getIndentation(1), param_type, param_length) )
-                if TypeInfo(param_type).type == TypeInfo.STRUCT:
+                if TypeInfo.get(param_type).type == TypeInfo.STRUCT:
                     lines_cpp.append("%sfor (size_t i = 0; i < %s; i++) { m_%s->struct_init(); }" % (self.getIndentation(1), param_length, param_name))
                 elif (param_val_const or param_val):
                     if not param_type_info.is_std_type: self.abort("%s.yaml --> only std types are allowed in val / val_const" % self.yaml_fname)
                     lines_cpp += ["%sfor (size_t i = 0; i < %s; i++){" % (self.getIndentation(1), str(param_length)),
                                  "%sm_%s[i] = %s;"% (self.getIndentation(2), param_name, str(param_val) if param_val != None else str(param_val_const)),
                                  "%s}" % (self.getIndentation(1))]
-                if obj_meta.is_tlv_class or TypeInfo(param_type).type == TypeInfo.STRUCT:
+                if obj_meta.is_tlv_class or TypeInfo.get(param_type).type == TypeInfo.STRUCT:
                     lines_cpp.append("}")
 
             if (param_val_const or param_val):
@@ -952,14 +2412,30 @@ class TlvF:
             self.insertLineCpp(obj_meta.name, self.CODE_CLASS_INIT_FUNC_INSERT, lines_cpp)
 
             # add var to swap list
-            if param_type_info.swap_needed:
+            if param_type_info.swap_needed and param_type_info.type != TypeInfo.CLASS:
+                if is_dynamic_len or is_var_len:
+                    t_length = "m_" + param_name + "_idx__"
+                else:
+                    t_length = str(param_meta.length)
+                obj_meta.stats_swap_terms.append("sizeof(%s) * %s" % (param_type, t_length))
+            if (param_type_info.swap_needed and param_type_info.type != TypeInfo.CLASS and
+                    self.backend == TlvF.BACKEND_TABLE):
+                if is_dynamic_len or is_var_len:
+                    t_length = "m_" + param_name + "_idx__"
+                else:
+                    t_length = str(param_meta.length)
+                self.addSwapLayoutEntry(obj_meta, param_name, param_type, param_type_info, t_length,
+                                        "m_%s" % param_name)
+            elif param_type_info.swap_needed:
                 if (param_type_info.type == TypeInfo.CLASS):
                     t_name = ("&" if not param_type_info.swap_is_func else "") + ("std::get<1>(%s(i))" % param_name) + ("." if param_type_info.swap_is_func else "")
                 else:
                     t_name = ("&" if not param_type_info.swap_is_func else "") + ("m_%s[i]" % param_name) + ("." if param_type_info.swap_is_func else "")
-                if is_dynamic_len: t_length = ("m_" + param_name + "_idx__")
-                elif is_var_len: t_length = ("(size_t)*m_" + param_meta.length) 
-                else: t_length = str(param_meta.length)
+                # not the length parameter of var length lists, which may already be swapped
+                if is_dynamic_len or is_var_len:
+                    t_length = ("m_" + param_name + "_idx__")
+                else:
+                    t_length = str(param_meta.length)
                 swap_func_lines.append( "for (size_t i = 0; i < %s; i++){" % (t_length) )
                 swap_func_lines.append( "%s%s%s%s;" % (self.getIndentation(1), param_type_info.swap_prefix, t_name, param_type_info.swap_suffix))
                 swap_func_lines.append( "}")
@@ -1081,7 +2557,8 @@ class TlvF:
                 lines_cpp.append( "%sif (!ret_success) {" % (self.getIndentation(1)) )
                 lines_cpp.append( '%sTLVF_LOG(ERROR) << "Requested index is greater than the number of available entries";' %  self.getIndentation(2) )
                 lines_cpp.append( "%s}" % self.getIndentation(1) )
-                if TypeInfo(param_type).type == TypeInfo.CLASS: #TODO:only if it's the last member of the class
+                # TODO: only if it's the last member of the class
+                if TypeInfo.get(param_type).type == TypeInfo.CLASS:
                     lines_cpp.append( "%sreturn std::forward_as_tuple(ret_success, *(m_%s_vector[ret_idx]));" % (self.getIndentation(1), param_name) )
                 else:
                     lines_cpp.append( "%sreturn std::forward_as_tuple(ret_success, m_%s[ret_idx]);" % (self.getIndentation(1), param_name) )
@@ -1099,27 +2576,41 @@ class TlvF:
         else:
             self.abort("%s.yaml --> unsupported length type: %r, param_name=%s" % (self.yaml_fname, param_length_type, param_name))
 
-        if len(swap_func_lines) > 0: self.insertLineCpp(obj_meta.name, self.CODE_CLASS_SWAP_FUNC_INSERT, swap_func_lines)
+        if self.backend == TlvF.BACKEND_TABLE:
+            obj_meta.swap_lines.extend(swap_func_lines)
+        elif len(swap_func_lines) > 0:
+            self.insertLineCpp(obj_meta.name, self.CODE_CLASS_SWAP_FUNC_INSERT, swap_func_lines)
         self.insertLineH(obj_meta.name, self.CODE_CLASS_PUBLIC_FUNC_INSERT, lines_h)
         self.insertLineCpp(obj_meta.name, self.CODE_CLASS_PUBLIC_FUNC_INSERT, lines_cpp)
 
     def addClassVarLenMethods(self, obj_meta, param_type, param_name, param_meta, param_length, is_var_len, is_dynamic_len):
         lines_cpp = []
         lines_h = []
-        if TypeInfo(param_type).type == TypeInfo.CLASS:
+        if TypeInfo.get(param_type).type == TypeInfo.CLASS:
             lines_h.append( "std::shared_ptr<%s> create_%s();" % (param_type, param_name) ) #TODO: maybe change to 'create' and add '_entry' postfix
             lines_cpp.append( "std::shared_ptr<%s> %s::create_%s() {" % (param_type, obj_meta.name, param_name) )
-            lines_cpp.append( "%sif (m_%s__ > %s) {" %(self.getIndentation(1), self.MEMBER_LOCK_ORDER_COUNTER, param_meta.list_index) )
-            lines_cpp.append( "%sTLVF_LOG(ERROR) << \"Out of order allocation for variable length list %s, abort!\";" %(self.getIndentation(2), param_name) )
-            lines_cpp.append( "%sreturn nullptr;" %self.getIndentation(2))
-            lines_cpp.append( "%s}" %self.getIndentation(1))
+            if self.profile == TlvF.PROFILE_DEBUG:
+                lines_cpp.append("%sif (m_%s__ > %s) {" % (self.getIndentation(1),
+                                 self.MEMBER_LOCK_ORDER_COUNTER, param_meta.list_index))
+                lines_cpp.append("%sTLVF_LOG(ERROR) << \"Out of order allocation for variable "
+                                 "length list %s, abort!\";" % (self.getIndentation(2), param_name))
+                lines_cpp.append("%sreturn nullptr;" % self.getIndentation(2))
+                lines_cpp.append("%s}" % self.getIndentation(1))
             lines_cpp.append( "%ssize_t len = %s::get_initial_size();" % (self.getIndentation(1), param_type) )
-            lines_cpp.append( "%sif (m_%s__ || getBuffRemainingBytes() < len) {" % (self.getIndentation(1), self.MEMBER_LOCK_ALLOCATION) )
+            if self.profile == TlvF.PROFILE_DEBUG:
+                lines_cpp.append("%sif (m_%s__ || getBuffRemainingBytes() < len) {" %
+                                 (self.getIndentation(1), self.MEMBER_LOCK_ALLOCATION))
+            else:
+                lines_cpp.append("%sif (getBuffRemainingBytes() < len) {" % self.getIndentation(1))
             lines_cpp.append( '%sTLVF_LOG(ERROR) << "Not enough available space on buffer";' %  self.getIndentation(2) )
+            lines_cpp += self.getStatsLines(obj_meta, 2, "bounds_failures")
             lines_cpp.append( "%sreturn nullptr;" % self.getIndentation(2))
             lines_cpp.append( "%s}" % self.getIndentation(1) )
-            lines_cpp.append( "%sm_%s__ = %s;" %(self.getIndentation(1), self.MEMBER_LOCK_ORDER_COUNTER, param_meta.list_index) )
-            lines_cpp.append( "%sm_%s__ = true;" % (self.getIndentation(1), self.MEMBER_LOCK_ALLOCATION) )
+            if self.profile == TlvF.PROFILE_DEBUG:
+                lines_cpp.append("%sm_%s__ = %s;" % (self.getIndentation(1),
+                                 self.MEMBER_LOCK_ORDER_COUNTER, param_meta.list_index))
+                lines_cpp.append("%sm_%s__ = true;" %
+                                 (self.getIndentation(1), self.MEMBER_LOCK_ALLOCATION))
             lines_cpp.extend(self.addAllocationMarkersCreate(obj_meta, param_meta, param_length, True)) # Variable length lists support
             if is_dynamic_len:
                 lines_cpp.append( "%sreturn std::make_shared<%s>(getBuffPtr(), getBuffRemainingBytes(), m_%s__);" % (self.getIndentation(1), param_type, self.MEMBER_PARSE) )
@@ -1136,10 +2627,21 @@ class TlvF:
             lines_cpp.append( "%sreturn false;" % self.getIndentation(2))
             lines_cpp.append( "%s}" % self.getIndentation(1) )
 
-            lines_cpp.append( "%sif (m_%s__ == false) {" % (self.getIndentation(1), self.MEMBER_LOCK_ALLOCATION) )
-            lines_cpp.append( '%sTLVF_LOG(ERROR) << "No call to create_%s was called before add_%s";' %  (self.getIndentation(2), param_name, param_name) )
-            lines_cpp.append( "%sreturn false;" % self.getIndentation(2))
-            lines_cpp.append( "%s}" % self.getIndentation(1) )
+            if self.profile == TlvF.PROFILE_DEBUG:
+                lines_cpp.append("%sif (m_%s__ == false) {" %
+                                 (self.getIndentation(1), self.MEMBER_LOCK_ALLOCATION))
+                lines_cpp.append('%sTLVF_LOG(ERROR) << "No call to create_%s was called before '
+                                 'add_%s";' % (self.getIndentation(2), param_name, param_name))
+                lines_cpp.append("%sreturn false;" % self.getIndentation(2))
+                lines_cpp.append("%s}" % self.getIndentation(1))
+            elif not (param_length or is_dynamic_len):
+                # without the allocation lock, a second add of the same class would move the
+                # buffer twice
+                lines_cpp.append("%sif (m_%s_init) {" % (self.getIndentation(1), param_meta.name))
+                lines_cpp.append('%sTLVF_LOG(ERROR) << "add_%s was already called";' %
+                                 (self.getIndentation(2), param_name))
+                lines_cpp.append("%sreturn false;" % self.getIndentation(2))
+                lines_cpp.append("%s}" % self.getIndentation(1))
 
             lines_cpp.append("%suint8_t *src = (uint8_t *)m_%s;" % (self.getIndentation(1), param_meta.name))
             if param_length != None:
@@ -1155,6 +2657,7 @@ class TlvF:
 
             lines_cpp.append( "%sif (ptr->getLen() > getBuffRemainingBytes(ptr->getStartBuffPtr())) {;" % self.getIndentation(1) )
             lines_cpp.append( '%sTLVF_LOG(ERROR) << "Not enough available space on buffer";' %  self.getIndentation(2) )
+            lines_cpp += self.getStatsLines(obj_meta, 2, "bounds_failures")
             lines_cpp.append( "%sreturn false;" % self.getIndentation(2))
             lines_cpp.append( "%s}" % self.getIndentation(1) )
 
@@ -1172,26 +2675,29 @@ class TlvF:
                 lines_cpp.append( "%sm_%s_vector.push_back(ptr);" % (self.getIndentation(1), param_name ))
             else:
                 lines_cpp.append( "%sm_%s_ptr = ptr;" % (self.getIndentation(1), param_name ))
-            lines_cpp.append("%sif (!buffPtrIncrementSafe(len)) {" % (self.getIndentation(1)) )
-            lines_cpp.append("%sLOG(ERROR) << \"buffPtrIncrementSafe(\" << std::dec << len << \") Failed!\";" % (self.getIndentation(2)))
-            lines_cpp.append("%sreturn false;" %(self.getIndentation(2)))
-            lines_cpp.append("%s}" %(self.getIndentation(1)))
+            lines_cpp += self.getBuffPtrIncrementLines(obj_meta, 1, "len")
             if obj_meta.is_tlv_class:
                 lines_cpp.append( "%sif(!m_parse__ && m_length){ (*m_length) += len; }" % (self.getIndentation(1)))
-            lines_cpp.append( "%sm_%s__ = false;" % (self.getIndentation(1), self.MEMBER_LOCK_ALLOCATION))
+            if self.profile == TlvF.PROFILE_DEBUG:
+                lines_cpp.append("%sm_%s__ = false;" %
+                                 (self.getIndentation(1), self.MEMBER_LOCK_ALLOCATION))
             lines_cpp.append( "%sreturn true;" % (self.getIndentation(1)) )
             lines_cpp.append( "}" )
             lines_cpp.append( "" )
         else: #simple list
             lines_h.append( "bool alloc_%s(size_t count = 1);" % (param_name) )
             lines_cpp.append( "bool %s::alloc_%s(size_t count) {" % (obj_meta.name, param_name) )
-            lines_cpp.append( "%sif (m_%s__ > %s) {;" %(self.getIndentation(1), self.MEMBER_LOCK_ORDER_COUNTER, param_meta.list_index) )
-            lines_cpp.append( "%sTLVF_LOG(ERROR) << \"Out of order allocation for variable length list %s, abort!\";" %(self.getIndentation(2), param_name) )
-            lines_cpp.append( "%sreturn false;" %self.getIndentation(2))
-            lines_cpp.append( "%s}" %self.getIndentation(1))
+            if self.profile == TlvF.PROFILE_DEBUG:
+                lines_cpp.append("%sif (m_%s__ > %s) {;" % (self.getIndentation(1),
+                                 self.MEMBER_LOCK_ORDER_COUNTER, param_meta.list_index))
+                lines_cpp.append("%sTLVF_LOG(ERROR) << \"Out of order allocation for variable "
+                                 "length list %s, abort!\";" % (self.getIndentation(2), param_name))
+                lines_cpp.append("%sreturn false;" % self.getIndentation(2))
+                lines_cpp.append("%s}" % self.getIndentation(1))
             lines_cpp.append( "%ssize_t len = sizeof(%s) * count;" % (self.getIndentation(1), param_type) )
             lines_cpp.append( "%sif(getBuffRemainingBytes() < len )  {" % (self.getIndentation(1)) )
             lines_cpp.append( '%sTLVF_LOG(ERROR) << "Not enough available space on buffer - can\'t allocate";' %  self.getIndentation(2) )
+            lines_cpp += self.getStatsLines(obj_meta, 2, "bounds_failures")
             lines_cpp.append( "%sreturn false;" % self.getIndentation(2))
             lines_cpp.append( "%s}" % self.getIndentation(1) )
             if param_meta.length_max:
@@ -1199,18 +2705,17 @@ class TlvF:
                 lines_cpp.append( '%sTLVF_LOG(ERROR) << "Can\'t allocate " << count << " elements (max length is " << %s << ")";' % ( self.getIndentation(2), param_meta.length_max ))
                 lines_cpp.append( "%sreturn false;" % self.getIndentation(2))
                 lines_cpp.append( "%s}" % self.getIndentation(1) )
-            lines_cpp.append( "%sm_%s__ = %s;" %(self.getIndentation(1), self.MEMBER_LOCK_ORDER_COUNTER, param_meta.list_index) )
+            if self.profile == TlvF.PROFILE_DEBUG:
+                lines_cpp.append("%sm_%s__ = %s;" % (self.getIndentation(1),
+                                 self.MEMBER_LOCK_ORDER_COUNTER, param_meta.list_index))
             lines_cpp.extend( self.addAllocationMarkersAlloc(obj_meta, param_meta, param_length, True) ) # Variable length lists support
             lines_cpp.append( "%sm_%s_idx__ += count;" % (self.getIndentation(1), param_name) )
             if is_var_len:
                 lines_cpp.append( "%s*m_%s += count;" % (self.getIndentation(1), param_length) )
-            lines_cpp.append("%sif (!buffPtrIncrementSafe(len)) {" % (self.getIndentation(1)) )
-            lines_cpp.append("%sLOG(ERROR) << \"buffPtrIncrementSafe(\" << std::dec << len << \") Failed!\";" % (self.getIndentation(2)))
-            lines_cpp.append("%sreturn false;" %(self.getIndentation(2)))
-            lines_cpp.append("%s}" %(self.getIndentation(1)))
+            lines_cpp += self.getBuffPtrIncrementLines(obj_meta, 1, "len")
             if obj_meta.is_tlv_class:
                 lines_cpp.append( "%sif(m_length){ (*m_length) += len; }" % (self.getIndentation(1)))
-            if TypeInfo(param_type).type == TypeInfo.STRUCT:
+            if TypeInfo.get(param_type).type == TypeInfo.STRUCT:
                 lines_cpp.append("%sif (!m_%s__) { " % (self.getIndentation(1), self.MEMBER_PARSE))
                 lines_cpp.append("%sfor (size_t i = m_%s_idx__ - count; i < m_%s_idx__; i++) { m_%s[i].struct_init(); }" % (self.getIndentation(2), param_name, param_name, param_name))
                 lines_cpp.append("%s}" % (self.getIndentation(1)))
@@ -1253,6 +2758,7 @@ class TlvF:
                 lines_cpp.append("%suint8_t *dst = src + len;" %(self.getIndentation(2)))
                 lines_cpp.append("%ssize_t move_length = getBuffRemainingBytes(src) - len;" %self.getIndentation(2))
                 lines_cpp.append("%sstd::copy_n(src, move_length, dst);" %self.getIndentation(2))
+                lines_cpp += self.getStatsLines(obj_meta, 2, "memmove_bytes", "move_length")
                 lines_cpp.append("%s}" %self.getIndentation(1))
 
             marker = "%s_%s_%s_%s" %(self.CODE_CLASS_ALLOC_INSERT, obj_meta.name, "create", param_meta.name)
@@ -1273,6 +2779,7 @@ class TlvF:
                 lines_cpp.append("%sif (!m_parse__) {" %self.getIndentation(1))                
                 lines_cpp.append("%ssize_t move_length = getBuffRemainingBytes(src) - len;" %self.getIndentation(2))
                 lines_cpp.append("%sstd::copy_n(src, move_length, dst);" %self.getIndentation(2))
+                lines_cpp += self.getStatsLines(obj_meta, 2, "memmove_bytes", "move_length")
                 lines_cpp.append("%s}" %self.getIndentation(1))
 
             marker = "%s_%s_%s_%s" %(self.CODE_CLASS_ALLOC_INSERT, obj_meta.name, "alloc", param_meta.name)
@@ -1290,6 +2797,111 @@ class TlvF:
             
         return lines_cpp
 
+    #########################################################################
+    # table driven backend support
+    #
+    # Instead of emitting a swap statement per member, struct_swap() and
+    # class_swap() of each object are reduced to a static array of member
+    # descriptors (sTlvfSwapField) which is interpreted by the shared
+    # tlvf_swap_*_layout() functions in tlvf/tlvflayout.h.
+    # Struct members are described by their offset, class members by their
+    # current pointer and element count, passed at runtime.
+    # Nested class members keep their explicit class_swap() calls, emitted
+    # after the table so that list counters are already swapped when read.
+    #########################################################################
+    def addSwapLayoutEntry(self, obj_meta, param_name, param_type, param_type_info, count,
+                           ptr=None):
+        if param_type_info.swap_is_func:
+            width = "0"
+            swap = "&tlvf_swap_struct<%s>" % param_type
+        else:
+            width = param_type_info.swap_width
+            swap = "nullptr"
+        obj_meta.swap_layout.append((param_name, param_type, width, swap, count, ptr))
+
+    def addSwapLayoutCode(self, obj_meta):
+        if len(obj_meta.swap_layout) == 0:
+            if len(obj_meta.swap_lines) > 0:
+                self.insertLineCpp(obj_meta.name, self.CODE_CLASS_SWAP_FUNC_INSERT,
+                                   obj_meta.swap_lines)
+            return
+        lines = ["static const sTlvfSwapField layout[] = {"]
+        for (param_name, param_type, width, swap, count, ptr) in obj_meta.swap_layout:
+            if obj_meta.type == MetaData.TYPE_STRUCT:
+                offset = "offsetof(%s, %s)" % (obj_meta.name, param_name)
+            else:
+                offset = "0"
+                count = "0"
+            lines.append("%s{%s, %s, %s, sizeof(%s), %s}, // %s" %
+                         (self.getIndentation(1), offset, width, count, param_type, swap,
+                          param_name))
+        lines.append("};")
+        if obj_meta.type == MetaData.TYPE_STRUCT:
+            lines.append("tlvf_swap_struct_layout(reinterpret_cast<uint8_t*>(this), layout, "
+                         "sizeof(layout) / sizeof(layout[0]));")
+            self.insertLineH(obj_meta.name, self.CODE_STRUCT_SWAP_FUNC_INSERT, lines)
+        else:
+            lines.append("const sTlvfSwapRef refs[] = {")
+            for (param_name, param_type, width, swap, count, ptr) in obj_meta.swap_layout:
+                lines.append("%s{reinterpret_cast<uint8_t*>(%s), %s}," %
+                             (self.getIndentation(1), ptr, count))
+            lines.append("};")
+            lines.append(
+                "tlvf_swap_class_layout(layout, refs, sizeof(layout) / sizeof(layout[0]));")
+            lines.extend(obj_meta.swap_lines)
+            self.insertLineCpp(obj_meta.name, self.CODE_CLASS_SWAP_FUNC_INSERT, lines)
+
+    def getBuffPtrIncrementLines(self, obj_meta, level, length):
+        if self.backend == TlvF.BACKEND_TABLE:
+            if self.stats:
+                return ["%sif (!tlvf_buff_ptr_increment(*this, %s)) {" %
+                        (self.getIndentation(level), length)] + \
+                       self.getStatsLines(obj_meta, level + 1, "bounds_failures") + \
+                       ["%sreturn false;" % (self.getIndentation(level + 1)),
+                        "%s}" % (self.getIndentation(level))]
+            return ["%sif (!tlvf_buff_ptr_increment(*this, %s)) { return false; }" %
+                    (self.getIndentation(level), length)]
+        lines = ["%sif (!buffPtrIncrementSafe(%s)) {" % (self.getIndentation(level), length),
+                 "%sLOG(ERROR) << \"buffPtrIncrementSafe(\" << std::dec << %s << \") Failed!\";" %
+                 (self.getIndentation(level + 1), length)]
+        lines += self.getStatsLines(obj_meta, level + 1, "bounds_failures")
+        lines += ["%sreturn false;" % (self.getIndentation(level + 1)),
+                  "%s}" % (self.getIndentation(level))]
+        return lines
+
+    #########################################################################
+    # --stats support
+    #
+    # Each generated class gets a static sTlvfClassStats (tlvf/tlvfstats.h)
+    # in its .cpp, updated by init(), class_swap(), the variable length list
+    # memmoves and the failed bounds checks.
+    #########################################################################
+    def getStatsName(self, name):
+        return "s_%s_stats" % name
+
+    def getStatsLines(self, obj_meta, level, counter, value="1"):
+        if not self.stats:
+            return []
+        stats_name = self.getStatsName(obj_meta.name)
+        if value == "1":
+            return ["%s%s.%s++;" % (self.getIndentation(level), stats_name, counter)]
+        return ["%s%s.%s += %s;" % (self.getIndentation(level), stats_name, counter, value)]
+
+    def addStatsCode(self, obj_meta):
+        name = obj_meta.name
+        full_name = ("%s::%s" % (self.namespace, name)) if self.namespace else name
+        stats_name = self.getStatsName(obj_meta.name)
+        self.insertLineCpp(name, self.CODE_CLASS_CONSTRACTOR,
+                           "static sTlvfClassStats %s(\"%s\");" % (stats_name, full_name))
+        self.insertLineCpp(name, self.CODE_CLASS_CONSTRACTOR, "")
+        self.insertLineCpp(name, self.CODE_CLASS_INIT_FUNC_SWAP_INSERT,
+                           "if (m_%s__) { %s.parsed++; } else { %s.built++; }" %
+                           (self.MEMBER_PARSE, stats_name, stats_name))
+        if obj_meta.stats_swap_terms:
+            self.insertLineCpp(name, self.CODE_CLASS_SWAP_FUNC_INSERT,
+                               self.getStatsLines(obj_meta, 0, "swapped_bytes",
+                                                  " + ".join(obj_meta.stats_swap_terms)))
+
     def getCommentLines(self, comment):
         ret = []
         if comment:
@@ -1346,6 +2958,7 @@ class TlvF:
         self.include_list = []
         self.local_include_list = []
         self.declared_include_list = []
+        self.cpp_include_list = []
         self.local_obj_list = []
         self.namespace = None
         self.class_last_param_has_dynamic_length = False
@@ -1385,14 +2998,26 @@ class TlvF:
             self.include_list.append("<cstddef>")
             self.include_list.append("<stdint.h>")
             self.include_list.append('<tlvf/swap.h>')
-        if not self.hasClass and obj_meta.type == MetaData.TYPE_CLASS:
-            self.include_list.append('<string.h>')
-            self.include_list.append('<memory>')
-            self.include_list.append('<tlvf/BaseClass.h>')
-            self.include_list.append('<tlvf/ClassList.h>')
+            if self.backend == TlvF.BACKEND_TABLE:
+                self.include_list.append('<tlvf/tlvflayout.h>')
+        if not self.hasClass and obj_meta.type in [MetaData.TYPE_CLASS, MetaData.TYPE_MESSAGE]:
+            if obj_meta.type == MetaData.TYPE_CLASS:
+                self.include_list.append('<memory>')
+                self.include_list.append('<tlvf/BaseClass.h>')
+                self.cpp_include_list.append('<string.h>')
+                self.cpp_include_list.append('<tlvf/ClassList.h>')
+            else:
+                self.include_list.append('<functional>')
+                self.include_list.append('<list>')
+                self.include_list.append('<memory>')
+                self.include_list.append('<tlvf/CmduMessageRx.h>')
+                self.include_list.append('<tlvf/CmduMessageTx.h>')
+                self.include_list.append('<tlvf/CmduTemplate.h>')
 
             self.appendLineCpp('#include <%s/%s.h>' % (self.yaml_path, self.yaml_fname) )
             self.appendLineCpp('#include <tlvf/tlvflogging.h>')
+            if self.stats and obj_meta.type == MetaData.TYPE_CLASS:
+                self.appendLineCpp('#include <tlvf/tlvfstats.h>')
             self.appendLineCpp(self.CODE_INCLUDE_INSERT)
             self.appendLineCpp("")
             if self.namespace:
@@ -1502,34 +3127,85 @@ class TlvF:
 
     def addEnumCode(self, insert_name, insert_marker, name, enum_storage):
         storage_str = "" if enum_storage == None else (": %s" % enum_storage)
+        self.include_list.append('<tlvf/tlvfenum.h>')
         self.insertLineH(insert_name, insert_marker, "%senum %s%s {" % (self.getIndentation(0), name, storage_str))
         self.insertLineH(insert_name, insert_marker, "%s%s_%s" % (self.getIndentation(1), self.CODE_ENUM_INSERT, name))
         self.insertLineH(insert_name, insert_marker, "%s};" % self.getIndentation(0))
+        self.addEnumNamesCode(insert_name, insert_marker, name)
         self.insertLineH(insert_name, insert_marker, "")
 
     def addEnumClassCode(self, insert_name, insert_marker, name, enum_storage):
         if enum_storage == None: self.abort("%s.yaml error: enum class type must be specified")
+        self.include_list.append('<tlvf/tlvfenum.h>')
         self.insertLineH(insert_name, insert_marker, "%senum class %s : %s {" % (self.getIndentation(0), name, enum_storage))
         self.insertLineH(insert_name, insert_marker, "%s%s_%s" % (self.getIndentation(1), self.CODE_ENUM_INSERT, name))
         self.insertLineH(insert_name, insert_marker, "%s};" % self.getIndentation(0))
+        self.addEnumNamesCode(insert_name, insert_marker, name)
         self.insertLineH(insert_name, insert_marker, "%sclass %sValidate {" % (self.getIndentation(0), name))
         self.insertLineH(insert_name, insert_marker, "%spublic:" % (self.getIndentation(0)))
         self.insertLineH(insert_name, insert_marker, "%sstatic bool check(%s value) {" % (self.getIndentation(1), enum_storage))
-        self.insertLineH(insert_name, insert_marker, "%sbool ret = false;" % (self.getIndentation(2)))
-        self.insertLineH(insert_name, insert_marker, "%sswitch (value) {" % (self.getIndentation(2)))
         self.insertLineH(insert_name, insert_marker, "%s%s_%s" % (self.getIndentation(2), self.CODE_ENUM_VALIDATION_INSERT, name))
-        self.insertLineH(insert_name, insert_marker, "%sret = true;" % (self.getIndentation(4)))
-        self.insertLineH(insert_name, insert_marker, "%sbreak;" % (self.getIndentation(4)))
-        self.insertLineH(insert_name, insert_marker, "%sdefault:" % (self.getIndentation(3)))
-        self.insertLineH(insert_name, insert_marker, "%sret = false;" % (self.getIndentation(4)))
-        self.insertLineH(insert_name, insert_marker, "%sbreak;" % (self.getIndentation(4)))
-        self.insertLineH(insert_name, insert_marker, "%s}" % self.getIndentation(2))
-        self.insertLineH(insert_name, insert_marker, "%sreturn ret;" % self.getIndentation(2))
         self.insertLineH(insert_name, insert_marker, "%s}" % self.getIndentation(1))
         self.insertLineH(insert_name, insert_marker, "%s};" % self.getIndentation(0))
         self.insertLineH(insert_name, insert_marker, "")
 
+    def addEnumNamesCode(self, insert_name, insert_marker, name):
+        # enums nested in a class get a static member function, otherwise an inline function
+        prefix = "static" if insert_name else "inline"
+        self.insertLineH(insert_name, insert_marker, "%s%s const char *%s_str(%s value) {" %
+                         (self.getIndentation(0), prefix, name, name))
+        self.insertLineH(insert_name, insert_marker, "%s%s_%s" %
+                         (self.getIndentation(1), self.CODE_ENUM_NAMES_INSERT, name))
+        self.insertLineH(insert_name, insert_marker, "%s}" % self.getIndentation(0))
 
+    ##########################################################################
+    # enum lookup tables
+    #
+    # Once all the enum values are known, fill the <enum>_str() body with a
+    # constexpr value to name table sorted by value, and the enum class
+    # <enum>Validate::check() body with a membership bitmap. Both lookups are
+    # a direct index when the values (bitmap words) are dense, and a binary
+    # search otherwise.
+    ##########################################################################
+    def addEnumLookupCode(self, obj_meta):
+        name = obj_meta.name
+        values = OrderedDict()
+        for (value, value_name) in sorted(obj_meta.enum_values,
+                                          key=lambda v: v[0] & 0xffffffffffffffff):
+            if (value & 0xffffffffffffffff) not in values:
+                values[value & 0xffffffffffffffff] = value_name
+        if not values:
+            self.insertLineH(name, self.CODE_ENUM_NAMES_INSERT, "return \"UNKNOWN\";")
+            if obj_meta.type == MetaData.TYPE_ENUM_CLASS:
+                self.insertLineH(name, self.CODE_ENUM_VALIDATION_INSERT, "return false;")
+            return
+
+        keys = list(values.keys())
+        # index directly if at most half of the value range are holes
+        dense = (keys[-1] - keys[0] + 1 <= 2 * len(keys))
+        lines = ["static constexpr sTlvfEnumName names[] = {"]
+        for value in (range(keys[0], keys[-1] + 1) if dense else keys):
+            value_name = ('"%s"' % values[value]) if value in values else "nullptr"
+            lines.append("%s{%s, %s}," % (self.getIndentation(1), hex(value), value_name))
+        lines.append("};")
+        lines.append("return tlvf_enum_name(names, static_cast<uint64_t>(value), %s);" %
+                     ("true" if dense else "false"))
+        self.insertLineH(name, self.CODE_ENUM_NAMES_INSERT, lines)
+
+        if obj_meta.type != MetaData.TYPE_ENUM_CLASS:
+            return
+        bitmap = OrderedDict()
+        for value in keys:
+            bitmap[value // 64] = bitmap.get(value // 64, 0) | (1 << (value % 64))
+        words = list(bitmap.keys())
+        dense = (words[-1] - words[0] + 1 == len(words))
+        lines = ["static constexpr sTlvfEnumBits bitmap[] = {"]
+        for word, bits in bitmap.items():
+            lines.append("%s{%s, %s}," % (self.getIndentation(1), hex(word), hex(bits)))
+        lines.append("};")
+        lines.append("return tlvf_enum_check(bitmap, static_cast<uint64_t>(value), %s);" %
+                     ("true" if dense else "false"))
+        self.insertLineH(name, self.CODE_ENUM_VALIDATION_INSERT, lines)
 
     def addClassConstructor(self, insert_name, insert_marker, name):
         self.insertLineH(insert_name, insert_marker, "%s%s_%s" % (self.getIndentation(2), self.CODE_CLASS_CONSTRACTOR, name))
@@ -1559,6 +3235,9 @@ class TlvF:
         self.insertLineCpp(insert_name, insert_marker, "{")
         self.insertLineCpp(insert_name, insert_marker, "%sif (getBuffRemainingBytes() < get_initial_size()) {" % (self.getIndentation(1)))
         self.insertLineCpp(insert_name, insert_marker, '%sTLVF_LOG(ERROR) << "Not enough available space on buffer. Class init failed";' %  self.getIndentation(2) )
+        if self.stats:
+            self.insertLineCpp(insert_name, insert_marker, "%s%s.bounds_failures++;" %
+                               (self.getIndentation(2), self.getStatsName(name)))
         self.insertLineCpp(insert_name, insert_marker, "%sreturn false;" % self.getIndentation(2))
         self.insertLineCpp(insert_name, insert_marker, "%s}" % self.getIndentation(1) )
         self.insertLineCpp(insert_name, insert_marker, "%s%s_%s" % (self.getIndentation(1), self.CODE_CLASS_INIT_FUNC_INSERT, name))
@@ -1622,6 +3301,14 @@ class TlvF:
         self.insertLineCpp(insert_name, insert_marker, "")
 
     def closeObject(self, obj_meta):
+        if self.backend == TlvF.BACKEND_TABLE:
+            self.addSwapLayoutCode(obj_meta)
+        if self.stats and obj_meta.type == MetaData.TYPE_CLASS:
+            self.addStatsCode(obj_meta)
+        if not self.dry_run:
+            self.addReportObject(obj_meta)
+        if obj_meta.type == MetaData.TYPE_ENUM or obj_meta.type == MetaData.TYPE_ENUM_CLASS:
+            self.addEnumLookupCode(obj_meta)
         if obj_meta.type == MetaData.TYPE_CLASS: # add class constractor
             # constractor 1
             self.insertLineH(obj_meta.name, self.CODE_CLASS_CONSTRACTOR, "%s(uint8_t* buff, size_t buff_len, bool parse = false);" % (obj_meta.name))
@@ -1713,21 +3400,13 @@ class TlvF:
         if not os.path.isfile(file_path):
             return False
         f = open(file_path, 'r')
-
-        for line in code_lines:
-            if not self.conf_debug_keep_source_marker:
-                if line.find("//~") != -1: continue
-            tempLine = f.readline()
-            if tempLine is None or line+"\n" != tempLine:
-                f.close()
-                return False
-        
-        eof = f.read()
+        content = f.read()
         f.close()
-        
-        if eof is not None:
-            return False
-        return True
+
+        # lines may hold more than one line (AUTO_GENERATED_MESSAGE), compare the whole content
+        expected = [line + "\n" for line in code_lines
+                    if self.conf_debug_keep_source_marker or line.find("//~") == -1]
+        return content == "".join(expected)
 
     def writeFile(self, code_lines, file_suffix):
         if file_suffix == ".h":
@@ -1741,22 +3420,16 @@ class TlvF:
             p = os.path.relpath(self.conf_output_path_src, self.conf_output_path)
             p = os.path.join(p, self.yaml_path)
             self.output_directories_cpp.append(p)
-        self.mkdir_p(file_path)
-        
+        if not self.dry_run:
+            self.mkdir_p(file_path)
+
         file_path = os.path.join(file_path, self.yaml_fname + file_suffix)
-        self.logger.debug("writing source file: %s" % file_path)
-        self.generated_file_list.append(file_path)
+        if not self.dry_run:
+            self.logger.debug("writing source file: %s" % file_path)
+            if file_path not in self.generated_file_list:
+                self.generated_file_list.append(file_path)
 
-        lines = [self.AUTO_GENERATED_MESSAGE]
-        # write source_license_header
-        if self.conf_source_license_header:
-            license_file_path = os.path.join(self.src_path, self.conf_source_license_header)
-            try: fl = open(license_file_path, 'r')
-            except: self.abort("can't open file %s" % license_file_path)
-            for line in fl:
-                lines.append(line.rstrip())
-            fl.close()
-            lines.append("")
+        lines = self.getFileHeaderLines()
         
         # write include header protection start
         if file_suffix == ".h":
@@ -1769,11 +3442,33 @@ class TlvF:
                 if (not (inc_name in tmp_list)):
                     tmp_list.append(inc_name)
                     self.insertLineH("",self.CODE_INCLUDE_INSERT, '#include %s' % inc_name)
+        else:
+            tmp_list = []
+            for inc_name in self.cpp_include_list:
+                if inc_name not in tmp_list:
+                    tmp_list.append(inc_name)
+                    self.insertLineCpp("", self.CODE_INCLUDE_INSERT, '#include %s' % inc_name)
 
         lines.extend(code_lines)
+        if self.profile == TlvF.PROFILE_RELEASE:
+            lines = self.releaseLogLines(lines, file_path)
+
+        out_lines = [line for line in lines
+                     if self.conf_debug_keep_source_marker or line.find("//~") == -1]
+        if self.backend != TlvF.BACKEND_INLINE or self.dry_run:
+            self.size_report[(file_path, self.backend)] = (len(out_lines),
+                                                           sum(len(line) + 1 for line in out_lines))
+        if self.dry_run:
+            return
+        self.addReportLines(out_lines, file_suffix)
+        if self.unity and file_suffix == ".cpp":
+            size = sum(len(line) + 1 for line in out_lines)
+            self.unity_sources[file_path] = (self.namespace, size)
         
-        # write code
-        if not self.compareFile(file_path, lines):
+        # write code - always rewritten by a one shot run, to keep the cmake outputs newer than
+        # their dependencies, but left untouched by --watch if unchanged, to avoid needless rebuilds
+        if not (self.watch and self.compareFile(file_path, lines)):
+            self.written_file_list.append(file_path)
             f = open(file_path, "w+")
             for line in lines:
                 if not self.conf_debug_keep_source_marker:
@@ -1781,6 +3476,106 @@ class TlvF:
                 f.write(line + "\n")
             f.close()
 
+    def getFileHeaderLines(self):
+        lines = [self.AUTO_GENERATED_MESSAGE]
+        # write source_license_header
+        if self.conf_source_license_header:
+            license_file_path = os.path.join(self.src_path, self.conf_source_license_header)
+            try:
+                fl = open(license_file_path, 'r')
+            except OSError:
+                self.abort("can't open file %s" % license_file_path)
+            for line in fl:
+                lines.append(line.rstrip())
+            fl.close()
+            lines.append("")
+        return lines
+
+    def writeUnityFiles(self):
+        # bucket the generated sources by namespace - the generated sources have a file scope
+        # "using namespace", so sources of different namespaces can't share a translation unit -
+        # and split each namespace to unity files of up to UNITY_MAX_BYTES of generated source
+        buckets = OrderedDict()
+        for file_path, (namespace, size) in self.unity_sources.items():
+            namespace = namespace if namespace else "global"
+            files = buckets.setdefault(namespace, [[]])
+            bucket_size = sum(self.unity_sources[f][1] for f in files[-1])
+            if files[-1] and bucket_size + size > TlvF.UNITY_MAX_BYTES:
+                files.append([])
+            files[-1].append(file_path)
+
+        unity_path = os.path.join(self.conf_output_path_src, TlvF.UNITY_DIR)
+        if not os.path.exists(unity_path):
+            os.makedirs(unity_path)
+        unity_file_list = []
+        for namespace, files in buckets.items():
+            for idx, sources in enumerate(files):
+                file_path = os.path.join(unity_path, "%s_%d.cpp" % (namespace, idx))
+                unity_file_list.append(file_path)
+                lines = self.getFileHeaderLines()
+                lines.append("// unity build of the %s generated sources" % namespace)
+                for source in sources:
+                    lines.append('#include "%s"' % os.path.relpath(source, unity_path))
+                self.writeGeneratedFile(file_path, lines)
+
+        # remove unity files left over from a previous run with more buckets
+        for fname in os.listdir(unity_path):
+            file_path = os.path.join(unity_path, fname)
+            if fname.endswith(".cpp") and file_path not in unity_file_list:
+                os.remove(file_path)
+                if file_path in self.generated_file_list:
+                    self.generated_file_list.remove(file_path)
+        logConsole("Unity build: %d generated sources in %d unity files\n" %
+                   (len(self.unity_sources), len(unity_file_list)))
+
+    def writeGeneratedFile(self, file_path, lines):
+        # write a generated file which has no code template (no markers, report or release profile)
+        if file_path not in self.generated_file_list:
+            self.generated_file_list.append(file_path)
+        if not (self.watch and self.compareFile(file_path, lines)):
+            self.written_file_list.append(file_path)
+            f = open(file_path, "w+")
+            for line in lines:
+                f.write(line + "\n")
+            f.close()
+
+    def releaseLogLines(self, lines, file_path):
+        # replace the log strings by error codes, drop debug / info logs
+        rel_path = os.path.relpath(file_path, self.conf_output_path)
+        out_lines = []
+        for line in lines:
+            if line.find("LOG(") == -1:
+                out_lines.append(line)
+                continue
+
+            def replace(match):
+                level = match.group(1)
+                if level not in TlvF.RELEASE_LOG_FUNCS:
+                    return ""
+                code = 0
+                if not self.dry_run:
+                    self.error_codes.append((level, rel_path, match.group(2).strip()))
+                    code = self.conf_error_code_base + len(self.error_codes)
+                return "%s(%d);" % (TlvF.RELEASE_LOG_FUNCS[level], code)
+            new_line = TlvF.RELEASE_LOG_RE.sub(replace, line)
+            if new_line != line and new_line.strip() == "":
+                continue
+            out_lines.append(new_line)
+        return out_lines
+
+    def writeErrorCodes(self):
+        file_path = os.path.join(self.conf_output_path, TlvF.ERROR_CODES_FILE)
+        lines = ["# code level file message"]
+        for (code, (level, rel_path, message)) in enumerate(self.error_codes,
+                                                            self.conf_error_code_base + 1):
+            lines.append("%d %s %s %s" % (code, level, rel_path, message))
+        if not self.compareFile(file_path, lines):
+            f = open(file_path, "w+")
+            for line in lines:
+                f.write(line + "\n")
+            f.close()
+        logConsole("Release profile: %d log statements replaced by error codes, see %s\n" %
+                   (len(self.error_codes), file_path))
 
     def logObject(self, obj, name=""):    
         self.logger.debug("=======%s=========" % name)
@@ -1791,13 +3586,21 @@ class TlvF:
     def loadAllYamlFilesToDB(self):
         logConsole("Loading Yaml files...")
         for fname in self.yaml_file_list:
-            yaml_fname = os.path.basename( fname )
-            prefix = os.path.commonprefix([os.path.dirname(fname), self.yaml_root_path])
-            yaml_path = os.path.relpath(os.path.dirname(fname), prefix)
-            yaml_inst = self.loadYaml(fname)
-            self.dumpYaml(yaml_inst)
-            self.loadYamlToDB(yaml_fname, yaml_inst, yaml_path)
+            self.loadYamlFileToDB(fname)
         logConsole("Done\n")
+
+    def loadYamlFileToDB(self, fname):
+        yaml_fname = os.path.basename(fname)
+        prefix = os.path.commonprefix([os.path.dirname(fname), self.yaml_root_path])
+        yaml_path = os.path.relpath(os.path.dirname(fname), prefix)
+        yaml_inst = self.loadYaml(fname)
+        self.dumpYaml(yaml_inst)
+        self.loadYamlToDB(yaml_fname, yaml_inst, yaml_path)
+
+    def unloadYamlFromDB(self, yaml_fname):
+        for key in [key for key in self.db.keys() if key[0] == yaml_fname]:
+            del self.db[key]
+            self.db_enum_storage_type.pop(key, None)
     
     def loadYamlToDB(self, yaml_fname, yaml_inst, yaml_path):
         yaml_fname = yaml_fname.replace(".yaml","")
@@ -1826,21 +3629,23 @@ class TlvF:
         if self.conf_log_level == "ERROR": self.conf_log_level = logging.ERROR
         if self.conf_log_level == "OFF": return
         
-        file_path = os.path.join(self.conf_output_path, self.conf_log_file)
-        self.mkdir_p(os.path.dirname(file_path))
-
         self.conf_log_format = logging.Formatter(fmt=self.conf_log_format, datefmt="") #datefmt=log_date_format --> log_date_format: '%d/%m/%Y %I:%M:%S %p'
 
-        logger_fh = logging.FileHandler(filename=file_path, mode='w')
-        logger_fh.setFormatter(self.conf_log_format) 
-        logger_fh.setLevel(self.conf_log_level)
+        # --check writes nothing, not even the log file
+        if not self.check:
+            file_path = os.path.join(self.conf_output_path, self.conf_log_file)
+            self.mkdir_p(os.path.dirname(file_path))
+            logger_fh = logging.FileHandler(filename=file_path, mode='w')
+            logger_fh.setFormatter(self.conf_log_format)
+            logger_fh.setLevel(self.conf_log_level)
 
         logger_ch = logging.StreamHandler()
         logger_ch.setFormatter(self.conf_log_format)
         logger_ch.setLevel(logging.WARNING)
 
         self.logger = logging.getLogger('root')
-        self.logger.addHandler(logger_fh)
+        if not self.check:
+            self.logger.addHandler(logger_fh)
         self.logger.addHandler(logger_ch)
 
         self.logger.setLevel(self.conf_log_level)
@@ -1856,6 +3661,18 @@ class TlvF:
         try: self.conf_source_license_header = yaml_conf["source_license_header"]
         except: self.conf_source_license_header = None
 
+        try:
+            self.conf_message_type_enum = yaml_conf["message_type_enum"]
+        except KeyError:
+            self.conf_message_type_enum = None
+
+        try:
+            self.conf_error_code_base = int(yaml_conf["error_code_base"])
+        except KeyError:
+            self.conf_error_code_base = 0
+        except (TypeError, ValueError):
+            self.abort("error_code_base must be an integer in the conf file")
+
         try: self.conf_log_file = yaml_conf["debug"]["log_file"]
         except: self.conf_log_file = ""
         try: self.conf_log_format = yaml_conf["debug"]["log_format"]
@@ -1924,6 +3741,10 @@ class TlvF:
             self.logger.debug( pp.pformat(yaml_inst) )
 
     def abort(self, msg=""):
+        if self.check_errors is not None:
+            self.check_errors.append(msg)
+            raise CheckError(msg)
+
         if self.conf_debug_dump_stack:
             stack_msg = "\n=========Traceback===========\n"
             tr = traceback.format_stack()
@@ -1986,12 +3807,48 @@ def main():
     parser.add_argument('--test', action='store_true', help='test')
     parser.add_argument('--print-dependencies', action='store_true', help='test print dependancies')
     parser.add_argument('--print-outputs', action='store_true', help='test print dependancies')
+    parser.add_argument('--backend', choices=TlvF.BACKENDS, default=TlvF.BACKEND_INLINE,
+                        help='code generation backend')
+    parser.add_argument('--report', metavar='PATH',
+                        help='write a generated code size and complexity report to PATH')
+    parser.add_argument('--budget', metavar='PATH',
+                        help='fail if a schema exceeds the code size budget in PATH')
+    parser.add_argument('--update-budget', action='store_true',
+                        help='write the current code sizes to the --budget file')
+    parser.add_argument('--profile', choices=TlvF.PROFILES, default=TlvF.PROFILE_DEBUG,
+                        help='release drops the allocation order checks and replaces log strings '
+                             'by error codes')
+    parser.add_argument('--stats', action='store_true',
+                        help='instrument the generated classes with runtime counters '
+                             '(tlvf/tlvfstats.h)')
+    parser.add_argument('--watch', action='store_true',
+                        help='keep running, and regenerate the changed schemas and their '
+                             'dependents')
+    parser.add_argument('--unity', action='store_true',
+                        help='also write amalgamated sources, bucketed by namespace, for a unity '
+                             'build')
+    parser.add_argument('--wire-size-report', metavar='PATH',
+                        help='write the wire size analysis of the classes and structs to PATH '
+                             '(JSON)')
+    parser.add_argument('--benchmark', metavar='PATH',
+                        help='also write a round trip benchmark of the TLV classes to PATH '
+                             '(C++ source)')
+    parser.add_argument('--check', action='store_true',
+                        help='validate all the yaml files, report all the errors and exit, '
+                             'without writing anything')
+    parser.add_argument('--lint-performance', action='store_true',
+                        help='report slow class layouts and exit, without generating code')
     args = parser.parse_args()
+    if args.update_budget and not args.budget:
+        parser.error("--update-budget requires --budget")
 
     if args.test:
         test(args.conf, args.output, args.print_dependencies, args.print_outputs)
     else:
-        tlvf = TlvF(args.src_path, args.yaml_path, args.out_path, args.conf, args.print_dependencies, args.print_outputs)
+        TlvF(args.src_path, args.yaml_path, args.out_path, args.conf, args.print_dependencies,
+             args.print_outputs, args.backend, args.report, args.budget, args.update_budget,
+             args.lint_performance, args.profile, args.stats, args.watch,
+             args.unity, args.check, args.wire_size_report, args.benchmark)
 
 if __name__ == '__main__':
     main()
@@ -26,6 +26,9 @@ from multiprocessing import Process
 from threading import Thread
 import struct
 
+import log_index
+import log_reader
+import log_record
 import logger_setup
 
 VERSION="3.3"
@@ -34,6 +37,7 @@ t_list=[]
 g_ext_log_file=False
 g_marker_update=False
 LOG_FILE="beerocks_analyzer.log"
+TIME_SLIDER_STEPS = 10  # time slider steps per second
 
 bra = None
 app = None
@@ -84,6 +88,8 @@ class BeeRocksAnalyzer(QMainWindow):
         self.cm_widget_mod = None
         self.log_widget = None
         self.log_widget_mod = None
+        self.subscribers = {}
+        self.record_kinds = log_record.CONTROL_KINDS
 
         self.ap_mac2num = {}
         self.sta_mac2num = {}
@@ -170,13 +176,13 @@ class BeeRocksAnalyzer(QMainWindow):
         self.closeLogFiles()
         if self.fname != None:
             try: # open log file
-                self.fdLog = open(self.fname,"rt")
+                self.fdLog = log_reader.LogReader(self.fname)
                 if log_start_pos > 0:
                     logger.debug("openLogFiles: seek to {:d}", log_start_pos)
-                    self.fdLog.seek(log_start_pos, 0)
+                    self.fdLog.seek(log_start_pos)
                 elif log_start_pos < 0:
-                    logger.debug("openLogFiles: seek to end of file", log_start_pos)
-                    self.fdLog.seek(0, 2)
+                    logger.debug("openLogFiles: seek to end of file")
+                    self.fdLog.seek(-1)
             except:
                 self.fdLog = None
             if self.fdLog == None:
@@ -203,121 +209,69 @@ class BeeRocksAnalyzer(QMainWindow):
             return True
 
     def readSample(self, line):
-        param_n = []
-        param_v = []
-        param_t = -1
-        is_start=False
-        is_stop=False
-        is_map_update=False
-        res=""
+        record = log_record.parse_line(line, self.record_kinds)
+        if record is None:
+            return None
 
-        if line.startswith("#") or len(line) < 4 : 
-            return [param_t, is_start, is_stop, is_map_update, res]
-
-        i1 = line.find("|")
-        if(i1 == -1) : 
-            return [param_t, is_start, is_stop, is_map_update, res]
-
-        param_t = float(line[0:i1])
-
-        i2=line.find(",")
-        if i2 == -1: # START or STOP or error
-            try:
-                param_m = (str(line[i1+1:])).strip()
-                if param_m=="MARK":
-                    self.wait_for_mark=False
-                    self.cm_widget.increment_node_counters()
-                if param_m=="START" or  param_m=="MARK":
-                    is_start=True
-                elif param_m=="STOP":
-                    is_stop = True
-                else:
-                    logger.error("readSample() 1 line --> {}\n", line)
-            except Exception as e : # TODO: too broad exception
-                logger.error("readSample() 1 line --> {}\n{}", line, str(e))
-
-            return [param_t, is_start, is_stop, is_map_update, res]
-        else:
-            try:
-                param_m = str(line[i1+1:i2])
-                # read line's key,value: param_n<-key, param_v<-value
-                line_args = line[i2+1:].split(',')
-                param_n = []
-                for arg in line_args:
-                    arg_val = arg.split(':')
-                    key = arg_val[0].lower().strip()
-                    param_n.append(key)
-                    if ("mac" in key) or ("bssid" in key) or ("backhaul" in key):
-                        param_v.append(arg.replace(":","=",1).split("=")[1].strip())
-                    else:
-                        param_v.append(arg_val[1].strip())
-            except Exception as e:
-                logger.error("readSample() 1 line --> {}".format(line))
-                logger.exception(e)
-                return [param_t, is_start, is_stop, is_map_update, res]
-
-        if param_v == None: 
-            return [param_t, is_start, is_stop, is_map_update, res]
-        if not self.wait_for_mark:
-            param_m_val = param_m.split(':')
-            param_m_n = param_m_val[0].strip()
-
-            if param_m_n != "type" and param_m_n != "Type":
-                is_map_update = True
-
-            if param_m_n == "Name": #nw_map_update
-                try:
-                    i_state=param_n.index('state')
-                    i_mac=param_n.index('mac')
-                    i_type=param_n.index('type')
-
-                except Exception as e: # TODO: too broad exception
+        if record.kind == log_record.MARK:
+            self.wait_for_mark = False
+            if self.isMap:
+                self.cm_widget.increment_node_counters()
+        elif record.line is None:  # no widget is interested in the line
+            pass
+        elif not self.wait_for_mark:
+            if record.kind == log_record.NW_MAP:
+                state = record.get('state')
+                mac = record.mac
+                line_type = record.type
+                if state is None or mac is None or line_type is None:
                     logger.error("readSample()  --> {}, "
-                                             "nw_map_update line does not contain state "
-                                             "or mac or type or parent bssid".format(line))
-                    logger.exception(e)
-                    return [param_t, is_start, is_stop, is_map_update, res]
-
-                state = (param_v[i_state].split())[0]
-                mac = param_v[i_mac]
-                line_type = param_v[i_type]
-                
-                if "2" in line_type: #IRE
-                    try:
-                        i_backhaul=param_n.index('backhaul')
-                        mac = param_v[i_backhaul] #for IRE, the backhaul mac is the "client" mac
-                    except Exception as e: # TODO: too broad exception
+                                 "nw_map_update line does not contain state "
+                                 "or mac or type".format(line))
+                    return record
+
+                if line_type == 2:  # IRE
+                    mac = record.get('backhaul')  # for IRE, the backhaul mac is the "client" mac
+                    if mac is None:
                         logger.error("readSample()  --> {}, "
-                                                 "nw_map_update IRE line does not contain "
-                                                 "a backhaul mac address\n{}".format(line, str(e)))
-                        return [param_t, is_start, is_stop, is_map_update, res]
-                if ("2" in line_type) or ("3" in line_type): #IRE or client
-                    if state == "Connected":
-                        if mac not in self.sta_mac2num: # new sta mac addr
-                            self.sta_mac2num[mac] = len(self.sta_mac2num)
-                        res += "sta_id: {:d},".format(self.sta_mac2num[mac])
-
-                        if res.endswith(','):
-                            res = res[:-1]
-
-            elif param_m_n == "type" or param_m_n == "Type":
-                param_m_v = int(param_m_val[1].strip())
-                try:
-                    i1=param_n.index('mac')
-                except Exception as e: # TODO: too broad exception
-                    logger.error("readSample() --> {}, 'stats_update' line not contain mac address.\n{}".format(line, e))
-                    return [param_t, is_start, is_stop, is_map_update, res]
+                                     "nw_map_update IRE line does not contain "
+                                     "a backhaul mac address".format(line))
+                        return record
+                if line_type == 2 or line_type == 3:  # IRE or client
+                    if state.split()[0] == "Connected":
+                        record.sta_id = self.getStaId(mac)
+
+            elif record.kind == log_record.STATS:
+                if record.mac is None:
+                    logger.error("readSample() --> {}, 'stats_update' line not contain "
+                                 "mac address".format(line))
+                    return record
+
+                if record.type == 3:  # Client stats update
+                    record.sta_id = self.getStaId(record.mac)
 
-                mac = param_v[i1]
-                i1+=1
+        # End of readSample()
+        return record
 
-                if param_m_v == 3: #Client stats update
-                    if mac not in self.sta_mac2num: # new sta mac addr
-                        self.sta_mac2num[mac] = len(self.sta_mac2num)
-                    res += "sta_id: %d"%self.sta_mac2num[mac]
+    def getStaId(self, mac):
+        if mac not in self.sta_mac2num:  # new sta mac addr
+            self.sta_mac2num[mac] = len(self.sta_mac2num)
+        return self.sta_mac2num[mac]
 
-        # End of readSample()
-        return [param_t, is_start, is_stop, is_map_update, res]
+    def updateSubscribers(self):
+        """Rebuild the record kind to widget handlers table, after (re)creating the widgets."""
+        self.subscribers = {}
+        widgets = [self.log_widget]
+        if self.isMap:
+            widgets.append(self.cm_widget)
+        if self.isGraphs:
+            widgets.append(self.wa_widget)
+        for widget in widgets:
+            if widget is None:
+                continue
+            for kind in widget.RECORD_KINDS:
+                self.subscribers.setdefault(kind, []).append(widget.readRecord)
+        self.record_kinds = log_record.CONTROL_KINDS | frozenset(self.subscribers)
 
     def readSampleThread(self, update_start_time = False):
         if self.isGraphs:
@@ -330,16 +284,16 @@ class BeeRocksAnalyzer(QMainWindow):
                 if not line:
                     time.sleep(1)
                     continue
-                [param_t1, is_start, is_stop, is_map_update, sta_ap_ids] = self.readSample(line)
-                if len(sta_ap_ids) > 0:
-                    line += ", " + sta_ap_ids
-                if is_stop:
+                record = self.readSample(line)
+                if record is None:
+                    time.sleep(0.1)
+                    continue
+                param_t1 = record.t
+                if record.kind == log_record.STOP:
                     logger.info("Read stop flag, stopping")
                     self.threadExit=True
 
-                if param_t1 == -1:
-                    time.sleep(0.1)
-                elif param_t1 == 0.000:
+                if param_t1 == 0.000:
                     logger.debug("readSampleThread() --> param_t1=0.000, updating self.start_time")
                     self.start_time = time.time()
                 else:
@@ -353,26 +307,21 @@ class BeeRocksAnalyzer(QMainWindow):
                         #if delta_t > 5:
                         logger.debug("readSampleThread() --> sleeping for {:.3f} seconds".format(delta_t))
                         time.sleep(delta_t)
-                    elif (delta_t < -3) and (not is_map_update):
+                    elif (delta_t < -3) and (not record.is_map_update()):
                         logger.debug("readSampleThread() --> (delta_t < -3) "
                                    "and (not is_map_update) -> update_widgets = False")
                         update_widgets = False
                     self.restartRuntime = False
                     self.timeUpdateSig.sig.emit(param_t1)
                     if update_widgets and not self.wait_for_mark:
-                        if "BML_EVENT" in line:
-                            self.log_widget.readSampleAndUpdateLogger(line, param_t1, is_start, is_stop)
-                        else:
-                            if self.isMap:
-                                logger.debug("self.isMap, calling readSample")
-                                self.cm_widget.readSample(line, param_t1, is_start, is_stop)
-                            if self.isGraphs:
-                                self.wa_widget.readSampleAndUpdateGraphs(line, param_t1, is_start, is_stop)
+                        for handler in self.subscribers.get(record.kind, ()):
+                            handler(record)
 
     def createAnalyzerWidget(self, widget_index=0):
         self.wa_widget_mod = __import__("beerocks_analyzer_widget")
         self.wa_widget = self.wa_widget_mod.BeeRocksAnalyzerWidget(self.argv)
         self.wa_widget.restartSig.sig.connect(self.resetFromLog)
+        self.updateSubscribers()
         self.openLogFiles(self.log_start_pos)
         self.main_widget.insertWidget(widget_index, self.wa_widget)
 
@@ -380,6 +329,7 @@ class BeeRocksAnalyzer(QMainWindow):
         self.cm_widget_mod = __import__("connectivity_map_widget")
         self.cm_widget = self.cm_widget_mod.ConnectivityMapWidget()
         self.cm_widget.restartSig.sig.connect(self.resetFromLog)
+        self.updateSubscribers()
         self.openLogFiles(self.log_start_pos)
         if self.isMapSepWin:
             self.cm_widget.setWindowTitle("BeeRocks Analyzer V%s" % VERSION) 
@@ -393,6 +343,7 @@ class BeeRocksAnalyzer(QMainWindow):
         self.log_widget_mod = __import__("logger_widget")
         self.log_widget = self.log_widget_mod.LoggerWidget()
         self.log_widget.restartSig.sig.connect(self.resetFromLog)
+        self.updateSubscribers()
         self.openLogFiles(self.log_start_pos)
         self.main_vsplitter.insertWidget(widget_index, self.log_widget)
 
@@ -530,6 +481,9 @@ class BeeRocksAnalyzer(QMainWindow):
 
             #Slider
             self.getFileMarkers()
+            reader = log_reader.LogReader(self.fname)
+            file_duration = reader.get_last_time()
+            reader.close()
      
             self.timeSlider = QSlider()
             self.lastTimerValue = 0.0
@@ -539,8 +493,8 @@ class BeeRocksAnalyzer(QMainWindow):
             self.timeSlider.sliderReleased.connect(self.timeSliderReleased)
             self.timeSlider.setOrientation(Qt.Horizontal)
             self.timeSlider.setMinimum(0)
-            self.timeSlider.setMaximum(len(self.file_marks)-1)
-            self.timeSlider.setTickInterval(1)
+            self.timeSlider.setMaximum(int(file_duration * TIME_SLIDER_STEPS))
+            self.timeSlider.setTickInterval(TIME_SLIDER_STEPS)
             self.timeSlider.setMaximumHeight(24)
             self.timeSlider.setMinimumWidth(220)
             self.timeSlider.setToolTip("Timeline slider")
@@ -574,37 +528,26 @@ class BeeRocksAnalyzer(QMainWindow):
         self.showMaximized()
 
     def getFileMarkers(self):
-        logger.info("Scanning log markers/time line...")
-        fd= open(self.fname,"rt")
-        line=" "
-        self.file_marks=[]
-        p=0
-        t="0.000"
-        self.file_marks.append( (p, t) )
-        while True:
-            p = fd.tell()
-            line = fd.readline()
-            if line == "":
-                break
-            i = line.find("|")
-            t = line[0:i]
-            if line.find("|MARK") != -1:
-                self.file_marks.append( (p, t) )
-
-        fd.close()
+        logger.info("Loading log markers/time line...")
+        self.file_marks = log_index.load_marks(self.fname)
         logger.info("Done.")
 
     def timeSliderChanged(self, value):
         self.lastTimerValueChanged = (self.lastTimerValue != value)
         self.lastTimerValue = value
-        self.fileTimeText.setText(self.file_marks[self.lastTimerValue][1])
+        self.fileTimeText.setText("{:.1f}".format(self.lastTimerValue / TIME_SLIDER_STEPS))
 
     def timeSliderReleased(self):
         if (self.lastTimerReleasedValue != self.lastTimerValue) or (self.lastTimerValueChanged):
             self.lastTimerValueChanged = False
             self.lastTimerReleasedValue = self.lastTimerValue
-            self.log_start_pos = self.file_marks[self.lastTimerValue][0]
-            self.fileTime = float(self.file_marks[self.lastTimerValue][1]) 
+            self.fileTime = self.lastTimerValue / TIME_SLIDER_STEPS
+            reader = log_reader.LogReader(self.fname)
+            self.log_start_pos = reader.find_time(self.fileTime)
+            reader.close()
+            if self.isMap:
+                # replay the whole network map update, the lines before fileTime are fast forwarded
+                self.log_start_pos = log_reader.get_mark_before(self.file_marks, self.log_start_pos)
             self.reset()
 
     def timeUpdateSlot(self, t):
@@ -640,6 +583,7 @@ class SocketServerThread(threading.Thread):
             Path to the logfile to store data to.
             If the file doesn't exist, it will be created.
             If it does, its content will be overwritten.
+            The index of its MARK lines (see `log_index`) is written along with it.
         """
         super().__init__()
         self.log_file = log_file
@@ -663,8 +607,10 @@ class SocketServerThread(threading.Thread):
         # Listen for incoming connections
         sock.listen(1)
 
-        #open log file
-        file = open(self.log_file,'w')
+        # open log file and its markers index. The log is written in binary mode, so that
+        # file.tell() is the byte offset of the MARK lines, as expected by the index.
+        file = open(self.log_file, 'wb')
+        marks = log_index.MarkIndexWriter(self.log_file)
 
         while self.run_flag:
             # Wait for a connection
@@ -674,17 +620,17 @@ class SocketServerThread(threading.Thread):
             startTime = time.time()
 
             logger.info("connection from {}".format(client_address))
-            file.write( '%.3f|START\n' % (time.time() - startTime))
+            file.write(b'%.3f|START\n' % (time.time() - startTime))
             file.flush()
             # Receive the data in chunks
-            data = ""
+            data = b""
             while self.run_flag:
                 if g_marker_update:
                     g_marker_update = False
                     sent_bytes = connection.send("marker")
                 try:
                     logger.debug("Trying to get data from the socket")
-                    data += connection.recv(256).decode("utf-8")
+                    data += connection.recv(256)
                 except socket.timeout:
                     logger.debug("Socket timed out")
                     continue
@@ -700,21 +646,31 @@ class SocketServerThread(threading.Thread):
                     break
                 while self.run_flag:
                     try:
-                        i=data.index('\n')
-                    except Exception as e:
+                        i = data.index(b'\n')
+                    except ValueError:
                         logger.debug("data.index failed: {}".format(data))
                         break
-                    send_data = data.split('\n')[0]
-                    data = data[i+1:]
-                    if send_data:
-                        file.write(('%.3f|' % (time.time() - startTime)) + send_data + '\n')
+                    send_data = data[:i]
+                    data = data[i + 1:]
+                    if send_data == b"MARK":
+                        with log_index.lock:
+                            t = '%.3f' % (time.time() - startTime)
+                            offset = file.tell()
+                            file.write(t.encode() + b'|' + send_data + b'\n')
+                            file.flush()
+                            marks.add(offset, t, file)
+                    elif send_data:
+                        file.write((b'%.3f|' % (time.time() - startTime)) + send_data + b'\n')
                         file.flush()
 
             # Clean up the connection
             connection.close()
-            file.write('%.3f|STOP\n' % (time.time() - startTime))
-            file.flush()
+            with log_index.lock:
+                file.write(b'%.3f|STOP\n' % (time.time() - startTime))
+                file.flush()
+                marks.sync(file)
 
+        marks.close()
         file.close()
 
     def terminate(self):
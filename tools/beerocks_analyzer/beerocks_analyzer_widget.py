@@ -12,6 +12,9 @@ from datetime import timedelta
 
 import threading
 
+import log_record
+import series_store
+
 from PySide2.QtCore import *
 from PySide2.QtGui import *
 
@@ -70,6 +73,10 @@ class UpdateSig(QObject):
     sig = Signal(int)
 
 class BeeRocksAnalyzerWidget(QWidget):
+    RECORD_KINDS = (log_record.START, log_record.STOP, log_record.MARK,
+                    log_record.NW_MAP, log_record.STATS)
+    """Kinds of the log records handled by readRecord()"""
+
     def __init__(self, argv, parent=None):
         super(BeeRocksAnalyzerWidget, self).__init__(parent)
         self.logger = logging.getLogger(__name__)
@@ -78,7 +85,9 @@ class BeeRocksAnalyzerWidget(QWidget):
         self.figsTitle = []
         self.subplots = []
         self.fig_ax = []
-        self.figCanvas = []
+        self.figCanvas = {}  # key = fig index : val = (fig, canvas)
+        self.figBackgrounds = {}  # key = fig index : val = {ax: background} (for blitting)
+        self.figFullRedraw = set()  # fig index of the figures whose lines or legends changed
         self.thread = None
         self.threadEvent = threading.Event()
         self.updateSig = UpdateSig()
@@ -100,6 +109,7 @@ class BeeRocksAnalyzerWidget(QWidget):
         self.general_label_color_idx = 0
 
         ### Log Data containers ###
+        self.series = series_store.SeriesStore()
         self.ap_mac2num = {}
         self.ap_mac2sta_mac = {}
         self.sta_mac2num = {}
@@ -129,7 +139,8 @@ class BeeRocksAnalyzerWidget(QWidget):
         self.subplots = []
         self.fig_subplot_nums2marker = []
         self.fig_ax = []
-        self.figCanvas = []
+        self.figCanvas = {}
+        self.figBackgrounds = {}
         try:plt.close('all')
         except: pass
         try: QWidget.closeEvent(self, event)
@@ -200,25 +211,26 @@ class BeeRocksAnalyzerWidget(QWidget):
 
     def printLabels(self):
         self.logger.info("printLabels:")
-        for a_name in dir(self):
-            if a_name.endswith("_v"):
-                self.logger.info(" {}".format(a_name))
+        for name in self.series:
+            self.logger.info(" {}".format(name))
 
     def printVals(self):
         self.logger.info("printVals:\n")
-        for a_name in dir(self):
-            if a_name.endswith("_v") or a_name.endswith("_t"):
-                self.logger.info(" {} : {}\n".format(a_name, str(getattr(BeeRocksAnalyzerWidget, a_name))))
-
-    def readSampleAndUpdateGraphs(self, line, param_t1, is_start, is_stop):
-        if is_start:
+        for name in self.series:
+            series = self.series.get(name)
+            self.logger.info(" {}_v : {}\n".format(name, str(series.values())))
+            self.logger.info(" {}_t : {}\n".format(name, str(series.times())))
+
+    def readRecord(self, record):
+        param_t1 = record.t
+        if record.kind == log_record.START or record.kind == log_record.MARK:
             self.wait_for_start=False
             return
-        elif is_stop:
+        elif record.kind == log_record.STOP:
             self.restartSig.sig.emit(1)
             return
 
-        self.readSample(line, param_t1)
+        self.readSample(record)
         #update start time
         if self.update_start_time:
             self.realtimeWindow_start = param_t1
@@ -232,97 +244,51 @@ class BeeRocksAnalyzerWidget(QWidget):
                 self.threadEvent.clear()
                 self.update_start_time=True
 
-    def readSample(self, line, param_t):
-        param_n = []
-        param_v = []
-        if line.startswith("#") or len(line) < 4 : return None
-        i1 = line.find("|")
-        if(i1 == -1) : return
-
-        i2=line.find(",")
-        try:
-            param_m = str(line[i1+1:i2])
-            line_args = line[i2+1:].split(',')
-            param_n = []
-            for arg in line_args:
-                arg_val = arg.split(':')
-                key = arg_val[0].lower().strip()
-                param_n.append(key)
-                if ("mac" in key) or ("bssid" in key) or ("backhaul" in key):
-                    param_v.append(arg.replace(":","=",1).split("=")[1].strip())
-                else:
-                    param_v.append(arg_val[1].strip())
-
-        except Exception as e: # TODO: too broad exception
-            self.logger.error("Error, readSample() 1 line --> {}".format(line))
-            self.logger.exception(e)
-            return
-
-        if param_v == None: return
-
-        param_m_val = param_m.split(':')
-        param_m_n = param_m_val[0].strip()
+    def readSample(self, record):
+        param_t = record.t
+        line = record.line
 
-        if param_m_n == "Name": #nw_map_update
+        if record.kind == log_record.NW_MAP:  # nw_map_update
             self.logger.debug("Updating network map")
-            try:
-                i_state=param_n.index('state')
-                i_mac=param_n.index('mac')
-                i_type=param_n.index('type')
-                if not ("1" in param_v[i_type]):
-                    i_ap_mac=param_n.index('parent bssid')
-                
-            except Exception as e: # TODO: too broad exception
+            state = record.get('state')
+            mac = record.mac
+            line_type = record.type
+            ap_mac = record.get('parent bssid')
+            if (state is None or mac is None or line_type is None or
+                    (line_type != 1 and ap_mac is None)):
                 self.logger.error("readSample()  --> {}, "
                                   "nw_map_update line does not contain state or mac"
                                   " or type or parent bssid".format(line))
-                self.logger.exception(e)
                 return
 
-            state = (param_v[i_state].split())[0]
-            mac = param_v[i_mac]
-            line_type = param_v[i_type]
-            if not ("1" in line_type):
-                ap_mac = param_v[i_ap_mac]
-            
-            if "2" in line_type: #IRE
-                try:
-                    i_backhaul=param_n.index('backhaul')
-                    mac = param_v[i_backhaul] #for IRE, the backhaul mac is the "client" mac
-                except Exception as e:  # TODO: too broad exception
-                    self.logger.error("readSample()  --> %s, nw_map_update IRE line does not contain"
-                                      " a backhaul mac address".format(line))
-                    self.logger.exception(e)
+            state = state.split()[0]
+
+            if line_type == 2:  # IRE
+                mac = record.get('backhaul')  # for IRE, the backhaul mac is the "client" mac
+                if mac is None:
+                    self.logger.error("readSample()  --> {}, nw_map_update IRE line does not "
+                                      "contain a backhaul mac address".format(line))
                     return
-            if ("2" in line_type) or ("3" in line_type): #IRE or client
+            if line_type == 2 or line_type == 3:  # IRE or client
                 if state == "Disconnected":
                     for mac_t in self.ap_mac2sta_mac: #remove sta from the previous mac addr
                         if mac in self.ap_mac2sta_mac[mac_t]:
                             self.ap_mac2sta_mac[mac_t].remove(mac)
 
                 elif state == "Connected":
-                    if not(self.sta_mac2num.has_key(mac)): # new sta mac addr
-                        sta_id=-1
-                        try: 
-                            i_sta_id=param_n.index('sta_id')
-                            sta_id = int(param_v[i_sta_id])
-                        except Exception as e:  # TODO: too broad exception
+                    if mac not in self.sta_mac2num:  # new sta mac addr
+                        if record.sta_id == -1:
                             self.logger.error("readSample()  --> {}, nw_map_update - "
                                               "new STA line does not contain sta_id".format(line))
-                            self.logger.exception(e)
                             return
-                        self.sta_mac2num[mac] = sta_id
+                        self.sta_mac2num[mac] = record.sta_id
                         self.defineLineColor('sta', self.sta_mac2num[mac])
-                    
-                    if not(self.ap_mac2num.has_key(ap_mac)): # new ap mac addr
-                        #ap_id = len(self.ap_mac2num)
-                        ap_id=-1
-                        try: 
-                            i_ap_id=param_n.index('ap_id')
-                            ap_id = int(param_v[i_ap_id])
-                        except Exception as e:  # TODO: too broad exception
-                            self.logger.error("readSample()  --> %s, nw_map_update - "
-                                              "new AP line does not contain ap_id\n{}".format(line, e))
+
+                    if ap_mac not in self.ap_mac2num:  # new ap mac addr
+                        ap_id = record.number('ap_id')
+                        if ap_id is None:
+                            self.logger.error("readSample()  --> {}, nw_map_update - "
+                                              "new AP line does not contain ap_id".format(line))
                             return
                         self.ap_mac2num[ap_mac] = ap_id
                         self.defineLineColor('ap', ap_id)
@@ -334,50 +300,39 @@ class BeeRocksAnalyzerWidget(QWidget):
                     if not(mac in self.ap_mac2sta_mac[ap_mac]):
                         self.ap_mac2sta_mac[ap_mac].append(mac)
 
-        elif param_m_n == "type" or param_m_n == "Type":
-            param_m_v = int(param_m_val[1].strip())
-            try:
-                i1=param_n.index('mac')
-            except Exception as e:  # TODO: too broad exception
+        elif record.kind == log_record.STATS:
+            mac = record.mac
+            if mac is None:
                 self.logger.error("readSample() --> {}, 'stats_update' line not contain mac address".format(line))
-                self.logger.exception(e)
                 return
 
-            mac = param_v[i1]
-            i1+=1
-            if param_m_v == 1: #AP stats update
-                if not(self.ap_mac2num.has_key(mac)): # new ap mac addr
-                    ap_id=-1
-                    try: 
-                        i_ap_id=param_n.index('ap_id')
-                        ap_id = int(param_v[i_ap_id])
-                    except Exception as e:  # TODO: too broad exception
-                        self.logger.error("readSample()  --> %s, nw_map_update"
+            i1 = record.index['mac'] + 1
+            if record.type == 1:  # AP stats update
+                if mac not in self.ap_mac2num:  # new ap mac addr
+                    ap_id = record.number('ap_id')
+                    if ap_id is None:
+                        self.logger.error("readSample()  --> {}, nw_map_update"
                                           " - new AP line does not contain ap_id".format(line))
-                        self.logger.exception(e)
                         return
                     self.ap_mac2num[mac] = ap_id
                     self.defineLineColor('ap', ap_id)
                     self.ap_mac2sta_mac[mac] = []
                 ap_id = self.ap_mac2num[mac]
 
-                for j in range(i1, len(param_n)):  # fill atrribute
-                    name = 'ap%d_' % self.ap_mac2num[mac] + param_n[j]
-                    val = int(param_v[j])
+                for j in range(i1, len(record.keys)):  # fill atrribute
+                    val = record.numbers[j]
+                    if val is None:
+                        continue
+                    name = 'ap%d_' % ap_id + record.keys[j]
                     self.addAttr(param_t, name, val, 'ap',ap_id)
 
-            elif param_m_v == 3: #Client stats update
-                if not(self.sta_mac2num.has_key(mac)): # new sta mac addr
-                    sta_id=-1
-                    try: 
-                        i_sta_id=param_n.index('sta_id')
-                        sta_id = int(param_v[i_sta_id])
-                    except Exception as e:  # TODO: too broad exception
-                        self.logger.error("readSample()  --> %s, nw_map_update"
+            elif record.type == 3:  # Client stats update
+                if mac not in self.sta_mac2num:  # new sta mac addr
+                    if record.sta_id == -1:
+                        self.logger.error("readSample()  --> {}, nw_map_update"
                                           " - new STA line does not contain sta_id".format(line))
-                        self.logger.exception(e)
                         return
-                    self.sta_mac2num[mac] = sta_id
+                    self.sta_mac2num[mac] = record.sta_id
                     self.defineLineColor('sta', self.sta_mac2num[mac])
                 sta_num = self.sta_mac2num[mac]
 
@@ -392,29 +347,26 @@ class BeeRocksAnalyzerWidget(QWidget):
                                       " did not find sta_mac={} in self.ap_mac2sta_mac".format(line, mac))
                     return
                 
-                for j in range(i1, len(param_n)):
-                    name_pattern = 'ap%d_sta%d_'+ param_n[j]
-                    name = name_pattern % (ap_num ,sta_num)
-                    val = int(param_v[j])
-                    self.addAttr(param_t, name, val, 'sta', sta_num)  # fill right atrribute with val
+                name_prefix = 'ap%d_sta%d_' % (ap_num, sta_num)
+                for j in range(i1, len(record.keys)):
+                    val = record.numbers[j]
+                    if val is None:
+                        continue
+                    # fill right atrribute with val
+                    self.addAttr(param_t, name_prefix + record.keys[j], val, 'sta', sta_num)
         # End of readSample()
 
     def getAttrVal(self, name):
-        return [getattr(BeeRocksAnalyzerWidget, name + "_v"), getattr(BeeRocksAnalyzerWidget, name + "_t")]
+        series = self.series.get(name)
+        return [series.values(), series.times()]
 
     def getValByName(self, name):
-        try:
-            ar_v = getattr(BeeRocksAnalyzerWidget, name + "_v")
-        except:
-            ar_v = []
-        return ar_v
+        series = self.series.get(name)
+        return series.values() if series is not None else []
 
     def getTimeByName(self, name):
-        try:
-            ar_t = getattr(BeeRocksAnalyzerWidget, name + "_t")
-        except:
-            ar_t = []
-        return ar_t
+        series = self.series.get(name)
+        return series.times() if series is not None else []
 
     def getTimeDiffSec(self, startTime):
         dt  = datetime.now() - startTime
@@ -422,27 +374,10 @@ class BeeRocksAnalyzerWidget(QWidget):
         return dt_sec
 
     def addAttr(self, param_t, param_n, param_v, entity, entity_num):
-        is_new_attr=False
-        try:
-            ar_v = getattr(BeeRocksAnalyzerWidget, param_n + "_v")
-            ar_t = getattr(BeeRocksAnalyzerWidget, param_n + "_t")
-        except:
-            ar_v = []
-            ar_t = []
-            setattr(BeeRocksAnalyzerWidget, param_n + "_v", ar_v)
-            setattr(BeeRocksAnalyzerWidget, param_n + "_t", ar_t)
-            is_new_attr=True
-        
-        if ar_t != []:
-            if (param_t - ar_t[-1]) > 3:
-                ar_v.append(None)
-                ar_t.append(param_t-0.1)
-            
-        ar_v.append(param_v)
-        ar_t.append(param_t)
-
+        series, is_new_attr = self.series.add(param_n, param_t, param_v)
         if is_new_attr:
-            self.addRemoveNewFigSubplots(ar_t, ar_v, param_n, True, entity, entity_num)
+            self.addRemoveNewFigSubplots(series.times(), series.values(), param_n, True, entity,
+                                         entity_num)
 
     def defineLineColor(self, entity, num):
         if entity=='ap':
@@ -491,6 +426,7 @@ class BeeRocksAnalyzerWidget(QWidget):
                                     ax.legend(handles, labels,loc='center left', prop={'size':8}, bbox_to_anchor=(1, 0.5))
                                     del self.subplots[f][p][c]
                                     plt.subplots_adjust(left=0.07, right=0.87, top=0.96, bottom=0.08)
+                                    self.figFullRedraw.add(f)
                                     return
                     
                     elif is_add and (asterisk_signed or param_n == target_lable):
@@ -516,7 +452,10 @@ class BeeRocksAnalyzerWidget(QWidget):
                                 marker=self.marker[0]
                                 self.fig_subplot_nums2marker[(f,p)] = 1
 
-                        plot_line, = ax.plot(ar_t, ar_v, color=color, marker=marker,markersize=5,linewidth=1.2, linestyle=self.linestyle, label=target_lable)
+                        # the lines are animated: drawn by blitting, over the figure background
+                        plot_line, = ax.plot(ar_t, ar_v, color=color, marker=marker, markersize=5,
+                                             linewidth=1.2, linestyle=self.linestyle,
+                                             label=target_lable, animated=True)
                         ax.ticklabel_format(axis='y',style='plain',scilimits=(1,4))
 
                         ax.set_xlim([0,1]) 
@@ -544,96 +483,100 @@ class BeeRocksAnalyzerWidget(QWidget):
                         handles, labels = ax.get_legend_handles_labels()
                         ax.legend(handles, labels, loc='center left', prop={'size':8}, bbox_to_anchor=(1, 0.5))
                         plt.subplots_adjust(left=0.07, right=0.82, top=0.96, bottom=0.08)
+                        self.figFullRedraw.add(f)
                         return
 
+    def getXlim(self):
+        x_end = self.realtimeWindow_start + self.realtimeInterval + 1.0
+        width = self.realtimeWindow + self.realtimeInterval + 1.0
+        # move the time axis by steps of a tenth of the window, so that most updates keep
+        # the axes limits and only need to blit the lines
+        step = max(self.realtimeInterval, self.realtimeWindow / 10.0)
+        x_end = math.ceil(x_end / step) * step
+        return (max(x_end - width, 0), x_end)
+
     def updatePlotData(self):
-        if self.threadEvent.isSet(): return
-        fig_num=0
-        t_start = self.realtimeWindow_start - self.realtimeWindow
-        if t_start <0: t_start=0
-        xlim = [t_start, self.realtimeWindow_start + self.realtimeInterval + 1.0]
+        if self.threadEvent.isSet():
+            return
+        xlim = self.getXlim()
+        self.deleteOldSamples()  # clear unused values
+        plotted_series = []
         for f in range(len(self.figsInfo)):
-            if self.figsInfo[f] == None: continue
-            self.deleteOldSamples(f) # clear unused values
-            update_fig=False
+            if self.figsInfo[f] is None:
+                continue
+            full_redraw = (f in self.figFullRedraw) or (f not in self.figBackgrounds)
+            dirty_subplots = []
             for p in range(len(self.figsInfo[f])):
-                ar_lables = self.figsInfo[f][p]
-                ymin=[]; ymax=[]
-                update_subplot=False
-                ax = None
-                for param_n in ar_lables:
-                    if param_n.find("*") == -1:
-                        try:
-                            ar_t = getattr(BeeRocksAnalyzerWidget, param_n + "_t")
-                            ar_v = getattr(BeeRocksAnalyzerWidget, param_n + "_v")
-                        except:
-                            continue
-
-                        for s in range(len( self.subplots[f][p])):
-                            (ax, plot_line, param_n_tmp) = self.subplots[f][p][s]
-                            if param_n_tmp == param_n:
-                                update_subplot=True
-                                update_fig = True
-                                plot_line.set_data(ar_t, ar_v)
-                                min, max = self.getMinMax(ar_v)
-                                ymin.append(min)
-                                ymax.append(max)
-                                break
-
-                if update_subplot: # update fig min max
-                    if len(ymin) > 0 and len(ymax) > 0:
+                ax = self.fig_ax[f][p]
+                ymin = []
+                ymax = []
+                update_subplot = False
+                for (line_ax, plot_line, param_n) in self.subplots[f][p]:
+                    series = self.series.get(param_n)
+                    if series is None:
+                        continue
+                    if series.dirty:
+                        plot_line.set_data(series.times(), series.values())
+                        plotted_series.append(series)
+                        update_subplot = True
+                    vmin, vmax = self.getMinMax(series)
+                    ymin.append(vmin)
+                    ymax.append(vmax)
+
+                if len(ymin) > 0 and len(ymax) > 0:  # update fig min max
+                    ylim = [min(ymin)-1, max(ymax)+1]
+                    dy = (ylim[1] - ylim[0])/10.0
+                    ylim[0] -= dy
+                    ylim[1] += dy
+                    if ax.get_xlim() != xlim or ax.get_ylim() != tuple(ylim):
                         ax.set_xlim(xlim)
-                        ylim = [np.min(ymin)-1, np.max(ymax)+1]
-                        dy = (ylim[1] - ylim[0])/10.0
-                        ylim[0]-=dy; ylim[1]+=dy
                         ax.set_ylim(ylim)
                         self.setYticks(ax, ylim[1])
-
-            if update_fig:
-                (fig,canvas) = self.figCanvas[fig_num]
-                canvas.draw()
-                update_fig = False
-
-            fig_num+=1
+                        full_redraw = True
+                    elif update_subplot:
+                        dirty_subplots.append(p)
+
+            (fig, canvas) = self.figCanvas[f]
+            if full_redraw:
+                self.figFullRedraw.discard(f)
+                canvas.draw()  # the backgrounds are saved by onDraw()
+            elif dirty_subplots:
+                backgrounds = self.figBackgrounds[f]
+                for p in dirty_subplots:
+                    ax = self.fig_ax[f][p]
+                    canvas.restore_region(backgrounds[ax])
+                    for (line_ax, plot_line, param_n) in self.subplots[f][p]:
+                        line_ax.draw_artist(plot_line)
+                    canvas.blit(ax.bbox)
+        for series in plotted_series:
+            series.dirty = False
         self.threadEvent.set()
 
-    def getMinMax(self, vec):
-        if(len(vec)==0): return (0, 0)
-        vmax = vmin = 0
-        for i in range(len(vec)):
-            if vec[i] == None: continue
-            if vmin > vec[i]: vmin = vec[i]
-            if vmax < vec[i]: vmax = vec[i]
-        return (vmin, vmax)
-
-    def deleteOldSamples(self, fig):
+    def onDraw(self, f, canvas):
+        """Save the background of the subplots after a full redraw.
+
+        The (animated) lines are then drawn over it.
+        """
+        backgrounds = {}
+        for p in range(len(self.figsInfo[f])):
+            ax = self.fig_ax[f][p]
+            backgrounds[ax] = canvas.copy_from_bbox(ax.bbox)
+            for (line_ax, plot_line, param_n) in self.subplots[f][p]:
+                line_ax.draw_artist(plot_line)
+        self.figBackgrounds[f] = backgrounds
+
+    def getMinMax(self, series):
+        # the y range always includes 0
+        extrema = series.min_max()
+        if extrema is None:
+            return (0, 0)
+        return (min(extrema[0], 0), max(extrema[1], 0))
+
+    def deleteOldSamples(self):
         t_start = self.realtimeWindow_start - self.realtimeWindow
         if t_start < 0: t_start=0
-        for f in range(len(self.figsInfo)):
-            if f != fig: continue
-            if self.figsInfo[f] == None: continue
-            for p in range(len(self.figsInfo[f])):
-                ar_lables = self.figsInfo[f][p]
-                for param_n in ar_lables:
-                    try:
-                        ar_v = getattr(BeeRocksAnalyzerWidget, param_n + "_v")
-                        ar_t = getattr(BeeRocksAnalyzerWidget, param_n + "_t")
-                        idx = 0
-                        t_start_idx=-1
-                        while(idx < len(ar_t)):
-                            if ar_t[idx] >=  t_start:
-                                t_start_idx = idx
-                                break
-                            idx+=1
-                        #delete old elements
-                        if t_start_idx == -1:
-                            delattr(BeeRocksAnalyzerWidget,ar_v)
-                            delattr(BeeRocksAnalyzerWidget,ar_t)
-                            self.addRemoveNewFigSubplots(None, None, param_n, False, None, None)                            
-                        else:
-                            del ar_v[ : t_start_idx]
-                            del ar_t[ : t_start_idx]
-                    except: pass
+        # delete old elements (an empty series keeps its plot line, for its next samples)
+        self.series.evict_before(t_start)
 
     def setYticks(self, ax, vmax):
         if vmax != 0: exp = math.log(abs(vmax),10)
@@ -697,7 +640,9 @@ class BeeRocksAnalyzerWidget(QWidget):
 
                 plt.subplots_adjust(left=0.07, right=0.87, top=0.96, bottom=0.08)
                 fig_subplot_num+=1
-            self.figCanvas.append((fig,canvas))
+            canvas.mpl_connect('draw_event',
+                               lambda event, f=f, canvas=canvas: self.onDraw(f, canvas))
+            self.figCanvas[f] = (fig, canvas)
             self.figs_tab_widget.addTab(fig_frame, "Graph %d" % (f+1))
             fig_num+=1
 
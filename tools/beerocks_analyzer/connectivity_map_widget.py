@@ -7,6 +7,8 @@ import threading
 import time
 import math
 
+import log_record
+
 from PySide2.QtCore import *
 from PySide2.QtGui import *
 
@@ -28,6 +30,10 @@ class UpdateSig(QObject):
 
 class ConnectivityMapWidget(QWidget):
 
+    RECORD_KINDS = (log_record.START, log_record.STOP, log_record.MARK,
+                    log_record.NW_MAP, log_record.RADIO, log_record.VAP, log_record.STATS)
+    """Kinds of the log records handled by readRecord()"""
+
     _MAX_LAST_SEEN = 2
     """Number of updates after which a node is considered to be disconnected and should be removed"""
 
@@ -651,186 +657,113 @@ class ConnectivityMapWidget(QWidget):
                 except Exception as e: # TODO: too broad exception
                     self.logger.exception(e)
 
-    def readSample(self, line, param_t, is_start, is_stop):
-        if is_start:
+    def readRecord(self, record):
+        if record.kind == log_record.START or record.kind == log_record.MARK:
             self.wait_for_start=False
             return
-        elif is_stop:
+        elif record.kind == log_record.STOP:
             self.restartSig.sig.emit(1)
             return
 
-        param_n = []
-        param_v = []
-        i1 = line.find("|")
-        if(i1 == -1) : return
-
-        if ("Radio" in line) or ("VAP" in line):
-            line = line.replace(":",":x,",1)
-
-        i2=line.find(",")
-        try:
-            param_m = str(line[i1+1:i2])
-            line_args = line[i2+1:].split(',')
-            param_n = []
-            for arg in line_args:
-                arg_val = arg.split(':')
-                key = arg_val[0].lower().strip()
-                param_n.append(key)
-                if ("mac" in key) or ("bssid" in key) or ("backhaul" in key):
-                    param_v.append(arg.replace(":","=",1).split("=")[1].strip())
-                else:
-                    param_v.append(arg_val[1].strip())
-
-        except Exception as e: # TODO: too broad exception
-            self.logger.error("Error, readSample() 1 line --> {}".format(line))
-            self.logger.exception(e)
-            return
+        line = record.line
 
-        if param_v is None:
-            self.logger.debug("self.param_v is null, returning")
-            return
+        if record.kind == log_record.NW_MAP:
+            state = record.get('state')
+            mac = record.mac
+            line_type = record.type
+            ip = record.get('ip')
+            if state is None or mac is None or line_type is None or ip is None:
+                self.logger.error("readRecord()  --> {}, nw_map_update line does not contain "
+                                  "state or mac address or ip or type".format(line))
+                return
 
-        param_m_val = param_m.split(':')
-        param_m_n = param_m_val[0].strip()
-        param_m_n_val = ""
-        if len(param_m_val) > 1:
-            param_m_n_val = param_m_val[1].strip()
+            state = state.split()[0]
+            name = record.name
+            channel = -1
+            bandwidth = -1
+            cac_completed = False
+            backhaul_mac = ""
+
+            if line_type == 2:
+                backhaul_mac = record.get('backhaul')
+                if backhaul_mac is None:
+                    self.logger.error("readRecord()  --> {}, nw_map_update IRE line does not "
+                                      "contain a backhaul mac address".format(line))
+                    return
 
-        if param_m_n == "Name":#nw_map_update
-            try:
-                i_state=param_n.index('state')
-                i_mac=param_n.index('mac')
-                i_type=param_n.index('type')
-                i_ip=param_n.index('ip')
-
-                state = (param_v[i_state].split())[0]
-                mac = param_v[i_mac]
-                line_type = param_v[i_type]
-                ip = param_v[i_ip]
-                name = param_m_n_val
-                channel = -1
-                bandwidth = -1
-                cac_completed = False
-                backhaul_mac = ""
-
-                if "2" in line_type:
-                    try:
-                        i_backhaul=param_n.index('backhaul')
-                        backhaul_mac=param_v[i_backhaul]
-                    except Exception as e: # TODO: too broad exception
-                        self.logger.error("readSample()  --> {}, nw_map_update IRE line does not contain a backhaul mac address".format(line))
-                        self.logger.exception(e)
-                        return
-                
-                if "3" in line_type:
-                    try:
-                        i_channel=param_n.index('channel')
-                        channel=param_v[i_channel]
-                    except ValueError:
-                        self.logger.debug("channel not available for client with mac {}".format(mac))
-                    try:
-                        i_bandwidth=param_n.index('bandwidth')
-                        bandwidth=param_v[i_bandwidth]
-                    except ValueError:
-                        self.logger.debug("bandwidth not available for client with mac {}".format(mac))
-            except Exception as e: # TODO: too broad Exception
-                self.logger.error("readSample()  --> {}, nw_map_update line does not contain state or mac address or parent bssid or type".format(line))
-                self.logger.exception(e)
-                return
+            if line_type == 3:
+                channel = record.number('channel')
+                if channel is None:
+                    channel = -1
+                    self.logger.debug("channel not available for client with mac {}".format(mac))
+                bandwidth = record.number('bandwidth')
+                if bandwidth is None:
+                    bandwidth = -1
+                    self.logger.debug("bandwidth not available for client with mac {}".format(mac))
 
             if state == "Connected":
-                if "1" in line_type:#GW
+                if line_type == 1:  # GW
                     cm = ConnectivityMapWidget.node('GW', mac, "", backhaul_mac, channel, bandwidth, cac_completed, False, name, ip)
                     self.add_node_to_graph(cm)
                     self.last_ap_mac = mac
                 else:
-                    i_sta_id=-1
-                    sta_id=-1
-                    try:
-                        i_sta_id=param_n.index('sta_id')
-                        sta_id = int(param_v[i_sta_id])
-                    except: pass
-                    try:
-                        i_parent_mac=param_n.index('parent bssid')
-                        parent_mac = param_v[i_parent_mac]
-                    except ValueError:
-                        # if it has no parent bssid, it should be connected to the gateway
-                        parent_mac = self.gw_eth_mac
-                    if "2" in line_type:#IRE
+                    sta_id = record.sta_id
+                    # if it has no parent bssid, it should be connected to the gateway
+                    parent_mac = record.get('parent bssid', self.gw_eth_mac)
+                    if line_type == 2:  # IRE
                         cm = ConnectivityMapWidget.node('IRE', mac, parent_mac, backhaul_mac, channel, bandwidth, cac_completed, False, name, ip, sta_id)
                         self.add_node_to_graph(cm)
                         self.last_ap_mac = mac
-                    if "3" in line_type:#client
+                    if line_type == 3:  # client
                         cm = ConnectivityMapWidget.node('Client', mac, parent_mac, backhaul_mac, channel, bandwidth, cac_completed, False, name, ip,sta_id)
                         self.add_node_to_graph(cm)
             elif state == "Disconnected":
                 self.remove_node_by_mac(mac)
-                
-        elif "Radio" in param_m_n:
-            try:
-                i_channel=param_n.index('channel')
-                i_bandwidth=param_n.index('bandwidth')
-                i_cac_completed=param_n.index('cac completed')
-                i_ap_active=param_n.index('ap active')
-            except Exception as e:  # TODO: too broad exception
-                self.logger.error("readSample()  --> {}, nw_map_update line "
+
+        elif record.kind == log_record.RADIO:
+            bandwidth = record.number('bandwidth')
+            channel_string = record.get('channel')
+            cac_completed_string = record.get('cac completed')
+            ap_active_string = record.get('ap active')
+            if (bandwidth is None or channel_string is None or cac_completed_string is None or
+                    ap_active_string is None):
+                self.logger.error("readRecord()  --> {}, nw_map_update line "
                                   "does not contain channel or bandwidth or cac_completed or ap_active".format(line))
                 return
-            
-            bandwidth = param_v[i_bandwidth]
-            self.last_radio_bandwidth = int(bandwidth)
 
-            channel_string = param_v[i_channel]
+            self.last_radio_bandwidth = bandwidth
+
             if (channel_string == 'N/A'):
                 self.last_radio_channel = -1
             else:
                 self.last_radio_channel = int(channel_string)
-            
-            cac_completed_string = param_v[i_cac_completed]
-            if cac_completed_string == "1":
-                self.last_radio_cac_completed = True
-            else:
-                self.last_radio_cac_completed = False
-            
-            self.last_radio_active_string = param_v[i_ap_active]
-            if self.last_radio_active_string == "true":
-                self.last_radio_active = True
-            else:
-                self.last_radio_active = False
 
-        elif "VAP" in param_m_n:
-            try:
-                i_bssid=param_n.index('bssid')
-            except Exception as e:  # TODO: too broad exception
-                self.logger.error("readSample()  --> {}, nw_map_update line does not contain bssid".format(line))
+            self.last_radio_cac_completed = (cac_completed_string == "1")
+            self.last_radio_active = (ap_active_string == "true")
+
+        elif record.kind == log_record.VAP:
+            mac = record.mac
+            if mac is None:
+                self.logger.error("readRecord()  --> {}, nw_map_update line does not contain "
+                                  "bssid".format(line))
                 return
-            mac = param_v[i_bssid]
             self.add_node_to_graph(ConnectivityMapWidget.node('RADIO', mac, self.last_ap_mac, "", self.last_radio_channel, self.last_radio_bandwidth, self.last_radio_cac_completed, self.last_radio_active))
 
-        elif param_m_n == "type" or param_m_n == "Type":
-            param_m_v = int(param_m_val[1].strip())
-            try:
-                i1=param_n.index('mac')
-            except Exception as e:  # TODO: too broad exception
-                self.logger.error("Error, readSample() --> {}, 'stats_update' line not contain mac address".format(line))
+        elif record.kind == log_record.STATS:
+            mac = record.mac
+            if mac is None:
+                self.logger.error("Error, readRecord() --> {}, 'stats_update' line not contain "
+                                  "mac address".format(line))
                 return
 
-            mac = param_v[i1]
-            i1+=1
-
-            if param_m_v == 3: #Client stats update
-                i_sta_id=-1
-                sta_id=-1
-                try: 
-                    i_sta_id=param_n.index('sta_id')
-                    sta_id = int(param_v[i_sta_id])
-                except: pass
+            if record.type == 3:  # Client stats update
+                sta_id = record.sta_id
                 if sta_id != -1:# new sta mac addr
                     for n in self.graph:
                         if mac == n.mac or mac == n.backhaul_mac:
                             n.analyzer_id = sta_id
 
-        return # End of readSample()
+        return  # End of readRecord()
     
     def addConnMap(self):
         dpi=80; w=1200; h=720
@@ -0,0 +1,174 @@
+"""Sidecar index of the MARK lines of an analyzer log.
+
+The time slider seeks the log to MARK lines (the start of a network map
+update). Rather than scanning the whole log for them every time it is opened,
+their byte offsets and times are kept in `<log>.marks`, beside the log:
+
+    <log size> <log mtime_ns>
+    <offset> <time>
+    ...
+
+The header is the log size and modification time covered by the index. It is
+rewritten in place on each update, the marks are appended. The index is
+written incrementally by `MarkIndexWriter` while recording, and validated
+(and completed, or rebuilt) by `load_marks()` on open.
+"""
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".marks"
+
+_HEADER_FORMAT = "{:020d} {:020d}\n"
+_HEADER_LENGTH = len(_HEADER_FORMAT.format(0, 0))
+
+lock = threading.Lock()
+"""Serializes the updates of the index files between the recording thread and the UI"""
+
+
+def get_index_file(log_file):
+    return log_file + INDEX_SUFFIX
+
+
+def _write_header(fd, log_size, log_mtime_ns):
+    fd.seek(0)
+    fd.write(_HEADER_FORMAT.format(log_size, log_mtime_ns).encode())
+    fd.flush()
+
+
+def _append_marks(fd, marks):
+    fd.seek(0, 2)
+    fd.write("".join("{:d} {}\n".format(p, t) for p, t in marks).encode())
+
+
+class MarkIndexWriter(object):
+    """Writes the index of a log while it is being recorded.
+
+    The log must be created at the same time as the writer, which truncates the index.
+    """
+
+    def __init__(self, log_file):
+        self.fd = open(get_index_file(log_file), "w+b")
+        _write_header(self.fd, 0, 0)
+
+    def add(self, offset, t, log_fd):
+        """Add a MARK line, once it is flushed to the log.
+
+        Parameters
+        ----------
+        offset : int
+            Byte offset of the MARK line in the log.
+        t : str
+            Time of the MARK line, as written in the log.
+        log_fd
+            The log file object, to get the size and mtime covered by the index.
+        """
+        _append_marks(self.fd, [(offset, t)])
+        self.sync(log_fd)
+
+    def sync(self, log_fd):
+        """Update the log size and mtime covered by the index (the log must be flushed)."""
+        st = os.fstat(log_fd.fileno())
+        _write_header(self.fd, st.st_size, st.st_mtime_ns)
+
+    def close(self):
+        self.fd.close()
+
+
+def _read_index(index_file):
+    """Read an index file.
+
+    Returns
+    -------
+    tuple
+        (log size, log mtime_ns, [(offset, time), ...]), or None if the index is missing or broken.
+    """
+    try:
+        with open(index_file, "rb") as fd:
+            header = fd.read(_HEADER_LENGTH).split()
+            log_size, log_mtime_ns = int(header[0]), int(header[1])
+            marks = []
+            for line in fd:
+                if not line.endswith(b"\n"):
+                    break  # partially written entry
+                p, t = line.split()
+                marks.append((int(p), t.decode()))
+    except (OSError, ValueError, IndexError):
+        return None
+    return log_size, log_mtime_ns, marks
+
+
+def _is_mark(fd, offset):
+    fd.seek(offset)
+    line = fd.readline()
+    return line.find(b"|MARK") != -1
+
+
+def _scan_marks(fd, offset):
+    """Scan the log from `offset` (the start of a line) for MARK lines.
+
+    Returns
+    -------
+    tuple
+        ([(offset, time), ...], offset of the end of the last complete line)
+    """
+    fd.seek(offset)
+    marks = []
+    p = offset
+    for line in fd:
+        if not line.endswith(b"\n"):
+            break  # line being written
+        if line.find(b"|MARK") != -1:
+            marks.append((p, line[0:line.find(b"|")].decode()))
+        p += len(line)
+    return marks, p
+
+
+def load_marks(log_file):
+    """Get the MARK lines of a log, from its index.
+
+    If the log was appended to since the index was last updated, only the
+    new part of the log is scanned. If the log does not match the index (or
+    there is no index), the whole log is scanned and the index is rebuilt.
+
+    Returns
+    -------
+    list
+        [(offset, time)] of the start of the log and of each MARK line, the
+        time being the string written in the log.
+    """
+    index_file = get_index_file(log_file)
+    with lock, open(log_file, "rb") as log_fd:
+        st = os.fstat(log_fd.fileno())
+        index = _read_index(index_file)
+        if index is None:
+            valid = False
+        else:
+            log_size, log_mtime_ns, marks = index
+            if log_size == st.st_size:
+                valid = (log_mtime_ns == st.st_mtime_ns)
+            else:
+                # the log may only have grown since, and its last indexed mark must still be there
+                valid = (log_size < st.st_size) and (not marks or _is_mark(log_fd, marks[-1][0]))
+
+        if valid:
+            scan_start = log_size
+        else:
+            logger.info("Log markers index {} is missing or outdated, rebuilding it".format(
+                index_file))
+            marks = []
+            scan_start = 0
+
+        new_marks, scan_end = _scan_marks(log_fd, scan_start)
+        if scan_end != scan_start or not valid:
+            try:
+                with open(index_file, "r+b" if valid else "w+b") as fd:
+                    _append_marks(fd, new_marks)
+                    _write_header(fd, scan_end, st.st_mtime_ns if scan_end == st.st_size else 0)
+            except OSError as e:
+                logger.warning("Can't write the log markers index {}: {}".format(index_file, e))
+        marks += new_marks
+
+    return [(0, "0.000")] + marks
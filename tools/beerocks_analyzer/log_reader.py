@@ -0,0 +1,163 @@
+"""Memory mapped reader of the analyzer log.
+
+Lines are returned as bytes, so that the lines no widget is interested in are
+never decoded (see `log_record.parse_line()`), and the `<time>|` prefix of the
+lines allows to binary search the log for a time.
+"""
+import bisect
+import mmap
+import os
+
+
+class LogReader(object):
+    """Reader of a log file, which may still be written to (the mapping follows the file growth).
+
+    Parameters
+    ----------
+    fname : str
+        Path of the log file.
+    """
+
+    def __init__(self, fname):
+        self.fd = open(fname, "rb")
+        self.mm = None
+        self.size = 0
+        self.pos = 0
+        self._remap()
+
+    def close(self):
+        if self.mm is not None:
+            self.mm.close()
+            self.mm = None
+        self.fd.close()
+
+    def _remap(self):
+        """Map the file again if it grew.
+
+        Returns
+        -------
+        bool
+            True if the mapping grew.
+        """
+        size = os.fstat(self.fd.fileno()).st_size
+        if size <= self.size:
+            return False
+        if self.mm is not None:
+            self.mm.close()
+        self.mm = mmap.mmap(self.fd.fileno(), size, access=mmap.ACCESS_READ)
+        self.size = size
+        return True
+
+    def tell(self):
+        return self.pos
+
+    def seek(self, pos):
+        """Seek to a line start, or to the end of the file if `pos` is negative."""
+        self._remap()
+        self.pos = self.size if pos < 0 else min(pos, self.size)
+
+    def readline(self):
+        """Read the next complete line.
+
+        Returns
+        -------
+        bytes
+            The line, including its end of line, or b"" if there is no complete line to read yet.
+        """
+        end = self.mm.find(b"\n", self.pos) if self.mm is not None else -1
+        if end == -1:
+            if not self._remap():
+                return b""
+            end = self.mm.find(b"\n", self.pos)
+            if end == -1:
+                return b""
+        line = self.mm[self.pos:end + 1]
+        self.pos = end + 1
+        return line
+
+    def _line_start(self, pos):
+        """Get the start of the first line which starts at or after `pos`."""
+        if pos == 0:
+            return 0
+        end = self.mm.find(b"\n", pos - 1, self.size)
+        return self.size if end == -1 else end + 1
+
+    def _line_time(self, pos):
+        """Get the time and start of the first line with a time, at or after the line start `pos`.
+
+        Returns
+        -------
+        tuple
+            (time, line start), or (None, end of file) if there is no such line.
+        """
+        while pos < self.size:
+            end = self.mm.find(b"\n", pos, self.size)
+            if end == -1:
+                break  # line being written
+            i = self.mm.find(b"|", pos, end)
+            if i != -1:
+                try:
+                    return float(self.mm[pos:i]), pos
+                except ValueError:
+                    pass
+            pos = end + 1
+        return None, self.size
+
+    def find_time(self, t):
+        """Find the first line whose time is at least `t`.
+
+        The times are assumed to increase along the log, which holds within
+        a recording session (the time restarts at each START line).
+
+        Returns
+        -------
+        int
+            Offset of the line start, or of the end of the file if there is no such line.
+        """
+        self._remap()
+        if self.mm is None:
+            return 0
+
+        def before(pos):
+            line_t = self._line_time(self._line_start(pos))[0]
+            return line_t is not None and line_t < t
+
+        # smallest offset whose next timed line is at least t
+        lo, hi = 0, self.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if before(mid):
+                lo = mid + 1
+            else:
+                hi = mid
+        return self._line_time(self._line_start(lo))[1]
+
+    def get_last_time(self):
+        """Get the time of the last complete line with a time, 0.0 if there is none."""
+        self._remap()
+        if self.mm is None:
+            return 0.0
+        end = self.mm.rfind(b"\n")
+        while end != -1:
+            start = self.mm.rfind(b"\n", 0, end) + 1
+            i = self.mm.find(b"|", start, end)
+            if i != -1:
+                try:
+                    return float(self.mm[start:i])
+                except ValueError:
+                    pass
+            end = start - 1
+        return 0.0
+
+
+def get_mark_before(file_marks, offset):
+    """Get the offset of the last MARK line at or before `offset`.
+
+    Parameters
+    ----------
+    file_marks : list
+        [(offset, time)] of the start of the log and its MARK lines, as returned by
+        `log_index.load_marks()`.
+    """
+    i = bisect.bisect_left(file_marks, (offset + 1,)) - 1
+    return file_marks[max(i, 0)][0]
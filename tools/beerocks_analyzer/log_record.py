@@ -0,0 +1,267 @@
+"""Parser of the beerocks analyzer log lines.
+
+Each log line is written by `SocketServerThread` as `<time>|<data>`, where
+`<data>` is a line sent by beerocks_cli (a MARK, a node of the network map, one
+of its radios or VAPs, a stats update, a BML event...).
+
+`parse_line()` tokenizes a line once into a `Record`, which is then dispatched
+by the analyzer to the widgets subscribed to its kind.
+"""
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+
+# Record kinds
+START = "START"
+STOP = "STOP"
+MARK = "MARK"
+NW_MAP = "nw_map"
+RADIO = "radio"
+VAP = "vap"
+STATS = "stats"
+EVENT = "event"
+OTHER = "other"
+
+CONTROL_KINDS = frozenset((START, STOP, MARK))
+"""Kinds of the lines written by the analyzer or the cli to delimit the updates"""
+
+# Kinds of the lines which are split in keys and values
+_KEYED_KINDS = frozenset((NW_MAP, RADIO, VAP, STATS))
+
+_STR_TOKENS = ("#", "|", ",", "BML_EVENT")
+_BYTES_TOKENS = (b"#", b"|", b",", b"BML_EVENT")
+
+# Keys whose value is kept whole (MAC addresses contain the ':' separator)
+_RAW_VALUE_KEYS = ("mac", "bssid", "backhaul")
+
+# Interned keys and whether their value is kept whole, by their raw spelling in the log
+_keys = {}
+# Key tuples, their key to position index and their whole value flags, by key tuple
+_layouts = {}
+
+
+class Record(object):
+    """A parsed log line.
+
+    Attributes
+    ----------
+    t : float
+        Time of the line, in seconds from the start of the log.
+    kind : str
+        One of the record kinds (START, STOP, MARK, NW_MAP, RADIO, VAP, STATS, EVENT, OTHER).
+    line : str
+        The original line, None if it was not parsed (see `parse_line()`).
+    name : str
+        Value of the line header: the node name for NW_MAP, the radio / VAP
+        index (e.g. "Radio[0]") for RADIO and VAP, the stats type for STATS.
+    type : int
+        Node type for NW_MAP, stats type for STATS, None otherwise.
+    mac : str
+        The node MAC for NW_MAP and STATS, the BSSID for VAP, None otherwise.
+    keys : tuple
+        Interned keys of the line (lower case), shared by all the lines with the same layout.
+    values : tuple
+        Values of the line, as strings, in the order of `keys`.
+    numbers : tuple
+        Numeric values of the line for STATS (None for non numeric values), None otherwise.
+    index : dict
+        Position of each key in `keys`, shared by all the lines with the same layout.
+    sta_id : int
+        Analyzer id of the station the line refers to, -1 if unknown.
+    """
+    __slots__ = ('t', 'kind', 'line', 'name', 'type', 'mac', 'keys', 'values', 'numbers',
+                 'index', 'sta_id')
+
+    def __init__(self, t, kind, line, name="", keys=(), values=(), index=None):
+        self.t = t
+        self.kind = kind
+        self.line = line
+        self.name = name
+        self.type = None
+        self.mac = None
+        self.keys = keys
+        self.values = values
+        self.numbers = None
+        self.index = index if index is not None else {}
+        self.sta_id = -1
+
+    def get(self, key, default=None):
+        """Get the value of `key`, or `default` if the line does not contain it."""
+        i = self.index.get(key)
+        if i is None:
+            return default
+        return self.values[i]
+
+    def number(self, key, default=None):
+        """Get the numeric value of `key`, or `default` if it is missing or not a number."""
+        i = self.index.get(key)
+        if i is None:
+            return default
+        if self.numbers is not None:
+            n = self.numbers[i]
+        else:
+            n = to_number(self.values[i])
+        return default if n is None else n
+
+    def is_map_update(self):
+        """Whether the line updates the network map (it is neither a control line nor stats)."""
+        return self.kind != STATS and self.kind not in CONTROL_KINDS
+
+
+def to_number(value):
+    """Convert a log value to a number.
+
+    Handles plain numbers, enums printed as "<name> (<value>)" and values
+    followed by a unit (e.g. "-50 dBm").
+
+    Returns
+    -------
+    int or float
+        The value, or None if it is not numeric.
+    """
+    if value.isdigit():
+        return int(value)
+    if value.endswith(')'):
+        i = value.rfind('(')
+        if i != -1:
+            return to_number(value[i + 1:-1])
+    token = value.split(None, 1)[0] if value else value
+    if token.lstrip('-').isdigit():
+        return int(token)
+    try:
+        return float(token)
+    except ValueError:
+        return None
+
+
+def _intern_key(raw):
+    entry = _keys.get(raw)
+    if entry is None:
+        key = sys.intern(raw.strip().lower())
+        entry = (key, any(k in key for k in _RAW_VALUE_KEYS))
+        _keys[raw] = entry
+    return entry
+
+
+def _get_layout(keys, raw):
+    layout = _layouts.get(keys)
+    if layout is None:
+        layout = (keys, {key: i for i, key in enumerate(keys)}, tuple(raw))
+        _layouts[keys] = layout
+    return layout
+
+
+def _split_args(args):
+    keys = []
+    raw = []
+    values = []
+    for arg in args:
+        i = arg.index(':')
+        key, is_raw = _intern_key(arg[:i])
+        keys.append(key)
+        raw.append(is_raw)
+        if is_raw:
+            values.append(arg[i + 1:].strip())
+        else:
+            j = arg.find(':', i + 1)
+            values.append(arg[i + 1:j if j != -1 else None].strip())
+    return _get_layout(tuple(keys), raw), tuple(values)
+
+
+def _decode(data):
+    return data.decode("utf-8", "replace") if isinstance(data, bytes) else data
+
+
+def parse_line(line, kinds=None):
+    """Parse a log line.
+
+    Parameters
+    ----------
+    line : str or bytes
+        A line of the analyzer log (bytes as returned by `LogReader.readline()`).
+    kinds : container
+        If given, lines of other kinds are not decoded nor split, and are
+        returned as records with only their time and kind.
+
+    Returns
+    -------
+    Record
+        The parsed line, or None if the line is a comment or has no time.
+        Lines which can't be parsed are logged and returned as OTHER records,
+        so that their time is still accounted for.
+    """
+    comment, bar, comma, event = _BYTES_TOKENS if isinstance(line, bytes) else _STR_TOKENS
+    if line.startswith(comment) or len(line) < 4:
+        return None
+    i1 = line.find(bar)
+    if i1 == -1:
+        return None
+    try:
+        t = float(line[0:i1])
+    except ValueError:
+        logger.error("parse_line() invalid time --> {}".format(_decode(line)))
+        return None
+
+    if event in line:
+        kind = EVENT
+    else:
+        i2 = line.find(comma, i1 + 1)
+        if i2 == -1:  # START or STOP or MARK
+            data = _decode(line[i1 + 1:]).strip()
+            if data in CONTROL_KINDS:
+                kind = data
+            else:
+                logger.error("parse_line() unknown line --> {}".format(_decode(line)))
+                kind = OTHER
+        else:
+            header = _decode(line[i1 + 1:i2])
+            i3 = header.find(":")
+            header_name = header[:i3].strip() if i3 != -1 else header.strip()
+            if header_name == "Name":
+                kind = NW_MAP
+            elif header_name == "type" or header_name == "Type":
+                kind = STATS
+            elif "Radio" in header_name:
+                kind = RADIO
+            elif "VAP" in header_name:
+                kind = VAP
+            else:  # e.g. the TX / RX lines of the stats, which none of the widgets use
+                kind = OTHER
+
+    if kinds is not None and kind not in kinds:
+        return Record(t, kind, None)
+    line = _decode(line)
+    if kind not in _KEYED_KINDS:
+        return Record(t, kind, line)
+
+    try:
+        # the offsets may differ in the decoded line
+        i1 = line.find("|")
+        i2 = line.find(",", i1 + 1)
+        header = line[i1 + 1:i2]
+        i3 = header.find(":")
+        if kind == RADIO or kind == VAP:
+            # "Radio[0]: Interface: wlan0, ..." - the first key is part of the header
+            name = header[:i3].strip()
+            args = line[i1 + 1 + i3 + 1:].split(',')
+        else:
+            name = header[i3 + 1:].strip()
+            args = line[i2 + 1:].split(',')
+        (keys, index, raw), values = _split_args(args)
+    except ValueError:
+        logger.error("parse_line() --> {}".format(line))
+        return Record(t, OTHER, line)
+
+    record = Record(t, kind, line, name, keys, values, index)
+    if kind == NW_MAP:
+        record.mac = record.get('mac')
+        record.type = record.number('type')
+    elif kind == STATS:
+        # MAC addresses are not numbers
+        record.numbers = tuple(None if r else to_number(v) for v, r in zip(values, raw))
+        record.mac = record.get('mac')
+        record.type = to_number(name)
+    elif kind == VAP:
+        record.mac = record.get('bssid')
+    return record
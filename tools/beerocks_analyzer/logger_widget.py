@@ -6,8 +6,11 @@ import threading
 import socket
 import time
 
+import log_record
+
 from PySide2.QtCore import *
 from PySide2.QtGui import *
+from PySide2.QtGui import QTextCursor
 from PySide2.QtWidgets import QWidget, QTextEdit, QTabWidget, QFormLayout
 
 
@@ -15,6 +18,9 @@ class UpdateSig(QObject):
     sig = Signal(float)
 
 class LoggerWidget(QWidget):
+    RECORD_KINDS = (log_record.EVENT,)
+    """Kinds of the log records handled by readRecord()"""
+
     def __init__(self, parent=None):
         super(LoggerWidget, self).__init__(parent)
         self.logOutput = QTextEdit()
@@ -45,7 +51,6 @@ class LoggerWidget(QWidget):
         self.updateSig = UpdateSig()
         self.restartSig = UpdateSig()
 
-    def readSampleAndUpdateLogger(self, line, param_t1, is_start, is_stop):
-        if "BML_EVENT" in line:
-            self.logOutput.insertPlainText(line)
-            self.logOutput.moveCursor(QTextCursor.End)
+    def readRecord(self, record):
+        self.logOutput.insertPlainText(record.line)
+        self.logOutput.moveCursor(QTextCursor.End)
@@ -0,0 +1,152 @@
+"""Storage of the metric series plotted by the analyzer graphs."""
+from collections import deque
+
+import numpy as np
+
+DEFAULT_CAPACITY = 4096
+"""Number of samples kept per series, the oldest samples are dropped beyond it"""
+
+GAP_SEC = 3.0
+"""Time without samples after which the plotted line is broken"""
+
+
+class Series(object):
+    """Ring buffer of the (time, value) samples of a metric.
+
+    Each sample is stored twice, `capacity` apart, so that the samples are
+    always contiguous from the head: times() and values() are views which
+    can be given to matplotlib without copying.
+
+    The extrema of the values are tracked with monotonic deques of
+    (sample number, value), so that min_max() is O(1) and each sample costs
+    O(1) amortized.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximum number of samples.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.t = np.full(2 * capacity, np.nan, dtype=np.float64)
+        self.v = np.full(2 * capacity, np.nan, dtype=np.float32)
+        self.head = 0
+        self.count = 0
+        # number of samples pushed so far, i.e. the sample number of the next sample
+        self.total = 0
+        # increasing values (the front is the minimum) /
+        # decreasing values (the front is the maximum)
+        self.mins = deque()
+        self.maxs = deque()
+        # whether the samples changed since they were last plotted (cleared by the plotter)
+        self.dirty = False
+
+    def __len__(self):
+        return self.count
+
+    def times(self):
+        return self.t[self.head:self.head + self.count]
+
+    def values(self):
+        return self.v[self.head:self.head + self.count]
+
+    def last_time(self):
+        return self.t[self.head + self.count - 1] if self.count else None
+
+    def _push(self, t, v):
+        i = (self.head + self.count) % self.capacity
+        self.t[i] = self.t[i + self.capacity] = t
+        self.v[i] = self.v[i + self.capacity] = v
+        if self.count == self.capacity:
+            self.head = (self.head + 1) % self.capacity
+        else:
+            self.count += 1
+        self.dirty = True
+        n = self.total
+        self.total += 1
+        v = float(self.v[i])
+        if v == v:  # not NaN
+            while self.mins and self.mins[-1][1] >= v:
+                self.mins.pop()
+            self.mins.append((n, v))
+            while self.maxs and self.maxs[-1][1] <= v:
+                self.maxs.pop()
+            self.maxs.append((n, v))
+        self._trim()
+
+    def _trim(self):
+        """Drop the extrema candidates which are no longer in the buffer."""
+        first = self.total - self.count
+        while self.mins and self.mins[0][0] < first:
+            self.mins.popleft()
+        while self.maxs and self.maxs[0][0] < first:
+            self.maxs.popleft()
+
+    def min_max(self):
+        """Get the (min, max) of the values, None if there are only NaN values."""
+        if not self.mins:
+            return None
+        return (self.mins[0][1], self.maxs[0][1])
+
+    def append(self, t, v):
+        """Add a sample, preceded by a NaN value if there was no sample for more than GAP_SEC."""
+        if self.count and (t - self.t[self.head + self.count - 1]) > GAP_SEC:
+            self._push(t - 0.1, np.nan)
+        self._push(t, v)
+
+    def evict_before(self, t_start):
+        """Drop the samples older than `t_start`.
+
+        The times are sorted, so the first sample to keep is found by
+        bisection, and the samples are dropped by moving the head.
+        """
+        drop = int(np.searchsorted(self.times(), t_start, side='left'))
+        self.head = (self.head + drop) % self.capacity
+        self.count -= drop
+        if drop:
+            self.dirty = True
+            self._trim()
+
+
+class SeriesStore(object):
+    """Series of the analyzer metrics, by name (e.g. "ap0_sta1_signal_strength")."""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.series = {}
+
+    def __contains__(self, name):
+        return name in self.series
+
+    def __iter__(self):
+        return iter(self.series)
+
+    def get(self, name):
+        """Get a series, None if there is no such series."""
+        return self.series.get(name)
+
+    def add(self, name, t, v):
+        """Add a sample to a series, creating the series if needed.
+
+        Returns
+        -------
+        tuple
+            (series, True if the series was created).
+        """
+        series = self.series.get(name)
+        is_new = series is None
+        if is_new:
+            series = Series(self.capacity)
+            self.series[name] = series
+        series.append(t, v)
+        return series, is_new
+
+    def remove(self, name):
+        self.series.pop(name, None)
+
+    def evict_before(self, t_start):
+        """Drop the samples older than `t_start` from all the series."""
+        # the series may be added to by the log reading thread meanwhile
+        for series in list(self.series.values()):
+            series.evict_before(t_start)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Unit tests of log_index.
+
+Run from tools/beerocks_analyzer with `python3 -m unittest discover -s test`.
+"""
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+import log_index
+import logger_setup
+
+
+def setUpModule():
+    # the analyzer logs with str.format arguments, see logger_setup
+    global _record_factory
+    _record_factory = logging.getLogRecordFactory()
+    logging.setLogRecordFactory(logger_setup.FormatRecordFactory)
+
+
+def tearDownModule():
+    logging.setLogRecordFactory(_record_factory)
+
+
+class TestLogIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.dir, "analyzer.log")
+        self.index_file = log_index.get_index_file(self.log_file)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def record(self, lines):
+        """Write a log as SocketServerThread does, and return its marks as (offset, time)."""
+        marks = []
+        with open(self.log_file, "wb") as fd:
+            writer = log_index.MarkIndexWriter(self.log_file)
+            for line in lines:
+                t = line[0:line.find(b"|")].decode()
+                if line.endswith(b"|MARK\n"):
+                    marks.append((fd.tell(), t))
+                fd.write(line)
+                fd.flush()
+                if line.endswith(b"|MARK\n"):
+                    writer.add(marks[-1][0], t, fd)
+            writer.sync(fd)
+            writer.close()
+        return marks
+
+    def test_writer(self):
+        # non ASCII data: the offsets are in bytes
+        marks = self.record([b"0.000|START\n", "0.100|Name: été, Type: 1\n".encode(),
+                             b"0.200|MARK\n", b"0.300|type: 1, mac: 00:11:22:33:44:55\n",
+                             b"0.400|MARK\n", b"0.500|STOP\n"])
+        self.assertEqual(marks, [(39, "0.200"), (88, "0.400")])
+        self.assertEqual(log_index.load_marks(self.log_file), [(0, "0.000")] + marks)
+
+        st = os.stat(self.log_file)
+        self.assertEqual(log_index._read_index(self.index_file),
+                         (st.st_size, st.st_mtime_ns, marks))
+
+    def test_rebuild(self):
+        marks = self.record([b"0.000|START\n", b"0.100|MARK\n", b"0.200|MARK\n"])
+        os.remove(self.index_file)
+        with self.assertLogs(log_index.logger, logging.INFO) as cm:
+            self.assertEqual(log_index.load_marks(self.log_file), [(0, "0.000")] + marks)
+        self.assertIn(self.index_file, cm.output[0])
+        # the rebuilt index is used as is on the next open
+        with open(self.index_file, "ab") as fd:
+            fd.write(b"1 9.999\n")
+        self.assertEqual(log_index.load_marks(self.log_file)[-1], (1, "9.999"))
+
+    def test_broken_index(self):
+        marks = self.record([b"0.000|START\n", b"0.100|MARK\n"])
+        with open(self.index_file, "wb") as fd:
+            fd.write(b"garbage")
+        self.assertEqual(log_index.load_marks(self.log_file), [(0, "0.000")] + marks)
+
+    def test_appended_log(self):
+        marks = self.record([b"0.000|START\n", b"0.100|MARK\n"])
+        # appended to by a tool other than the writer: only the new part is scanned,
+        # and the partial last line is left for the next open
+        with open(self.log_file, "ab") as fd:
+            fd.write(b"0.200|MARK\n0.300|MA")
+        marks.append((23, "0.200"))
+        self.assertEqual(log_index.load_marks(self.log_file), [(0, "0.000")] + marks)
+        with open(self.log_file, "ab") as fd:
+            fd.write(b"RK\n")
+        marks.append((34, "0.300"))
+        self.assertEqual(log_index.load_marks(self.log_file), [(0, "0.000")] + marks)
+        self.assertEqual(log_index._read_index(self.index_file)[2], marks)
+
+    def test_replaced_log(self):
+        self.record([b"0.000|START\n", b"0.100|MARK\n", b"0.200|MARK\n"])
+        # a shorter log with the same name: the index is rebuilt
+        with open(self.log_file, "wb") as fd:
+            fd.write(b"0.000|START\n0.500|MARK\n")
+        self.assertEqual(log_index.load_marks(self.log_file), [(0, "0.000"), (12, "0.500")])
+        # a longer log whose last indexed mark moved: the index is rebuilt too
+        with open(self.log_file, "wb") as fd:
+            fd.write(b"0.000|START\n0.010|type: 1\n0.500|MARK\n0.600|MARK\n")
+        self.assertEqual(log_index.load_marks(self.log_file),
+                         [(0, "0.000"), (26, "0.500"), (37, "0.600")])
+
+    def test_unwritable_index(self):
+        marks = self.record([b"0.000|START\n", b"0.100|MARK\n"])
+        os.remove(self.index_file)
+        os.mkdir(self.index_file)
+        # the marks are still returned, only the index is not saved
+        with self.assertLogs(log_index.logger, logging.WARNING) as cm:
+            self.assertEqual(log_index.load_marks(self.log_file), [(0, "0.000")] + marks)
+        self.assertIn("Can't write the log markers index " + self.index_file, cm.output[-1])
+
+    def test_no_marks(self):
+        self.record([b"0.000|START\n", b"0.500|STOP\n"])
+        self.assertEqual(log_index.load_marks(self.log_file), [(0, "0.000")])
+
+
+if __name__ == '__main__':
+    unittest.main()
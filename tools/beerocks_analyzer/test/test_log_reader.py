@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Unit tests of log_reader.
+
+Run from tools/beerocks_analyzer with `python3 -m unittest discover -s test`.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import log_index
+import log_reader
+
+LOG = (b"0.000|START\n"
+       b"# a comment without a time\n"
+       b"0.500|Name: GW_BRIDGE, Type: 2\n"
+       b"1.000|MARK\n"
+       b"1.000|Name: GW_BRIDGE, Type: 2\n"
+       b"1.500|type: 1, mac: 00:11:22:33:44:55, rssi: -50\n"
+       b"2.000|MARK\n"
+       b"2.250|Name: RE, Type: 2\n"
+       b"3.000|STOP\n")
+
+
+def offset_of(line):
+    return LOG.index(line)
+
+
+class TestLogReader(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.dir, "analyzer.log")
+        self.write(LOG, "wb")
+        self.reader = log_reader.LogReader(self.log_file)
+
+    def tearDown(self):
+        self.reader.close()
+        shutil.rmtree(self.dir)
+
+    def write(self, data, mode="ab"):
+        with open(self.log_file, mode) as fd:
+            fd.write(data)
+
+    def test_readline(self):
+        self.assertEqual(self.reader.readline(), b"0.000|START\n")
+        self.reader.seek(offset_of(b"2.000|MARK"))
+        self.assertEqual(self.reader.readline(), b"2.000|MARK\n")
+        self.assertEqual(self.reader.tell(), offset_of(b"2.250"))
+        self.reader.seek(-1)
+        self.assertEqual(self.reader.tell(), len(LOG))
+        self.assertEqual(self.reader.readline(), b"")
+
+    def test_readline_growing(self):
+        self.reader.seek(-1)
+        # a line being written is only returned once it is complete
+        self.write(b"0.000|STA")
+        self.assertEqual(self.reader.readline(), b"")
+        self.write(b"RT\n")
+        self.assertEqual(self.reader.readline(), b"0.000|START\n")
+        self.assertEqual(self.reader.readline(), b"")
+
+    def test_find_time(self):
+        self.assertEqual(self.reader.find_time(0.0), 0)
+        self.assertEqual(self.reader.find_time(0.25), offset_of(b"0.500"))
+        # the first of the lines with the same time
+        self.assertEqual(self.reader.find_time(1.0), offset_of(b"1.000|MARK"))
+        self.assertEqual(self.reader.find_time(1.75), offset_of(b"2.000|MARK"))
+        self.assertEqual(self.reader.find_time(3.0), offset_of(b"3.000|STOP"))
+        self.assertEqual(self.reader.find_time(10.0), len(LOG))
+
+    def test_find_time_growing(self):
+        self.write(b"4.000|MARK\n5.000|Na")
+        self.assertEqual(self.reader.find_time(4.0), len(LOG))
+        # the line being written is not a line yet: no line has a time of at least 4.5
+        self.assertEqual(self.reader.find_time(4.5), os.path.getsize(self.log_file))
+
+    def test_get_last_time(self):
+        self.assertEqual(self.reader.get_last_time(), 3.0)
+        # lines without a time and a line being written are skipped
+        self.write(b"# comment\n4.000|Na")
+        self.assertEqual(self.reader.get_last_time(), 3.0)
+        self.write(b"me: RE\n")
+        self.assertEqual(self.reader.get_last_time(), 4.0)
+
+    def test_empty_log(self):
+        self.write(b"", "wb")
+        reader = log_reader.LogReader(self.log_file)
+        self.assertEqual(reader.find_time(1.0), 0)
+        self.assertEqual(reader.get_last_time(), 0.0)
+        self.assertEqual(reader.readline(), b"")
+        reader.close()
+
+
+class TestGetMarkBefore(unittest.TestCase):
+
+    def test_get_mark_before(self):
+        marks = [(0, "0.000"), (100, "1.000"), (200, "2.000")]
+        self.assertEqual(log_reader.get_mark_before(marks, 0), 0)
+        self.assertEqual(log_reader.get_mark_before(marks, 99), 0)
+        # a mark is at or before its own offset
+        self.assertEqual(log_reader.get_mark_before(marks, 100), 100)
+        self.assertEqual(log_reader.get_mark_before(marks, 199), 100)
+        self.assertEqual(log_reader.get_mark_before(marks, 200), 200)
+        self.assertEqual(log_reader.get_mark_before(marks, 1000), 200)
+        self.assertEqual(log_reader.get_mark_before([(0, "0.000")], 50), 0)
+
+    def test_seek_to_mark(self):
+        # the time slider: find the line of a time, then read from the mark before it
+        tmp = tempfile.mkdtemp()
+        try:
+            log_file = os.path.join(tmp, "analyzer.log")
+            with open(log_file, "wb") as fd:
+                fd.write(LOG)
+            marks = log_index.load_marks(log_file)
+            reader = log_reader.LogReader(log_file)
+            for t, mark_line in ((0.5, b"0.000|START\n"), (1.0, b"1.000|MARK\n"),
+                                 (1.5, b"1.000|MARK\n"), (2.0, b"2.000|MARK\n"),
+                                 (2.5, b"2.000|MARK\n")):
+                reader.seek(log_reader.get_mark_before(marks, reader.find_time(t)))
+                self.assertEqual(reader.readline(), mark_line, "t = {}".format(t))
+            reader.close()
+        finally:
+            shutil.rmtree(tmp)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Unit tests of log_record.
+
+Run from tools/beerocks_analyzer with `python3 -m unittest discover -s test`.
+"""
+import logging
+import unittest
+
+import log_record
+import logger_setup
+
+NW_MAP_LINE = ("1.250|Name: GW_BRIDGE, Type: 2, State: Connected (1), MAC: 00:11:22:33:44:55, "
+               "Backhaul: 00:11:22:33:44:66")
+RADIO_LINE = "1.500|Radio[0]: Interface: wlan0, Channel: 36, MAC: 00:11:22:33:44:77"
+VAP_LINE = "1.750|VAP[1]: BSSID: 00:11:22:33:44:88, SSID: prplmesh"
+STATS_LINE = "2.000|type: 3, mac: 00:11:22:33:44:99, rssi: -50 dBm, load: 12.5 %, state: idle"
+EVENT_LINE = "2.500|BML_EVENT: STA connected, mac: 00:11:22:33:44:aa"
+
+
+def setUpModule():
+    # the analyzer logs with str.format arguments, see logger_setup
+    global _record_factory
+    _record_factory = logging.getLogRecordFactory()
+    logging.setLogRecordFactory(logger_setup.FormatRecordFactory)
+
+
+def tearDownModule():
+    logging.setLogRecordFactory(_record_factory)
+
+
+class TestParseLine(unittest.TestCase):
+
+    def test_control(self):
+        for kind in (log_record.START, log_record.STOP, log_record.MARK):
+            record = log_record.parse_line("3.125|{}\n".format(kind))
+            self.assertEqual(record.kind, kind)
+            self.assertEqual(record.t, 3.125)
+            self.assertFalse(record.is_map_update())
+
+    def test_nw_map(self):
+        record = log_record.parse_line(NW_MAP_LINE)
+        self.assertEqual(record.kind, log_record.NW_MAP)
+        self.assertEqual(record.t, 1.25)
+        self.assertEqual(record.name, "GW_BRIDGE")
+        self.assertEqual(record.keys, ("type", "state", "mac", "backhaul"))
+        # MAC addresses are kept whole, other values end at the next ':'
+        self.assertEqual(record.mac, "00:11:22:33:44:55")
+        self.assertEqual(record.get("backhaul"), "00:11:22:33:44:66")
+        self.assertEqual(record.type, 2)
+        self.assertEqual(record.number("state"), 1)
+        self.assertIsNone(record.get("ssid"))
+        self.assertTrue(record.is_map_update())
+
+    def test_radio(self):
+        record = log_record.parse_line(RADIO_LINE)
+        self.assertEqual(record.kind, log_record.RADIO)
+        # the first key is part of the header
+        self.assertEqual(record.name, "Radio[0]")
+        self.assertEqual(record.keys, ("interface", "channel", "mac"))
+        self.assertEqual(record.get("interface"), "wlan0")
+        self.assertEqual(record.number("channel"), 36)
+        self.assertIsNone(record.mac)
+
+    def test_vap(self):
+        record = log_record.parse_line(VAP_LINE)
+        self.assertEqual(record.kind, log_record.VAP)
+        self.assertEqual(record.name, "VAP[1]")
+        self.assertEqual(record.mac, "00:11:22:33:44:88")
+        self.assertEqual(record.get("ssid"), "prplmesh")
+
+    def test_stats(self):
+        record = log_record.parse_line(STATS_LINE)
+        self.assertEqual(record.kind, log_record.STATS)
+        self.assertEqual(record.type, 3)
+        self.assertEqual(record.mac, "00:11:22:33:44:99")
+        self.assertEqual(record.numbers, (None, -50, 12.5, None))
+        self.assertEqual(record.number("rssi"), -50)
+        self.assertEqual(record.number("state", -1), -1)
+        self.assertFalse(record.is_map_update())
+
+    def test_event(self):
+        record = log_record.parse_line(EVENT_LINE)
+        self.assertEqual(record.kind, log_record.EVENT)
+        self.assertEqual(record.line, EVENT_LINE)
+        self.assertEqual(record.keys, ())
+
+    def test_other(self):
+        record = log_record.parse_line("4.000|TX: bytes: 10, packets: 1")
+        self.assertEqual(record.kind, log_record.OTHER)
+        with self.assertLogs(log_record.logger, logging.ERROR):
+            record = log_record.parse_line("4.500|UNKNOWN")
+        self.assertEqual(record.kind, log_record.OTHER)
+        self.assertEqual(record.t, 4.5)
+
+    def test_invalid(self):
+        self.assertIsNone(log_record.parse_line("# comment|1"))
+        self.assertIsNone(log_record.parse_line("1.0"))
+        self.assertIsNone(log_record.parse_line("no time in this line"))
+        with self.assertLogs(log_record.logger, logging.ERROR) as cm:
+            self.assertIsNone(log_record.parse_line("abc|START"))
+        # the line is part of the message, whatever the log record factory
+        self.assertIn("parse_line() invalid time --> abc|START", cm.output[0])
+
+    def test_bytes(self):
+        for line in (NW_MAP_LINE, RADIO_LINE, VAP_LINE, STATS_LINE, EVENT_LINE, "5.0|MARK"):
+            expected = log_record.parse_line(line)
+            record = log_record.parse_line(line.encode())
+            for attr in ("t", "kind", "name", "keys", "values"):
+                self.assertEqual(getattr(record, attr), getattr(expected, attr))
+            self.assertIsInstance(record.line, str)
+
+    def test_kinds(self):
+        record = log_record.parse_line(NW_MAP_LINE.encode(), kinds=(log_record.STATS,))
+        self.assertEqual((record.t, record.kind, record.line), (1.25, log_record.NW_MAP, None))
+        record = log_record.parse_line(STATS_LINE.encode(), kinds=(log_record.STATS,))
+        self.assertEqual(record.number("rssi"), -50)
+
+    def test_shared_layout(self):
+        r1 = log_record.parse_line(STATS_LINE)
+        r2 = log_record.parse_line(STATS_LINE.replace("-50", "-60"))
+        self.assertIs(r1.keys, r2.keys)
+        self.assertIs(r1.index, r2.index)
+        self.assertEqual(r2.number("rssi"), -60)
+
+
+class TestToNumber(unittest.TestCase):
+
+    def test_to_number(self):
+        self.assertEqual(log_record.to_number("42"), 42)
+        self.assertEqual(log_record.to_number("-7"), -7)
+        self.assertEqual(log_record.to_number("1.5"), 1.5)
+        self.assertEqual(log_record.to_number("Connected (3)"), 3)
+        self.assertEqual(log_record.to_number("-50 dBm"), -50)
+        self.assertIsNone(log_record.to_number("idle"))
+        self.assertIsNone(log_record.to_number(""))
+
+
+if __name__ == '__main__':
+    unittest.main()
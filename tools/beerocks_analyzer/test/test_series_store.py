@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Unit tests of series_store.
+
+Run from tools/beerocks_analyzer with `python3 -m unittest discover -s test`.
+"""
+import unittest
+
+import numpy as np
+
+import series_store
+
+
+def fill(series, times, values=None):
+    for i, t in enumerate(times):
+        series.append(t, float(i) if values is None else values[i])
+
+
+class TestSeries(unittest.TestCase):
+
+    def test_append(self):
+        series = series_store.Series(8)
+        self.assertEqual(len(series), 0)
+        self.assertIsNone(series.last_time())
+        fill(series, [1.0, 2.0, 3.0])
+        self.assertEqual(list(series.times()), [1.0, 2.0, 3.0])
+        self.assertEqual(list(series.values()), [0.0, 1.0, 2.0])
+        self.assertEqual(series.last_time(), 3.0)
+
+    def test_wrap_around(self):
+        series = series_store.Series(4)
+        for n in range(1, 11):
+            series.append(float(n), float(10 * n))
+            # the samples are contiguous views of the last `capacity` samples
+            first = max(1, n - 3)
+            self.assertEqual(list(series.times()), [float(t) for t in range(first, n + 1)])
+            self.assertEqual(list(series.values()), [10.0 * t for t in range(first, n + 1)])
+        self.assertEqual(len(series), 4)
+        self.assertEqual(series.last_time(), 10.0)
+        self.assertIsNotNone(series.times().base)
+
+    def test_gap(self):
+        series = series_store.Series(8)
+        fill(series, [1.0, 2.0, 2.0 + series_store.GAP_SEC + 1])
+        # a NaN value before the sample breaks the plotted line
+        self.assertEqual(len(series), 4)
+        self.assertTrue(np.isnan(series.values()[2]))
+        self.assertEqual(series.values()[3], 2.0)
+
+    def test_evict_before(self):
+        series = series_store.Series(8)
+        fill(series, [1.0, 2.0, 2.5, 3.0, 4.0])
+        series.evict_before(0.5)
+        self.assertEqual(len(series), 5)
+        # the samples at t_start are kept
+        series.evict_before(2.5)
+        self.assertEqual(list(series.times()), [2.5, 3.0, 4.0])
+        self.assertEqual(list(series.values()), [2.0, 3.0, 4.0])
+        series.evict_before(3.5)
+        self.assertEqual(list(series.times()), [4.0])
+        series.evict_before(10.0)
+        self.assertEqual(len(series), 0)
+        self.assertIsNone(series.last_time())
+        # the series is usable again after it was emptied
+        series.append(11.0, 5.0)
+        self.assertEqual(list(series.times()), [11.0])
+
+    def test_evict_wrapped(self):
+        series = series_store.Series(4)
+        fill(series, [float(t) for t in range(1, 8)])
+        self.assertEqual(list(series.times()), [4.0, 5.0, 6.0, 7.0])
+        # the head moves across the end of the ring
+        series.evict_before(6.0)
+        self.assertEqual(list(series.times()), [6.0, 7.0])
+        fill(series, [8.0, 9.0, 10.0])
+        self.assertEqual(list(series.times()), [7.0, 8.0, 9.0, 10.0])
+        series.evict_before(9.5)
+        self.assertEqual(list(series.times()), [10.0])
+
+    def test_min_max(self):
+        series = series_store.Series(8)
+        self.assertIsNone(series.min_max())
+        fill(series, [1.0, 2.0, 3.0, 4.0], [5.0, 1.0, 9.0, 3.0])
+        self.assertEqual(series.min_max(), (1.0, 9.0))
+        # the extrema are dropped with their sample, the next candidates take over
+        series.evict_before(3.0)
+        self.assertEqual(series.min_max(), (3.0, 9.0))
+        series.evict_before(4.0)
+        self.assertEqual(series.min_max(), (3.0, 3.0))
+        series.evict_before(5.0)
+        self.assertIsNone(series.min_max())
+
+    def test_min_max_nan(self):
+        series = series_store.Series(4)
+        series.append(1.0, float("nan"))
+        self.assertIsNone(series.min_max())
+        series.append(2.0, 4.0)
+        # the NaN value inserted before a sample after a gap is not an extremum
+        series.append(10.0, 2.0)
+        self.assertEqual(len(series), 4)
+        self.assertEqual(series.min_max(), (2.0, 4.0))
+
+    def test_min_max_wrapped(self):
+        # the extrema match a full scan while the samples wrap around and are evicted
+        rng = np.random.RandomState(1)
+        series = series_store.Series(16)
+        t = 0.0
+        for n in range(500):
+            t += 1.0
+            series.append(t, float(rng.randint(-100, 100)))
+            if n % 7 == 0:
+                series.evict_before(t - rng.randint(0, 16))
+            values = series.values()
+            self.assertEqual(series.min_max(), (float(np.nanmin(values)), float(np.nanmax(values))))
+
+
+class TestSeriesStore(unittest.TestCase):
+
+    def test_store(self):
+        store = series_store.SeriesStore(capacity=4)
+        series, is_new = store.add("ap0_signal", 1.0, -50.0)
+        self.assertTrue(is_new)
+        self.assertEqual(series.capacity, 4)
+        self.assertEqual(store.add("ap0_signal", 2.0, -60.0), (series, False))
+        self.assertIn("ap0_signal", store)
+        self.assertEqual(list(store), ["ap0_signal"])
+        self.assertIs(store.get("ap0_signal"), series)
+        self.assertIsNone(store.get("ap1_signal"))
+        store.remove("ap0_signal")
+        self.assertNotIn("ap0_signal", store)
+
+    def test_store_evict_before(self):
+        store = series_store.SeriesStore(capacity=8)
+        for t in (1.0, 2.0, 3.0):
+            store.add("ap0_signal", t, -50.0)
+            store.add("ap1_signal", t + 0.5, -60.0)
+        store.evict_before(2.0)
+        self.assertEqual(list(store.get("ap0_signal").times()), [2.0, 3.0])
+        self.assertEqual(list(store.get("ap1_signal").times()), [2.5, 3.5])
+
+
+if __name__ == '__main__':
+    unittest.main()